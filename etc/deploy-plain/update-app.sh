@@ -100,6 +100,15 @@ cd ${OPTIMAP_APP}
 python manage.py clear_caches
 "
 
+# Rebuild statistics, pages, feeds and sitemaps in the background, so the
+# first visitors after the deploy do not pay for the cold caches.
+echo "Enqueueing cache warm-up..."
+sudo -u "${OPTIMAP_USER}" bash -c "
+source ${OPTIMAP_VENV}/bin/activate
+cd ${OPTIMAP_APP}
+python manage.py warm_caches --async
+"
+
 # Verify services
 sleep 5
 if systemctl is-active --quiet optimap && systemctl is-active --quiet optimap-worker; then
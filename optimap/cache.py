@@ -0,0 +1,290 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Two-tier cache backend: a small per-process L1 in front of a shared L2.
+
+``TieredCache`` keeps a bounded ``LocMemCache`` (L1) in every worker and reads
+through to another configured cache alias (L2) — a Redis-protocol server in
+production, the database cache otherwise, or any local stand-in in tests. Only
+keys whose prefix (the part before the first ``:``) is listed in
+``L1_PREFIXES`` are held in L1; login tokens, sessions and throttling counters
+go straight to L2, so there is a single source of truth for them.
+
+Coherence uses one version stamp per prefix, stored in L2. Each L1 entry
+remembers the stamp it was read under, and every write through this backend
+that replaces or removes an existing key (``set``, ``delete``, ``incr``,
+``clear``, …) replaces the stamp of its prefix.
+Workers re-read the stamps of the prefixes they use at most every
+``STAMP_INTERVAL`` seconds, so a write in one worker invalidates the L1 entries
+of all others within that interval without a round trip per read.
+``L1_TIMEOUT`` bounds how long an L1 entry outlives its L2 expiry.
+
+Hits are counted per prefix and tier (``l1``, ``l2``, ``miss``) in each
+process — see :meth:`TieredCache.stats` — and added to totals in L2 every
+``STATS_INTERVAL`` seconds, which ``manage.py cache_stats`` reports.
+
+Example::
+
+    CACHES = {
+        "default": {
+            "BACKEND": "optimap.cache.TieredCache",
+            "OPTIONS": {"L2": "shared", "L1_PREFIXES": ["feed", "work_popup"]},
+        },
+        "shared": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://…"},
+    }
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+_MISSING = object()
+#: Prefix of the backend's own bookkeeping keys in L2 (never held in L1).
+INTERNAL_PREFIX = "tiered"
+STATS_PREFIXES_KEY = f"{INTERNAL_PREFIX}:stats:prefixes"
+TIERS = ("l1", "l2", "miss")
+
+
+def key_prefix(key: str) -> str:
+    """Prefix a key is counted and invalidated under: the part before the first ``:``."""
+    return str(key).split(":", 1)[0]
+
+
+def stats_key(prefix: str, tier: str) -> str:
+    return f"{INTERNAL_PREFIX}:stats:{prefix}:{tier}"
+
+
+class TieredCache(BaseCache):
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._l2_alias = options.get("L2", "shared")
+        self._l1_prefixes = frozenset(options.get("L1_PREFIXES", ()))
+        self._stamp_interval = float(options.get("STAMP_INTERVAL", 1.0))
+        self._stats_interval = float(options.get("STATS_INTERVAL", 60.0))
+        self._l1 = LocMemCache(
+            f"optimap-l1-{location or self._l2_alias}",
+            {
+                "TIMEOUT": options.get("L1_TIMEOUT", 30),
+                "OPTIONS": {"MAX_ENTRIES": options.get("L1_MAX_ENTRIES", 1000)},
+            },
+        )
+        self._stamps = {}  # prefix -> (stamp, read at)
+        self._counts = Counter()  # (prefix, tier) -> hits since the last flush
+        self._totals = Counter()  # (prefix, tier) -> hits since start
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def l2(self) -> BaseCache:
+        return caches[self._l2_alias]
+
+    # --- tiers and stamps -------------------------------------------------
+
+    def _uses_l1(self, prefix: str) -> bool:
+        return prefix in self._l1_prefixes
+
+    def _stamp_key(self, prefix: str) -> str:
+        return f"{INTERNAL_PREFIX}:stamp:{prefix}"
+
+    def _stamp(self, prefix: str) -> str:
+        """Current stamp of ``prefix``, re-read from L2 at most every ``STAMP_INTERVAL``."""
+        now = time.monotonic()
+        known = self._stamps.get(prefix)
+        if known is not None and now - known[1] < self._stamp_interval:
+            return known[0]
+        stamp = self.l2.get(self._stamp_key(prefix))
+        if stamp is None:
+            stamp = uuid.uuid4().hex
+            if not self.l2.add(self._stamp_key(prefix), stamp, timeout=None):
+                stamp = self.l2.get(self._stamp_key(prefix), stamp)
+        self._stamps[prefix] = (stamp, now)
+        return stamp
+
+    def _changed(self, key, version=None, replaced=True) -> None:
+        """Record a write to ``key``: drop it locally and, if another worker may
+        hold it (``replaced``), move its prefix to a new stamp."""
+        prefix = key_prefix(key)
+        if not self._uses_l1(prefix):
+            return
+        self._l1.delete(key, version=version)
+        if not replaced:
+            return
+        stamp = uuid.uuid4().hex
+        self.l2.set(self._stamp_key(prefix), stamp, timeout=None)
+        self._stamps[prefix] = (stamp, time.monotonic())
+
+    # --- hit counters -----------------------------------------------------
+
+    def _count(self, prefix: str, tier: str, n: int = 1) -> None:
+        if prefix == INTERNAL_PREFIX:
+            return
+        with self._lock:
+            self._counts[prefix, tier] += n
+            self._totals[prefix, tier] += n
+            due = time.monotonic() - self._flushed_at >= self._stats_interval
+        if due:
+            self.flush_stats()
+
+    def stats(self) -> dict:
+        """This process's hits per prefix since start: ``{prefix: {"l1", "l2", "miss", "hit_rate"}}``."""
+        with self._lock:
+            totals = dict(self._totals)
+        return summarize(totals)
+
+    def flush_stats(self) -> None:
+        """Add the hits counted since the last flush to the shared totals in L2."""
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+            self._flushed_at = time.monotonic()
+        if not counts:
+            return
+        l2 = self.l2
+        prefixes = set(l2.get(STATS_PREFIXES_KEY) or ())
+        if not {prefix for prefix, _tier in counts} <= prefixes:
+            l2.set(STATS_PREFIXES_KEY, sorted(prefixes | {prefix for prefix, _tier in counts}), timeout=None)
+        for (prefix, tier), n in counts.items():
+            key = stats_key(prefix, tier)
+            if not l2.add(key, n, timeout=None):
+                try:
+                    l2.incr(key, n)
+                except ValueError:
+                    l2.set(key, n, timeout=None)
+
+    # --- reads ------------------------------------------------------------
+
+    def get(self, key, default=None, version=None):
+        prefix = key_prefix(key)
+        stamp = None
+        if self._uses_l1(prefix):
+            stamp = self._stamp(prefix)
+            entry = self._l1.get(key, _MISSING, version=version)
+            if entry is not _MISSING and entry[0] == stamp:
+                self._count(prefix, "l1")
+                return entry[1]
+        value = self.l2.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            self._count(prefix, "miss")
+            return default
+        self._count(prefix, "l2")
+        if stamp is not None:
+            self._l1.set(key, (stamp, value), version=version)
+        return value
+
+    def get_many(self, keys, version=None):
+        found = {}
+        remote = []
+        for key in keys:
+            prefix = key_prefix(key)
+            if self._uses_l1(prefix):
+                entry = self._l1.get(key, _MISSING, version=version)
+                if entry is not _MISSING and entry[0] == self._stamp(prefix):
+                    self._count(prefix, "l1")
+                    found[key] = entry[1]
+                    continue
+            remote.append(key)
+        if remote:
+            stamps = {key: self._stamp(key_prefix(key)) for key in remote if self._uses_l1(key_prefix(key))}
+            fetched = self.l2.get_many(remote, version=version)
+            for key in remote:
+                prefix = key_prefix(key)
+                if key not in fetched:
+                    self._count(prefix, "miss")
+                    continue
+                self._count(prefix, "l2")
+                found[key] = fetched[key]
+                if key in stamps:
+                    self._l1.set(key, (stamps[key], fetched[key]), version=version)
+        return found
+
+    def has_key(self, key, version=None):
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    # --- writes -----------------------------------------------------------
+
+    # A key that is not in L2 cannot be in any worker's L1 either (entries only
+    # get there from L2 hits), so writing it needs no new stamp. That keeps the
+    # usual cache-aside "miss, compute, set" from invalidating the whole prefix.
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.l2.add(key, value, timeout=self._l2_timeout(timeout), version=version)
+        if added:
+            self._changed(key, version, replaced=False)
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        replaced = self._uses_l1(key_prefix(key)) and self.l2.has_key(key, version=version)
+        self.l2.set(key, value, timeout=self._l2_timeout(timeout), version=version)
+        self._changed(key, version, replaced=replaced)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        cached = [key for key in data if self._uses_l1(key_prefix(key))]
+        existing = self.l2.get_many(cached, version=version) if cached else {}
+        failed = self.l2.set_many(data, timeout=self._l2_timeout(timeout), version=version)
+        for key in data:
+            self._changed(key, version, replaced=key in existing)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.l2.touch(key, timeout=self._l2_timeout(timeout), version=version)
+
+    def delete(self, key, version=None):
+        deleted = self.l2.delete(key, version=version)
+        self._changed(key, version)
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.l2.delete_many(keys, version=version)
+        for key in keys:
+            self._changed(key, version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.l2.incr(key, delta, version=version)
+        self._changed(key, version)
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        value = self.l2.decr(key, delta, version=version)
+        self._changed(key, version)
+        return value
+
+    def clear(self):
+        # Dropping the stamps from L2 invalidates every other worker's L1 too.
+        self.l2.clear()
+        self._l1.clear()
+        self._stamps.clear()
+
+    def close(self, **kwargs):
+        self.l2.close(**kwargs)
+
+    def _l2_timeout(self, timeout):
+        # DEFAULT_TIMEOUT means this backend's TIMEOUT, not the L2 alias's own.
+        return self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+
+
+def summarize(counts) -> dict:
+    """``{(prefix, tier): n}`` → ``{prefix: {"l1": …, "l2": …, "miss": …, "hit_rate": …}}``."""
+    summary = {}
+    for (prefix, tier), n in counts.items():
+        summary.setdefault(prefix, dict.fromkeys(TIERS, 0))[tier] += n
+    for row in summary.values():
+        lookups = row["l1"] + row["l2"] + row["miss"]
+        row["hit_rate"] = (row["l1"] + row["l2"]) / lookups if lookups else 0.0
+    return dict(sorted(summary.items()))
+
+
+def shared_stats(cache) -> dict:
+    """Hit totals of every worker, as flushed to L2 by :meth:`TieredCache.flush_stats`."""
+    l2 = cache.l2
+    prefixes = l2.get(STATS_PREFIXES_KEY) or ()
+    keys = {stats_key(prefix, tier): (prefix, tier) for prefix in prefixes for tier in TIERS}
+    values = l2.get_many(list(keys))
+    return summarize({keys[key]: n for key, n in values.items()})
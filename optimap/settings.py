@@ -19,6 +19,7 @@ https://djangocentral.com/environment-variables-in-django/
 import os
 import re
 import sys
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -81,6 +82,9 @@ DATA_DUMP_RETENTION = int(os.getenv("OPTIMAP_DATA_DUMP_RETENTION", 3))
 
 # Feed configuration
 FEED_CACHE_HOURS = int(os.getenv("OPTIMAP_FEED_CACHE_HOURS", 24))
+# Streamed collection GeoJSON downloads up to this size are cached once complete;
+# larger ones are streamed on every request, so a worker never buffers them whole.
+COLLECTION_GEOJSON_CACHE_MAX_BYTES = int(os.getenv("OPTIMAP_COLLECTION_GEOJSON_CACHE_MAX_BYTES", 8 * 1024 * 1024))
 
 # Ocean geometry simplification configuration
 OCEAN_SIMPLIFICATION_TOLERANCE = float(os.getenv("OPTIMAP_OCEAN_SIMPLIFICATION_TOLERANCE", "0.05"))
@@ -96,6 +100,37 @@ COUNTRY_SIMPLIFICATION_TOLERANCE = float(os.getenv("OPTIMAP_COUNTRY_SIMPLIFICATI
 # For deployment: set to a non-volatile directory like /var/opt/optimap/data
 GLOBAL_REGIONS_DATA_DIR = os.getenv("OPTIMAP_GLOBAL_REGIONS_DATA_DIR", None)
 
+# Max vertices per piece when country/region outlines are cut with ST_Subdivide
+# into the CountrySubdivided / GlobalRegionSubdivided join tables. Smaller pieces
+# make each point-in-polygon test cheaper at the cost of more index entries.
+OUTLINE_SUBDIVIDE_MAX_VERTICES = int(os.getenv("OPTIMAP_OUTLINE_SUBDIVIDE_MAX_VERTICES", 255))
+
+# Simplified-geometry zoom band (low/medium/high, or none for full resolution)
+# used for the "all works" layer of the facet maps on source, country, topic and
+# year pages. See works.utils.geometry.SIMPLIFIED_GEOMETRY_BANDS.
+WORKS_MAP_SIMPLIFY = os.getenv("OPTIMAP_WORKS_MAP_SIMPLIFY", "medium")
+
+# Server-side lifetime of rendered /api/v1/tiles/works/ vector tiles. Tiles are
+# also retired as soon as any work is saved, so this only bounds cache growth.
+WORKS_TILE_CACHE_SECONDS = int(os.getenv("OPTIMAP_WORKS_TILE_CACHE_SECONDS", 86400))
+
+# Server-side lifetime of cached /api/v1/works/<id>/popup/ payloads. Saving a
+# work or its source drops the entry at once; this bounds how long source
+# statistics written with QuerySet.update() can lag.
+WORK_POPUP_CACHE_SECONDS = int(os.getenv("OPTIMAP_WORK_POPUP_CACHE_SECONDS", 86400))
+
+# Prebuilt snapshot of the public works map (works.services.map_snapshot): a
+# content-hashed GeoJSON with .gz/.br siblings, served by nginx from this
+# directory at MAP_SNAPSHOT_URL (Django serves it too, for development).
+MAP_SNAPSHOT_DIR = os.getenv("OPTIMAP_MAP_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "optimap_map_snapshot"))
+MAP_SNAPSHOT_URL = os.getenv("OPTIMAP_MAP_SNAPSHOT_URL", "/map-snapshot/")
+
+# Prebuilt, gzip-compressed sitemap shards of the published works
+# (works.services.sitemap_shards), one per SITEMAP_SHARD_SIZE range of work IDs
+# (at most 50,000 URLs each per the sitemap protocol).
+SITEMAP_DIR = os.getenv("OPTIMAP_SITEMAP_DIR", os.path.join(tempfile.gettempdir(), "optimap_sitemaps"))
+SITEMAP_SHARD_SIZE = int(os.getenv("OPTIMAP_SITEMAP_SHARD_SIZE", 10000))
+
 AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
 ]
@@ -156,6 +191,16 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "works.pagination.LinkHeaderPagination",
     "PAGE_SIZE": 999,
+    # orjson-backed JSON (stock DRF behaviour when orjson is not installed).
+    "DEFAULT_RENDERER_CLASSES": [
+        "works.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "works.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     # Per-scope rate limits (only the endpoints that opt in via throttle_classes
     # are affected — there is no global default throttle). The contribute-by-DOI
     # endpoint triggers external API calls (Crossref/OpenAlex/OpenAIRE), so it is
@@ -196,7 +241,8 @@ without auth). The UI is rendered by [Redoc](https://github.com/Redocly/redoc) f
   feed / download endpoints accept anonymous GETs. `Subscriptions` requires session auth.
 - **Pagination:** list endpoints return a `{count, next, previous, results}` envelope with
   the default page size from `REST_FRAMEWORK['PAGE_SIZE']`. Use `?limit=` for explicit page
-  size, `?offset=` to skip records.
+  size, `?offset=` to skip records. `Works` also offers keyset pagination with
+  `?pagination=cursor` — follow `next` (or the `Link: rel="next"` header) to walk the full list.
 - **Spatial filtering:** list endpoints with a geometry field accept `?in_bbox=west,south,east,north`
   (longitude/latitude in EPSG:4326).
 - **GeoJSON envelope:** `Works` responses are valid GeoJSON `FeatureCollection`s; the OPTIMAP
@@ -219,6 +265,7 @@ The full corpus is available as flat-file dumps (regenerated every 6 h):
 | [`/download/geojson/`](/download/geojson/) | GeoJSON `FeatureCollection` | Gzipped when the client sends `Accept-Encoding: gzip` |
 | [`/download/geopackage/`](/download/geopackage/) | OGC GeoPackage (`.gpkg`) | Single layer `works`, EPSG:4326 |
 | [`/download/csv/`](/download/csv/) | CSV with WKT geometry column | UTF-8, RFC 4180 |
+| [`/download/flatgeobuf/`](/download/flatgeobuf/) | FlatGeobuf (`.fgb`) | Spatially indexed; supports HTTP `Range` requests |
 
 These are documented in the *Downloads* section below.
 
@@ -344,16 +391,73 @@ Q_CLUSTER = {
     "catch_up": env.bool("OPTIMAP_SCHEDULER_CATCH_UP", default=False),
 }
 
+# Shared cache for all workers: a Redis-protocol server (Redis, Valkey, …) when
+# OPTIMAP_REDIS_URL is set, otherwise the database cache table. The table holds
+# up to CACHE_MAX_ENTRIES entries (Django's default of 300 is less than the
+# work landing contexts and feeds alone) before a third of it is culled.
+REDIS_URL = os.getenv("OPTIMAP_REDIS_URL", "")
+CACHE_MAX_ENTRIES = env.int("OPTIMAP_CACHE_MAX_ENTRIES", default=20000)
+if REDIS_URL:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+else:
+    SHARED_CACHE = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "cache",
+        "OPTIONS": {"MAX_ENTRIES": CACHE_MAX_ENTRIES},
+    }
+
+# Map popups (works.services.popups) have a cache of their own: one entry per
+# clicked work outnumbers everything else in the default cache, whose culling
+# would otherwise evict login tokens and cached pages. With the database
+# backend they get their own table (`manage.py createcachetable`) bounded by
+# WORK_POPUP_CACHE_MAX_ENTRIES; on Redis they share the server's memory policy.
+WORK_POPUP_CACHE_MAX_ENTRIES = env.int("OPTIMAP_WORK_POPUP_CACHE_MAX_ENTRIES", default=50000)
+if REDIS_URL:
+    POPUP_CACHE = {**SHARED_CACHE, "KEY_PREFIX": "popups"}
+else:
+    POPUP_CACHE = {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "work_popup_cache",
+        "OPTIONS": {"MAX_ENTRIES": WORK_POPUP_CACHE_MAX_ENTRIES, "CULL_FREQUENCY": 10},
+    }
+
+# Keep a small per-worker copy (L1) of read-mostly entries in front of the
+# shared cache; see optimap/cache.py and `manage.py cache_stats`. Only keys
+# with these prefixes are held in L1.
+CACHE_L1 = env.bool("OPTIMAP_CACHE_L1", default=False)
+CACHE_L1_PREFIXES = [
+    "feed",
+    "feed_page",
+    "facet_map_all",
+    "facet",
+    "download",
+    "work_landing",
+    "work_tiles",
+    "cache_tag",
+]
+
+# Cache warm-up after deploys (works.services.cache_warmup, `manage.py
+# warm_caches`): landing pages of this many works are built, ranked by their
+# requests in the access log if one is set, with up to CACHE_WARMUP_WORKERS
+# artifacts built at once.
+CACHE_WARMUP_ACCESS_LOG = os.getenv("OPTIMAP_CACHE_WARMUP_ACCESS_LOG", "")
+CACHE_WARMUP_WORKS = int(os.getenv("OPTIMAP_CACHE_WARMUP_WORKS", 200))
+CACHE_WARMUP_WORKERS = int(os.getenv("OPTIMAP_CACHE_WARMUP_WORKERS", 4))
+# GZipMiddleware adds "Vary: Accept-Encoding", so the page cache keys each page
+# by this header; warm the variant current browsers request.
+CACHE_WARMUP_ACCEPT_ENCODING = os.getenv("OPTIMAP_CACHE_WARMUP_ACCEPT_ENCODING", "gzip, deflate, br, zstd")
+
 CACHES = {
     # Default: persists across processes (login tokens, email confirmations,
     # GeoRSS feed bodies). See https://docs.djangoproject.com/en/4.1/topics/cache/
-    "default": {
-        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
-        "LOCATION": "cache",
-    },
+    "default": SHARED_CACHE,
+    "popups": POPUP_CACHE,
     # Per-process in-memory cache for hot anonymous reads — view-level
     # @cache_page decorators on static / low-change pages (feeds list,
-    # sitemap, robots, privacy, …) and the work_landing context cache.
+    # sitemap, robots, privacy, …).
     # Each gunicorn worker keeps its own copy; first hit per worker is a
     # miss, subsequent hits are pure dict lookups (no DB roundtrip).
     "memory": {
@@ -364,14 +468,29 @@ CACHES = {
     "dummy": {
         "BACKEND": "django.core.cache.backends.dummy.DummyCache",
     },
-    #'redis': {
-    #    "BACKEND": "django_redis.cache.RedisCache",
-    #    "LOCATION": "redis://127.0.0.1:6379/1",
-    #    "OPTIONS": {
-    #        "CLIENT_CLASS": "django_redis.client.DefaultClient",
-    #    },
-    # }
 }
+if CACHE_L1:
+    CACHES["shared"] = SHARED_CACHE
+    CACHES["default"] = {
+        "BACKEND": "optimap.cache.TieredCache",
+        "OPTIONS": {
+            "L2": "shared",
+            "L1_PREFIXES": CACHE_L1_PREFIXES,
+            "L1_TIMEOUT": env.int("OPTIMAP_CACHE_L1_TIMEOUT", default=30),
+            "L1_MAX_ENTRIES": env.int("OPTIMAP_CACHE_L1_MAX_ENTRIES", default=1000),
+        },
+    }
+    CACHES["popups_shared"] = POPUP_CACHE
+    CACHES["popups"] = {
+        "BACKEND": "optimap.cache.TieredCache",
+        "LOCATION": "popups",
+        "OPTIONS": {
+            "L2": "popups_shared",
+            "L1_PREFIXES": ["work_popup"],
+            "L1_TIMEOUT": env.int("OPTIMAP_CACHE_L1_TIMEOUT", default=30),
+            "L1_MAX_ENTRIES": env.int("OPTIMAP_CACHE_L1_MAX_ENTRIES", default=1000),
+        },
+    }
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -405,6 +524,9 @@ EMAIL_IMAP_SENT_FOLDER = env("OPTIMAP_EMAIL_IMAP_SENT_FOLDER", default="")
 OPTIMAP_EMAIL_SEND_DELAY = env("OPTIMAP_EMAIL_SEND_DELAY", default=2)
 EMAIL_SEND_DELAY = 2
 DATA_DUMP_INTERVAL_HOURS = 6
+# Full statistics recount correcting the trigger-maintained counters and
+# refreshing the breakdowns (works.tasks.reconcile_statistics).
+STATISTICS_RECONCILE_HOURS = env.int("OPTIMAP_STATISTICS_RECONCILE_HOURS", default=24)
 INACTIVITY_WARNING_DAYS = env.int("OPTIMAP_INACTIVITY_WARNING_DAYS", default=365)
 INACTIVITY_DELETION_DAYS = env.int("OPTIMAP_INACTIVITY_DELETION_DAYS", default=396)
 
@@ -560,7 +682,9 @@ BOK_ENABLED_COLLECTIONS = [s.strip() for s in os.getenv("OPTIMAP_BOK_ENABLED_COL
 SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 
 # Per Django's cache-framework docs, the canonical placement is:
-#   UpdateCacheMiddleware  — outermost on the response side; sets
+#   ConditionalGetMiddleware — wraps the page cache, so cached copies are
+#                            validated against the request too.
+#   UpdateCacheMiddleware  — next on the response side; sets
 #                            Cache-Control + Expires headers and stores
 #                            qualifying responses in the default cache.
 #   SessionMiddleware      — must run *before* FetchFromCacheMiddleware
@@ -570,6 +694,7 @@ SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
 # stray second copy (and a duplicate UpdateCache/CommonMiddleware/
 # FetchFromCache trio above SessionMiddleware) — both removed.
 MIDDLEWARE = [
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.cache.UpdateCacheMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -741,6 +866,12 @@ WORKS_PAGE_SIZE_OPTIONS = _calculate_page_size_options(
 # Number of works fetched per chunk when loading the main map.
 OPTIMAP_MAP_CHUNK_SIZE = int(env("OPTIMAP_MAP_CHUNK_SIZE", default=500))
 
+# Load the main map from /api/v1/tiles/works/{z}/{x}/{y}.mvt (only what is in
+# view) instead of paging every work through the API. Needs Leaflet.VectorGrid
+# (see works/static/download_libraries.sh); without it the map falls back to
+# chunked loading.
+OPTIMAP_MAP_VECTOR_TILES = env.bool("OPTIMAP_MAP_VECTOR_TILES", default=False)
+
 # OGC API - Features via pygeoapi (issue #19)
 # Served at /ogcapi/ when etc/pygeoapi-config.yml is present and the
 # etc/pygeoapi-openapi.yml has been generated (see manage.py generate_pygeoapi_openapi).
@@ -6,6 +6,7 @@ from django.db.models import Count, Q
 from django.urls import reverse
 
 from works.models import Collection, Country, GlobalRegion, Source, Work
+from works.services.sitemap_shards import work_path_builder
 
 
 class WorksSitemap(Sitemap):  # based on django.contrib.sitemaps.GenericSitemap
@@ -15,17 +16,19 @@ class WorksSitemap(Sitemap):  # based on django.contrib.sitemaps.GenericSitemap
     protocol = None
 
     def items(self):
-        items = self.queryset.filter()
-        # items.count()
-        return items
+        # Plain (id, doi, lastUpdate) rows; the sitemap index lists the prebuilt
+        # shards of works.services.sitemap_shards instead once they exist.
+        return self.queryset.order_by("id").values_list("id", "doi", "lastUpdate")
 
     def location(self, item):
         """Return the URL path for a work (without domain)."""
-        return reverse("optimap:work-landing", args=[item.get_identifier()])
+        if not hasattr(self, "_work_path"):
+            self._work_path = work_path_builder()
+        return self._work_path(item[0], item[1])
 
     def lastmod(self, item):
         """Return the last modification date of the work."""
-        return item.lastUpdate
+        return item[2]
 
 
 class StaticViewSitemap(Sitemap):
@@ -36,7 +36,7 @@ from optimap.sitemaps import (
     WorksSitemap,
     YearSitemap,
 )
-from optimap.views import RobotsView, sitemap_index_gz, sitemap_section_gz
+from optimap.views import RobotsView, sitemap_index, sitemap_index_gz, sitemap_section_gz, sitemap_works_shard
 
 sitemaps = {
     "static": StaticViewSitemap,
@@ -56,7 +56,7 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path(
         "sitemap.xml",
-        cache_page(settings.PAGE_CACHE_LONG, cache="memory")(sitemaps_views.index),
+        sitemap_index,
         {"sitemaps": sitemaps},
         name="django.contrib.sitemaps.views.index",
     ),
@@ -72,6 +72,8 @@ urlpatterns = [
         {"sitemaps": sitemaps},
         name="sitemap-index-gz",
     ),
+    # Prebuilt work shards (works.services.sitemap_shards); before the generic section pattern.
+    path("sitemap-works-<int:shard>.xml.gz", sitemap_works_shard, name="sitemap-works-shard"),
     path(
         "sitemap-<section>.xml.gz",
         sitemap_section_gz,
@@ -15,6 +15,7 @@ This module handles:
 """
 
 import gzip as _gzip
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,10 +29,15 @@ import humanize
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.sitemaps import views as sitemaps_views
-from django.http import HttpResponse, JsonResponse
+from django.contrib.sitemaps.views import SitemapIndexItem
+from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import caches
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
 from django.utils.decorators import method_decorator
+from django.utils.http import http_date
 from django.utils.timezone import get_default_timezone
 from django.views.decorators.cache import cache_page, never_cache
 from django.views.decorators.http import require_POST
@@ -43,6 +49,8 @@ from works.feeds import normalize_region_slug
 from works.models import Collection, GlobalRegion
 from works.seo import build_homepage_meta
 from works.serializers import get_available_gazetteers as _available_gazetteers
+from works.services.map_snapshot import current_snapshot_url
+from works.services.sitemap_shards import current_shards, shard_name, sitemap_dir
 
 
 def main(request):
@@ -56,6 +64,9 @@ def main(request):
             "meta": build_homepage_meta(request),
             "canonical_url": request.build_absolute_uri(reverse("optimap:main")),
             "map_chunk_size": settings.OPTIMAP_MAP_CHUNK_SIZE,
+            "map_vector_tiles": settings.OPTIMAP_MAP_VECTOR_TILES,
+            # Staff see unpublished works too, so only others get the public snapshot.
+            "map_snapshot_url": None if request.user.is_staff else current_snapshot_url(),
         },
     )
 
@@ -87,14 +98,16 @@ def data(request):
     geojson_files = sorted(cache_dir.glob("optimap_data_dump_*.geojson"), reverse=True)
     gpkg_files = sorted(cache_dir.glob("optimap_data_dump_*.gpkg"), reverse=True)
     csv_files = sorted(cache_dir.glob("optimap_data_dump_*.csv"), reverse=True)
+    fgb_files = sorted(cache_dir.glob("optimap_data_dump_*.fgb"), reverse=True)
 
     last_geo = geojson_files[0] if geojson_files else None
     last_gzip = Path(str(last_geo) + ".gz") if last_geo else None
     last_gpkg = gpkg_files[0] if gpkg_files else None
     last_csv = csv_files[0] if csv_files else None
+    last_fgb = fgb_files[0] if fgb_files else None
 
     # — Supervisor check: ensure all dump file times are within 1 hour
-    dump_files = (last_geo, last_gzip, last_gpkg, last_csv)
+    dump_files = (last_geo, last_gzip, last_gpkg, last_csv, last_fgb)
     mtimes = [p.stat().st_mtime for p in dump_files if p and p.exists()]
     if mtimes and (max(mtimes) - min(mtimes) > 3600):
         ts_map = {
@@ -108,6 +121,7 @@ def data(request):
     geojson_size = humanize.naturalsize(last_geo.stat().st_size, binary=True) if last_geo else None
     geopackage_size = humanize.naturalsize(last_gpkg.stat().st_size, binary=True) if last_gpkg else None
     csv_size = humanize.naturalsize(last_csv.stat().st_size, binary=True) if last_csv else None
+    flatgeobuf_size = humanize.naturalsize(last_fgb.stat().st_size, binary=True) if last_fgb else None
 
     # last updated timestamp (using JSON file)
     if last_geo:
@@ -123,11 +137,13 @@ def data(request):
             "geojson_size": geojson_size,
             "geopackage_size": geopackage_size,
             "csv_size": csv_size,
+            "flatgeobuf_size": flatgeobuf_size,
             "interval": settings.DATA_DUMP_INTERVAL_HOURS,
             "last_updated": last_updated,
             "last_geojson": last_geo.name if last_geo else None,
             "last_gpkg": last_gpkg.name if last_gpkg else None,
             "last_csv": last_csv.name if last_csv else None,
+            "last_fgb": last_fgb.name if last_fgb else None,
             "pygeoapi_enabled": getattr(settings, "PYGEOAPI_ENABLED", False),
         },
     )
@@ -208,10 +224,99 @@ def _as_gz(response):
     return gz
 
 
-@cache_page(settings.PAGE_CACHE_SHORT, cache="memory")
+def _render_sitemap_index(request, sitemaps, shards, **kwargs):
+    """Django's sitemap index, listing the prebuilt work ``shards`` in place of the ``works`` section.
+
+    Until the first shard build (``works.services.sitemap_shards``) the
+    dynamic ``sitemap-works.xml`` is listed as before.
+    """
+    if shards:
+        sitemaps = {section: sitemap for section, sitemap in sitemaps.items() if section != "works"}
+    response = sitemaps_views.index(request, sitemaps, **kwargs)
+    domain = get_current_site(request).domain
+    response.context_data["sitemaps"].extend(
+        SitemapIndexItem(f"{request.scheme}://{domain}{reverse('sitemap-works-shard', args=[shard])}", last_mod)
+        for shard, last_mod in shards
+    )
+    response.render()
+    return response
+
+
+def _sitemap_index_entry(request, sitemaps, **kwargs):
+    """``(content, headers)`` of the rendered sitemap index, from the ``memory`` cache.
+
+    The key names the built shards and their modification times, so a shard
+    build is listed at once, while the rest of the index is rendered at most
+    once per ``PAGE_CACHE_LONG``.
+    """
+    shards = current_shards()
+    stamp = hashlib.sha1(repr(shards).encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+    key = f"sitemap_index:{request.scheme}:{request.get_host()}:{stamp}"
+    memory = caches["memory"]
+    entry = memory.get(key)
+    if entry is None:
+        response = _render_sitemap_index(request, sitemaps, shards, **kwargs)
+        headers = {name: value for name, value in response.items() if name != "Content-Length"}
+        entry = (response.content, headers)
+        memory.set(key, entry, settings.PAGE_CACHE_LONG)
+    return entry
+
+
+def _revalidated(response):
+    """Let clients and the site-wide page cache revalidate ``response`` on every use.
+
+    The entity tag comes from the body, and the outermost
+    ``ConditionalGetMiddleware`` answers a matching ``If-None-Match`` with
+    ``304``, so an unchanged index costs crawlers no transfer.
+    """
+    response["ETag"] = quote_etag(hashlib.sha1(response.content, usedforsecurity=False).hexdigest())
+    patch_cache_control(response, no_cache=True, max_age=0)
+    return response
+
+
+def sitemap_index(request, sitemaps, **kwargs):
+    """``/sitemap.xml``: the sitemap index (see :func:`_render_sitemap_index`).
+
+    Served from :func:`_sitemap_index_entry`, so a new shard build shows up in
+    the next response instead of after a day in the page cache.
+    """
+    content, headers = _sitemap_index_entry(request, sitemaps, **kwargs)
+    response = HttpResponse(content)
+    for name, value in headers.items():
+        response[name] = value
+    return _revalidated(response)
+
+
+def sitemap_works_shard(request, shard):
+    """Serve a prebuilt work sitemap shard (sitemap-works-<n>.xml.gz).
+
+    In production nginx can serve ``SITEMAP_DIR`` directly; this view covers
+    development and deployments without that location. Crawlers revalidating
+    with ``If-Modified-Since`` get ``304`` while the shard is unchanged.
+    """
+    path = sitemap_dir() / shard_name(shard)
+    try:
+        mtime = int(path.stat().st_mtime)
+    except OSError:
+        raise Http404("No such sitemap shard.")
+    not_modified = get_conditional_response(request, last_modified=mtime)
+    if not_modified is not None:
+        return not_modified
+    # Streamed, so the site-wide cache middleware does not copy it into the cache.
+    response = FileResponse(open(path, "rb"), content_type="application/gzip")
+    response["Last-Modified"] = http_date(mtime)
+    response["Cache-Control"] = f"public, max-age={settings.PAGE_CACHE_SHORT}"
+    return response
+
+
 def sitemap_index_gz(request, sitemaps, **kwargs):
-    """Serve the sitemap index as a gzip-compressed file (sitemap.xml.gz)."""
-    return _as_gz(sitemaps_views.index(request, sitemaps, **kwargs))
+    """Serve the sitemap index as a gzip-compressed file (sitemap.xml.gz), as current as ``/sitemap.xml``."""
+    content, headers = _sitemap_index_entry(request, sitemaps, **kwargs)
+    # mtime=0 keeps the compressed bytes, and with them the ETag, stable.
+    response = HttpResponse(_gzip.compress(content, mtime=0), content_type="application/gzip")
+    if "Last-Modified" in headers:
+        response["Last-Modified"] = headers["Last-Modified"]
+    return _revalidated(response)
 
 
 @cache_page(settings.PAGE_CACHE_SHORT, cache="memory")
@@ -10,11 +10,11 @@ Tests pagination, statistics, and work display features.
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
-from works.models import Source, Work
-from works.utils.statistics import STATS_CACHE_KEY, update_statistics_cache
+from works.models import Source, StatisticsCounters, Work
+from works.utils.statistics import reconcile_statistics
 
 User = get_user_model()
 
@@ -165,8 +165,8 @@ class WorksListViewTest(TestCase):
 
     def test_statistics_displayed(self):
         """Test that statistics are included in context"""
-        # Update statistics cache
-        update_statistics_cache()
+        # Recount the statistics counters
+        reconcile_statistics()
 
         response = self.client.get(reverse("optimap:works"))
         self.assertEqual(response.status_code, 200)
@@ -181,20 +181,20 @@ class WorksListViewTest(TestCase):
         self.assertIn("with_authors", stats)
         self.assertIn("with_doi", stats)
 
-    def test_statistics_cached(self):
-        """Test that statistics are cached"""
-        # First request should calculate and cache
-        cache.delete(STATS_CACHE_KEY)
+    @override_settings(CACHE_MIDDLEWARE_ALIAS="dummy")
+    def test_statistics_read_from_counters(self):
+        """Test that statistics are read from the counter row"""
+        # First request should recount into the counter row
+        StatisticsCounters.objects.filter(pk=1).update(reconciled_at=None)
         response1 = self.client.get(reverse("optimap:works"))
         stats1 = response1.context["statistics"]
 
-        # Second request should use cache
+        # Second request should read the row; the page cache is off, so the view runs again
         response2 = self.client.get(reverse("optimap:works"))
         stats2 = response2.context["statistics"]
 
         self.assertEqual(stats1, stats2)
-        # Verify cache was used
-        self.assertIsNotNone(cache.get(STATS_CACHE_KEY))
+        self.assertIsNotNone(StatisticsCounters.objects.get(pk=1).reconciled_at)
 
     def test_api_url_present(self):
         """Test that API URL is included in context"""
@@ -223,7 +223,7 @@ class WorksListViewTest(TestCase):
 
     def test_statistics_section_in_template(self):
         """Test that statistics section is rendered"""
-        update_statistics_cache()
+        reconcile_statistics()
         response = self.client.get(reverse("optimap:works"))
         self.assertEqual(response.status_code, 200)
 
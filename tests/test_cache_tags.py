@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for tag-based cache invalidation (works/services/cache_tags.py)."""
+
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from works.feeds import SourceGeoFeed
+from works.models import Collection, Source, Work
+from works.services.cache_tags import COLLECTION, TAGGED_RESPONSE_MAX_AGE, WORKS, bump_tags, tag, tagged_key
+from works.services.facets import SOURCE
+
+
+class TaggedKeyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_key_is_stable_until_a_tag_is_bumped(self):
+        key = tagged_key("page", ["source:1", "region:2"])
+        self.assertEqual(key, tagged_key("page", ["region:2", "source:1"]))
+        bump_tags(["region:2"])
+        self.assertNotEqual(key, tagged_key("page", ["source:1", "region:2"]))
+
+    def test_unrelated_bumps_keep_the_key(self):
+        key = tagged_key("page", ["source:1"])
+        bump_tags(["source:2"])
+        self.assertEqual(key, tagged_key("page", ["source:1"]))
+
+
+class WorkChangeBumpsTagsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.source = Source.objects.create(
+            name="Tagged Journal", slug="tagged-journal", url_field="https://e.org/oai"
+        )
+        self.work = Work.objects.create(
+            status="p",
+            title="Original title",
+            url="https://e.org/work",
+            source=self.source,
+            geometry=GeometryCollection(Point(8.0, 51.0)),
+        )
+        self.source_tag = tag(SOURCE, self.source.pk)
+
+    def test_editing_a_published_work_refreshes_the_cached_source_feed(self):
+        # Call the feed directly: the site-wide page cache in front of it is
+        # only held for TAGGED_RESPONSE_MAX_AGE seconds and is not under test.
+        feed = SourceGeoFeed(feed_type_variant="georss")
+        url = reverse("optimap:api-source-georss", kwargs={"source_slug": self.source.slug})
+
+        def fetch():
+            return feed(RequestFactory().get(url), source_slug=self.source.slug)
+
+        response = fetch()
+        self.assertIn(b"Original title", response.content)
+        self.assertIn(f"max-age={TAGGED_RESPONSE_MAX_AGE}", response["Cache-Control"])
+        self.assertIn(b"Original title", fetch().content)
+        self.work.title = "Edited title"
+        self.work.save()
+        self.assertIn(b"Edited title", fetch().content)
+
+    def test_unpublishing_bumps_the_source_and_global_tags(self):
+        source_key = tagged_key("x", [self.source_tag])
+        global_key = tagged_key("x", [WORKS])
+        self.work.status = "d"
+        self.work.save()
+        self.assertNotEqual(source_key, tagged_key("x", [self.source_tag]))
+        self.assertNotEqual(global_key, tagged_key("x", [WORKS]))
+
+    def test_saving_a_draft_leaves_public_artifacts_alone(self):
+        draft = Work.objects.create(status="h", title="Harvested", source=self.source)
+        key = tagged_key("x", [self.source_tag, WORKS])
+        draft.title = "Still harvested"
+        draft.save()
+        self.assertEqual(key, tagged_key("x", [self.source_tag, WORKS]))
+
+    def test_collection_membership_and_edits_bump_the_collection(self):
+        collection = Collection.objects.create(identifier="tagged", name="Tagged", is_published=True)
+        collection_tag = tag(COLLECTION, collection.pk)
+        key = tagged_key("x", [collection_tag])
+        self.work.collections.add(collection)
+        self.assertNotEqual(key, tagged_key("x", [collection_tag]))
+
+        key = tagged_key("x", [collection_tag])
+        collection.name = "Renamed"
+        collection.save()
+        self.assertNotEqual(key, tagged_key("x", [collection_tag]))
+
+    def test_deleting_a_published_work_bumps_its_source(self):
+        key = tagged_key("x", [self.source_tag])
+        self.work.delete()
+        self.assertNotEqual(key, tagged_key("x", [self.source_tag]))
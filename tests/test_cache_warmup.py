@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the cache warm-up (works/services/cache_warmup.py, manage.py warm_caches)."""
+
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from works.models import StatisticsCounters, Work
+from works.services import cache_warmup
+from works.views.work_views import _work_landing_cache_key
+
+
+def _work(title, **kwargs):
+    return Work.objects.create(
+        status="p", title=title, url=f"https://e.org/{title}", geometry=GeometryCollection(Point(8.0, 51.0)), **kwargs
+    )
+
+
+def _path(work):
+    return reverse("optimap:work-landing", args=[work.get_identifier()])
+
+
+class PopularWorkPathsTests(TestCase):
+    def setUp(self):
+        self.old = _work("old")
+        self.popular = _work("popular")
+        self.newest = _work("newest")
+
+    def _log(self, lines):
+        fd, path = tempfile.mkstemp(suffix=".log")
+        with os.fdopen(fd, "w") as fh:
+            fh.write("\n".join(lines) + "\n")
+        self.addCleanup(os.unlink, path)
+        return path
+
+    def _line(self, path, status=200):
+        return f'1.2.3.4 - - [19/Oct/2026:10:00:00 +0000] "GET {path} HTTP/1.1" {status} 512 "-" "Mozilla/5.0"'
+
+    def test_ranks_logged_requests_first(self):
+        log = self._log(
+            [self._line(_path(self.popular))] * 3
+            + [self._line(_path(self.old)), self._line("/about/"), self._line(_path(self.newest), status=404)]
+            + [self._line(_path(self.newest) + "preview.png")] * 5
+        )
+        paths = cache_warmup.popular_work_paths(2, access_log=log)
+        self.assertEqual(paths, [_path(self.popular), _path(self.old)])
+
+    def test_fills_up_with_recently_updated_works(self):
+        log = self._log([self._line(_path(self.old))])
+        paths = cache_warmup.popular_work_paths(3, access_log=log)
+        self.assertEqual(paths, [_path(self.old), _path(self.newest), _path(self.popular)])
+
+    def test_missing_log_falls_back_to_recency(self):
+        paths = cache_warmup.popular_work_paths(2, access_log="/nonexistent/optimap-access.log")
+        self.assertEqual(paths, [_path(self.newest), _path(self.popular)])
+
+
+@override_settings(BASE_URL="https://optimap.example.org")
+class WarmCachesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.work = _work("warmed")
+
+    def test_builds_statistics_and_landing_pages(self):
+        results = cache_warmup.warm_caches(["statistics", "works"], workers=1, works=5)
+        self.assertEqual({r["status"] for r in results}, {"ok"})
+        self.assertEqual([r["stage"] for r in results], ["statistics", "works"])
+        self.assertIsNotNone(StatisticsCounters.objects.get(pk=1).reconciled_at)
+        self.work.refresh_from_db()
+        request = RequestFactory().get(_path(self.work), HTTP_HOST="optimap.example.org", secure=True)
+        self.assertTrue(cache.has_key(_work_landing_cache_key(self.work, request)))
+
+    @override_settings(CACHE_WARMUP_ACCEPT_ENCODING="gzip, deflate, br")
+    def test_fills_the_page_cache_for_browsers(self):
+        results = cache_warmup.warm_caches(["works"], workers=1, works=5)
+        self.assertEqual({r["status"] for r in results}, {"ok"})
+        self.work.refresh_from_db()
+        # A page cache hit answers before the view renders anything.
+        with mock.patch("works.views.work_views.render", side_effect=AssertionError("page cache missed")):
+            response = self.client.get(
+                _path(self.work),
+                HTTP_HOST="optimap.example.org",
+                HTTP_ACCEPT_ENCODING="gzip, deflate, br",
+                secure=True,
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_a_failing_artifact_does_not_stop_later_stages(self):
+        with mock.patch("works.utils.statistics.get_statistics", side_effect=RuntimeError("boom")):
+            results = cache_warmup.warm_caches(["statistics", "works"], workers=1, works=5)
+        self.assertEqual([(r["stage"], r["status"]) for r in results], [("statistics", "failed"), ("works", "ok")])
+
+    def test_command_reports_every_artifact(self):
+        out = StringIO()
+        call_command("warm_caches", only=["statistics", "feeds"], workers=1, stdout=out)
+        output = out.getvalue()
+        self.assertIn("statistics", output)
+        self.assertIn("feeds", output)
+        self.assertIn("Done in", output)
+
+    def test_async_enqueues_the_task(self):
+        with mock.patch("django_q.tasks.async_task", return_value="abc") as async_task:
+            call_command("warm_caches", "--async", only=["feeds"], stdout=StringIO())
+        async_task.assert_called_once_with("works.tasks.warm_caches", ["feeds"], works=None, access_log=None)
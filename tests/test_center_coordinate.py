@@ -11,6 +11,8 @@ Tests center coordinate calculation for different geometry types:
 - GeometryCollection
 """
 
+from io import StringIO
+
 from django.contrib.gis.geos import GeometryCollection, LineString, Point, Polygon
 from django.test import TestCase
 
@@ -686,3 +688,68 @@ class GlobalFeedsFixtureTest(TestCase):
         self.assertLess(lon, 55)
         self.assertGreater(lat, 18)
         self.assertLess(lat, 25)
+
+
+class StoredSpatialSummaryTest(TestCase):
+    """The extent columns are written on save and read without spatial queries."""
+
+    def test_columns_written_on_save(self):
+        work = Work.objects.create(
+            title="Stored extent",
+            status="p",
+            geometry=GeometryCollection(LineString((0.0, 0.0), (10.0, 4.0))),
+        )
+        work.refresh_from_db()
+        self.assertEqual(work.bbox.extent, (0.0, 0.0, 10.0, 4.0))
+        self.assertEqual(work.bbox_center.coords, (5.0, 2.0))
+        self.assertEqual(work.extreme_north.coords, (10.0, 4.0))
+        self.assertEqual(work.extreme_west.coords, (0.0, 0.0))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(work.get_center_coordinate(), (5.0, 2.0))
+            self.assertEqual(work.get_extreme_points()["east"], (10.0, 4.0))
+
+    def test_targeted_geometry_save_updates_columns(self):
+        work = Work.objects.create(title="Moved", status="p", geometry=GeometryCollection(Point(1.0, 1.0)))
+        work.geometry = GeometryCollection(Point(7.0, 8.0))
+        work.save(update_fields=["geometry"])
+        work.refresh_from_db()
+        self.assertEqual(work.bbox_center.coords, (7.0, 8.0))
+
+    def test_clearing_geometry_clears_columns(self):
+        work = Work.objects.create(title="Cleared", status="p", geometry=GeometryCollection(Point(1.0, 1.0)))
+        work.geometry = None
+        work.save()
+        work.refresh_from_db()
+        self.assertIsNone(work.bbox)
+        self.assertIsNone(work.extreme_north)
+
+    def test_backfill_command_fills_missing_rows(self):
+        from django.core.management import call_command
+
+        work = Work.objects.create(title="Legacy", status="p", geometry=GeometryCollection(Point(3.0, 4.0)))
+        # Simulate a row saved before the columns existed.
+        Work.objects.filter(pk=work.pk).update(bbox=None, bbox_center=None, extreme_north=None)
+        call_command("backfill_derived_geometry", columns="summary", stdout=StringIO())
+        work.refresh_from_db()
+        self.assertEqual(work.bbox_center.coords, (3.0, 4.0))
+        self.assertEqual(work.extreme_north.coords, (3.0, 4.0))
+
+    def test_backfill_command_fills_every_column_set_by_default(self):
+        from django.core.management import call_command
+
+        work = Work.objects.create(title="Legacy", status="p", geometry=GeometryCollection(Point(3.0, 4.0)))
+        Work.objects.filter(pk=work.pk).update(bbox_center=None, geometry_geojson=None)
+        out = StringIO()
+        call_command("backfill_derived_geometry", stdout=out)
+        work.refresh_from_db()
+        self.assertEqual(work.bbox_center.coords, (3.0, 4.0))
+        self.assertIsNotNone(work.geometry_geojson)
+        for name in ("summary", "simplified", "geojson"):
+            self.assertIn(f"{name}: processed", out.getvalue())
+
+    def test_backfill_command_rejects_unknown_column_sets(self):
+        from django.core.management import CommandError, call_command
+
+        with self.assertRaises(CommandError):
+            call_command("backfill_derived_geometry", columns="summary,extent", stdout=StringIO())
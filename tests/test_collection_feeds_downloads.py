@@ -9,7 +9,7 @@ import xml.etree.ElementTree as ET
 
 from django.contrib.auth import get_user_model
 from django.contrib.gis.geos import GeometryCollection, Point, Polygon
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from osgeo import ogr
 
@@ -281,21 +281,21 @@ class CollectionDownloadTests(_CollectionFixtureMixin, TestCase):
     # --- GeoJSON content ---
 
     def test_geojson_is_valid_feature_collection(self):
-        data = json.loads(self.client.get(self._url("geojson")).content)
+        data = json.loads(self.client.get(self._url("geojson")).getvalue())
         self.assertEqual(data["type"], "FeatureCollection")
         self.assertIn("features", data)
 
     def test_geojson_includes_published_work(self):
-        body = self.client.get(self._url("geojson")).content.decode()
+        body = self.client.get(self._url("geojson")).getvalue().decode()
         self.assertIn("Published with geometry", body)
 
     def test_geojson_includes_published_work_without_geometry(self):
         # Downloads include all published works; geometry is optional.
-        body = self.client.get(self._url("geojson")).content.decode()
+        body = self.client.get(self._url("geojson")).getvalue().decode()
         self.assertIn("Published no geometry", body)
 
     def test_geojson_excludes_unpublished_work(self):
-        body = self.client.get(self._url("geojson")).content.decode()
+        body = self.client.get(self._url("geojson")).getvalue().decode()
         self.assertNotIn("Harvested work", body)
 
     # --- GeoPackage / CSV basic sanity ---
@@ -311,7 +311,7 @@ class CollectionDownloadTests(_CollectionFixtureMixin, TestCase):
     def test_now_param_still_returns_200(self):
         resp = self.client.get(self._url("geojson") + "?now")
         self.assertEqual(resp.status_code, 200)
-        data = json.loads(resp.content)
+        data = json.loads(resp.getvalue())
         self.assertEqual(data["type"], "FeatureCollection")
 
 
@@ -572,7 +572,7 @@ class CollectionDownloadGeometryTests(_CollectionFixtureMixin, TestCase):
 
     def _geojson(self, slug="test-col"):
         return json.loads(
-            self.client.get(reverse("optimap:download-collection-geojson", args=[slug]) + "?now").content
+            self.client.get(reverse("optimap:download-collection-geojson", args=[slug]) + "?now").getvalue()
         )
 
     def test_point_geometry_is_unwrapped(self):
@@ -582,6 +582,36 @@ class CollectionDownloadGeometryTests(_CollectionFixtureMixin, TestCase):
             "GeometryCollection", geo_types, "GeoJSON export must not contain raw GeometryCollection wrappers"
         )
 
+    def test_geojson_download_is_streamed(self):
+        response = self.client.get(reverse("optimap:download-collection-geojson", args=["test-col"]))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/geo+json")
+        self.assertIn("optimap_collection_test-col.geojson", response["Content-Disposition"])
+        self.assertEqual(len(json.loads(response.getvalue())["features"]), 2)
+
+    def test_geojson_download_is_cached_once_complete(self):
+        url = reverse("optimap:download-collection-geojson", args=["test-col"])
+        streamed = self.client.get(url).getvalue()
+        cached = self.client.get(url)
+        self.assertFalse(cached.streaming)
+        self.assertEqual(cached.content, streamed)
+        self.assertTrue(self.client.get(url + "?now").streaming)
+
+    @override_settings(COLLECTION_GEOJSON_CACHE_MAX_BYTES=100)
+    def test_geojson_download_over_the_size_cap_is_not_cached(self):
+        url = reverse("optimap:download-collection-geojson", args=["test-col"])
+        self.assertGreater(len(self.client.get(url).getvalue()), 100)
+        self.assertTrue(self.client.get(url).streaming)
+
+    def test_cached_geojson_download_follows_collection_changes(self):
+        url = reverse("optimap:download-collection-geojson", args=["test-col"])
+        self.client.get(url).getvalue()
+        work = Work.objects.create(title="Added later", status="p", url="https://example.com/added-later")
+        self.col.works.add(work)
+        response = self.client.get(url)
+        self.assertTrue(response.streaming)
+        self.assertIn(b"Added later", response.getvalue())
+
     def test_point_feature_has_point_type(self):
         data = self._geojson()
         # pub_geo is a single-point GeometryCollection — must unwrap to Point.
@@ -614,7 +644,8 @@ class CollectionGdalValidationTests(_CollectionFixtureMixin, TestCase):
         url = reverse(f"optimap:download-collection-{fmt}", args=[slug]) + "?now"
         resp = self.client.get(url)
         self.assertEqual(resp.status_code, 200)
-        return resp.content
+        # The GeoJSON download is streamed; getvalue() reads either kind of response.
+        return resp.getvalue()
 
     # --- GeoJSON ---
 
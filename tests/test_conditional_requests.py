@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for ETag / Last-Modified conditional GET on the read-only API."""
+
+import time
+from unittest import mock
+
+from django.contrib.gis.geos import GeometryCollection, MultiPolygon, Point, Polygon
+from django.core.cache import cache
+from django.test import TestCase
+
+from works.models import Collection, Country, Source, Work
+
+WORKS = "/api/v1/works/"
+
+
+class ConditionalWorksTests(TestCase):
+    """Through the full middleware stack, site-wide page cache included."""
+
+    def setUp(self):
+        cache.clear()
+        self.work = Work.objects.create(
+            status="p", title="Conditional work", doi="10.1234/cond", geometry=GeometryCollection(Point(8, 51))
+        )
+
+    def test_list_carries_validators(self):
+        response = self.client.get(WORKS)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get(WORKS)["ETag"]
+        response = self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_validation_runs_no_queries(self):
+        etag = self.client.get(WORKS)["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_saving_a_work_changes_the_etag(self):
+        etag = self.client.get(WORKS)["ETag"]
+        self.work.title = "Edited"
+        self.work.save()
+        response = self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertContains(response, "Edited")
+
+    def test_query_parameters_have_their_own_etag(self):
+        etag = self.client.get(WORKS)["ETag"]
+        response = self.client.get(WORKS + "?minimal=true", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(WORKS)["Last-Modified"]
+        response = self.client.get(WORKS, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_unpublishing_moves_last_modified(self):
+        last_modified = self.client.get(WORKS)["Last-Modified"]
+        later = time.time_ns() + 5 * 10**9
+        with mock.patch("works.services.cache_tags.time.time_ns", return_value=later):
+            self.work.status = "d"
+            self.work.save()
+        response = self.client.get(WORKS, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Conditional work")
+
+    def test_detail_is_conditional(self):
+        url = f"{WORKS}{self.work.pk}/"
+        etag = self.client.get(url)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_missing_work_is_still_404(self):
+        self.assertEqual(self.client.get(f"{WORKS}999999/", HTTP_IF_NONE_MATCH='"x"').status_code, 404)
+
+    def test_deleting_a_work_changes_the_etag(self):
+        etag = self.client.get(WORKS)["ETag"]
+        self.work.delete()
+        self.assertEqual(self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_bulk_publish_changes_the_etag(self):
+        from works.admin import make_public
+
+        draft = Work.objects.create(status="d", title="Draft", geometry=GeometryCollection(Point(9, 52)))
+        etag = self.client.get(WORKS)["ETag"]
+        make_public(None, None, Work.objects.filter(pk=draft.pk))
+        self.assertEqual(self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_collection_membership_changes_the_etag(self):
+        collection = Collection.objects.create(name="Conditional", identifier="conditional", is_published=True)
+        etag = self.client.get(WORKS)["ETag"]
+        self.work.collections.add(collection)
+        self.assertEqual(self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_source_edit_changes_the_etag(self):
+        source = Source.objects.create(name="Old name", url_field="https://e.org/oai")
+        Work.objects.filter(pk=self.work.pk).update(source=source)
+        etag = self.client.get(WORKS)["ETag"]
+        source.name = "New name"
+        source.save()
+        response = self.client.get(WORKS, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class ConditionalCountriesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.country = Country.objects.create(
+            name="Squareland",
+            iso_code="SQ",
+            geom=MultiPolygon(Polygon(((0, 0), (1, 0), (1, 1), (0, 1), (0, 0)))),
+        )
+
+    def test_unchanged_countries_are_not_modified(self):
+        etag = self.client.get("/api/v1/countries/")["ETag"]
+        self.assertEqual(self.client.get("/api/v1/countries/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_reloading_a_country_changes_the_etag(self):
+        etag = self.client.get("/api/v1/countries/")["ETag"]
+        self.country.save()
+        self.assertEqual(self.client.get("/api/v1/countries/", HTTP_IF_NONE_MATCH=etag).status_code, 200)
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the orjson-backed renderer/parser (``works.renderers``) and ``encode_json``."""
+
+import datetime
+import io
+import json
+from decimal import Decimal
+
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from works.models import Work
+from works.renderers import FastJSONParser, FastJSONRenderer, RawJSONAwareEncoder
+from works.utils.geojson import RawJSON, encode_json
+
+SAMPLE = {
+    "geometry": RawJSON('{"type":"Point","coordinates":[7.5,51.0]}'),
+    "title": "Münster",
+    "price": Decimal("1.50"),
+    "when": datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+    "day": datetime.date(2026, 1, 2),
+    "label": gettext_lazy("Published"),
+    "counts": {1: 2},
+}
+
+
+class _StdlibRenderer(JSONRenderer):
+    encoder_class = RawJSONAwareEncoder
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_output_matches_the_stdlib_renderer(self):
+        fast = json.loads(FastJSONRenderer().render(SAMPLE, "application/json"))
+        stdlib = json.loads(_StdlibRenderer().render(SAMPLE, "application/json"))
+        self.assertEqual(fast, stdlib)
+        self.assertEqual(fast["geometry"], {"type": "Point", "coordinates": [7.5, 51.0]})
+        self.assertEqual(fast["when"], "2026-01-02T03:04:05.678Z")
+
+    def test_line_separators_are_escaped_like_the_stdlib_renderer(self):
+        data = {"abstract": "one\u2028two\u2029three"}
+        fast = FastJSONRenderer().render(data, "application/json")
+        self.assertEqual(fast, _StdlibRenderer().render(data, "application/json"))
+        self.assertIn(b"one\\u2028two\\u2029three", fast)
+        self.assertEqual(json.loads(fast), data)
+
+    def test_raw_json_is_spliced_verbatim(self):
+        self.assertIn(b'{"type":"Point","coordinates":[7.5,51.0]}', encode_json(SAMPLE, cls=RawJSONAwareEncoder))
+
+    def test_indented_output_is_still_available(self):
+        body = FastJSONRenderer().render({"a": 1}, "application/json; indent=4")
+        self.assertTrue(body.startswith(b'{\n    "a"'))
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def test_parses_json(self):
+        self.assertEqual(FastJSONParser().parse(io.BytesIO('{"a": [1, "ü"]}'.encode())), {"a": [1, "ü"]})
+
+    def test_invalid_json_is_a_parse_error(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b"{not json"))
+
+
+class WorksApiRenderingTests(TestCase):
+    def test_works_page_renders_stored_geometry(self):
+        Work.objects.create(status="p", title="Rendered", geometry=GeometryCollection(Point(7.123456789, 51.0)))
+        response = self.client.get("/api/v1/works/?limit=999", HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        feature = response.json()["results"]["features"][0]
+        self.assertEqual(feature["geometry"]["geometries"][0]["coordinates"], [7.12346, 51.0])
@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for background feed rendering (works/services/feed_prerender.py)."""
+
+from unittest.mock import patch
+
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from works.feeds import BaseCachedGeoFeed
+from works.models import Source, Work
+from works.services import feed_prerender
+
+
+@override_settings(BASE_URL="https://optimap.example.org")
+class FeedPrerenderTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.source = Source.objects.create(
+            name="Prerendered Journal", slug="prerendered", url_field="https://e.org/oai"
+        )
+        self.work = Work.objects.create(
+            status="p",
+            title="Prerendered work",
+            url="https://e.org/work",
+            source=self.source,
+            geometry=GeometryCollection(Point(8.0, 51.0)),
+        )
+        # Creating the published work already queued a pre-render; start without one.
+        cache.clear()
+
+    def test_renders_global_and_source_feeds_once(self):
+        counts = feed_prerender.prerender_feeds()
+        self.assertEqual(counts["failed"], 0)
+        self.assertGreaterEqual(counts["rendered"], 4)  # global and source, both variants
+        again = feed_prerender.prerender_feeds()
+        self.assertEqual(again["rendered"], 0)
+        self.assertEqual(again["cached"], counts["rendered"])
+
+    def test_requests_are_served_from_the_prerendered_entry(self):
+        feed_prerender.prerender_feeds()
+        with patch.object(BaseCachedGeoFeed, "render", side_effect=AssertionError("rendered on request")):
+            response = self.client.get("/api/v1/feeds/optimap-global.rss")
+            source_response = self.client.get(f"/api/v1/feeds/source-{self.source.slug}.atom")
+        self.assertContains(response, "Prerendered work")
+        self.assertContains(response, "https://optimap.example.org/api/v1/feeds/optimap-global.rss")
+        self.assertContains(source_response, "Prerendered work")
+
+    def test_only_retired_feeds_are_rendered_again(self):
+        feed_prerender.prerender_feeds()
+        self.work.title = "Edited work"
+        self.work.save()
+        counts = feed_prerender.prerender_feeds()
+        self.assertEqual(counts["rendered"], 4)
+        self.assertContains(self.client.get("/api/v1/feeds/optimap-global.atom"), "Edited work")
+
+    @patch("django_q.tasks.async_task")
+    def test_runs_are_debounced(self, mock_async):
+        feed_prerender.schedule_feed_prerender()
+        feed_prerender.schedule_feed_prerender()
+        mock_async.assert_called_once_with("works.tasks.prerender_feeds")
@@ -12,6 +12,7 @@ import xml.etree.ElementTree as ET
 from datetime import datetime
 
 from django.contrib.gis.geos import GeometryCollection, LineString, Point, Polygon
+from django.core.cache import cache
 from django.test import TestCase
 from xmldiff import formatting
 from xmldiff import main as xmldiff_main
@@ -168,3 +169,72 @@ class GeoFeedTestCase(TestCase):
         point_texts = [point.text for point in points]
 
         self.assertIn(expected_point, point_texts, f"Expected point '{expected_point}' not found in feed")
+
+
+class FeedConditionalGetTests(TestCase):
+    """ETag / Last-Modified validators and 304 answers for polling feed readers."""
+
+    url = "/api/v1/feeds/optimap-global.rss"
+
+    def setUp(self):
+        cache.clear()
+        self.work = Work.objects.create(
+            title="Polled work",
+            url="https://example.com/polled",
+            status="p",
+            geometry=GeometryCollection(Point(8.0, 51.0)),
+        )
+
+    def test_feed_carries_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(self.url)["Last-Modified"]
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_work_changes_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        Work.objects.create(
+            title="Newer work", url="https://example.com/newer", status="p", geometry=GeometryCollection(Point(9, 52))
+        )
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn(b"Newer work", response.content)
+
+    def test_unpublished_work_changes_the_etag(self):
+        other = Work.objects.create(
+            title="Retracted work",
+            url="https://example.com/retracted",
+            status="p",
+            geometry=GeometryCollection(Point(9, 52)),
+        )
+        etag = self.client.get(self.url)["ETag"]
+        other.status = "d"
+        other.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotIn(b"Retracted work", response.content)
+
+    def test_rerender_of_unchanged_feed_keeps_the_validators(self):
+        first = self.client.get(self.url)
+        second = self.client.get(self.url + "?now")
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(second["Last-Modified"], first["Last-Modified"])
+
+    def test_feed_stays_out_of_the_page_cache(self):
+        response = self.client.get(self.url)
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("max-age=0", response["Cache-Control"])
@@ -137,6 +137,21 @@ class GlobalFeedsAndLandingPageTests(TestCase):
                 f"GeoRSS feed for {region.name} returned {titles!r}, expected {expected_titles!r}",
             )
 
+    def test_region_feed_reads_works_in_one_limited_query(self):
+        """The feed reads the persisted region links, not every overlapping work."""
+        from django.core.cache import cache
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        cache.clear()
+        url = reverse("optimap:api-ocean-georss", kwargs={"ocean_slug": "north-atlantic-ocean"})
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        work_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "works_work"' in q["sql"]]
+        self.assertEqual(len(work_queries), 1, work_queries)
+        self.assertIn("LIMIT", work_queries[0])
+        self.assertNotIn('"provenance"', work_queries[0])
+
     def test_geoatom_feed_australia(self):
         # Use new API v1 Atom endpoint
         url = reverse("optimap:api-continent-atom", kwargs={"continent_slug": "australia"})
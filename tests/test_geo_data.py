@@ -19,6 +19,7 @@ from works.tasks import (
     convert_geojson_to_geopackage,
     regenerate_all_data_dumps,
     regenerate_csv_cache,
+    regenerate_flatgeobuf_cache,
     regenerate_geojson_cache,
     regenerate_geopackage_cache,
 )
@@ -129,6 +130,18 @@ class GeoDataAlternativeTestCase(TestCase):
         )
         self.assertRegex(response["Content-Disposition"], r"optimap_data_dump_.*\.geojson\.gz")
 
+    def test_download_geojson_follows_work_changes(self):
+        regenerate_geojson_cache()
+        url = reverse("optimap:download_geojson")
+        Work.objects.create(
+            title="Published after the dump",
+            status="p",
+            url="http://example.com/after",
+            geometry="GEOMETRYCOLLECTION(POINT(10.5 50.5))",
+        )
+        body = b"".join(self.client.get(url).streaming_content)
+        self.assertIn(b"Published after the dump", body)
+
     def test_download_geopackage_endpoint(self):
         url = reverse("optimap:download_geopackage")
         response = self.client.get(url)
@@ -253,13 +266,84 @@ class GeoDataAlternativeTestCase(TestCase):
         self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
         self.assertRegex(response["Content-Disposition"], r"optimap_data_dump_.*\.csv")
 
+    def test_flatgeobuf_dump_is_readable(self):
+        pub = Work.objects.first()
+        pub.status = "p"
+        pub.save()
+
+        fgb_path = regenerate_flatgeobuf_cache()
+        self.assertIsNotNone(fgb_path, "GDAL FlatGeobuf conversion should succeed")
+        self.assertTrue(fgb_path.endswith(".fgb"))
+        with fiona.open(fgb_path) as layer:
+            self.assertEqual(len(layer), Work.objects.filter(status="p").count())
+            self.assertIn("title", layer.schema["properties"])
+            # Same layer as the ?format=fgb API output.
+            self.assertEqual(layer.name, "works")
+
+    def test_download_flatgeobuf_supports_range_requests(self):
+        fgb_path = Path(regenerate_flatgeobuf_cache())
+        size = fgb_path.stat().st_size
+        url = reverse("optimap:download_flatgeobuf")
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/flatgeobuf")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(b"".join(response.streaming_content), fgb_path.read_bytes())
+
+        response = self.client.get(url, HTTP_RANGE="bytes=0-7")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 0-7/{size}")
+        self.assertEqual(response.content[:3], b"fgb")
+
+        response = self.client.get(url, HTTP_RANGE=f"bytes={size + 10}-")
+        self.assertEqual(response.status_code, 416)
+
+    def test_download_flatgeobuf_honours_if_range(self):
+        fgb_path = Path(regenerate_flatgeobuf_cache())
+        url = reverse("optimap:download_flatgeobuf")
+        full = self.client.get(url)
+        etag, last_modified = full["ETag"], full["Last-Modified"]
+
+        for validator in (etag, last_modified):
+            response = self.client.get(url, HTTP_RANGE="bytes=0-7", HTTP_IF_RANGE=validator)
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(response["ETag"], etag)
+
+        # The client's copy is of another dump: it gets the whole current file.
+        response = self.client.get(url, HTTP_RANGE="bytes=0-7", HTTP_IF_RANGE='"an-older-dump"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), fgb_path.read_bytes())
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_download_flatgeobuf_resumes_for_gzip_clients(self):
+        fgb_path = Path(regenerate_flatgeobuf_cache())
+        data = fgb_path.read_bytes()
+        url = reverse("optimap:download_flatgeobuf")
+
+        full = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(full["Content-Encoding"], "identity")
+        self.assertFalse(full["ETag"].startswith("W/"))
+        self.assertEqual(b"".join(full.streaming_content), data)
+
+        # A browser resuming after the first 100 bytes.
+        response = self.client.get(
+            url, HTTP_ACCEPT_ENCODING="gzip", HTTP_RANGE="bytes=100-", HTTP_IF_RANGE=full["ETag"]
+        )
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Encoding"], "identity")
+        self.assertEqual(response["Content-Range"], f"bytes 100-{len(data) - 1}/{len(data)}")
+        self.assertEqual(response.content, data[100:])
+
     def test_regenerate_all_data_dumps_creates_all_three(self):
         cache_dir = Path(tempfile.gettempdir()) / "optimap_cache"
         for f in cache_dir.glob("optimap_data_dump_*"):
             f.unlink()
 
         result = regenerate_all_data_dumps()
-        self.assertSetEqual(set(result.keys()), {"geojson", "gpkg", "csv"})
+        self.assertSetEqual(set(result.keys()), {"geojson", "gpkg", "csv", "fgb"})
         for fmt, path in result.items():
             self.assertIsNotNone(path, f"{fmt} dump should be produced")
             self.assertTrue(Path(path).exists(), f"{fmt} dump file should exist on disk")
@@ -2,15 +2,23 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import json
+import math
 
+from django.contrib.gis.geos import GeometryCollection, Point, Polygon
 from django.test import TestCase
 
 from works.models import Source, Work
+from works.utils.geojson import RawJSON, RawJSONEncoder, publications_to_geojson
 from works.utils.geometry import (
     COORDINATE_PRECISION,
+    SIMPLIFIED_GEOMETRY_FIELDS,
     annotate_rounded_geometry,
+    geojson_texts,
+    geometry_for_band,
+    resolve_simplify_band,
     round_geojson_coordinates,
     sanitize_geojson_geometry,
+    simplified_geometries,
 )
 
 
@@ -130,3 +138,155 @@ class AnnotateRoundedGeometryTests(TestCase):
         db_rounded = json.loads(annotated._rounded_geojson)
         python_rounded = round_geojson_coordinates(json.loads(self.work.geometry.geojson))
         self.assertEqual(db_rounded, python_rounded)
+
+    def test_annotation_reads_the_text_stored_on_save(self):
+        self.work.refresh_from_db()
+        self.assertEqual(
+            json.loads(self.work.geometry_geojson), round_geojson_coordinates(json.loads(self.work.geometry.geojson))
+        )
+        # A marker value proves the annotation reads the column instead of running ST_AsGeoJSON.
+        Work.objects.filter(pk=self.work.pk).update(geometry_geojson='{"type":"GeometryCollection","geometries":[]}')
+        annotated = annotate_rounded_geometry(Work.objects.filter(pk=self.work.pk)).get()
+        self.assertEqual(annotated._rounded_geojson, '{"type":"GeometryCollection","geometries":[]}')
+
+    def test_annotation_falls_back_to_postgis_for_rows_without_text(self):
+        Work.objects.filter(pk=self.work.pk).update(geometry_geojson=None)
+        annotated = annotate_rounded_geometry(Work.objects.filter(pk=self.work.pk)).get()
+        self.assertEqual(
+            json.loads(annotated._rounded_geojson), round_geojson_coordinates(json.loads(self.work.geometry.geojson))
+        )
+
+
+class GeojsonTextTests(TestCase):
+    def test_texts_are_rounded_and_unwrapped(self):
+        texts = geojson_texts(GeometryCollection(Point(7.123456789, 51.0), srid=4326))
+        self.assertEqual(
+            json.loads(texts["geometry_geojson"]),
+            {"type": "GeometryCollection", "geometries": [{"type": "Point", "coordinates": [7.12346, 51.0]}]},
+        )
+        self.assertEqual(
+            json.loads(texts["geometry_geojson_unwrapped"]), {"type": "Point", "coordinates": [7.12346, 51.0]}
+        )
+
+    def test_same_type_members_become_multi_geometry(self):
+        texts = geojson_texts(GeometryCollection(Point(1, 2), Point(3, 4), srid=4326))
+        self.assertEqual(json.loads(texts["geometry_geojson_unwrapped"])["type"], "MultiPoint")
+
+    def test_missing_and_empty_geometry(self):
+        self.assertEqual(geojson_texts(None), {"geometry_geojson": None, "geometry_geojson_unwrapped": None})
+        texts = geojson_texts(GeometryCollection(srid=4326))
+        self.assertEqual(json.loads(texts["geometry_geojson"]), {"type": "GeometryCollection", "geometries": []})
+        self.assertIsNone(texts["geometry_geojson_unwrapped"])
+
+    def test_save_keeps_text_in_step_with_geometry(self):
+        work = Work.objects.create(
+            title="Moving work", url="https://example.com/moving", geometry=GeometryCollection(Point(1, 1))
+        )
+        work.geometry = GeometryCollection(Point(2, 2))
+        work.save(update_fields=["geometry"])
+        work.refresh_from_db()
+        self.assertEqual(json.loads(work.geometry_geojson_unwrapped), {"type": "Point", "coordinates": [2, 2]})
+
+
+class RawJSONTests(TestCase):
+    def test_raw_text_is_spliced_verbatim(self):
+        encoded = json.dumps(
+            {"geometry": RawJSON('{"type":"Point","coordinates":[1,2]}'), "title": "é"}, cls=RawJSONEncoder
+        )
+        self.assertEqual(encoded, '{"geometry": {"type":"Point","coordinates":[1,2]}, "title": "\\u00e9"}')
+
+    def test_publications_to_geojson_embeds_stored_geometry(self):
+        Work.objects.create(
+            title="Stored geometry",
+            url="https://example.com/stored",
+            status="p",
+            geometry=GeometryCollection(Point(7.123456789, 51.0)),
+        )
+        data = json.loads(publications_to_geojson(annotate_rounded_geometry(Work.objects.all())))
+        self.assertEqual(data["features"][0]["geometry"]["geometries"][0]["coordinates"], [7.12346, 51.0])
+
+    def test_publications_to_geojson_streams_querysets_like_lists(self):
+        Work.objects.create(title="With geometry", status="p", geometry=GeometryCollection(Point(7.0, 51.0)))
+        Work.objects.create(title="Without geometry", status="p")
+        works = annotate_rounded_geometry(Work.objects.order_by("pk"))
+        streamed = publications_to_geojson(works)
+        self.assertEqual(streamed, publications_to_geojson(list(works)))
+        self.assertEqual([f["properties"]["title"] for f in json.loads(streamed)["features"]], ["With geometry"])
+
+
+def _circle(cx, cy, radius, n=720):
+    """A densely digitized polygon, standing in for a detailed coastline outline."""
+    ring = [
+        (cx + radius * math.cos(2 * math.pi * i / n), cy + radius * math.sin(2 * math.pi * i / n)) for i in range(n)
+    ]
+    ring.append(ring[0])
+    return Polygon(ring, srid=4326)
+
+
+class SimplifiedGeometriesTests(TestCase):
+    def test_detailed_polygon_gets_coarser_per_band(self):
+        geom = GeometryCollection(_circle(10, 50, 1.0), srid=4326)
+        result = simplified_geometries(geom)
+        counts = [result[field].num_coords for field in SIMPLIFIED_GEOMETRY_FIELDS]
+        self.assertLess(counts[0], counts[1])
+        self.assertLess(counts[1], counts[2])
+        self.assertLess(counts[2], geom.num_coords)
+        for field in SIMPLIFIED_GEOMETRY_FIELDS:
+            self.assertEqual(result[field].geom_type, "GeometryCollection")
+            self.assertEqual(result[field].srid, 4326)
+            self.assertTrue(result[field].valid)
+
+    def test_points_are_not_duplicated(self):
+        result = simplified_geometries(GeometryCollection(Point(1, 2), Point(3, 4), srid=4326))
+        self.assertEqual(result, dict.fromkeys(SIMPLIFIED_GEOMETRY_FIELDS))
+
+    def test_empty_and_missing_geometry(self):
+        self.assertEqual(simplified_geometries(None), dict.fromkeys(SIMPLIFIED_GEOMETRY_FIELDS))
+        self.assertEqual(simplified_geometries(GeometryCollection()), dict.fromkeys(SIMPLIFIED_GEOMETRY_FIELDS))
+
+    def test_resolve_simplify_band(self):
+        self.assertIsNone(resolve_simplify_band())
+        self.assertIsNone(resolve_simplify_band("none"))
+        self.assertEqual(resolve_simplify_band("Medium"), "medium")
+        self.assertEqual(resolve_simplify_band(zoom="2"), "low")
+        self.assertEqual(resolve_simplify_band(zoom="6"), "medium")
+        self.assertEqual(resolve_simplify_band(zoom="12"), "high")
+        self.assertIsNone(resolve_simplify_band(zoom="15"))
+        # An explicit band wins over the zoom level.
+        self.assertEqual(resolve_simplify_band("high", zoom="2"), "high")
+        with self.assertRaises(ValueError):
+            resolve_simplify_band("ultra")
+        with self.assertRaises(ValueError):
+            resolve_simplify_band(zoom="far")
+
+
+class StoredSimplifiedGeometryTests(TestCase):
+    def test_save_maintains_simplified_columns(self):
+        work = Work.objects.create(
+            title="Detailed outline",
+            url="https://example.com/simplified",
+            status="p",
+            geometry=GeometryCollection(_circle(10, 50, 1.0), srid=4326),
+        )
+        work.refresh_from_db()
+        self.assertIsNotNone(work.geometry_low)
+        self.assertLess(work.geometry_low.num_coords, work.geometry.num_coords)
+
+        work.geometry = GeometryCollection(Point(5, 5), srid=4326)
+        work.save(update_fields=["geometry"])
+        work.refresh_from_db()
+        for field in SIMPLIFIED_GEOMETRY_FIELDS:
+            self.assertIsNone(getattr(work, field))
+
+    def test_band_annotation_falls_back_to_full_geometry(self):
+        Work.objects.create(
+            title="Point work",
+            url="https://example.com/simplified-point",
+            status="p",
+            geometry=GeometryCollection(Point(7.5, 51.5), srid=4326),
+        )
+        work = annotate_rounded_geometry(Work.objects.all(), geo_field=geometry_for_band("low")).get()
+        self.assertEqual(
+            json.loads(work._rounded_geojson),
+            {"type": "GeometryCollection", "geometries": [{"type": "Point", "coordinates": [7.5, 51.5]}]},
+        )
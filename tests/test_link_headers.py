@@ -140,6 +140,74 @@ class LinkHeaderQueryParamPreservationTests(TestCase):
         self.assertIn("limit=2", links["last"])
 
 
+class CursorPaginationTests(TestCase):
+    """?pagination=cursor walks the list by (creationDate, id) keyset with next links."""
+
+    def setUp(self):
+        _make_works(7)
+
+    def _walk(self, url):
+        titles, pages = [], 0
+        while url:
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200)
+            body = resp.json()
+            self.assertNotIn("count", body)
+            titles.extend(f["properties"]["title"] for f in body["results"]["features"])
+            links = _parse_link_header(resp.get("Link", ""))
+            self.assertEqual(links.get("next"), body["next"])
+            url = body["next"]
+            pages += 1
+        return titles, pages
+
+    def test_walk_returns_every_work_once_newest_first(self):
+        titles, pages = self._walk(WORKS_URL + "?pagination=cursor&limit=3")
+        self.assertEqual(pages, 3)
+        self.assertEqual(titles, [f"Work {i}" for i in reversed(range(7))])
+
+    def test_cursor_pages_have_no_first_or_last_link(self):
+        resp = self.client.get(WORKS_URL + "?pagination=cursor&limit=3")
+        links = _parse_link_header(resp["Link"])
+        self.assertIn("next", links)
+        self.assertIn("cursor=", links["next"])
+        self.assertNotIn("first", links)
+        self.assertNotIn("last", links)
+
+    def test_extra_params_preserved_in_next_link(self):
+        resp = self.client.get(WORKS_URL + "?pagination=cursor&limit=2&minimal=true")
+        self.assertIn("minimal=true", resp.json()["next"])
+
+    def test_estimated_count_is_opt_in(self):
+        resp = self.client.get(WORKS_URL + "?pagination=cursor&limit=2&count=estimate")
+        self.assertIsInstance(resp.json()["count"], int)
+
+    def test_offset_mode_is_unchanged(self):
+        body = self.client.get(WORKS_URL + "?limit=3").json()
+        self.assertEqual(body["count"], 7)
+
+    def test_staff_map_keeps_published_first_ordering(self):
+        Work.objects.filter(title="Work 6").update(status="h")
+        staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        titles, pages = [], 0
+        url = WORKS_URL + "?pagination=cursor&limit=3&minimal=true"
+        while url:
+            body = self.client.get(url).json()
+            titles.extend(f["properties"]["title"] for f in body["results"]["features"])
+            url = body["next"]
+            pages += 1
+        self.assertEqual(pages, 3)
+        self.assertEqual(titles, [f"Work {i}" for i in reversed(range(6))] + ["Work 6"])
+
+    def test_cursor_token_for_another_ordering_is_rejected(self):
+        token = _parse_link_header(self.client.get(WORKS_URL + "?pagination=cursor&limit=3")["Link"])["next"]
+        staff = User.objects.create_user(username="staff", password="pw", is_staff=True)
+        self.client.force_login(staff)
+        resp = self.client.get(token + "&minimal=true")
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("error", resp.json())
+
+
 class LinkHeaderStatisticsTests(TestCase):
     """Statistics endpoint is a ViewSet (not paginated) — no Link header."""
 
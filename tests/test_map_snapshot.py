@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the prebuilt public map snapshot (``works.services.map_snapshot``)."""
+
+import gzip
+import json
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from works.models import Work
+from works.services import map_snapshot
+
+User = get_user_model()
+
+
+class MapSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        override = override_settings(MAP_SNAPSHOT_DIR=self.directory)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.published = Work.objects.create(
+            status="p", title="Snapshot work", doi="10.1234/snap", geometry=GeometryCollection(Point(8, 51))
+        )
+        Work.objects.create(status="d", title="Draft work", geometry=GeometryCollection(Point(9, 52)))
+        # Creating the published work already queued a rebuild; start without one.
+        cache.clear()
+
+    def test_snapshot_holds_the_published_minimal_features(self):
+        path = map_snapshot.build_map_snapshot()
+        collection = json.loads(path.read_bytes())
+        self.assertEqual([f["properties"]["title"] for f in collection["features"]], ["Snapshot work"])
+        api = self.client.get("/api/v1/works/?minimal=true&simplify=high").json()["results"]["features"]
+        self.assertEqual(collection["features"], api)
+
+    def test_compressed_siblings_match(self):
+        path = map_snapshot.build_map_snapshot()
+        gz = path.with_name(path.name + ".gz")
+        self.assertEqual(gzip.decompress(gz.read_bytes()), path.read_bytes())
+
+    def test_name_follows_the_content(self):
+        first = map_snapshot.build_map_snapshot()
+        self.assertEqual(map_snapshot.build_map_snapshot(), first)
+        self.published.title = "Renamed"
+        self.published.save()
+        second = map_snapshot.build_map_snapshot()
+        self.assertNotEqual(second, first)
+        self.assertEqual(map_snapshot.current_snapshot_url(), f"/map-snapshot/{second.name}")
+
+    def test_snapshot_is_served_precompressed_and_immutable(self):
+        path = map_snapshot.build_map_snapshot()
+        response = self.client.get(f"/map-snapshot/{path.name}", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(gzip.decompress(b"".join(response.streaming_content)), path.read_bytes())
+
+    def test_unknown_snapshot_names_are_404(self):
+        self.assertEqual(self.client.get("/map-snapshot/works-minimal.0000000000000000.geojson").status_code, 404)
+        self.assertEqual(self.client.get("/map-snapshot/..%2Fsecret").status_code, 404)
+
+    def test_homepage_points_non_staff_at_the_snapshot(self):
+        path = map_snapshot.build_map_snapshot()
+        self.assertContains(self.client.get("/"), f"mapSnapshotUrl: '/map-snapshot/{path.name}'")
+        admin = User.objects.create_user("snapadmin", "snap@test.com", "test", is_staff=True)
+        self.client.force_login(admin)
+        self.assertContains(self.client.get("/"), "mapSnapshotUrl: null")
+
+    @patch("django_q.tasks.async_task")
+    def test_rebuilds_are_debounced(self, mock_async):
+        map_snapshot.schedule_map_snapshot()
+        map_snapshot.schedule_map_snapshot()
+        mock_async.assert_called_once_with("works.tasks.regenerate_map_snapshot")
+
+    @patch("django_q.tasks.async_task")
+    def test_a_started_rebuild_lets_the_next_trigger_enqueue(self, mock_async):
+        map_snapshot.schedule_map_snapshot()
+        map_snapshot.build_map_snapshot()
+        map_snapshot.schedule_map_snapshot()
+        self.assertEqual(mock_async.call_count, 2)
+
+    @patch("django_q.tasks.async_task", side_effect=RuntimeError("broker down"))
+    def test_a_failed_enqueue_is_retried_by_the_next_trigger(self, mock_async):
+        map_snapshot.schedule_map_snapshot()
+        map_snapshot.schedule_map_snapshot()
+        self.assertEqual(mock_async.call_count, 2)
+
+    @patch("django_q.tasks.async_task")
+    def test_saving_a_moved_published_work_schedules_a_rebuild(self, mock_async):
+        self.published.geometry = GeometryCollection(Point(10, 50))
+        self.published.save()
+        self.assertIn("works.tasks.regenerate_map_snapshot", [c.args[0] for c in mock_async.call_args_list])
+
+    @patch("django_q.tasks.async_task")
+    def test_other_edits_of_a_published_work_do_not_rebuild(self, mock_async):
+        self.published.abstract = "Not on the map."
+        self.published.save()
+        self.assertNotIn("works.tasks.regenerate_map_snapshot", [c.args[0] for c in mock_async.call_args_list])
+
+    @patch("django_q.tasks.async_task")
+    def test_deleting_a_published_work_schedules_a_rebuild(self, mock_async):
+        self.published.delete()
+        self.assertIn("works.tasks.regenerate_map_snapshot", [c.args[0] for c in mock_async.call_args_list])
+
+    @patch("django_q.tasks.async_task")
+    def test_bulk_publish_schedules_a_rebuild(self, mock_async):
+        from works.admin import make_public
+
+        make_public(None, None, Work.objects.filter(status="d"))
+        # The feed pre-render (works.services.feed_prerender) is enqueued alongside.
+        self.assertEqual(
+            [c.args[0] for c in mock_async.call_args_list],
+            ["works.tasks.regenerate_map_snapshot", "works.tasks.prerender_feeds"],
+        )
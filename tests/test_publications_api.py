@@ -168,3 +168,84 @@ class PublicationsApiTest(TestCase):
         body = self.client.get("/api/v1/works/").json()
         statuses = sorted(f["properties"]["status"] for f in body["results"]["features"])
         self.assertEqual(statuses, ["h", "p", "p"])
+
+    def test_api_simplify_parameter_selects_stored_simplified_geometry(self):
+        ring = [(10 + i * 0.001, 50 + (i % 2) * 0.00001) for i in range(500)]
+        ring += [(10.5, 51), (10, 51), ring[0]]
+        Work.objects.create(
+            title="Detailed Polygon",
+            url="https://example.com/detailed",
+            status="p",
+            publicationDate=date(2022, 11, 1),
+            geometry=GeometryCollection(Polygon(ring)),
+        )
+
+        def polygon_size(query):
+            body = self.client.get("/api/v1/works/" + query).json()
+            feature = next(f for f in body["results"]["features"] if f["properties"]["title"] == "Detailed Polygon")
+            return len(feature["geometry"]["geometries"][0]["coordinates"][0])
+
+        full = polygon_size("")
+        self.assertEqual(full, len(ring))
+        self.assertLess(polygon_size("?simplify=low"), full)
+        self.assertEqual(polygon_size("?simplify=low"), polygon_size("?zoom=3"))
+        self.assertEqual(polygon_size("?simplify=none"), full)
+
+    def test_api_rejects_unknown_simplify_band(self):
+        response = self.client.get("/api/v1/works/?simplify=ultra")
+        self.assertEqual(response.status_code, 400)
+
+    def test_api_splices_stored_geometry_text_verbatim(self):
+        work = Work.objects.get(title="Publication Two")
+        self.assertIn(work.geometry_geojson.encode(), self.client.get("/api/v1/works/").content)
+        self.assertIn(work.geometry_geojson.encode(), self.client.get("/api/v1/works/?format=json").content)
+
+    def test_api_renders_flatgeobuf(self):
+        from fiona.io import MemoryFile
+
+        response = self.client.get("/api/v1/works/?format=fgb&minimal=true")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/flatgeobuf")
+        self.assertTrue(response.content.startswith(b"fgb\x03"))
+        self.assertIn("Link", response)
+        with MemoryFile(response.content) as memfile, memfile.open(driver="FlatGeobuf") as layer:
+            self.assertEqual(sorted(f["properties"]["title"] for f in layer), ["Publication One", "Publication Two"])
+
+    def test_api_flatgeobuf_errors_stay_json(self):
+        response = self.client.get("/api/v1/works/?format=fgb&simplify=ultra")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response["Content-Type"], "application/json")
+
+    def test_api_fields_selects_properties(self):
+        body = self.client.get("/api/v1/works/?fields=title,doi").json()
+        feature = body["results"]["features"][0]
+        self.assertEqual(set(feature["properties"]), {"title", "doi"})
+        self.assertIn("geometry", feature)
+        self.assertIn("id", feature)
+
+    def test_api_omit_drops_properties(self):
+        body = self.client.get("/api/v1/works/?omit=abstract,locations").json()
+        properties = body["results"]["features"][0]["properties"]
+        self.assertNotIn("abstract", properties)
+        self.assertNotIn("locations", properties)
+        self.assertIn("title", properties)
+        self.assertIn("country_codes", properties)
+
+    def test_api_sparse_fields_prune_the_query(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/v1/works/?fields=title")
+        self.assertEqual(response.status_code, 200)
+        work_selects = [q["sql"] for q in queries if 'FROM "works_work"' in q["sql"] and "DISTINCT" in q["sql"]]
+        self.assertTrue(work_selects)
+        for sql in work_selects:
+            self.assertNotIn('"abstract"', sql)
+            self.assertNotIn('"openalex_match_info"', sql)
+        self.assertFalse([q for q in queries if "works_work_countries" in q["sql"]])
+
+    def test_api_rejects_unknown_fields(self):
+        response = self.client.get("/api/v1/works/?fields=title,nonsense")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("nonsense", response.json()["error"])
@@ -2,14 +2,20 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import gzip
+import os
+import shutil
+import tempfile
+import time
 from http import HTTPStatus
 
 from django.conf import settings
 from django.contrib.gis.geos import MultiPolygon, Polygon
 from django.core.cache import caches
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-from works.models import GlobalRegion
+from works.models import GlobalRegion, Work
+from works.services.sitemap_shards import build_sitemap_shards
 
 
 class SitemapTest(TestCase):
@@ -116,18 +122,79 @@ class SitemapTest(TestCase):
         content = gzip.decompress(response.content).decode("utf-8")
         self.assertIn("<urlset", content)
 
-    def test_index_cache_control(self):
+    def test_index_is_revalidated(self):
+        # The index follows shard builds, so clients revalidate it with its ETag.
         response = self.client.get("/sitemap.xml")
-        self.assertIn(f"max-age={settings.PAGE_CACHE_LONG}", response.get("Cache-Control", ""))
+        self.assertIn("no-cache", response.get("Cache-Control", ""))
+        not_modified = self.client.get("/sitemap.xml", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, HTTPStatus.NOT_MODIFIED)
 
     def test_section_cache_control(self):
         response = self.client.get("/sitemap-static.xml")
         self.assertIn(f"max-age={settings.PAGE_CACHE_LONG}", response.get("Cache-Control", ""))
 
-    def test_index_gz_cache_control(self):
+    def test_index_gz_is_revalidated(self):
         response = self.client.get("/sitemap.xml.gz")
-        self.assertIn(f"max-age={settings.PAGE_CACHE_SHORT}", response.get("Cache-Control", ""))
+        self.assertIn("no-cache", response.get("Cache-Control", ""))
+        not_modified = self.client.get("/sitemap.xml.gz", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, HTTPStatus.NOT_MODIFIED)
 
     def test_section_gz_cache_control(self):
         response = self.client.get("/sitemap-static.xml.gz")
         self.assertIn(f"max-age={settings.PAGE_CACHE_SHORT}", response.get("Cache-Control", ""))
+
+
+@override_settings(SITEMAP_SHARD_SIZE=2, BASE_URL="https://optimap.example.org")
+class SitemapShardTests(TestCase):
+    """Prebuilt work sitemap shards (works.services.sitemap_shards)."""
+
+    def setUp(self):
+        caches["memory"].clear()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        override = override_settings(SITEMAP_DIR=directory)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.works = [
+            Work.objects.create(status="p", title=f"Shard work {i}", doi=f"10.1234/shard-{i}") for i in range(3)
+        ]
+        Work.objects.create(status="d", title="Draft", doi="10.1234/draft")
+
+    def test_shards_split_published_works_by_id_range(self):
+        paths = build_sitemap_shards()
+        self.assertEqual(len(paths), len({work.pk // 2 for work in self.works}))
+        content = "".join(gzip.decompress(path.read_bytes()).decode("utf-8") for path in paths)
+        for work in self.works:
+            location = "https://optimap.example.org" + reverse("optimap:work-landing", args=[work.doi])
+            self.assertEqual(content.count(f"<loc>{location}</loc>"), 1)
+        self.assertNotIn("10.1234/draft", content)
+
+    def test_unchanged_shards_are_not_rewritten(self):
+        paths = build_sitemap_shards()
+        hour_ago = int(time.time()) - 3600
+        for path in paths:
+            os.utime(path, (hour_ago, hour_ago))
+        self.assertEqual(build_sitemap_shards(), paths)
+        self.assertTrue(all(path.stat().st_mtime == hour_ago for path in paths))
+
+    def test_index_lists_shards_instead_of_the_works_section(self):
+        self.assertIn("/sitemap-works.xml<", self.client.get("/sitemap.xml").content.decode("utf-8"))
+        paths = build_sitemap_shards()
+        for url in ("/sitemap.xml", "/sitemap.xml.gz"):
+            content = self.client.get(url).content
+            if url.endswith(".gz"):
+                content = gzip.decompress(content)
+            content = content.decode("utf-8")
+            self.assertNotIn("/sitemap-works.xml<", content)
+            for path in paths:
+                self.assertIn(f"/{path.name}</loc>", content)
+
+    def test_shard_is_served_with_last_modified(self):
+        path = build_sitemap_shards()[0]
+        response = self.client.get(f"/{path.name}")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response["content-type"], "application/gzip")
+        self.assertEqual(b"".join(response.streaming_content), path.read_bytes())
+        not_modified = self.client.get(f"/{path.name}", HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(not_modified.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(self.client.get("/sitemap-works-999.xml.gz").status_code, HTTPStatus.NOT_FOUND)
@@ -1,14 +1,22 @@
 # SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-"""Tests for StatisticsSnapshot, SourceCoverageSnapshot, the API endpoint, and the statistics page."""
+"""Tests for StatisticsSnapshot, StatisticsCounters, SourceCoverageSnapshot, the API endpoint, and the statistics page."""
 
 from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 
-from works.models import Source, StatisticsSnapshot, Work
+from works.models import (
+    Collection,
+    Contribution,
+    Source,
+    StatisticsCounters,
+    StatisticsCounterShard,
+    StatisticsSnapshot,
+    Work,
+)
 
 User = get_user_model()
 
@@ -19,6 +27,7 @@ STATS_PAGE_URL = "/statistics/"
 _CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "memory": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "popups": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "statistics-popups"},
     "dummy": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
@@ -114,6 +123,34 @@ class StatisticsSnapshotTests(TestCase):
         self.assertIn("DE", codes)
         self.assertIn("FR", codes)
 
+    def test_scalar_counts_in_one_query(self):
+        from django.contrib.gis.geos import GeometryCollection, Point
+
+        from works.utils.statistics import _work_counts
+
+        _make_published_work(
+            geometry=GeometryCollection(Point(0, 0)),
+            timeperiod_startdate=["2020"],
+            authors=["A. Author"],
+            doi="10.1234/one",
+            abstract="",
+        )
+        _make_published_work(authors=[], openalex_id="W1", openalex_open_access_status="gold")
+        Work.objects.create(status="h", title="Harvested", geometry=GeometryCollection(Point(0, 0)))
+
+        with self.assertNumQueries(1):
+            counts = _work_counts()
+        self.assertEqual(counts["total_works"], 3)
+        self.assertEqual((counts["status_p"], counts["status_h"], counts["status_d"]), (2, 1, 0))
+        self.assertEqual(counts["with_geometry"], 1)
+        self.assertEqual(counts["with_temporal"], 1)
+        self.assertEqual(counts["with_authors"], 1)
+        self.assertEqual(counts["with_doi"], 1)
+        self.assertEqual(counts["with_abstract"], 0)
+        self.assertEqual(counts["open_access"], 1)
+        self.assertEqual(counts["from_openalex"], 1)
+        self.assertEqual(counts["with_complete_metadata"], 1)
+
     def test_next_update_is_24h_after_computed(self):
         from works.utils.statistics import save_statistics_snapshot
 
@@ -123,6 +160,89 @@ class StatisticsSnapshotTests(TestCase):
 
 
 @override_settings(CACHES=_CACHES)
+class StatisticsCountersTests(TestCase):
+    """The database triggers keep the counter row and its shards in step with every kind of write."""
+
+    def setUp(self):
+        from works.utils.statistics import reconcile_statistics
+
+        reconcile_statistics()
+
+    def _scalars(self, stats):
+        return {key: value for key, value in stats.items() if not key.startswith("by_")}
+
+    def assertCountersMatchRecount(self):
+        from works.utils.statistics import calculate_statistics, get_statistics
+
+        self.assertEqual(self._scalars(get_statistics()), self._scalars(calculate_statistics()))
+
+    def test_saves_follow_status_and_metadata(self):
+        from django.contrib.gis.geos import GeometryCollection, Point
+
+        from works.utils.statistics import get_statistics
+
+        work = Work.objects.create(status="h", title="Harvested", doi="10.1234/counted")
+        self.assertEqual(get_statistics()["works_by_status"]["h"], 1)
+        work.status = "p"
+        work.geometry = GeometryCollection(Point(8.0, 51.0))
+        work.timeperiod_startdate = ["2020-01-01"]
+        work.authors = ["A. Author"]
+        work.save()
+        stats = get_statistics()
+        self.assertEqual(stats["published_works"], 1)
+        self.assertEqual(stats["with_doi"], 1)
+        self.assertEqual(stats["with_complete_metadata"], 1)
+        self.assertEqual(stats["complete_percentage"], 100.0)
+        self.assertCountersMatchRecount()
+
+    def test_bulk_writes_are_counted(self):
+        Work.objects.bulk_create([Work(status="h", title=f"Bulk {n}", abstract="Text") for n in range(3)])
+        Work.objects.filter(title="Bulk 0").update(status="p")
+        Work.objects.filter(title="Bulk 1").delete()
+        self.assertCountersMatchRecount()
+
+    def test_sources_collections_users_and_contributions(self):
+        work = _make_published_work()
+        _make_source()
+        Collection.objects.create(identifier="counted", name="Counted")
+        user = User.objects.create_user(username="counter", password="pw")
+        Contribution.objects.create(user=user, work=work, kind=Contribution.DOI)
+        self.assertCountersMatchRecount()
+        user.delete()
+        self.assertCountersMatchRecount()
+
+    def test_reconcile_corrects_drift(self):
+        from works.utils.statistics import get_statistics, reconcile_statistics
+
+        _make_published_work()
+        StatisticsCounters.objects.filter(pk=1).update(published_works=41)
+        self.assertEqual(get_statistics()["published_works"], 42)  # plus the new work's shard delta
+        with self.assertLogs("works.utils.statistics", level="WARNING"):
+            reconcile_statistics()
+        self.assertEqual(get_statistics()["published_works"], 1)
+
+    def test_writes_go_to_the_shards(self):
+        from works.utils.statistics import get_statistics, reconcile_statistics
+
+        _make_published_work()
+        _make_published_work()
+        self.assertEqual(StatisticsCounters.objects.get(pk=1).published_works, 0)
+        self.assertEqual(sum(StatisticsCounterShard.objects.values_list("published_works", flat=True)), 2)
+        self.assertEqual(get_statistics()["published_works"], 2)
+        reconcile_statistics()
+        self.assertEqual(StatisticsCounters.objects.get(pk=1).published_works, 2)
+        self.assertFalse(StatisticsCounterShard.objects.exclude(published_works=0).exists())
+        self.assertEqual(get_statistics()["published_works"], 2)
+
+    def test_first_read_recounts(self):
+        from works.utils.statistics import get_statistics
+
+        _make_published_work()
+        StatisticsCounters.objects.all().delete()
+        self.assertEqual(get_statistics()["published_works"], 1)
+        self.assertIsNotNone(StatisticsCounters.objects.get(pk=1).reconciled_at)
+
+
 class SourceCoverageSnapshotTests(TestCase):
     """calculate_source_coverage() creates a correct DB row."""
 
@@ -187,6 +307,59 @@ class SourceCoverageSnapshotTests(TestCase):
         snap = calculate_source_coverage(src)
         self.assertEqual(snap.by_year, [])
 
+    def test_all_sources_in_a_fixed_number_of_queries(self):
+        from django.contrib.gis.geos import GeometryCollection, Point
+
+        from works.utils.statistics import calculate_sources_coverage
+
+        sources = [_make_source(name=f"Journal {i}", works_count=10) for i in range(3)]
+        user = User.objects.create_user(username="contrib", password="pw")
+        work = _make_published_work(source=sources[0], geometry=GeometryCollection(Point(0, 0)))
+        _make_published_work(source=sources[0], openalex_open_access_status="gold")
+        _make_published_work(source=sources[1])
+        Contribution.objects.create(work=work, user=user, kind=Contribution.DOI)
+
+        # counts, contributors, works per year, and one INSERT of every snapshot
+        with self.assertNumQueries(4):
+            snaps = calculate_sources_coverage(sources)
+        self.assertEqual([snap.source for snap in snaps], sources)
+        self.assertEqual([snap.optimap_count for snap in snaps], [2, 1, 0])
+        self.assertEqual([snap.spatial_rate for snap in snaps], [50.0, 0.0, None])
+        self.assertEqual([snap.open_access_ratio for snap in snaps], [50.0, 0.0, None])
+        self.assertEqual([snap.contributors_count for snap in snaps], [1, 0, 0])
+
+    def test_scheduled_task_snapshots_every_source(self):
+        from works.models import SourceCoverageSnapshot
+        from works.tasks import calculate_source_coverage
+
+        _make_published_work(source=_make_source(name="First", works_count=10))
+        _make_source(name="Second")
+        self.assertEqual(calculate_source_coverage(), Source.objects.count())
+        self.assertEqual(SourceCoverageSnapshot.objects.count(), Source.objects.count())
+
+    def test_coverage_is_scheduled_weekly(self):
+        from django_q.models import Schedule
+
+        from works.tasks import schedule_source_coverage
+
+        Schedule.objects.filter(func="works.tasks.calculate_source_coverage").delete()
+        schedule_source_coverage()
+        schedule_source_coverage()
+        schedule = Schedule.objects.get(func="works.tasks.calculate_source_coverage")
+        self.assertEqual(schedule.schedule_type, Schedule.WEEKLY)
+
+
+class BenchmarkStatisticsCommandTests(TestCase):
+    """benchmark_statistics loads the database, so it needs DEBUG or an explicit opt-in."""
+
+    @override_settings(DEBUG=False)
+    def test_refuses_to_run_without_debug(self):
+        from django.core.management import CommandError, call_command
+
+        with self.assertRaisesMessage(CommandError, "--yes-i-know"):
+            call_command("benchmark_statistics", works=1, sources=1, repeat=1)
+        self.assertFalse(Source.objects.filter(name__startswith="Benchmark journal").exists())
+
 
 @override_settings(CACHES=_CACHES, CACHE_MIDDLEWARE_ALIAS="dummy")
 class StatisticsAPITests(TestCase):
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the two-tier cache backend (optimap/cache.py)."""
+
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from optimap.cache import TieredCache, shared_stats
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tiered-default"},
+    "shared": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tiered-shared"},
+}
+
+
+def tiered(name, **options):
+    """A worker's view of the shared cache; each ``name`` gets its own L1."""
+    return TieredCache(name, {"OPTIONS": {"L2": "shared", "L1_PREFIXES": ["feed"], "STAMP_INTERVAL": 0, **options}})
+
+
+@override_settings(CACHES=CACHES)
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        caches["shared"].clear()
+        self.worker = tiered("worker-a")
+        self.worker._l1.clear()
+
+    def test_second_read_is_served_from_l1(self):
+        caches["shared"].set("feed:georss", "body")
+        self.assertEqual(self.worker.get("feed:georss"), "body")
+        self.assertEqual(self.worker.get("feed:georss"), "body")
+        self.assertEqual(self.worker.stats()["feed"], {"l1": 1, "l2": 1, "miss": 0, "hit_rate": 1.0})
+
+    def test_write_in_one_worker_invalidates_the_other(self):
+        other = tiered("worker-b")
+        other._l1.clear()
+        self.worker.set("feed:georss", "old")
+        self.assertEqual(other.get("feed:georss"), "old")
+        self.worker.set("feed:georss", "new")
+        self.assertEqual(other.get("feed:georss"), "new")
+        self.worker.delete("feed:georss")
+        self.assertIsNone(other.get("feed:georss"))
+
+    def test_unlisted_prefixes_bypass_l1(self):
+        self.worker.set("magic_link:abc", "token")
+        self.assertEqual(self.worker.get("magic_link:abc"), "token")
+        caches["shared"].delete("magic_link:abc")
+        self.assertIsNone(self.worker.get("magic_link:abc"))
+        self.assertEqual(self.worker.stats()["magic_link"]["l1"], 0)
+
+    def test_get_many_mixes_tiers(self):
+        self.worker.set_many({"feed:a": 1, "feed:b": 2, "other:c": 3})
+        self.worker.get("feed:a")
+        self.assertEqual(
+            self.worker.get_many(["feed:a", "feed:b", "other:c", "feed:z"]), {"feed:a": 1, "feed:b": 2, "other:c": 3}
+        )
+        self.assertEqual(self.worker.stats()["feed"]["miss"], 1)
+
+    def test_flushed_counters_add_up_across_workers(self):
+        other = tiered("worker-b")
+        for worker in (self.worker, other):
+            worker.get("feed:missing")
+            worker.flush_stats()
+        self.assertEqual(shared_stats(self.worker)["feed"]["miss"], 2)
+
+
+class CacheStatsCommandTests(SimpleTestCase):
+    def test_requires_a_tiered_default_cache(self):
+        with override_settings(CACHES=CACHES):
+            with self.assertRaisesMessage(Exception, "not a TieredCache"):
+                call_command("cache_stats", stdout=StringIO())
@@ -8,14 +8,15 @@ Covers:
   anonymous pages (privacy, about, accessibility, feeds, sitemap_page,
   RobotsView): a second request reuses the cached response without
   recomputing the view body.
-- The anonymous ``work_landing`` context cache (key
-  ``work_landing:ctx:<host>:<work.id>:<lastUpdate>``): cache miss on
-  first request, cache hit on second; saving the work (which bumps
-  ``lastUpdate``) immediately misses the old entry; staff requests
-  always render live.
-
-The tests use the real ``LocMemCache`` backend from ``CACHES['memory']``
-and clear it in ``setUp`` so they're deterministic across runs.
+- The anonymous ``work_landing`` context cache in the shared ``default``
+  backend (key ``work_landing:ctx:<host>:<work.id>:<lastUpdate>``, tagged
+  with the work's source and collections): cache miss on first request,
+  cache hit on second; saving the work (which bumps ``lastUpdate``), its
+  source or its collections immediately misses the old entry; staff
+  requests always render live.
+
+The tests use the real backends from ``CACHES`` and clear them in
+``setUp`` so they're deterministic across runs.
 """
 
 from __future__ import annotations
@@ -27,13 +28,14 @@ from unittest import mock
 import django
 from django.contrib.gis.geos import GeometryCollection, GEOSGeometry
 from django.core.cache import caches
-from django.test import Client, TestCase
+from django.test import Client, RequestFactory, TestCase, override_settings
 from django.urls import reverse
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "optimap.settings")
 django.setup()
 
-from works.models import Source, Work
+from works.models import Collection, Source, Work
+from works.views.work_views import _work_landing_cache_key
 
 User = django.contrib.auth.get_user_model() if hasattr(django.contrib, "auth") else None
 from django.contrib.auth import get_user_model
@@ -112,59 +114,80 @@ class StaticPageCacheTests(TestCase):
         self._hits_cache_on_second_request(url)
 
 
+@override_settings(CACHE_MIDDLEWARE_ALIAS="dummy")
 class WorkLandingCacheTests(TestCase):
-    """Anonymous landing-page context is cached per work + lastUpdate."""
+    """Anonymous landing-page context is cached per work + lastUpdate.
+
+    The site-wide page cache is switched off so that every request of the
+    landing URL reaches the view and its context cache.
+    """
 
     def setUp(self):
         self.client = Client()
         caches["memory"].clear()
+        caches["default"].clear()
         self.work = _make_published_work()
         self.url = reverse("optimap:work-landing", args=[self.work.get_identifier()])
 
-    def _cache_keys_for_work(self, work):
-        # LocMemCache stores under cache.LocMemCache._cache as
-        # {make_key(key): (expiry, value)}. We just look for any key
-        # mentioning our work's pk + the current host.
-        backend = caches["memory"]
-        store = getattr(backend, "_cache", {})
-        prefix = "work_landing:ctx:"
-        return [k for k in store.keys() if prefix in k and f":{work.id}:" in k]
+    def _cached(self, work):
+        # The context lives in the shared default cache under the key of the
+        # work's current lastUpdate (the test client's host is "testserver").
+        work.refresh_from_db()
+        request = RequestFactory().get(self.url)
+        return caches["default"].has_key(_work_landing_cache_key(work, request))
 
     def test_cache_miss_then_hit(self):
         # First request populates the cache.
-        self.assertEqual(self._cache_keys_for_work(self.work), [])
+        self.assertFalse(self._cached(self.work))
         r1 = self.client.get(self.url)
         self.assertEqual(r1.status_code, 200)
-        keys_after = self._cache_keys_for_work(self.work)
-        self.assertEqual(len(keys_after), 1, f"expected one cache entry, found {keys_after}")
+        self.assertTrue(self._cached(self.work))
 
-        # Second request should not write a new entry — same key reused.
-        r2 = self.client.get(self.url)
+        # Second request reuses the entry instead of rebuilding it.
+        with mock.patch("works.views.work_views._build_work_landing_cacheable") as build:
+            r2 = self.client.get(self.url)
         self.assertEqual(r2.status_code, 200)
-        self.assertEqual(self._cache_keys_for_work(self.work), keys_after)
+        build.assert_not_called()
 
     def test_save_invalidates_cache_via_lastupdate_bump(self):
         # Populate cache.
         self.client.get(self.url)
-        keys_before = set(self._cache_keys_for_work(self.work))
-        self.assertEqual(len(keys_before), 1)
+        self.assertTrue(self._cached(self.work))
 
         # Saving bumps lastUpdate (auto_now=True), so the next request
         # computes a *different* cache key — old entry stays under the
         # superseded key but is unreachable.
         self.work.title = "New title"
         self.work.save()
+        self.assertFalse(self._cached(self.work))
 
         r = self.client.get(self.url)
         self.assertEqual(r.status_code, 200)
-        keys_after = set(self._cache_keys_for_work(self.work))
-        # Old key still present (TTL-bound), new key added — same work,
-        # different lastUpdate value.
-        self.assertGreaterEqual(len(keys_after), len(keys_before))
-        self.assertNotEqual(keys_after - keys_before, set(), "saving the work should produce a new cache key")
+        self.assertTrue(self._cached(self.work))
         # The response uses the new title.
         self.assertContains(r, "New title")
 
+    def test_entry_is_shared_across_workers(self):
+        # Another process sees the entry: a fresh in-memory cache changes nothing.
+        self.client.get(self.url)
+        caches["memory"].clear()
+        with mock.patch("works.views.work_views._build_work_landing_cacheable") as build:
+            self.client.get(self.url)
+        build.assert_not_called()
+
+    def test_source_edit_invalidates_cache(self):
+        self.client.get(self.url)
+        self.work.source.name = "Renamed Journal"
+        self.work.source.save()
+        self.assertFalse(self._cached(self.work))
+        self.assertContains(self.client.get(self.url), "Renamed Journal")
+
+    def test_collection_membership_invalidates_cache(self):
+        self.client.get(self.url)
+        collection = Collection.objects.create(identifier="landing", name="Landing collection", is_published=True)
+        collection.works.add(self.work)
+        self.assertFalse(self._cached(self.work))
+
     def test_admin_request_bypasses_cache(self):
         admin = User.objects.create_user(
             username="cacheadmin",
@@ -175,7 +198,7 @@ class WorkLandingCacheTests(TestCase):
         self.client.force_login(admin)
         self.client.get(self.url)
         # Authenticated requests don't write to the anon cache.
-        self.assertEqual(self._cache_keys_for_work(self.work), [])
+        self.assertFalse(self._cached(self.work))
 
     def test_anonymous_user_with_unpublished_work_404(self):
         unpublished = _make_published_work(
@@ -185,7 +208,7 @@ class WorkLandingCacheTests(TestCase):
         r = self.client.get(url)
         self.assertEqual(r.status_code, 404)
         # And no cache entry created for an unauthorised request.
-        self.assertEqual(self._cache_keys_for_work(unpublished), [])
+        self.assertFalse(self._cached(unpublished))
 
 
 def _max_age_from_cache_control(value: str) -> int | None:
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the propagation of work changes (works/services/work_changes.py)."""
+
+from unittest.mock import patch
+
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.core.cache import cache, caches
+from django.test import TestCase
+
+from works.models import Work, WorkFacet
+from works.services import popups, tiles
+
+
+def _queued(mock_async):
+    return [c.args[0] for c in mock_async.call_args_list]
+
+
+@patch("django_q.tasks.async_task")
+class WorkChangesTests(TestCase):
+    def setUp(self):
+        self.work = Work.objects.create(
+            status="p",
+            title="Changed work",
+            url="https://e.org/changed",
+            geometry=GeometryCollection(Point(8, 51)),
+            timeperiod_startdate=["2020"],
+        )
+        self.draft = Work.objects.create(
+            status="d", title="Draft work", url="https://e.org/draft", timeperiod_startdate=["2021"]
+        )
+        cache.clear()
+        caches["popups"].clear()
+
+    def test_bulk_update_goes_through_every_artifact(self, mock_async):
+        from works.services.work_changes import on_works_changed
+
+        caches["popups"].set(popups.popup_key(self.draft.pk), {"title": "stale"})
+        generation = tiles._generation()
+        Work.objects.filter(pk=self.draft.pk).update(status="p")
+        on_works_changed([self.draft.pk])
+        self.assertTrue(WorkFacet.objects.filter(work=self.draft).exists())
+        self.assertIsNone(caches["popups"].get(popups.popup_key(self.draft.pk)))
+        self.assertNotEqual(tiles._generation(), generation)
+        self.assertEqual(_queued(mock_async), ["works.tasks.regenerate_map_snapshot", "works.tasks.prerender_feeds"])
+
+    def test_editing_a_published_work_renders_the_feeds(self, mock_async):
+        self.work.abstract = "Edited"
+        self.work.save()
+        self.assertEqual(_queued(mock_async), ["works.tasks.prerender_feeds"])
+
+    def test_editing_a_draft_leaves_public_artifacts_alone(self, mock_async):
+        caches["popups"].set(popups.popup_key(self.draft.pk), {"title": "stale"})
+        self.draft.title = "Edited draft"
+        self.draft.save()
+        self.assertIsNone(caches["popups"].get(popups.popup_key(self.draft.pk)))
+        self.assertEqual(_queued(mock_async), [])
+
+    def test_unpublishing_rebuilds_the_map(self, mock_async):
+        self.work.status = "d"
+        self.work.save()
+        self.assertFalse(WorkFacet.objects.filter(work=self.work).exists())
+        self.assertEqual(_queued(mock_async), ["works.tasks.regenerate_map_snapshot", "works.tasks.prerender_feeds"])
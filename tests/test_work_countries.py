@@ -13,8 +13,8 @@ from django.contrib.gis.geos import (
 from django.core import mail
 from django.test import TestCase, override_settings
 
-from works.models import Country, Work
-from works.services.countries import countries_for_geometry
+from works.models import Country, CountrySubdivided, Work
+from works.services.countries import countries_for_geometry, refresh_country_subdivisions
 from works.tasks import backfill_work_countries
 
 _LOCMEM_EMAIL = override_settings(
@@ -88,6 +88,36 @@ class CountriesForGeometryTests(TestCase):
         self.assertEqual(countries_for_geometry(geom, snap_tolerance=0), [])
 
 
+class CountrySubdivisionTests(TestCase):
+    """The join reads ``CountrySubdivided``, kept in sync with ``Country`` outlines."""
+
+    def setUp(self):
+        # ~800-vertex circle, so ST_Subdivide has to cut it into several pieces.
+        self.round = Country.objects.create(
+            name="Roundland", iso_code="RL", geom=MultiPolygon(Point(10, 50).buffer(3, quadsegs=200))
+        )
+
+    def test_save_subdivides_outline(self):
+        pieces = CountrySubdivided.objects.filter(country=self.round)
+        self.assertGreater(pieces.count(), 1)
+        self.assertEqual([c.iso_code for c in countries_for_geometry(GeometryCollection(Point(10, 50)))], ["RL"])
+
+    def test_outline_edit_resubdivides(self):
+        self.round.geom = _box(30, 0, 31, 1)
+        self.round.save()
+        self.assertEqual(countries_for_geometry(GeometryCollection(Point(10, 50))), [])
+        self.assertEqual([c.iso_code for c in countries_for_geometry(GeometryCollection(Point(30.5, 0.5)))], ["RL"])
+
+    def test_refresh_rebuilds_all(self):
+        CountrySubdivided.objects.all().delete()
+        self.assertEqual(countries_for_geometry(GeometryCollection(Point(10, 50))), [])
+        self.assertGreater(refresh_country_subdivisions(), 1)
+        self.assertEqual([c.iso_code for c in countries_for_geometry(GeometryCollection(Point(10, 50)))], ["RL"])
+
+    def test_sentinel_has_no_pieces(self):
+        self.assertFalse(CountrySubdivided.objects.filter(country__iso_code="ZZ").exists())
+
+
 @override_settings(GEOCODE_WORKS_ON_SAVE=True)
 class AssignWorkCountriesSignalTests(TestCase):
     def setUp(self):
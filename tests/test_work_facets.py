@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the incrementally maintained WorkFacet index (works/services/facets.py)."""
+
+from io import StringIO
+
+from django.contrib.gis.geos import MultiPolygon, Polygon
+from django.core.management import call_command
+from django.test import TestCase
+
+from works.models import SENTINEL_COUNTRY_ISO, Country, Source, Work, WorkFacet
+from works.services import facets
+from works.services.facets import facet_counts, rebuild_facets
+
+
+def _square(cx, cy, d=1.0):
+    return Polygon(((cx - d, cy - d), (cx + d, cy - d), (cx + d, cy + d), (cx - d, cy + d), (cx - d, cy - d)))
+
+
+def _keys(work):
+    return set(WorkFacet.objects.filter(work=work).values_list("kind", "key"))
+
+
+class WorkFacetMaintenanceTests(TestCase):
+    def setUp(self):
+        self.source = Source.objects.create(name="Facet Journal", url_field="https://e.org/oai")
+        self.work = Work.objects.create(
+            status="p",
+            title="Faceted work",
+            source=self.source,
+            topics=["Hydrology"],
+            timeperiod_startdate=["2019-03-01"],
+            timeperiod_enddate=["2020-06-30"],
+        )
+
+    def test_published_work_is_indexed_on_save(self):
+        self.assertEqual(
+            _keys(self.work),
+            {
+                ("year", "2019"),
+                ("year", "2020"),
+                ("topic", "Hydrology"),
+                ("source", str(self.source.pk)),
+            },
+        )
+
+    def test_unpublishing_and_editing_update_the_index(self):
+        self.work.topics = ["Remote Sensing"]
+        self.work.save()
+        self.assertIn(("topic", "Remote Sensing"), _keys(self.work))
+        self.assertNotIn(("topic", "Hydrology"), _keys(self.work))
+
+        self.work.status = "d"
+        self.work.save()
+        self.assertEqual(_keys(self.work), set())
+
+    def test_unpublished_work_is_not_indexed(self):
+        draft = Work.objects.create(status="h", title="Harvested", topics=["Hydrology"])
+        self.assertEqual(_keys(draft), set())
+
+    def test_country_changes_refresh_the_index(self):
+        germany = Country.objects.create(name="Germany", iso_code="DE", geom=MultiPolygon(_square(10, 51)))
+        self.work.countries.add(germany)
+        self.assertIn(("country", "DE"), _keys(self.work))
+        self.work.countries.clear()
+        self.assertNotIn(("country", "DE"), _keys(self.work))
+
+    def test_sentinel_country_is_never_indexed(self):
+        sentinel = Country.objects.get(iso_code=SENTINEL_COUNTRY_ISO)
+        self.work.countries.add(sentinel)
+        self.assertFalse(any(kind == "country" for kind, _key in _keys(self.work)))
+
+    def test_bulk_publish_refreshes_the_index(self):
+        from works.admin import make_public
+
+        draft = Work.objects.create(status="d", title="Draft", topics=["Geodesy"])
+        make_public(None, None, Work.objects.filter(pk=draft.pk))
+        self.assertIn(("topic", "Geodesy"), _keys(draft))
+
+    def test_counts_are_per_kind(self):
+        Work.objects.create(status="p", title="Another", topics=["Hydrology"])
+        self.assertEqual(facet_counts(facets.TOPIC), {"Hydrology": 2})
+
+
+class ExtendYearFacetsTests(TestCase):
+    def test_new_year_is_added_to_works_covering_it(self):
+        import datetime
+        from unittest import mock
+
+        this_year = datetime.date.today().year
+        work = Work.objects.create(
+            status="p", title="Future coverage", timeperiod_startdate=["2020"], timeperiod_enddate=["2100"]
+        )
+        self.assertIn((facets.YEAR, str(this_year + 1)), _keys(work))
+        self.assertNotIn((facets.YEAR, str(this_year + 2)), _keys(work))
+        with mock.patch("works.services.facets.datetime") as clock:
+            clock.date.today.return_value = datetime.date(this_year + 1, 1, 1)
+            facets.extend_year_facets()
+        self.assertIn((facets.YEAR, str(this_year + 2)), _keys(work))
+
+
+class RebuildWorkFacetsTests(TestCase):
+    def test_rebuild_restores_a_lost_index(self):
+        work = Work.objects.create(status="p", title="Rebuilt", topics=["Cartography"])
+        WorkFacet.objects.all().delete()
+        self.assertEqual(rebuild_facets(), 1)
+        self.assertEqual(_keys(work), {("topic", "Cartography")})
+
+    def test_command(self):
+        Work.objects.create(status="p", title="Command", topics=["Cartography"])
+        out = StringIO()
+        call_command("rebuild_work_facets", stdout=out)
+        self.assertIn("1 row(s)", out.getvalue())
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the cached map popup endpoint (``/api/v1/works/<id>/popup/``)."""
+
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from works.models import Source, Work
+from works.services import popups
+
+User = get_user_model()
+
+
+class WorkPopupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["popups"].clear()
+        self.source = Source.objects.create(
+            name="Popup Journal", url_field="https://example.org/oai", homepage_url="https://example.org"
+        )
+        self.work = Work.objects.create(
+            status="p",
+            title="Clicked work",
+            doi="10.1234/popup",
+            authors=["Ada Lovelace", "Alan Turing"],
+            publicationDate=date(2024, 5, 1),
+            source=self.source,
+        )
+        self.draft = Work.objects.create(status="d", title="Draft work")
+
+    def url(self, work):
+        return f"/api/v1/works/{work.pk}/popup/"
+
+    def test_popup_has_the_fields_the_map_shows(self):
+        response = self.client.get(self.url(self.work))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["title"], "Clicked work")
+        self.assertEqual(data["authors"], ["Ada Lovelace", "Alan Turing"])
+        self.assertEqual(data["publicationDate"], "2024-05-01")
+        self.assertEqual(data["status_display"], "Published")
+        self.assertEqual(data["source_details"]["name"], "Popup Journal")
+        self.assertEqual(data["source_details"]["homepage_url"], "https://example.org")
+        self.assertNotIn("geometry", data)
+        self.assertNotIn("bok_concepts_resolved", data)
+
+    def test_cache_hit_does_not_read_the_work(self):
+        popup = popups.get_work_popup(self.work.pk)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(popups.get_work_popup(self.work.pk), popup)
+        # Only the shared (database) cache itself may be read.
+        self.assertFalse([q for q in queries if Work._meta.db_table in q["sql"]])
+
+    def test_popups_stay_out_of_the_default_cache(self):
+        popups.get_work_popup(self.work.pk)
+        self.assertTrue(caches["popups"].has_key(popups.popup_key(self.work.pk)))
+        self.assertFalse(cache.has_key(popups.popup_key(self.work.pk)))
+
+    def test_unpublished_and_unknown_works_are_404_for_the_public(self):
+        self.assertEqual(self.client.get(self.url(self.draft)).status_code, 404)
+        self.assertEqual(self.client.get("/api/v1/works/999999/popup/").status_code, 404)
+
+    def test_staff_see_unpublished_works(self):
+        admin = User.objects.create_user("popupadmin", "popup@test.com", "test", is_staff=True)
+        self.client.force_login(admin)
+        response = self.client.get(self.url(self.draft))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "private, no-store")
+        self.assertIsNone(response.json()["source_details"])
+
+    def test_saving_a_work_drops_its_popup(self):
+        popups.get_work_popup(self.work.pk)
+        self.work.title = "Renamed work"
+        self.work.save()
+        self.assertEqual(self.client.get(self.url(self.work)).json()["title"], "Renamed work")
+
+    def test_saving_the_source_drops_its_works_popups(self):
+        popups.get_work_popup(self.work.pk)
+        self.source.name = "Renamed Journal"
+        self.source.save()
+        data = self.client.get(self.url(self.work)).json()
+        self.assertEqual(data["source_details"]["name"], "Renamed Journal")
+
+    def test_bulk_unpublish_drops_the_popup(self):
+        from works.admin import make_draft
+
+        self.assertEqual(self.client.get(self.url(self.work)).status_code, 200)
+        make_draft(None, None, Work.objects.filter(pk=self.work.pk))
+        self.assertEqual(popups.get_work_popup(self.work.pk)["status"], "d")
@@ -17,8 +17,8 @@ from django.contrib.gis.geos import (
 from django.core import mail
 from django.test import TestCase, override_settings
 
-from works.models import GlobalRegion, Work
-from works.services.regions import regions_for_geometry
+from works.models import GlobalRegion, GlobalRegionSubdivided, Work
+from works.services.regions import refresh_region_subdivisions, regions_for_geometry
 from works.tasks import backfill_work_regions
 
 _LOCMEM_EMAIL = override_settings(
@@ -79,6 +79,24 @@ class RegionsForGeometryTests(TestCase):
         self.assertEqual(regions_for_geometry(GeometryCollection(Point(4.95, 51))), [])
 
 
+class RegionSubdivisionTests(TestCase):
+    """The join reads ``GlobalRegionSubdivided``, kept in sync with region outlines."""
+
+    def setUp(self):
+        # ~800-vertex circle, so ST_Subdivide has to cut it into several pieces.
+        self.sea = _make_region("Roundsea", GlobalRegion.OCEAN, MultiPolygon(Point(-30, 0).buffer(5, quadsegs=200)))
+
+    def test_save_subdivides_outline(self):
+        self.assertGreater(GlobalRegionSubdivided.objects.filter(region=self.sea).count(), 1)
+        self.assertEqual([r.name for r in regions_for_geometry(GeometryCollection(Point(-30, 0)))], ["Roundsea"])
+
+    def test_refresh_rebuilds_all(self):
+        GlobalRegionSubdivided.objects.all().delete()
+        self.assertEqual(regions_for_geometry(GeometryCollection(Point(-30, 0))), [])
+        self.assertGreater(refresh_region_subdivisions(), 1)
+        self.assertEqual([r.name for r in regions_for_geometry(GeometryCollection(Point(-30, 0)))], ["Roundsea"])
+
+
 @override_settings(GEOCODE_WORKS_ON_SAVE=True)
 class AssignWorkRegionsSignalTests(TestCase):
     def setUp(self):
@@ -0,0 +1,143 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tests for the works map vector tiles (``/api/v1/tiles/works/{z}/{x}/{y}.mvt``)."""
+
+from django.contrib.auth import get_user_model
+from django.contrib.gis.geos import GeometryCollection, Point, Polygon
+from django.core.cache import cache
+from django.test import TestCase
+
+from works.models import Work
+from works.services import tiles
+
+User = get_user_model()
+
+# Zoom 0 shows the whole world; zoom 1 tile 1/0 is the north-east quadrant.
+WORLD = "/api/v1/tiles/works/0/0/0.mvt"
+NORTH_EAST = "/api/v1/tiles/works/1/1/0.mvt"
+SOUTH_WEST = "/api/v1/tiles/works/1/0/1.mvt"
+
+
+class WorkTileTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.published = Work.objects.create(
+            status="p",
+            title="Published in Germany",
+            geometry=GeometryCollection(
+                Point(8.0, 51.0),
+                Polygon(((7, 50), (9, 50), (9, 52), (7, 52), (7, 50))),
+            ),
+        )
+        self.draft = Work.objects.create(
+            status="d",
+            title="Draft in Germany",
+            geometry=GeometryCollection(Point(8.5, 51.5)),
+        )
+        Work.objects.create(status="r", title="Merged away", geometry=GeometryCollection(Point(8.2, 51.2)))
+
+    def test_public_tile_has_only_the_published_layer(self):
+        response = self.client.get(WORLD)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/vnd.mapbox-vector-tile")
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn(b"published", response.content)
+        self.assertIn(b"Published in Germany", response.content)
+        self.assertNotIn(b"draft", response.content)
+        self.assertNotIn(b"Merged away", response.content)
+
+    def test_staff_tile_has_a_layer_per_status(self):
+        admin = User.objects.create_user("tileadmin", "tiles@test.com", "test", is_staff=True)
+        self.client.force_login(admin)
+        response = self.client.get(WORLD)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Cache-Control"], "private, no-store")
+        self.assertIn(b"published", response.content)
+        self.assertIn(b"Draft in Germany", response.content)
+        self.assertNotIn(b"Merged away", response.content)
+
+    def test_only_works_in_view_are_included(self):
+        self.assertIn(b"Published in Germany", self.client.get(NORTH_EAST).content)
+        self.assertEqual(self.client.get(SOUTH_WEST).content, b"")
+
+    def test_global_polygon_is_clipped_before_projection(self):
+        Work.objects.create(
+            status="p",
+            title="Global extent",
+            geometry=GeometryCollection(Polygon(((-180, -90), (180, -90), (180, 90), (-180, 90), (-180, -90)))),
+        )
+        for url in (WORLD, NORTH_EAST, SOUTH_WEST):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(b"Global extent", response.content)
+
+    def test_tiles_outside_the_pyramid_are_404(self):
+        self.assertEqual(self.client.get("/api/v1/tiles/works/1/2/0.mvt").status_code, 404)
+        self.assertEqual(self.client.get("/api/v1/tiles/works/23/0/0.mvt").status_code, 404)
+
+    def test_saving_a_work_retires_cached_tiles(self):
+        self.assertIn(b"Published in Germany", tiles.get_work_tile(0, 0, 0))
+        self.published.title = "Renamed work"
+        self.published.save()
+        tile = tiles.get_work_tile(0, 0, 0)
+        self.assertIn(b"Renamed work", tile)
+        self.assertNotIn(b"Published in Germany", tile)
+
+    def test_bulk_publish_retires_cached_tiles(self):
+        from works.admin import make_public
+
+        self.assertNotIn(b"Draft in Germany", tiles.get_work_tile(0, 0, 0))
+        make_public(None, None, Work.objects.filter(pk=self.draft.pk))
+        self.assertIn(b"Draft in Germany", tiles.get_work_tile(0, 0, 0))
+
+
+class WorkClusterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.older = Work.objects.create(status="p", title="Older", geometry=GeometryCollection(Point(8.0, 51.0)))
+        self.newer = Work.objects.create(
+            status="p",
+            title="Newer",
+            geometry=GeometryCollection(Polygon(((8, 51), (9, 51), (9, 52), (8, 52), (8, 51)))),
+        )
+        Work.objects.create(status="h", title="Harvested", geometry=GeometryCollection(Point(8.2, 51.2)))
+        Work.objects.create(status="p", title="Far away", geometry=GeometryCollection(Point(-70.0, -30.0)))
+
+    def _clusters(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/geo+json")
+        return response.json()["features"]
+
+    def test_nearby_works_share_a_cluster(self):
+        clusters = self._clusters("/api/v1/clusters/works/0/0/0.geojson")
+        self.assertEqual(sorted(c["properties"]["count"] for c in clusters), [1, 2])
+        germany = next(c for c in clusters if c["properties"]["count"] == 2)
+        self.assertEqual(germany["properties"]["work_id"], self.newer.pk)
+        self.assertEqual(germany["properties"]["bbox"], [8.0, 51.0, 9.0, 52.0])
+
+    def test_staff_clusters_include_unpublished_works(self):
+        admin = User.objects.create_user("clusteradmin", "clusters@test.com", "test", is_staff=True)
+        self.client.force_login(admin)
+        clusters = self._clusters("/api/v1/clusters/works/0/0/0.geojson")
+        self.assertEqual(sum(c["properties"]["count"] for c in clusters), 4)
+
+    def test_clusters_are_limited_to_the_tile(self):
+        clusters = self._clusters("/api/v1/clusters/works/1/1/0.geojson")
+        self.assertEqual([c["properties"]["count"] for c in clusters], [2])
+
+    def test_each_work_is_clustered_in_exactly_one_tile(self):
+        # On and just west of the edge between tiles 1/0/0 and 1/1/0.
+        edge = Work.objects.create(status="p", title="On the edge", geometry=GeometryCollection(Point(0.0, 10.0)))
+        Work.objects.create(status="p", title="West of the edge", geometry=GeometryCollection(Point(-0.01, 10.0)))
+        west = self._clusters("/api/v1/clusters/works/1/0/0.geojson")
+        east = self._clusters("/api/v1/clusters/works/1/1/0.geojson")
+        self.assertEqual([c["properties"]["count"] for c in west], [1])
+        self.assertEqual(sorted(c["properties"]["count"] for c in east), [1, 2])
+        self.assertIn(edge.pk, [c["properties"]["work_id"] for c in east])
+
+    def test_saving_a_work_retires_cached_clusters(self):
+        self.assertEqual(len(tiles.get_cluster_tile(0, 0, 0)["features"]), 2)
+        Work.objects.create(status="p", title="Pacific", geometry=GeometryCollection(Point(-150.0, 10.0)))
+        self.assertEqual(len(tiles.get_cluster_tile(0, 0, 0)["features"]), 3)
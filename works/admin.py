@@ -92,12 +92,20 @@ def export_to_wikidata_dryrun(modeladmin, request, queryset):
 
 @admin.action(description="Mark selected works as published")
 def make_public(modeladmin, request, queryset):
-    queryset.update(status="p")
+    from works.services.work_changes import on_works_changed
+
+    ids = list(queryset.values_list("pk", flat=True))
+    queryset.update(status="p", lastUpdate=now())
+    on_works_changed(ids)
 
 
 @admin.action(description="Mark selected works as draft (unpublished)")
 def make_draft(modeladmin, request, queryset):
-    queryset.update(status="d")
+    from works.services.work_changes import on_works_changed
+
+    ids = list(queryset.values_list("pk", flat=True))
+    queryset.update(status="d", lastUpdate=now())
+    on_works_changed(ids)
 
 
 def _enqueue_harvest(sources, request, modeladmin):
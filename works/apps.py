@@ -71,6 +71,33 @@ def schedule_region_backfill_tasks(sender, **kwargs):
     schedule_backfill_work_regions()
 
 
+def schedule_statistics_tasks(sender, **kwargs):
+    from works.tasks import schedule_source_coverage, schedule_statistics_reconciliation
+
+    schedule_statistics_reconciliation()
+    schedule_source_coverage()
+
+
+def schedule_facet_tasks(sender, **kwargs):
+    from works.tasks import schedule_year_facet_extension
+
+    schedule_year_facet_extension()
+
+
+def build_work_facets(sender, **kwargs):
+    """Build the ``WorkFacet`` index once after the migration that creates it.
+
+    Only runs while the index is empty but published works exist, so later
+    ``migrate`` runs (and the empty test database) cost a single query.
+    Incremental maintenance takes over from there (see works/services/facets.py).
+    """
+    from works.models import Work, WorkFacet
+    from works.services.facets import rebuild_facets
+
+    if not WorkFacet.objects.exists() and Work.objects.filter(status="p").exists():
+        logger.info("Built work facet index: %d rows", rebuild_facets())
+
+
 def _update_pygeoapi_extent(sender=None, **kwargs):
     """Compute the bounding box of all published works and patch PYGEOAPI_CONFIG.
 
@@ -142,4 +169,22 @@ class WorksConfig(AppConfig):
             weak=False,
             dispatch_uid="works.schedule_region_backfill_tasks",
         )
+        post_migrate.connect(
+            schedule_statistics_tasks,
+            sender=self,
+            weak=False,
+            dispatch_uid="works.schedule_statistics_tasks",
+        )
+        post_migrate.connect(
+            schedule_facet_tasks,
+            sender=self,
+            weak=False,
+            dispatch_uid="works.schedule_facet_tasks",
+        )
+        post_migrate.connect(
+            build_work_facets,
+            sender=self,
+            weak=False,
+            dispatch_uid="works.build_work_facets",
+        )
         import works.signals  # noqa: F401 — connects @receiver decorators
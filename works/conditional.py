@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Conditional GET (``ETag`` / ``Last-Modified``) for the read-only API viewsets.
+
+Polling clients and repeat visitors re-download whole list endpoints although
+the data rarely changes. :class:`ConditionalGetMixin` derives validators from a
+version stamp (:func:`works.services.cache_tags.tag_stamp`) or a cheap
+aggregate query instead of the rendered body, so a request carrying a matching
+``If-None-Match`` or ``If-Modified-Since`` is answered with ``304 Not
+Modified`` before the queryset is paginated or serialized.
+
+Validated responses are marked ``Cache-Control: no-cache, max-age=0``: the
+site-wide page cache (``UpdateCacheMiddleware``) then stores none of them, so
+a changed resource is never served from a copy cached under the old
+validators, and browsers revalidate (cheaply) instead of reusing a stale body.
+"""
+
+import hashlib
+
+from django.http import HttpResponseNotModified
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+
+
+def build_etag(*parts) -> str:
+    """Entity tag (SHA-1 hex) over the ``str()`` of ``parts``."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ConditionalGetMixin:
+    """Answer unchanged ``list``/``retrieve`` requests with ``304 Not Modified``.
+
+    Subclasses implement :meth:`conditional_state`, returning ``(parts,
+    last_modified)`` for the requested resource: ``parts`` are folded into the
+    ETag together with the full request path (so every filter, page and format
+    gets its own tag), the negotiated renderer and the caller's staff flag;
+    ``last_modified`` (a datetime or ``None``) becomes the ``Last-Modified``
+    header. Returning ``None`` disables validation for that request.
+    """
+
+    def conditional_state(self, request, detail, **kwargs):
+        return None
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(request, False, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._conditional(request, True, super().retrieve, *args, **kwargs)
+
+    def _conditional(self, request, detail, handler, *args, **kwargs):
+        state = self.conditional_state(request, detail, **kwargs)
+        if state is None:
+            return handler(request, *args, **kwargs)
+        parts, last_modified = state
+        renderer = getattr(getattr(request, "accepted_renderer", None), "format", "")
+        etag = quote_etag(build_etag(request.get_full_path(), renderer, bool(request.user.is_staff), *parts))
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            # 304 (or 412 for a failed precondition) — nothing is serialized.
+            if isinstance(not_modified, HttpResponseNotModified):
+                patch_vary_headers(not_modified, ["Accept"])
+                patch_cache_control(not_modified, no_cache=True, max_age=0)
+            return not_modified
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+            patch_vary_headers(response, ["Accept"])
+            patch_cache_control(response, no_cache=True, max_age=0)
+        return response
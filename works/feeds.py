@@ -5,18 +5,25 @@
 Improved feed implementation for OPTIMAP with caching, validation fixes, and regional feeds.
 """
 
+import hashlib
 import logging
+import time
 import urllib.parse
 from datetime import datetime
 
 from django.conf import settings
 from django.contrib.syndication.views import Feed
 from django.core.cache import cache
-from django.http import Http404
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
 from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.utils.http import http_date, parse_http_date_safe
 
 from .models import Collection, GlobalRegion, Source, Work
+from .services.cache_tags import COLLECTION, WORKS, tag, tagged_key
+from .services.facets import REGION, SOURCE
 from .utils.geometry import COORDINATE_PRECISION
 
 logger = logging.getLogger(__name__)
@@ -146,6 +153,33 @@ def _format_georss_geometry(geometry):
     return georss_data
 
 
+#: Work columns the feed item methods of :class:`BaseCachedGeoFeed` read.
+FEED_ITEM_FIELDS = (
+    "id",
+    "doi",
+    "title",
+    "abstract",
+    "url",
+    "geometry",
+    "publicationDate",
+    "creationDate",
+    "lastUpdate",
+    "authors",
+    "openalex_match_info",
+    "keywords",
+    "topics",
+    "source__name",
+    "source__homepage_url",
+)
+
+
+def feed_items(queryset):
+    """The newest ``FEED_MAX_ITEMS`` works of ``queryset``, loading only :data:`FEED_ITEM_FIELDS`."""
+    return (
+        queryset.select_related("source").only(*FEED_ITEM_FIELDS).order_by("-creationDate")[: settings.FEED_MAX_ITEMS]
+    )
+
+
 def normalize_region_slug(slug):
     """
     Normalize a region slug to lowercase with hyphens.
@@ -221,6 +255,13 @@ class BaseCachedGeoFeed(Feed):
         Override __call__ to implement caching.
 
         Cache feeds for FEED_CACHE_HOURS unless ?now parameter is present.
+        A work, source or collection change retires the cached feed at once
+        through its :meth:`cache_tags`; ``works.tasks.prerender_feeds`` renders
+        the new version in the background so requests rarely find it missing.
+        Polling readers that send the ``ETag`` or ``Last-Modified`` of their
+        copy get ``304 Not Modified`` while the feed is unchanged. The cached
+        feed is what makes polls cheap, so responses stay out of the site-wide
+        page cache, whose copy would outlive a change of the feed.
         """
         # Check for ?now parameter to force refresh
         force_refresh = request.GET.get("now") is not None
@@ -228,28 +269,89 @@ class BaseCachedGeoFeed(Feed):
         # Build cache key
         cache_key = self._get_cache_key(request, *args, **kwargs)
 
-        if not force_refresh:
-            # Try to get cached response
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                logger.debug("Serving cached feed: %s", cache_key)
-                return cached_response
+        entry = None if force_refresh else cache.get(cache_key)
+        if entry is None:
+            logger.debug("Generating fresh feed: %s", cache_key)
+            entry = self.render(request, cache_key, *args, **kwargs)
+        else:
+            logger.debug("Serving cached feed: %s", cache_key)
+        response = self._cached_response(request, entry)
+        patch_cache_control(response, no_cache=True, max_age=0)
+        return response
 
-        # Generate fresh feed
-        logger.debug("Generating fresh feed: %s", cache_key)
-        response = super().__call__(request, *args, **kwargs)
+    def render(self, request, cache_key, *args, **kwargs):
+        """Render the feed, cache its body and headers under ``cache_key`` and return that entry.
 
-        # Cache the response
+        The ``ETag`` is a digest of the rendered document, so every change a
+        reader would see (an item entering or leaving the capped feed, an
+        unpublished or edited item, a renamed source) yields a new one, while
+        a re-render of unchanged content keeps it. ``Last-Modified`` is when
+        the document last changed, remembered per feed URL, and never earlier
+        than the newest item.
+        """
+        try:
+            obj = self.get_object(request, *args, **kwargs)
+        except ObjectDoesNotExist:
+            raise Http404("Feed object does not exist.")
+        feedgen = self.get_feed(obj, request)
+        content = feedgen.writeString("utf-8").encode("utf-8")
+        etag = quote_etag(hashlib.sha1(content, usedforsecurity=False).hexdigest())
+
+        state_key = f"feed_state:{self.feed_type_variant}:{request.path}"
+        state = cache.get(state_key)
+        if state is not None and state[0] == etag:
+            last_modified = state[1]
+        else:
+            last_modified = max(time.time(), feedgen.latest_post_date().timestamp())
+            cache.set(state_key, (etag, last_modified), timeout=None)
+
+        entry = {
+            "content": content,
+            "headers": {
+                "Content-Type": feedgen.content_type,
+                "Last-Modified": http_date(last_modified),
+                "ETag": etag,
+            },
+        }
         cache_hours = getattr(settings, "FEED_CACHE_HOURS", 24)
-        cache.set(cache_key, response, timeout=cache_hours * 3600)
+        cache.set(cache_key, entry, timeout=cache_hours * 3600)
+        return entry
 
+    def prerender(self, request, *args, **kwargs) -> bool:
+        """Render the feed into the cache unless its current version is there; returns whether it rendered."""
+        cache_key = self._get_cache_key(request, *args, **kwargs)
+        if cache.get(cache_key) is not None:
+            return False
+        self.render(request, cache_key, *args, **kwargs)
+        return True
+
+    @staticmethod
+    def _cached_response(request, entry):
+        """The cached feed ``entry`` as a response, or ``304`` if the reader's copy is current."""
+        headers = entry["headers"]
+        not_modified = get_conditional_response(
+            request,
+            etag=headers["ETag"],
+            last_modified=parse_http_date_safe(headers["Last-Modified"]),
+        )
+        if not_modified is not None:
+            not_modified["ETag"] = headers["ETag"]
+            not_modified["Last-Modified"] = headers["Last-Modified"]
+            return not_modified
+        response = HttpResponse(entry["content"])
+        for name, value in headers.items():
+            response[name] = value
         return response
 
     def _get_cache_key(self, request, *args, **kwargs):
-        """Generate cache key for this feed."""
+        """Generate cache key for this feed, qualified by its cache tags."""
         path = request.path
         variant = self.feed_type_variant
-        return f"feed:{variant}:{path}"
+        return tagged_key(f"feed:{variant}:{path}", self.cache_tags(request, *args, **kwargs))
+
+    def cache_tags(self, request, *args, **kwargs):
+        """Tags (:mod:`works.services.cache_tags`) whose bump retires the cached feed."""
+        return [WORKS]
 
     def get_feed(self, obj, request):
         """Set up the correct feed type."""
@@ -407,14 +509,8 @@ class GlobalGeoFeed(BaseCachedGeoFeed):
 
     def items(self):
         """Return feed items."""
-        return (
-            Work.objects.filter(
-                status="p",
-                geometry__isnull=False,
-            )
-            .exclude(url__isnull=True)
-            .exclude(url__exact="")
-            .order_by("-creationDate")[: settings.FEED_MAX_ITEMS]
+        return feed_items(
+            Work.objects.filter(status="p", geometry__isnull=False).exclude(url__isnull=True).exclude(url__exact="")
         )
 
 
@@ -437,6 +533,13 @@ class RegionalGeoFeed(BaseCachedGeoFeed):
             raise Http404(f"Region not found: {region_slug}")
         return region
 
+    def cache_tags(self, request, *args, **kwargs):
+        try:
+            region = self.get_object(request, **kwargs)
+        except Http404:
+            return [WORKS]
+        return [tag(REGION, region.pk)]
+
     def title(self, obj):
         """Return feed title with region name."""
         region_type = obj.get_region_type_display()
@@ -452,35 +555,18 @@ class RegionalGeoFeed(BaseCachedGeoFeed):
         return f"Latest research works with geographic metadata from {obj.name} ({region_type}) on OPTIMAP."
 
     def items(self, obj):
-        """Return feed items filtered by region geometry."""
-        # Use bbox overlap first for performance
-        candidates = (
-            Work.objects.filter(
-                status="p",
-                geometry__isnull=False,
-                geometry__bboverlaps=obj.geom,
-            )
-            .exclude(url__isnull=True)
-            .exclude(url__exact="")
-            .order_by("-creationDate")
-        )
+        """Return published works linked to the region.
 
-        # Prepare geometry for faster intersection checks
-        prepared_geom = obj.geom.prepared
-
-        # Filter by actual intersection and limit
-        filtered = [work for work in candidates if prepared_geom.intersects(work.geometry)][: settings.FEED_MAX_ITEMS]
-
-        logger.debug(
-            "Region feed '%s': %d candidates, %d after intersection with a limit of %d",
-            obj.name,
-            candidates.count(),
-            len(filtered),
-            settings.FEED_MAX_ITEMS,
+        Reads the persisted ``Work.regions`` association (kept current by the
+        ``assign_work_regions`` signal and the ``backfill_work_regions`` sweep),
+        the same one the region landing page lists, so the feed is a single
+        indexed query with a ``LIMIT`` instead of an intersection test per
+        candidate work in Python.
+        """
+        return feed_items(
+            obj.works.filter(status="p", geometry__isnull=False).exclude(url__isnull=True).exclude(url__exact="")
         )
 
-        return filtered
-
 
 class CollectionGeoFeed(BaseCachedGeoFeed):
     """Feed filtered by curated collection."""
@@ -492,6 +578,10 @@ class CollectionGeoFeed(BaseCachedGeoFeed):
     def get_object(self, request, collection_slug):
         return get_object_or_404(Collection, identifier=collection_slug, is_published=True)
 
+    def cache_tags(self, request, collection_slug):
+        pk = Collection.objects.filter(identifier=collection_slug).values_list("pk", flat=True).first()
+        return [tag(COLLECTION, pk)]
+
     def title(self, obj):
         return f"OPTIMAP – {obj.name}"
 
@@ -502,11 +592,7 @@ class CollectionGeoFeed(BaseCachedGeoFeed):
         return obj.description or f"Latest works in collection '{obj.name}'"
 
     def items(self, obj):
-        return (
-            Work.objects.filter(collections=obj, status="p")
-            .exclude(geometry__isnull=True)
-            .order_by("-creationDate")[: settings.FEED_MAX_ITEMS]
-        )
+        return feed_items(Work.objects.filter(collections=obj, status="p").exclude(geometry__isnull=True))
 
 
 class SourceGeoFeed(BaseCachedGeoFeed):
@@ -519,6 +605,10 @@ class SourceGeoFeed(BaseCachedGeoFeed):
     def get_object(self, request, source_slug):
         return get_object_or_404(Source, slug=source_slug)
 
+    def cache_tags(self, request, source_slug):
+        pk = Source.objects.filter(slug=source_slug).values_list("pk", flat=True).first()
+        return [tag(SOURCE, pk)]
+
     def title(self, obj):
         return f"OPTIMAP – {obj.name}"
 
@@ -529,8 +619,4 @@ class SourceGeoFeed(BaseCachedGeoFeed):
         return f"Latest works from source '{obj.name}'"
 
     def items(self, obj):
-        return (
-            Work.objects.filter(source=obj, status="p")
-            .exclude(geometry__isnull=True)
-            .order_by("-creationDate")[: settings.FEED_MAX_ITEMS]
-        )
+        return feed_items(Work.objects.filter(source=obj, status="p").exclude(geometry__isnull=True))
@@ -745,6 +745,16 @@ def complete_harvest(event, stats, warning_collector, spatial_count=None, tempor
         except Exception as exc:
             logger.warning("Could not enqueue OpenAIRE enrichment sweep for event %s: %s", event.id, exc)
 
+    # The harvested works went through the save signals (and so through
+    # works.services.work_changes.on_works_changed) one by one. The source
+    # statistics above were written with .update(), past the signals, so retire
+    # the source's cached feeds, facet map and pages here.
+    if source is not None:
+        from works.services import cache_tags
+        from works.services.facets import SOURCE
+
+        cache_tags.bump_tags([cache_tags.tag(SOURCE, source.pk)])
+
     return spatial_count, temporal_count
 
 
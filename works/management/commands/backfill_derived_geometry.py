@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Backfill the columns ``Work.save`` derives from the geometry.
+
+``Work.save`` maintains these column sets whenever the geometry is written:
+
+``summary``
+    ``bbox``, ``bbox_center`` and ``extreme_north``/``_south``/``_east``/``_west``
+    (``works.utils.geometry.spatial_summary``);
+``simplified``
+    ``geometry_low``, ``geometry_medium`` and ``geometry_high``
+    (``works.utils.geometry.simplified_geometries``). Works whose geometry
+    cannot be simplified (points, short lines) legitimately keep ``NULL``
+    columns, so without ``--force`` they are (cheaply) re-checked on each run;
+``geojson``
+    ``geometry_geojson`` and ``geometry_geojson_unwrapped``
+    (``works.utils.geometry.geojson_texts``); re-render them with ``--force``
+    after changing ``COORDINATE_PRECISION``.
+
+This command fills the selected sets (all by default) for rows saved before
+the columns existed, or, with ``--force``, recomputes every row, using the same
+helpers. Writes go through ``bulk_update`` so ``lastUpdate`` is not bumped and
+no save signals fire.
+
+Usage:
+    python manage.py backfill_derived_geometry
+    python manage.py backfill_derived_geometry --columns summary,geojson --limit 1000
+    python manage.py backfill_derived_geometry --columns geojson --force
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from works.models import Work
+from works.utils.geometry import GEOJSON_TEXT_FIELDS, SIMPLIFIED_GEOMETRY_FIELDS, SPATIAL_SUMMARY_FIELDS
+
+#: name -> (columns written, column that is NULL until filled, Work method computing them, skip empty geometries)
+COLUMN_SETS = {
+    "summary": (SPATIAL_SUMMARY_FIELDS, "bbox_center", "refresh_spatial_summary", True),
+    "simplified": (SIMPLIFIED_GEOMETRY_FIELDS, "geometry_low", "refresh_simplified_geometries", True),
+    "geojson": (GEOJSON_TEXT_FIELDS, "geometry_geojson", "refresh_geojson_text", False),
+}
+
+
+class Command(BaseCommand):
+    help = "Fill the Work columns derived from the geometry (extent, simplified geometries, GeoJSON text)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--columns",
+            default=",".join(COLUMN_SETS),
+            help=f"Comma-separated column sets to fill: {', '.join(COLUMN_SETS)} (default: all).",
+        )
+        parser.add_argument("--limit", type=int, default=None, help="Max works to process per set (default: all).")
+        parser.add_argument("--force", action="store_true", help="Recompute even when the columns are already set.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows per bulk update (default: 500).")
+
+    def handle(self, *args, **opts):
+        names = [name.strip() for name in opts["columns"].split(",") if name.strip()]
+        unknown = sorted(set(names) - set(COLUMN_SETS))
+        if unknown or not names:
+            raise CommandError(f"Unknown column set(s) {', '.join(unknown)}; choose from {', '.join(COLUMN_SETS)}.")
+        for name in COLUMN_SETS:
+            if name in names:
+                total = self._backfill(*COLUMN_SETS[name], opts)
+                self.stdout.write(self.style.SUCCESS(f"{name}: processed {total} work(s)"))
+
+    def _backfill(self, fields, marker, refresh, skip_empty, opts):
+        batch_size = opts["batch_size"]
+        qs = Work.objects.filter(geometry__isnull=False)
+        if skip_empty:
+            qs = qs.exclude(geometry__isempty=True)
+        if not opts["force"]:
+            qs = qs.filter(**{f"{marker}__isnull": True})
+        qs = qs.only("id", "geometry").order_by("id")
+        if opts["limit"]:
+            qs = qs[: opts["limit"]]
+
+        batch = []
+        total = 0
+        for work in qs.iterator(chunk_size=batch_size):
+            getattr(work, refresh)()
+            batch.append(work)
+            if len(batch) >= batch_size:
+                total += self._flush(batch, fields, batch_size)
+        total += self._flush(batch, fields, batch_size)
+        return total
+
+    def _flush(self, batch, fields, batch_size):
+        n = len(batch)
+        if n:
+            Work.objects.bulk_update(batch, fields, batch_size=batch_size)
+            batch.clear()
+        return n
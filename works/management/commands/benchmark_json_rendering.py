@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark JSON rendering of a works API page: stdlib encoder vs. orjson.
+
+Fetches one page of ``/api/v1/works/`` (``?limit=999`` by default) through the
+``WorkViewSet`` — queries and serialization included — and then renders the
+same response data repeatedly with DRF's stock encoder (plus the ``RawJSON``
+splicing the works renderer needs) and with :class:`works.renderers.FastJSONRenderer`.
+Only the encoding step is timed, since that is the part the renderers change.
+
+Usage:
+    python manage.py benchmark_json_rendering
+    python manage.py benchmark_json_rendering --limit 999 --repeat 20 --minimal
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from works.renderers import FastJSONRenderer, RawJSONAwareEncoder
+from works.utils.geojson import FAST_JSON
+from works.viewsets import WorkViewSet
+
+
+class _StdlibRenderer(JSONRenderer):
+    encoder_class = RawJSONAwareEncoder
+
+
+class Command(BaseCommand):
+    help = "Time JSON rendering of a /api/v1/works/ page with the stdlib encoder and with orjson."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, default=999, help="Works per page (default 999).")
+        parser.add_argument("--repeat", type=int, default=10, help="Timed renders per encoder (default 10).")
+        parser.add_argument("--minimal", action="store_true", help="Benchmark the ?minimal=true map payload.")
+
+    def handle(self, *args, **opts):
+        if not FAST_JSON:
+            raise CommandError("orjson (>= 3.9) is not installed; there is nothing to compare against.")
+        query = {"limit": opts["limit"]}
+        if opts["minimal"]:
+            query["minimal"] = "true"
+        request = APIRequestFactory().get("/api/v1/works/", query, HTTP_ACCEPT="application/json")
+        request.user = AnonymousUser()
+        response = WorkViewSet.as_view({"get": "list"})(request)
+        if response.status_code != 200:
+            raise CommandError(f"/api/v1/works/ answered {response.status_code}")
+        data = response.data
+        features = data.get("results", {}).get("features", [])
+        self.stdout.write(f"Rendering {len(features)} work(s), {opts['repeat']} run(s) per encoder")
+
+        results = {}
+        for label, renderer in (("stdlib json", _StdlibRenderer()), ("orjson", FastJSONRenderer())):
+            renderer.render(data, "application/json")  # warm-up
+            timings = []
+            for _ in range(opts["repeat"]):
+                start = time.perf_counter()
+                body = renderer.render(data, "application/json")
+                timings.append(time.perf_counter() - start)
+            results[label] = statistics.median(timings)
+            self.stdout.write(f"  {label:<12} median {results[label] * 1000:8.1f} ms  ({len(body):,} bytes)")
+
+        speedup = results["stdlib json"] / results["orjson"] if results["orjson"] else float("inf")
+        self.stdout.write(self.style.SUCCESS(f"orjson renders {speedup:.1f}x faster"))
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Benchmark the statistics recount: one query per metric vs. one filtered aggregate.
+
+Inserts a synthetic dataset (``--works`` works spread over ``--sources``
+sources, with a mix of statuses and filled/empty metadata) on top of the
+existing data, then times two parts of ``works.utils.statistics``:
+
+``counts``
+    the scalar work counts of ``calculate_statistics``: the previous one
+    ``COUNT`` query per metric against the single ``COUNT(*) FILTER (WHERE ...)``
+    aggregate;
+``coverage``
+    the source coverage snapshots: the previous seven queries per source
+    against ``calculate_sources_coverage``'s three grouped queries.
+
+Both implementations must agree before their times are reported. Everything,
+the synthetic works included, is rolled back at the end. Until then the
+inserts hold locks on the work table and fire its triggers, so the command
+refuses to run unless ``DEBUG`` is on or ``--yes-i-know`` is given.
+
+Usage:
+    python manage.py benchmark_statistics
+    python manage.py benchmark_statistics --works 500000 --sources 200 --repeat 3
+    python manage.py benchmark_statistics --yes-i-know  # with DEBUG off, e.g. on a staging copy
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import ExtractYear
+
+from works.models import Contribution, Source, SourceCoverageSnapshot, Work
+from works.utils.statistics import _work_counts, calculate_sources_coverage
+
+_COVERAGE_FIELDS = (
+    "optimap_count",
+    "openalex_total",
+    "coverage_pct",
+    "spatial_rate",
+    "temporal_rate",
+    "open_access_ratio",
+    "contributors_count",
+    "by_year",
+)
+
+
+def _legacy_counts():
+    """The scalar counts as calculate_statistics computed them before, one query each."""
+    published = Work.objects.filter(status="p")
+    temporal = Q(timeperiod_startdate__isnull=False) | Q(timeperiod_enddate__isnull=False)
+    counts = {"total_works": Work.objects.count()}
+    counts.update((f"status_{s}", Work.objects.filter(status=s).count()) for s in ("p", "h", "c", "d", "t", "w"))
+    counts.update(
+        with_geometry=published.exclude(geometry__isnull=True).count(),
+        with_temporal=published.filter(temporal).count(),
+        with_authors=published.exclude(authors__isnull=True).exclude(authors=[]).count(),
+        with_doi=published.exclude(doi__isnull=True).exclude(doi="").count(),
+        with_abstract=published.exclude(abstract__isnull=True).exclude(abstract="").count(),
+        open_access=published.exclude(openalex_open_access_status__isnull=True)
+        .exclude(openalex_open_access_status="")
+        .count(),
+        from_openalex=published.exclude(openalex_id__isnull=True).exclude(openalex_id="").count(),
+        with_complete_metadata=published.exclude(geometry__isnull=True)
+        .filter(temporal)
+        .exclude(authors__isnull=True)
+        .exclude(authors=[])
+        .count(),
+    )
+    return counts
+
+
+def _legacy_coverage(sources):
+    """The source coverage snapshots as calculate_source_coverage computed them before, source by source."""
+    snapshots = []
+    for source in sources:
+        published = Work.objects.filter(status="p", source=source)
+        optimap_count = published.count()
+        openalex_total = source.works_count
+
+        def _rate(numerator):
+            return round(numerator / optimap_count * 100, 1) if optimap_count > 0 else None
+
+        snapshots.append(
+            SourceCoverageSnapshot.objects.create(
+                source=source,
+                openalex_total=openalex_total,
+                optimap_count=optimap_count,
+                coverage_pct=round(optimap_count / openalex_total * 100, 1) if openalex_total else None,
+                spatial_rate=_rate(published.exclude(geometry__isnull=True).count()),
+                temporal_rate=_rate(
+                    published.filter(
+                        Q(timeperiod_startdate__isnull=False) | Q(timeperiod_enddate__isnull=False)
+                    ).count()
+                ),
+                open_access_ratio=_rate(
+                    published.filter(openalex_open_access_status__in=("gold", "green", "hybrid")).count()
+                ),
+                contributors_count=Contribution.objects.filter(work__source=source)
+                .exclude(user__isnull=True)
+                .values("user")
+                .distinct()
+                .count(),
+                by_year=[
+                    {"year": row["year"], "count": row["cnt"]}
+                    for row in published.exclude(publicationDate__isnull=True)
+                    .annotate(year=ExtractYear("publicationDate"))
+                    .values("year")
+                    .annotate(cnt=Count("id"))
+                    .order_by("year")
+                ],
+            )
+        )
+    return snapshots
+
+
+def _coverage_values(snapshots):
+    return [[getattr(snapshot, name) for name in _COVERAGE_FIELDS] for snapshot in snapshots]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Time the statistics recount on a synthetic dataset, per-metric queries vs. one filtered aggregate."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--works", type=int, default=100_000, help="Synthetic works to add (default 100000).")
+        parser.add_argument("--sources", type=int, default=50, help="Synthetic sources to add (default 50).")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per implementation (default 5).")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed of the synthetic dataset.")
+        parser.add_argument(
+            "--yes-i-know",
+            action="store_true",
+            help="Run even though DEBUG is off; the synthetic inserts load and lock the live database.",
+        )
+
+    def handle(self, *args, **opts):
+        if not settings.DEBUG and not opts["yes_i_know"]:
+            raise CommandError(
+                "Refusing to insert a synthetic dataset with DEBUG off. Run against a development or staging "
+                "database, or pass --yes-i-know."
+            )
+        try:
+            with transaction.atomic():
+                self._run(opts)
+                raise _Rollback
+        except _Rollback:
+            self.stdout.write("Rolled back the synthetic dataset.")
+
+    def _run(self, opts):
+        started = time.perf_counter()
+        sources = self._create_dataset(opts["works"], opts["sources"], random.Random(opts["seed"]))
+        self.stdout.write(
+            f"Inserted {opts['works']:,} works over {len(sources)} sources in {time.perf_counter() - started:.1f}s; "
+            f"{Work.objects.count():,} works in total, {opts['repeat']} run(s) per implementation"
+        )
+
+        benchmarks = (
+            ("counts", _legacy_counts, _work_counts, lambda result: result),
+            (
+                "coverage",
+                lambda: _legacy_coverage(sources),
+                lambda: calculate_sources_coverage(sources),
+                _coverage_values,
+            ),
+        )
+        for name, legacy, current, comparable in benchmarks:
+            if comparable(legacy()) != comparable(current()):  # also the warm-up
+                raise CommandError(f"The {name} of both implementations differ.")
+            results = {}
+            for label, func in (("per metric", legacy), ("aggregated", current)):
+                timings = []
+                for _ in range(opts["repeat"]):
+                    start = time.perf_counter()
+                    func()
+                    timings.append(time.perf_counter() - start)
+                results[label] = statistics.median(timings)
+                self.stdout.write(f"  {name:<9} {label:<12} median {results[label] * 1000:8.1f} ms")
+            speedup = results["per metric"] / results["aggregated"] if results["aggregated"] else float("inf")
+            self.stdout.write(self.style.SUCCESS(f"{name}: the aggregated queries run {speedup:.1f}x faster"))
+
+    def _create_dataset(self, n_works, n_sources, rng):
+        run = f"benchmark-{time.time_ns()}"
+        sources = [
+            Source.objects.create(
+                name=f"Benchmark journal {i}",
+                url_field=f"https://{run}.example.org/{i}",
+                source_type="oai-pmh",
+                works_count=rng.choice([None, n_works]),
+            )
+            for i in range(n_sources)
+        ]
+        statuses = ["p"] * 6 + ["h", "c", "d", "t", "w"]
+        open_access = [None, "", "gold", "green", "hybrid", "bronze", "closed"]
+        works = []
+        for i in range(n_works):
+            year = rng.randint(1990, 2026)
+            works.append(
+                Work(
+                    title=f"Benchmark work {i}",
+                    status=rng.choice(statuses),
+                    source=rng.choice(sources),
+                    url=f"https://{run}.example.org/works/{i}",
+                    doi=f"10.9999/{run}.{i}" if rng.random() < 0.8 else None,
+                    abstract=rng.choice([None, "", "An abstract."]),
+                    authors=rng.choice([None, [], ["A. Author", "B. Author"]]),
+                    geometry=GeometryCollection(Point(rng.uniform(-180, 180), rng.uniform(-90, 90)))
+                    if rng.random() < 0.7
+                    else None,
+                    timeperiod_startdate=[str(year)] if rng.random() < 0.6 else None,
+                    timeperiod_enddate=[str(year + 1)] if rng.random() < 0.4 else None,
+                    publicationDate=datetime.date(year, 1, 1) if rng.random() < 0.9 else None,
+                    openalex_id=f"W{i}" if rng.random() < 0.5 else None,
+                    openalex_open_access_status=rng.choice(open_access),
+                )
+            )
+        Work.objects.bulk_create(works, batch_size=5000)
+        return sources
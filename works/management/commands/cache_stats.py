@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Report hit rates of the two-tier cache per key prefix.
+
+Only available when ``OPTIMAP_CACHE_L1`` is set, i.e. the ``default`` cache is
+:class:`optimap.cache.TieredCache`. Workers add their counters to the shared
+totals every ``STATS_INTERVAL`` seconds (60 by default), so the report lags
+traffic by up to that long.
+
+Usage:
+    python manage.py cache_stats            # totals of all workers
+    python manage.py cache_stats --json     # same, machine-readable
+"""
+
+import json
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
+
+from optimap.cache import TieredCache, shared_stats
+
+
+class Command(BaseCommand):
+    help = "Report per-prefix L1/L2 hit rates of the two-tier cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--cache", default="default", metavar="ALIAS", help="Cache alias (default: default).")
+        parser.add_argument("--json", action="store_true", help="Print the totals as JSON.")
+
+    def handle(self, *args, **options):
+        cache = caches[options["cache"]]
+        if not isinstance(cache, TieredCache):
+            raise CommandError(f"Cache '{options['cache']}' is not a TieredCache; set OPTIMAP_CACHE_L1=true.")
+
+        stats = shared_stats(cache)
+        if options["json"]:
+            self.stdout.write(json.dumps(stats, indent=2))
+            return
+        if not stats:
+            self.stdout.write("No hits recorded yet.")
+            return
+
+        self.stdout.write(f"{'prefix':<28}{'l1':>10}{'l2':>10}{'miss':>10}{'hit rate':>10}")
+        for prefix, row in stats.items():
+            self.stdout.write(f"{prefix:<28}{row['l1']:>10}{row['l2']:>10}{row['miss']:>10}{row['hit_rate']:>10.1%}")
@@ -11,6 +11,9 @@ with ``COUNTRY_SIMPLIFICATION_TOLERANCE`` before storing — they drive the
 ``/at/<country>`` pages and a toggleable countries map layer, neither of which
 needs full-resolution borders.
 
+After loading, the outlines are cut into the ``CountrySubdivided`` pieces used
+by the point-in-polygon join (see ``works.services.subdivisions``).
+
 Usage:
     python manage.py load_countries
     python manage.py load_countries --force        # re-download + reload
@@ -28,6 +31,7 @@ from django.core.management.base import BaseCommand
 from django.utils.text import slugify
 
 from works.models import Country
+from works.services.countries import refresh_country_subdivisions
 
 COMMAND_DIR = os.path.dirname(__file__)
 
@@ -159,9 +163,14 @@ class Command(BaseCommand):
             created_n += created
             updated_n += not created
 
+        # Full rebuild of the subdivided join table (the per-row post-save signal
+        # already re-cut each country; this also settles any drift in one pass).
+        pieces_n = refresh_country_subdivisions()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f"Countries loaded: {created_n} created, {updated_n} updated, "
-                f"{merged_n} merged from multiple features, {skipped_n} skipped (no ISO/name)."
+                f"{merged_n} merged from multiple features, {skipped_n} skipped (no ISO/name); "
+                f"{pieces_n} subdivided outline pieces."
             )
         )
@@ -15,6 +15,7 @@ from django.core.management import call_command
 from django.core.management.base import BaseCommand
 
 from works.models import GlobalRegion
+from works.services.regions import refresh_region_subdivisions
 
 # Use configurable data directory if set, otherwise fall back to command directory
 COMMAND_DIR = os.path.dirname(__file__)
@@ -191,3 +192,7 @@ class Command(BaseCommand):
             verb = "Created" if created else "Updated"
             self.stdout.write(f"{verb} ocean '{obj.name}'")
         del ds  # We cannot close the source but can only rely on the GC
+
+        # Rebuild the subdivided join table used by works.services.regions.lookup_regions.
+        pieces_n = refresh_region_subdivisions()
+        self.stdout.write(self.style.SUCCESS(f"Subdivided global region outlines into {pieces_n} pieces"))
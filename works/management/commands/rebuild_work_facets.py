@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Rebuild the ``WorkFacet`` index behind the facet pages from scratch.
+
+The index is maintained incrementally on save, publish and country/region
+changes (see ``works.services.facets``); this command recomputes it for every
+published work in one transaction — after a bulk import that bypassed
+``save()``, or to reconcile after a bug.
+
+Usage:
+    python manage.py rebuild_work_facets
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from works.services.facets import rebuild_facets
+
+
+class Command(BaseCommand):
+    help = "Rebuild the WorkFacet index (data years, topics, countries, regions, sources) from published works."
+
+    def handle(self, *args, **opts):
+        written = rebuild_facets()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt work facet index: {written} row(s)"))
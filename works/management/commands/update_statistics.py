@@ -3,24 +3,25 @@
 
 # publications/management/commands/update_statistics.py
 """
-Management command to update cached statistics.
-Run this command nightly via cron job:
-    0 2 * * * /path/to/manage.py update_statistics
+Management command to recount the work statistics.
+The counts are kept current by database triggers and recounted every
+STATISTICS_RECONCILE_HOURS by the scheduled works.tasks.reconcile_statistics;
+run this to correct them or refresh the breakdowns right away.
 """
 
 from django.core.management.base import BaseCommand
 
-from works.utils.statistics import update_statistics_cache
+from works.utils.statistics import reconcile_statistics
 
 
 class Command(BaseCommand):
-    help = "Update cached work statistics"
+    help = "Recount work statistics"
 
     def handle(self, *args, **options):
         self.stdout.write("Updating work statistics...")
 
         try:
-            stats = update_statistics_cache()
+            stats = reconcile_statistics()
 
             self.stdout.write(self.style.SUCCESS("✓ Statistics updated successfully"))
             self.stdout.write(f"  Total works: {stats['total_works']}")
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Build cold caches ahead of visitors after a deploy, ``clear_caches`` or a cache restart.
+
+Runs the stages of :mod:`works.services.cache_warmup` in order — statistics,
+facets, regions, collections, feeds, sitemap, works — and prints the time
+and outcome of every artifact and a summary per stage.
+
+Usage:
+    python manage.py warm_caches                          # everything
+    python manage.py warm_caches --only feeds --only works
+    python manage.py warm_caches --works 500 --access-log /var/log/nginx/optimap-access.log
+    python manage.py warm_caches --async                  # enqueue as a Django-Q task
+    python manage.py warm_caches --json                   # timings, machine-readable
+"""
+
+import json
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from works.services.cache_warmup import STAGES, warm_caches
+
+
+class Command(BaseCommand):
+    help = "Rebuild cached statistics, pages, feeds and sitemaps before visitors request them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            choices=STAGES,
+            metavar="STAGE",
+            help=f"Warm only this stage (repeatable): {', '.join(STAGES)}.",
+        )
+        parser.add_argument("--works", type=int, metavar="N", help="Number of work landing pages to build.")
+        parser.add_argument("--workers", type=int, metavar="N", help="Artifacts built at once within a stage.")
+        parser.add_argument(
+            "--access-log", metavar="PATH", help="Rank work landing pages by their requests in this access log."
+        )
+        parser.add_argument("--async", action="store_true", dest="enqueue", help="Enqueue as a Django-Q task.")
+        parser.add_argument("--json", action="store_true", help="Print the timings as JSON.")
+
+    def handle(self, *args, **options):
+        stages = options["only"] or None
+        if options["enqueue"]:
+            from django_q.tasks import async_task
+
+            task_id = async_task(
+                "works.tasks.warm_caches", stages, works=options["works"], access_log=options["access_log"]
+            )
+            self.stdout.write(f"Enqueued cache warm-up task {task_id}.")
+            return
+
+        report = None if options["json"] else self._report
+        started = time.monotonic()
+        results = warm_caches(
+            stages,
+            workers=options["workers"],
+            works=options["works"],
+            access_log=options["access_log"],
+            report=report,
+        )
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        totals = defaultdict(lambda: {"n": 0, "failed": 0, "seconds": 0.0})
+        for result in results:
+            row = totals[result["stage"]]
+            row["n"] += 1
+            row["failed"] += result["status"] == "failed"
+            row["seconds"] += result["seconds"]
+        self.stdout.write("")
+        self.stdout.write(f"{'stage':<14}{'artifacts':>10}{'failed':>8}{'seconds':>10}")
+        for stage, row in totals.items():
+            self.stdout.write(f"{stage:<14}{row['n']:>10}{row['failed']:>8}{row['seconds']:>10.2f}")
+        self.stdout.write(f"Done in {time.monotonic() - started:.2f}s.")
+
+    def _report(self, result):
+        line = f"{result['stage']:<14}{result['seconds']:>8.2f}s  {result['status']:<8}{result['artifact']}"
+        self.stdout.write(self.style.ERROR(line) if result["status"] == "failed" else line)
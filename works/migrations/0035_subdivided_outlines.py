@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import django.contrib.gis.db.models.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Seed the derived tables from the outlines already in the database, so existing
+# deployments keep matching works without re-running load_countries /
+# load_global_regions. 255 mirrors the OUTLINE_SUBDIVIDE_MAX_VERTICES default;
+# later rebuilds (signals, load commands) use the configured value.
+_SEED_COUNTRIES = """
+INSERT INTO works_countrysubdivided (country_id, geom)
+SELECT id, ST_Subdivide(ST_MakeValid(geom), 255) FROM works_country WHERE NOT ST_IsEmpty(geom);
+"""
+_SEED_REGIONS = """
+INSERT INTO works_globalregionsubdivided (region_id, geom)
+SELECT id, ST_Subdivide(ST_MakeValid(geom), 255) FROM works_globalregion WHERE NOT ST_IsEmpty(geom);
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0034_work_language_work_publisher"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CountrySubdivided",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("geom", django.contrib.gis.db.models.fields.GeometryField(srid=4326)),
+                (
+                    "country",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subdivisions",
+                        to="works.country",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "subdivided country outline",
+            },
+        ),
+        migrations.CreateModel(
+            name="GlobalRegionSubdivided",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("geom", django.contrib.gis.db.models.fields.GeometryField(srid=4326)),
+                (
+                    "region",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subdivisions",
+                        to="works.globalregion",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "subdivided global region outline",
+            },
+        ),
+        migrations.RunSQL(_SEED_COUNTRIES, reverse_sql=migrations.RunSQL.noop),
+        migrations.RunSQL(_SEED_REGIONS, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+# Existing rows are filled by `manage.py backfill_derived_geometry --columns summary`; until then
+# Work.get_center_coordinate / get_extreme_points compute the values in-process.
+
+
+def _point_field(**kwargs):
+    return django.contrib.gis.db.models.fields.PointField(
+        blank=True, editable=False, null=True, spatial_index=False, srid=4326, **kwargs
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0035_subdivided_outlines"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="work",
+            name="bbox",
+            field=django.contrib.gis.db.models.fields.GeometryField(
+                blank=True,
+                editable=False,
+                help_text="Bounding box (ST_Envelope) of the geometry; a Point for single-point works.",
+                null=True,
+                spatial_index=False,
+                srid=4326,
+            ),
+        ),
+        migrations.AddField(
+            model_name="work",
+            name="bbox_center",
+            field=_point_field(help_text="Centre of the bounding box."),
+        ),
+        migrations.AddField(model_name="work", name="extreme_north", field=_point_field()),
+        migrations.AddField(model_name="work", name="extreme_south", field=_point_field()),
+        migrations.AddField(model_name="work", name="extreme_east", field=_point_field()),
+        migrations.AddField(model_name="work", name="extreme_west", field=_point_field()),
+    ]
@@ -0,0 +1,38 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations
+
+# Existing rows are filled by `manage.py backfill_derived_geometry --columns simplified`; until
+# then readers fall back to the full-resolution geometry (Coalesce).
+
+
+def _simplified_field(help_text):
+    return django.contrib.gis.db.models.fields.GeometryCollectionField(
+        blank=True, editable=False, help_text=help_text, null=True, spatial_index=False, srid=4326
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0036_work_spatial_summary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="work",
+            name="geometry_low",
+            field=_simplified_field("Geometry simplified for world/continent zoom (up to zoom 4)."),
+        ),
+        migrations.AddField(
+            model_name="work",
+            name="geometry_medium",
+            field=_simplified_field("Geometry simplified for country/region zoom (zoom 5-8)."),
+        ),
+        migrations.AddField(
+            model_name="work",
+            name="geometry_high",
+            field=_simplified_field("Geometry simplified for local zoom (zoom 9-12)."),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.db import migrations, models
+
+# Existing rows are filled by `manage.py backfill_derived_geometry --columns geojson`; until then
+# annotate_rounded_geometry falls back to ST_AsGeoJSON for them.
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0037_work_simplified_geometries"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="work",
+            name="geometry_geojson",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Rounded GeoJSON of the geometry (GeometryCollection), as served by the API.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="work",
+            name="geometry_geojson_unwrapped",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Rounded GeoJSON of the geometry with the GeometryCollection wrapper removed, for exports.",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# The index is derived data: it is built from the existing works right after
+# `migrate` by the post_migrate hook in works/apps.py (build_work_facets),
+# or on demand with `manage.py rebuild_work_facets`.
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0038_work_geometry_geojson"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkFacet",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("year", "Data year"),
+                            ("topic", "Topic"),
+                            ("country", "Country"),
+                            ("region", "Global region"),
+                            ("source", "Source"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("key", models.CharField(max_length=255)),
+                (
+                    "work",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facets",
+                        to="works.work",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "work facet",
+                "constraints": [
+                    models.UniqueConstraint(fields=("kind", "key", "work"), name="workfacet_kind_key_work_uniq")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from django.db import migrations, models
+
+# Statement-level triggers keep the single StatisticsCounters row current in the
+# transaction that changes the counted rows, including QuerySet.update() and
+# bulk_create(), which send no model signals. Each statement adds the counts of
+# its new rows and subtracts those of its old rows (transition tables), and only
+# touches the counter row when a count actually changed. The counts start at
+# zero; the first reconciliation (works.utils.statistics.reconcile_statistics,
+# also run on the first read) fills in the real values.
+
+# Per-row flags of a works_work row, over a transition table.
+_WORK_FLAGS = """
+    SELECT {sign} AS s, status,
+           status = 'p' AND geometry IS NOT NULL AS geo,
+           status = 'p' AND (timeperiod_startdate IS NOT NULL OR timeperiod_enddate IS NOT NULL) AS tmp,
+           status = 'p' AND authors IS NOT NULL AND authors <> '{{}}' AS aut,
+           status = 'p' AND doi IS NOT NULL AND doi <> '' AS doi,
+           status = 'p' AND abstract IS NOT NULL AND abstract <> '' AS abs,
+           status = 'p' AND openalex_open_access_status IS NOT NULL AND openalex_open_access_status <> '' AS oa,
+           status = 'p' AND openalex_id IS NOT NULL AND openalex_id <> '' AS oax
+    FROM {table}
+"""
+
+# counter column -> FILTER condition over the flags above.
+_WORK_COUNTS = {
+    "total_works": "TRUE",
+    "published_works": "status = 'p'",
+    "harvested_works": "status = 'h'",
+    "contributed_works": "status = 'c'",
+    "draft_works": "status = 'd'",
+    "testing_works": "status = 't'",
+    "withdrawn_works": "status = 'w'",
+    "with_geometry": "geo",
+    "with_temporal": "tmp",
+    "with_authors": "aut",
+    "with_doi": "doi",
+    "with_abstract": "abs",
+    "open_access": "oa",
+    "from_openalex": "oax",
+    "with_complete_metadata": "geo AND tmp AND aut",
+}
+
+
+def _work_delta_function(name, rows):
+    deltas = ",\n".join(f"COALESCE(SUM(s) FILTER (WHERE {cond}), 0) AS {col}" for col, cond in _WORK_COUNTS.items())
+    assignments = ", ".join(f"{col} = c.{col} + d.{col}" for col in _WORK_COUNTS)
+    changed = " OR ".join(f"d.{col} <> 0" for col in _WORK_COUNTS)
+    return f"""
+CREATE OR REPLACE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE works_statisticscounters c SET {assignments}
+    FROM (SELECT {deltas} FROM ({rows}) r) d
+    WHERE c.id = 1 AND ({changed});
+    RETURN NULL;
+END $$;
+"""
+
+
+_WORK_INSERTED = _WORK_FLAGS.format(sign="1", table="new_rows")
+_WORK_DELETED = _WORK_FLAGS.format(sign="-1", table="old_rows")
+
+_CREATE_SQL = f"""
+{_work_delta_function("works_statistics_works_inserted", _WORK_INSERTED)}
+{_work_delta_function("works_statistics_works_updated", _WORK_INSERTED + " UNION ALL " + _WORK_DELETED)}
+{_work_delta_function("works_statistics_works_deleted", _WORK_DELETED)}
+
+CREATE TRIGGER works_work_statistics_insert AFTER INSERT ON works_work
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_works_inserted();
+CREATE TRIGGER works_work_statistics_update AFTER UPDATE ON works_work
+    REFERENCING NEW TABLE AS new_rows OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_works_updated();
+CREATE TRIGGER works_work_statistics_delete AFTER DELETE ON works_work
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_works_deleted();
+
+-- Row counts of small tables; the counter column is the trigger argument.
+CREATE OR REPLACE FUNCTION works_statistics_count_rows() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    delta bigint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT count(*) INTO delta FROM new_rows;
+    ELSE
+        SELECT -count(*) INTO delta FROM old_rows;
+    END IF;
+    IF delta <> 0 THEN
+        EXECUTE format('UPDATE works_statisticscounters SET %1$I = %1$I + $1 WHERE id = 1', TG_ARGV[0]) USING delta;
+    END IF;
+    RETURN NULL;
+END $$;
+
+CREATE TRIGGER works_source_statistics_insert AFTER INSERT ON works_source
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_rows('sources');
+CREATE TRIGGER works_source_statistics_delete AFTER DELETE ON works_source
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_rows('sources');
+CREATE TRIGGER works_collection_statistics_insert AFTER INSERT ON works_collection
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_rows('collections');
+CREATE TRIGGER works_collection_statistics_delete AFTER DELETE ON works_collection
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_rows('collections');
+CREATE TRIGGER works_customuser_statistics_insert AFTER INSERT ON works_customuser
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_rows('users');
+CREATE TRIGGER works_customuser_statistics_delete AFTER DELETE ON works_customuser
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_rows('users');
+
+-- Contributors are distinct users, so recount the (small) contribution table.
+CREATE OR REPLACE FUNCTION works_statistics_count_contributions() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE works_statisticscounters SET
+        contributed_dois = (SELECT count(*) FROM works_contribution WHERE kind = 'doi'),
+        contributors = (SELECT count(DISTINCT user_id) FROM works_contribution WHERE user_id IS NOT NULL)
+    WHERE id = 1;
+    RETURN NULL;
+END $$;
+
+CREATE TRIGGER works_contribution_statistics AFTER INSERT OR UPDATE OR DELETE ON works_contribution
+    FOR EACH STATEMENT EXECUTE FUNCTION works_statistics_count_contributions();
+"""
+
+_DROP_SQL = """
+DROP TRIGGER IF EXISTS works_work_statistics_insert ON works_work;
+DROP TRIGGER IF EXISTS works_work_statistics_update ON works_work;
+DROP TRIGGER IF EXISTS works_work_statistics_delete ON works_work;
+DROP TRIGGER IF EXISTS works_source_statistics_insert ON works_source;
+DROP TRIGGER IF EXISTS works_source_statistics_delete ON works_source;
+DROP TRIGGER IF EXISTS works_collection_statistics_insert ON works_collection;
+DROP TRIGGER IF EXISTS works_collection_statistics_delete ON works_collection;
+DROP TRIGGER IF EXISTS works_customuser_statistics_insert ON works_customuser;
+DROP TRIGGER IF EXISTS works_customuser_statistics_delete ON works_customuser;
+DROP TRIGGER IF EXISTS works_contribution_statistics ON works_contribution;
+DROP FUNCTION IF EXISTS works_statistics_works_inserted();
+DROP FUNCTION IF EXISTS works_statistics_works_updated();
+DROP FUNCTION IF EXISTS works_statistics_works_deleted();
+DROP FUNCTION IF EXISTS works_statistics_count_rows();
+DROP FUNCTION IF EXISTS works_statistics_count_contributions();
+"""
+
+
+def create_counter_row(apps, schema_editor):
+    apps.get_model("works", "StatisticsCounters").objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0040_source_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatisticsCounters",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("total_works", models.BigIntegerField(default=0)),
+                ("published_works", models.BigIntegerField(default=0)),
+                ("harvested_works", models.BigIntegerField(default=0)),
+                ("contributed_works", models.BigIntegerField(default=0)),
+                ("draft_works", models.BigIntegerField(default=0)),
+                ("testing_works", models.BigIntegerField(default=0)),
+                ("withdrawn_works", models.BigIntegerField(default=0)),
+                ("with_geometry", models.BigIntegerField(default=0)),
+                ("with_temporal", models.BigIntegerField(default=0)),
+                ("with_authors", models.BigIntegerField(default=0)),
+                ("with_doi", models.BigIntegerField(default=0)),
+                ("with_abstract", models.BigIntegerField(default=0)),
+                ("open_access", models.BigIntegerField(default=0)),
+                ("from_openalex", models.BigIntegerField(default=0)),
+                ("with_complete_metadata", models.BigIntegerField(default=0)),
+                ("contributed_dois", models.BigIntegerField(default=0)),
+                ("contributors", models.BigIntegerField(default=0)),
+                ("sources", models.BigIntegerField(default=0)),
+                ("collections", models.BigIntegerField(default=0)),
+                ("users", models.BigIntegerField(default=0)),
+                ("by_continent", models.JSONField(default=list)),
+                ("by_ocean", models.JSONField(default=list)),
+                ("by_country", models.JSONField(default=list)),
+                ("by_publisher", models.JSONField(default=list)),
+                ("by_journal", models.JSONField(default=list)),
+                ("by_collection", models.JSONField(default=list)),
+                ("reconciled_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name_plural": "statistics counters",
+            },
+        ),
+        migrations.RunPython(create_counter_row, migrations.RunPython.noop),
+        migrations.RunSQL(_CREATE_SQL, reverse_sql=_DROP_SQL),
+    ]
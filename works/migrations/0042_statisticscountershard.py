@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from importlib import import_module
+
+from django.db import migrations, models
+
+# The triggers of 0041 added every statement's deltas to the single counter row,
+# so each writing transaction held that row's lock until it committed and
+# concurrent writers queued behind each other. They now add to one of SHARDS
+# delta rows, picked by the writing connection's backend PID; readers sum the
+# shards onto the counter row and the reconciliation folds them back into it.
+# The contribution trigger keeps writing its absolute counts to the counter row.
+
+SHARDS = 16
+
+_counters = import_module("works.migrations.0041_statisticscounters")
+_WORK_COUNTS = _counters._WORK_COUNTS
+_WORK_INSERTED = _counters._WORK_INSERTED
+_WORK_DELETED = _counters._WORK_DELETED
+
+
+def _work_delta_function(name, rows):
+    deltas = ",\n".join(f"COALESCE(SUM(s) FILTER (WHERE {cond}), 0) AS {col}" for col, cond in _WORK_COUNTS.items())
+    assignments = ", ".join(f"{col} = c.{col} + d.{col}" for col in _WORK_COUNTS)
+    changed = " OR ".join(f"d.{col} <> 0" for col in _WORK_COUNTS)
+    return f"""
+CREATE OR REPLACE FUNCTION {name}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE works_statisticscountershard c SET {assignments}
+    FROM (SELECT {deltas} FROM ({rows}) r) d
+    WHERE c.slot = pg_backend_pid() % {SHARDS} AND ({changed});
+    RETURN NULL;
+END $$;
+"""
+
+
+def _count_rows_function(update):
+    return f"""
+CREATE OR REPLACE FUNCTION works_statistics_count_rows() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    delta bigint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT count(*) INTO delta FROM new_rows;
+    ELSE
+        SELECT -count(*) INTO delta FROM old_rows;
+    END IF;
+    IF delta <> 0 THEN
+        {update}
+    END IF;
+    RETURN NULL;
+END $$;
+"""
+
+
+def _work_functions(delta_function):
+    return "\n".join(
+        (
+            delta_function("works_statistics_works_inserted", _WORK_INSERTED),
+            delta_function("works_statistics_works_updated", _WORK_INSERTED + " UNION ALL " + _WORK_DELETED),
+            delta_function("works_statistics_works_deleted", _WORK_DELETED),
+        )
+    )
+
+
+_SHARDED_SQL = _work_functions(_work_delta_function) + _count_rows_function(
+    "EXECUTE format('UPDATE works_statisticscountershard SET %1$I = %1$I + $1 WHERE slot = $2', TG_ARGV[0])\n"
+    f"            USING delta, pg_backend_pid() % {SHARDS};"
+)
+_SINGLE_ROW_SQL = _work_functions(_counters._work_delta_function) + _count_rows_function(
+    "EXECUTE format('UPDATE works_statisticscounters SET %1$I = %1$I + $1 WHERE id = 1', TG_ARGV[0]) USING delta;"
+)
+
+_COUNT_FIELDS = (*_WORK_COUNTS, "sources", "collections", "users")
+
+
+def create_shards(apps, schema_editor):
+    Shard = apps.get_model("works", "StatisticsCounterShard")
+    Shard.objects.bulk_create([Shard(slot=slot) for slot in range(SHARDS)], ignore_conflicts=True)
+
+
+def fold_shards(apps, schema_editor):
+    """Add the pending deltas to the counter row before the shards are dropped."""
+    Counters = apps.get_model("works", "StatisticsCounters")
+    Shard = apps.get_model("works", "StatisticsCounterShard")
+    counters = Counters.objects.filter(pk=1).first()
+    if counters is not None:
+        for name in _COUNT_FIELDS:
+            setattr(counters, name, getattr(counters, name) + sum(Shard.objects.values_list(name, flat=True)))
+        counters.save()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("works", "0041_statisticscounters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatisticsCounterShard",
+            fields=[
+                ("slot", models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+                ("total_works", models.BigIntegerField(default=0)),
+                ("published_works", models.BigIntegerField(default=0)),
+                ("harvested_works", models.BigIntegerField(default=0)),
+                ("contributed_works", models.BigIntegerField(default=0)),
+                ("draft_works", models.BigIntegerField(default=0)),
+                ("testing_works", models.BigIntegerField(default=0)),
+                ("withdrawn_works", models.BigIntegerField(default=0)),
+                ("with_geometry", models.BigIntegerField(default=0)),
+                ("with_temporal", models.BigIntegerField(default=0)),
+                ("with_authors", models.BigIntegerField(default=0)),
+                ("with_doi", models.BigIntegerField(default=0)),
+                ("with_abstract", models.BigIntegerField(default=0)),
+                ("open_access", models.BigIntegerField(default=0)),
+                ("from_openalex", models.BigIntegerField(default=0)),
+                ("with_complete_metadata", models.BigIntegerField(default=0)),
+                ("sources", models.BigIntegerField(default=0)),
+                ("collections", models.BigIntegerField(default=0)),
+                ("users", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_shards, fold_shards),
+        migrations.RunSQL(_SHARDED_SQL, reverse_sql=_SINGLE_ROW_SQL),
+    ]
@@ -7,11 +7,8 @@ from datetime import timedelta
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, Group, Permission
 from django.contrib.gis.db import models
-from django.contrib.gis.db.models.functions import Centroid, Envelope
-from django.contrib.gis.geos import Point
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
-from django.db import connection
 from django.db.models import Q
 from django.urls import reverse
 from django.utils import timezone
@@ -20,6 +17,15 @@ from django.utils.timezone import now
 from django_currentuser.db.models import CurrentUserField
 from django_q.models import Schedule
 
+from works.utils.geometry import (
+    GEOJSON_TEXT_FIELDS,
+    SIMPLIFIED_GEOMETRY_FIELDS,
+    SPATIAL_SUMMARY_FIELDS,
+    geojson_texts,
+    simplified_geometries,
+    spatial_summary,
+)
+
 logger = logging.getLogger(__name__)
 
 # ISO code of the reserved sentinel Country used to mark a work as "will not be
@@ -153,6 +159,76 @@ class Work(models.Model):
     publisher = models.CharField(max_length=255, null=True, blank=True)
     url = models.URLField(max_length=1024, null=True, blank=True, unique=True)
     geometry = models.GeometryCollectionField(verbose_name="Work geometry/ies", srid=4326, null=True, blank=True)
+    # Derived from ``geometry`` on every save that touches it (see ``save`` and
+    # ``works.utils.geometry.spatial_summary``) so SEO/JSON-LD, Wikidata export
+    # and listings read a work's extent without extra PostGIS queries. Filled
+    # for existing rows by ``manage.py backfill_derived_geometry --columns summary``.
+    bbox = models.GeometryField(
+        srid=4326,
+        null=True,
+        blank=True,
+        editable=False,
+        spatial_index=False,
+        help_text="Bounding box (ST_Envelope) of the geometry; a Point for single-point works.",
+    )
+    bbox_center = models.PointField(
+        srid=4326,
+        null=True,
+        blank=True,
+        editable=False,
+        spatial_index=False,
+        help_text="Centre of the bounding box.",
+    )
+    extreme_north = models.PointField(srid=4326, null=True, blank=True, editable=False, spatial_index=False)
+    extreme_south = models.PointField(srid=4326, null=True, blank=True, editable=False, spatial_index=False)
+    extreme_east = models.PointField(srid=4326, null=True, blank=True, editable=False, spatial_index=False)
+    extreme_west = models.PointField(srid=4326, null=True, blank=True, editable=False, spatial_index=False)
+    # Topology-preserving simplified variants of ``geometry`` for the map zoom
+    # bands in ``works.utils.geometry.SIMPLIFIED_GEOMETRY_BANDS``, maintained
+    # by ``save`` and selected by the API's ``?simplify=``/``?zoom=``. NULL when
+    # simplifying would not drop a vertex; readers then fall back to
+    # ``geometry`` (``works.utils.geometry.geometry_for_band``). Filled for
+    # existing rows by ``manage.py backfill_derived_geometry --columns simplified``.
+    geometry_low = models.GeometryCollectionField(
+        srid=4326,
+        null=True,
+        blank=True,
+        editable=False,
+        spatial_index=False,
+        help_text="Geometry simplified for world/continent zoom (up to zoom 4).",
+    )
+    geometry_medium = models.GeometryCollectionField(
+        srid=4326,
+        null=True,
+        blank=True,
+        editable=False,
+        spatial_index=False,
+        help_text="Geometry simplified for country/region zoom (zoom 5-8).",
+    )
+    geometry_high = models.GeometryCollectionField(
+        srid=4326,
+        null=True,
+        blank=True,
+        editable=False,
+        spatial_index=False,
+        help_text="Geometry simplified for local zoom (zoom 9-12).",
+    )
+    # Coordinate-rounded GeoJSON text of ``geometry``, rendered on save
+    # (``works.utils.geometry.geojson_texts``) and spliced verbatim into API
+    # responses, feeds, facet maps and data dumps, so read paths do no geometry
+    # serialization. Filled for existing rows by ``manage.py backfill_derived_geometry --columns geojson``.
+    geometry_geojson = models.TextField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Rounded GeoJSON of the geometry (GeometryCollection), as served by the API.",
+    )
+    geometry_geojson_unwrapped = models.TextField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Rounded GeoJSON of the geometry with the GeometryCollection wrapper removed, for exports.",
+    )
     timeperiod_startdate = ArrayField(models.CharField(max_length=1024, null=True), null=True, blank=True)
     timeperiod_enddate = ArrayField(models.CharField(max_length=1024, null=True), null=True, blank=True)
     job = models.ForeignKey("HarvestingEvent", on_delete=models.CASCADE, related_name="works", null=True, blank=True)
@@ -255,6 +331,39 @@ class Work(models.Model):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # Keep the derived extent, simplified-geometry and GeoJSON text columns
+        # in step with the geometry. Skipped when geometry is deferred (reading
+        # it would cost a query) or when a targeted save does not write it.
+        update_fields = kwargs.get("update_fields")
+        if "geometry" not in self.get_deferred_fields() and (update_fields is None or "geometry" in update_fields):
+            self.refresh_spatial_summary()
+            self.refresh_simplified_geometries()
+            self.refresh_geojson_text()
+            if update_fields is not None:
+                kwargs["update_fields"] = {
+                    *update_fields,
+                    *SPATIAL_SUMMARY_FIELDS,
+                    *SIMPLIFIED_GEOMETRY_FIELDS,
+                    *GEOJSON_TEXT_FIELDS,
+                }
+        super().save(*args, **kwargs)
+
+    def refresh_spatial_summary(self):
+        """Recompute ``bbox``, ``bbox_center`` and ``extreme_*`` from ``geometry`` (no save)."""
+        for field, value in spatial_summary(self.geometry).items():
+            setattr(self, field, value)
+
+    def refresh_simplified_geometries(self):
+        """Recompute ``geometry_low``/``_medium``/``_high`` from ``geometry`` (no save)."""
+        for field, value in simplified_geometries(self.geometry).items():
+            setattr(self, field, value)
+
+    def refresh_geojson_text(self):
+        """Re-render ``geometry_geojson``/``geometry_geojson_unwrapped`` from ``geometry`` (no save)."""
+        for field, value in geojson_texts(self.geometry).items():
+            setattr(self, field, value)
+
     def get_identifier(self) -> str:
         """
         Return the most suitable identifier for this work.
@@ -367,14 +476,11 @@ class Work(models.Model):
 
     def get_center_coordinate(self):
         """
-        Calculate and return the center coordinate of the work's geometry using PostGIS.
-
-        For publications with geometry, this method:
-        1. Uses PostGIS ST_Envelope to get the bounding box
-        2. Uses PostGIS ST_Centroid to calculate the center of the bounding box
-        3. Returns a tuple (longitude, latitude) or None if no geometry
+        Return the center of the work's bounding box as ``(longitude, latitude)``.
 
-        This uses database-level geometry operations for accuracy and performance.
+        Reads the stored ``bbox_center`` column (maintained on save), so no
+        spatial query is issued. Works saved before the column existed and not
+        yet backfilled fall back to computing it in-process from ``geometry``.
 
         Returns:
             tuple: (longitude, latitude) as floats, or None if no geometry
@@ -388,35 +494,23 @@ class Work(models.Model):
             >>> work.get_center_coordinate()
             (5.0, 5.0)
         """
-        if not self.geometry:
-            return None
-
-        try:
-            # Use database query to calculate centroid of bounding box
-            # ST_Centroid(ST_Envelope(geometry)) gives us the center of the bounding box
-            result = (
-                Work.objects.filter(pk=self.pk)
-                .annotate(bbox_center=Centroid(Envelope("geometry")))
-                .values_list("bbox_center", flat=True)
-                .first()
-            )
-
-            if result and isinstance(result, Point):
-                # Return as (longitude, latitude)
-                return (result.x, result.y)
-
-            return None
-
-        except Exception:
-            # If there's any error calculating center, return None
+        center = self.bbox_center
+        if center is None:
+            if not self.geometry:
+                return None
+            center = spatial_summary(self.geometry)["bbox_center"]
+        if center is None:
             return None
+        return (center.x, center.y)
 
     def get_extreme_points(self):
         """
-        Calculate and return the extreme points (northernmost, southernmost, easternmost, westernmost)
-        of the work's geometry using PostGIS.
+        Return the extreme points (northernmost, southernmost, easternmost, westernmost)
+        of the work's geometry.
 
-        Uses ST_DumpPoints to extract all vertices and orders them by coordinates.
+        Reads the stored ``extreme_*`` columns (maintained on save), falling
+        back to an in-process vertex scan of ``geometry`` for rows that have not
+        been backfilled yet.
 
         Returns:
             dict: Dictionary with keys 'north', 'south', 'east', 'west', each containing
@@ -425,59 +519,25 @@ class Work(models.Model):
         Examples:
             >>> work.geometry = Polygon([(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)])
             >>> extremes = work.get_extreme_points()
-            >>> extremes['north']  # (5.0, 10.0) - any point at max latitude
-            >>> extremes['south']  # (5.0, 0.0) - any point at min latitude
-            >>> extremes['east']   # (10.0, 5.0) - any point at max longitude
-            >>> extremes['west']   # (0.0, 5.0) - any point at min longitude
+            >>> extremes['north']  # (10.0, 10.0) - first vertex at max latitude
+            >>> extremes['south']  # (0.0, 0.0) - first vertex at min latitude
+            >>> extremes['east']   # (10.0, 0.0) - first vertex at max longitude
+            >>> extremes['west']   # (0.0, 0.0) - first vertex at min longitude
         """
-        if not self.geometry:
-            return None
-
-        try:
-            # Raw SQL query to get all extreme points
-            # For each direction, we dump all points, order by coordinate, and take the first
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    """
-                    WITH points AS (
-                        SELECT (ST_DumpPoints(geometry)).geom AS pt
-                        FROM works_work
-                        WHERE id = %s
-                    )
-                    SELECT
-                        -- Northernmost point (highest Y/latitude)
-                        (SELECT ST_X(pt) FROM points ORDER BY ST_Y(pt) DESC LIMIT 1) AS north_lon,
-                        (SELECT ST_Y(pt) FROM points ORDER BY ST_Y(pt) DESC LIMIT 1) AS north_lat,
-                        -- Southernmost point (lowest Y/latitude)
-                        (SELECT ST_X(pt) FROM points ORDER BY ST_Y(pt) ASC LIMIT 1) AS south_lon,
-                        (SELECT ST_Y(pt) FROM points ORDER BY ST_Y(pt) ASC LIMIT 1) AS south_lat,
-                        -- Easternmost point (highest X/longitude)
-                        (SELECT ST_X(pt) FROM points ORDER BY ST_X(pt) DESC LIMIT 1) AS east_lon,
-                        (SELECT ST_Y(pt) FROM points ORDER BY ST_X(pt) DESC LIMIT 1) AS east_lat,
-                        -- Westernmost point (lowest X/longitude)
-                        (SELECT ST_X(pt) FROM points ORDER BY ST_X(pt) ASC LIMIT 1) AS west_lon,
-                        (SELECT ST_Y(pt) FROM points ORDER BY ST_X(pt) ASC LIMIT 1) AS west_lat
-                """,
-                    [self.pk],
-                )
-
-                row = cursor.fetchone()
-
-                if row:
-                    north_lon, north_lat, south_lon, south_lat, east_lon, east_lat, west_lon, west_lat = row
-
-                    return {
-                        "north": (north_lon, north_lat) if north_lon is not None else None,
-                        "south": (south_lon, south_lat) if south_lon is not None else None,
-                        "east": (east_lon, east_lat) if east_lon is not None else None,
-                        "west": (west_lon, west_lat) if west_lon is not None else None,
-                    }
-
-            return None
-
-        except Exception:
-            # If there's any error calculating extremes, return None
-            return None
+        points = {
+            "north": self.extreme_north,
+            "south": self.extreme_south,
+            "east": self.extreme_east,
+            "west": self.extreme_west,
+        }
+        if points["north"] is None:
+            if not self.geometry:
+                return None
+            summary = spatial_summary(self.geometry)
+            points = {direction: summary[f"extreme_{direction}"] for direction in points}
+            if points["north"] is None:
+                return None
+        return {direction: (pt.x, pt.y) if pt is not None else None for direction, pt in points.items()}
 
 
 class Subscription(models.Model):
@@ -727,6 +787,47 @@ class Country(models.Model):
         return reverse("optimap:at-place", kwargs={"place_slug": self.get_slug()})
 
 
+class CountrySubdivided(models.Model):
+    """One ``ST_Subdivide`` piece of a :class:`Country` outline.
+
+    Derived table for the point-in-polygon join in
+    :func:`works.services.countries.lookup_countries`: intersecting a work
+    against many small, GiST-indexed pieces (at most
+    ``OUTLINE_SUBDIVIDE_MAX_VERTICES`` vertices each) is far cheaper than
+    testing the full multipolygon with its complex coastline. Never edited by
+    hand — rebuilt by :func:`works.services.subdivisions.refresh_subdivisions`
+    whenever a country is saved and at the end of ``load_countries``.
+    """
+
+    country = models.ForeignKey(Country, on_delete=models.CASCADE, related_name="subdivisions")
+    geom = models.GeometryField(srid=4326)
+
+    class Meta:
+        verbose_name = "subdivided country outline"
+
+    def __str__(self):
+        return f"Subdivision {self.pk} of country {self.country_id}"
+
+
+class GlobalRegionSubdivided(models.Model):
+    """One ``ST_Subdivide`` piece of a :class:`GlobalRegion` outline.
+
+    The continent/ocean mirror of :class:`CountrySubdivided`, used by
+    :func:`works.services.regions.lookup_regions`. Ocean polygons are the
+    largest and most detailed outlines in the database, so they gain the most.
+    Rebuilt whenever a region is saved and at the end of ``load_global_regions``.
+    """
+
+    region = models.ForeignKey(GlobalRegion, on_delete=models.CASCADE, related_name="subdivisions")
+    geom = models.GeometryField(srid=4326)
+
+    class Meta:
+        verbose_name = "subdivided global region outline"
+
+    def __str__(self):
+        return f"Subdivision {self.pk} of region {self.region_id}"
+
+
 class Collection(models.Model):
     """
     A curated grouping of Works.
@@ -832,6 +933,7 @@ class Source(models.Model):
         help_text="Auto-harvest interval in minutes. 0 means manual-only (run via management command or admin action).",
     )
     last_harvest = models.DateTimeField(auto_now_add=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True)
     collection = models.ForeignKey(
         "Collection",
         on_delete=models.SET_NULL,
@@ -1067,6 +1169,42 @@ class Source(models.Model):
 Journal = Source
 
 
+class WorkFacet(models.Model):
+    """One facet membership of a *published* work: ``(kind, key) → work``.
+
+    Derived index behind the ``/browse/``, ``/during/<year>``, ``/on/<topic>``
+    and place pages and the facet sitemaps (see :mod:`works.services.facets`):
+    ``kind`` is ``year`` (a data year the temporal coverage spans), ``topic``
+    (an OpenAlex topic), ``country`` (ISO code), ``region`` (``GlobalRegion``
+    id) or ``source`` (``Source`` id), ``key`` its value as text. Never edited
+    by hand — maintained on save, publish and country/region changes, and
+    rebuilt by ``manage.py rebuild_work_facets``.
+    """
+
+    KIND_CHOICES = [
+        ("year", "Data year"),
+        ("topic", "Topic"),
+        ("country", "Country"),
+        ("region", "Global region"),
+        ("source", "Source"),
+    ]
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    key = models.CharField(max_length=255)
+    work = models.ForeignKey(Work, on_delete=models.CASCADE, related_name="facets")
+
+    class Meta:
+        verbose_name = "work facet"
+        constraints = [
+            # Also the index for per-kind counts (GROUP BY key) and the
+            # work lists of one facet page (kind = … AND key = …).
+            models.UniqueConstraint(fields=["kind", "key", "work"], name="workfacet_kind_key_work_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.key} → work {self.work_id}"
+
+
 class WikidataExportLog(models.Model):
     """
     Log of Wikidata exports for works.
@@ -1199,6 +1337,140 @@ class StatisticsSnapshot(models.Model):
         return f"StatisticsSnapshot {self.computed_at:%Y-%m-%d %H:%M}"
 
 
+class StatisticsCounters(models.Model):
+    """Current site-wide statistics in a single row (``pk=1``).
+
+    The counts are kept current inside every writing transaction by statement
+    triggers on the work, contribution, source, collection and user tables
+    (migrations ``0041_statisticscounters`` and
+    ``0042_statisticscountershard``), so they also follow bulk
+    ``QuerySet.update()``/``bulk_create()`` calls that bypass model signals.
+    Apart from the contribution counts, the triggers add their deltas to a
+    :class:`StatisticsCounterShard` rather than to this row; the current
+    counts are this row plus the sum of the shards. The breakdowns and
+    ``reconciled_at`` are written by the periodic full recount,
+    ``works.utils.statistics.reconcile_statistics``, which also corrects any
+    drift of the counts and folds the shards back into this row.
+    """
+
+    STATUS_FIELDS = {
+        "p": "published_works",
+        "h": "harvested_works",
+        "c": "contributed_works",
+        "d": "draft_works",
+        "t": "testing_works",
+        "w": "withdrawn_works",
+    }
+    #: Counts kept current by the triggers; all but the status counts are of published works.
+    COUNT_FIELDS = (
+        "total_works",
+        *STATUS_FIELDS.values(),
+        "with_geometry",
+        "with_temporal",
+        "with_authors",
+        "with_doi",
+        "with_abstract",
+        "open_access",
+        "from_openalex",
+        "with_complete_metadata",
+        "contributed_dois",
+        "contributors",
+        "sources",
+        "collections",
+        "users",
+    )
+    BREAKDOWN_FIELDS = ("by_continent", "by_ocean", "by_country", "by_publisher", "by_journal", "by_collection")
+
+    total_works = models.BigIntegerField(default=0)
+    published_works = models.BigIntegerField(default=0)
+    harvested_works = models.BigIntegerField(default=0)
+    contributed_works = models.BigIntegerField(default=0)
+    draft_works = models.BigIntegerField(default=0)
+    testing_works = models.BigIntegerField(default=0)
+    withdrawn_works = models.BigIntegerField(default=0)
+    with_geometry = models.BigIntegerField(default=0)
+    with_temporal = models.BigIntegerField(default=0)
+    with_authors = models.BigIntegerField(default=0)
+    with_doi = models.BigIntegerField(default=0)
+    with_abstract = models.BigIntegerField(default=0)
+    open_access = models.BigIntegerField(default=0)
+    from_openalex = models.BigIntegerField(default=0)
+    with_complete_metadata = models.BigIntegerField(default=0)
+    contributed_dois = models.BigIntegerField(default=0)
+    contributors = models.BigIntegerField(default=0)
+    sources = models.BigIntegerField(default=0)
+    collections = models.BigIntegerField(default=0)
+    users = models.BigIntegerField(default=0)
+
+    # Same shape as on StatisticsSnapshot; refreshed by each reconciliation.
+    by_continent = models.JSONField(default=list)
+    by_ocean = models.JSONField(default=list)
+    by_country = models.JSONField(default=list)
+    by_publisher = models.JSONField(default=list)
+    by_journal = models.JSONField(default=list)
+    by_collection = models.JSONField(default=list)
+
+    # null until the first reconciliation filled the row.
+    reconciled_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name_plural = "statistics counters"
+
+    def __str__(self):
+        return f"StatisticsCounters (reconciled {self.reconciled_at or 'never'})"
+
+    def as_statistics(self):
+        """The counters in the shape of ``works.utils.statistics.calculate_statistics``."""
+        stats = {name: getattr(self, name) for name in self.COUNT_FIELDS + self.BREAKDOWN_FIELDS}
+        # The other statuses are only reported within works_by_status.
+        for name in ("draft_works", "testing_works", "withdrawn_works"):
+            del stats[name]
+        stats["works_by_status"] = {code: getattr(self, name) for code, name in self.STATUS_FIELDS.items()}
+        published = self.published_works
+        stats["complete_percentage"] = round(self.with_complete_metadata / published * 100, 1) if published else 0
+        return stats
+
+
+class StatisticsCounterShard(models.Model):
+    """Pending count deltas of one slot, added to :class:`StatisticsCounters` on read.
+
+    With one counter row every writing transaction would lock that row until
+    it commits, serializing concurrent harvests, imports and admin edits. The
+    triggers instead update the shard ``pg_backend_pid() % SHARDS``, so
+    concurrent connections mostly write to different rows.
+    """
+
+    #: Number of shard rows; fixed by migration ``0042_statisticscountershard``.
+    SHARDS = 16
+    #: The delta-maintained counts; the contribution counts stay absolute on the counter row.
+    COUNT_FIELDS = tuple(
+        name for name in StatisticsCounters.COUNT_FIELDS if name not in ("contributed_dois", "contributors")
+    )
+
+    slot = models.PositiveSmallIntegerField(primary_key=True)
+    total_works = models.BigIntegerField(default=0)
+    published_works = models.BigIntegerField(default=0)
+    harvested_works = models.BigIntegerField(default=0)
+    contributed_works = models.BigIntegerField(default=0)
+    draft_works = models.BigIntegerField(default=0)
+    testing_works = models.BigIntegerField(default=0)
+    withdrawn_works = models.BigIntegerField(default=0)
+    with_geometry = models.BigIntegerField(default=0)
+    with_temporal = models.BigIntegerField(default=0)
+    with_authors = models.BigIntegerField(default=0)
+    with_doi = models.BigIntegerField(default=0)
+    with_abstract = models.BigIntegerField(default=0)
+    open_access = models.BigIntegerField(default=0)
+    from_openalex = models.BigIntegerField(default=0)
+    with_complete_metadata = models.BigIntegerField(default=0)
+    sources = models.BigIntegerField(default=0)
+    collections = models.BigIntegerField(default=0)
+    users = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"StatisticsCounterShard {self.slot}"
+
+
 class SourceCoverageSnapshot(models.Model):
     """Weekly coverage snapshot: how many works from a Source are in OPTIMAP vs OpenAlex."""
 
@@ -1,10 +1,32 @@
 # SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from rest_framework.pagination import LimitOffsetPagination
+import json
+
+from django.db import connections
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+from rest_framework.response import Response
 from rest_framework.utils.urls import replace_query_param
 
 
+def estimate_count(queryset) -> int:
+    """Row count of ``queryset`` as estimated by the PostgreSQL planner.
+
+    Reads the top-level ``Plan Rows`` of ``EXPLAIN (FORMAT JSON)`` instead of
+    running ``COUNT(*)``, so it costs the same on the whole corpus as on a
+    single page. The figure is approximate (it comes from table statistics)
+    and is meant for progress indicators, not for computing page offsets.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 class LinkHeaderPagination(LimitOffsetPagination):
     """LimitOffsetPagination that also emits RFC 5988 Link headers."""
 
@@ -41,3 +63,85 @@ class LinkHeaderPagination(LimitOffsetPagination):
         if links:
             response["Link"] = ", ".join(links)
         return response
+
+
+class LinkHeaderCursorPagination(CursorPagination):
+    """Keyset pagination over ``(-creationDate, -id)`` with RFC 5988 Link headers.
+
+    Each page is a range scan on the ``work_creationdate_id_idx`` index that
+    starts where the previous page ended, so walking the whole list costs
+    O(n) rather than the O(n²) of ever-growing offsets, and no ``COUNT(*)`` is
+    run. Pass ``?count=estimate`` to add the planner's row estimate as
+    ``count``; there are no ``first``/``last`` links, as a cursor cannot jump.
+    """
+
+    ordering = ("-creationDate", "-id")
+    page_size_query_param = "limit"
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.estimated_count = None
+        if request.query_params.get(self.count_query_param) == "estimate":
+            self.estimated_count = estimate_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        payload = {"next": self.get_next_link(), "previous": self.get_previous_link(), "results": data}
+        if self.estimated_count is not None:
+            payload = {"count": self.estimated_count, **payload}
+        response = Response(payload)
+
+        links = []
+        if payload["next"]:
+            links.append(f'<{payload["next"]}>; rel="next"')
+        if payload["previous"]:
+            links.append(f'<{payload["previous"]}>; rel="prev"')
+        if links:
+            response["Link"] = ", ".join(links)
+        return response
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"] = {
+            "count": {"type": "integer", "example": 123, "description": "Estimate; only with ?count=estimate."},
+            **response_schema["properties"],
+        }
+        return response_schema
+
+
+class WorkPagination(LinkHeaderPagination):
+    """Offset pagination for the works API, with an opt-in keyset (cursor) mode.
+
+    ``?limit=``/``?offset=`` behave as before. ``?pagination=cursor`` (and the
+    ``?cursor=`` token carried by its ``next`` links) switches to
+    :class:`LinkHeaderCursorPagination` — recommended for clients that walk the
+    whole list, such as the map and external harvesters.
+
+    The cursor imposes its own ordering, so it is only used for querysets
+    already ordered by its keys. Others keep offset pagination and their
+    ordering, e.g. the staff map's published-first list; their ``next`` links
+    are offset links, which clients following ``next`` walk the same way. A
+    ``?cursor=`` token sent for such a list is answered with ``400`` rather
+    than quietly restarting at the first page.
+    """
+
+    cursor_pagination_class = LinkHeaderCursorPagination
+    mode_query_param = "pagination"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        has_token = self.cursor_pagination_class.cursor_query_param in request.query_params
+        cursor_requested = has_token or request.query_params.get(self.mode_query_param) == "cursor"
+        if cursor_requested and tuple(queryset.query.order_by) == tuple(self.cursor_pagination_class.ordering):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        if has_token:
+            raise ValidationError(
+                {"error": "This list is not ordered by the cursor's keys; page it with limit and offset."}
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""JSON renderer and parser for the REST API, backed by orjson when it is installed.
+
+Encoding large lists of dicts is a significant share of the CPU time of big API
+responses (``/api/v1/works/?limit=999``); orjson does it several times faster
+than the stdlib encoder DRF uses. Both classes fall back to DRF's stock
+behaviour when orjson is missing, and the renderer also for indented
+(browsable / ``; indent=``) output, which orjson cannot produce with arbitrary
+widths.
+
+Values orjson does not handle natively (``Decimal``, lazy translation strings,
+datetimes) go through DRF's encoder, so the output is the same as before.
+Like DRF, the renderer escapes U+2028 and U+2029 (valid in JSON, but line
+terminators in JavaScript before ES2019, which breaks inlined JSON), which
+orjson writes raw. Pre-rendered geometry text (:class:`~works.utils.geojson.RawJSON`) is embedded
+verbatim on both paths. ``python manage.py benchmark_json_rendering`` compares
+the two encoders on a works page.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder as DRFJSONEncoder
+
+from works.utils.geojson import FAST_JSON, RawJSONEncoderMixin, encode_json, orjson
+
+
+class RawJSONAwareEncoder(RawJSONEncoderMixin, DRFJSONEncoder):
+    """DRF's encoder that also splices :class:`~works.utils.geojson.RawJSON` verbatim."""
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` that encodes with orjson (see the module docstring)."""
+
+    encoder_class = RawJSONAwareEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if not FAST_JSON or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escapes as JSONRenderer; the UTF-8 of U+2028/U+2029 cannot occur inside other characters.
+        return (
+            encode_json(data, cls=self.encoder_class)
+            .replace("\u2028".encode(), b"\\u2028")
+            .replace("\u2029".encode(), b"\\u2029")
+        )
+
+
+class FastJSONParser(JSONParser):
+    """``JSONParser`` that decodes request bodies with orjson when it is installed."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if not FAST_JSON:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
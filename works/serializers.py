@@ -16,6 +16,7 @@ from rest_framework_gis.fields import GeometryField as _BaseGeometryField
 from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
 from .models import Collection, Country, GlobalRegion, Source, Subscription, Work
+from .utils.geojson import RawJSON
 from .utils.geometry import COORDINATE_PRECISION, round_geojson_coordinates
 
 User = get_user_model()
@@ -43,15 +44,17 @@ class _GeometryWithPrecomputedJSON:
 
 
 class PrecomputedGeometryField(_BaseGeometryField):
-    """GeometryField that prefers a DB-precomputed, already-rounded GeoJSON
+    """GeometryField that prefers a precomputed, already-rounded GeoJSON
     string (``instance._rounded_geojson``, produced by
-    ``works.utils.geometry.annotate_rounded_geometry``) over re-serializing
-    the GEOSGeometry in Python — PostGIS does the rounding during
-    serialization instead of Python re-parsing/rounding/re-dumping the
-    full-precision GeoJSON (~30x faster for complex geometries).
+    ``works.utils.geometry.annotate_rounded_geometry`` — normally the text
+    pre-rendered on save in ``Work.geometry_geojson``) over re-serializing
+    the GEOSGeometry in Python.
 
-    Falls back to the original GEOS-based rounding for any instance not
-    sourced from an annotated queryset (e.g. ad hoc instances in tests)."""
+    The string is returned as a :class:`~works.utils.geojson.RawJSON` and
+    spliced into the response verbatim by the Work API's renderers (see
+    ``works.renderers.FastJSONRenderer``), so it is never parsed or
+    re-dumped. Falls back to the original GEOS-based rounding for any instance
+    not sourced from an annotated queryset (e.g. ad hoc instances in tests)."""
 
     def get_attribute(self, instance):
         return _GeometryWithPrecomputedJSON(instance.geometry, getattr(instance, "_rounded_geojson", None))
@@ -61,7 +64,7 @@ class PrecomputedGeometryField(_BaseGeometryField):
         if geometry is None:
             return None
         if value.rounded_geojson is not None:
-            return GeoJsonDict(value.rounded_geojson)
+            return RawJSON(value.rounded_geojson)
         if geometry.geojson:
             return GeoJsonDict(round_geojson_coordinates(json.loads(geometry.geojson)))
         return GeoJsonDict({"type": geometry.geom_type, "coordinates": []})
@@ -249,6 +252,17 @@ class WorkSerializer(GeoFeatureModelSerializer):
         ),
     )
 
+    #: Always serialized: GeoJSON needs a feature's ``id`` and ``geometry``.
+    REQUIRED_FIELDS = ("id", "geometry")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Sparse fieldset chosen with ?fields= / ?omit= (see WorkViewSet.sparse_fields).
+        keep = self.context.get("fields")
+        if keep is not None:
+            for name in set(self.fields) - set(keep) - set(self.REQUIRED_FIELDS):
+                self.fields.pop(name)
+
     def to_representation(self, instance):
         feature = super().to_representation(instance)
         # auto_bbox computes the bbox from the real (full-precision) geometry's
@@ -305,6 +319,54 @@ class WorkMinimalSerializer(GeoFeatureModelSerializer):
         fields = ["id", "title", "doi", "status", "status_display"]
 
 
+class WorkPopupSourceSerializer(serializers.ModelSerializer):
+    """The source columns a map popup shows — no per-source queries."""
+
+    class Meta:
+        model = Source
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "issn_l",
+            "publisher_name",
+            "works_count",
+            "homepage_url",
+            "abbreviated_title",
+            "is_oa",
+        ]
+
+
+class WorkPopupSerializer(serializers.ModelSerializer):
+    """What a map popup shows when a feature is clicked (see ``map-popup.js``).
+
+    Plain columns of the work and its source, without geometry, countries,
+    regions or BoK resolution, so it can be cached per work by
+    :mod:`works.services.popups`.
+    """
+
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+    source_details = WorkPopupSourceSerializer(source="source", read_only=True, allow_null=True)
+
+    class Meta:
+        model = Work
+        fields = [
+            "id",
+            "title",
+            "doi",
+            "status",
+            "status_display",
+            "url",
+            "abstract",
+            "authors",
+            "publicationDate",
+            "timeperiod_startdate",
+            "timeperiod_enddate",
+            "openalex_id",
+            "source_details",
+        ]
+
+
 class SubscriptionSerializer(GeoFeatureModelSerializer):
     class Meta:
         model = Subscription
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Tag-based invalidation for cached pages, feeds, facet maps and downloads.
+
+A cached artifact names the tags it depends on when it builds its key:
+
+    key = tagged_key(f"feed:{variant}:{path}", [tag(SOURCE, source.pk)])
+
+:func:`tagged_key` appends a digest of the tags' current versions, so
+:func:`bump_tags` retires every entry built under a tag at once — later reads
+compute a new key and miss — without knowing which keys exist. Old entries are
+never read again and expire with their timeout.
+
+Tags are ``"<kind>:<key>"`` strings: the ``source``, ``region`` and ``country``
+facets of :mod:`works.services.facets`, ``collection:<pk>``, :data:`WORKS`
+for artifacts that list all published works, and :data:`WORK_RECORDS`, which
+moves with any change to any work's API representation (drafts included) and
+validates the works API (``works.viewsets.WorkViewSet``). :func:`bump_work_tags` is called
+from :func:`works.services.facets.refresh_facets`, which already runs on every
+work save, country/region change and bulk status update, with the facets the
+works belonged to before and after the change; the signals in
+:mod:`works.signals` cover deletes and collection/source edits, and a completed
+harvest bumps its source.
+
+Responses built from tagged entries go through :func:`short_lived`, so the
+site-wide page cache in front of them does not outlive a bump by more than a
+minute.
+
+A tag's version is the time of its last bump plus a random token rather than
+a counter, so a version evicted from the cache is re-created with a value no
+stored entry was built under, and :func:`tag_stamp` can read the time back as
+a ``Last-Modified`` date.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+import uuid
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+
+from works.services.facets import COUNTRY, REGION, SOURCE
+
+#: Tag of artifacts built from all published works (global feeds, topic slugs).
+WORKS = "works"
+#: Tag of every work's API representation, published or not.
+WORK_RECORDS = "work_records"
+COLLECTION = "collection"
+
+#: ``max-age`` of responses served from tagged entries. Browsers and the
+#: site-wide ``UpdateCacheMiddleware`` honour it, so keep it short: the tagged
+#: server-side entries absorb repeated requests and are retired on every bump.
+TAGGED_RESPONSE_MAX_AGE = 60
+
+#: Facet kinds with cached artifacts. Year and topic pages are not cached, so
+#: their facets are not tags.
+TAGGED_FACETS = (SOURCE, REGION, COUNTRY)
+
+
+def tag(kind: str, key) -> str:
+    """Tag for one facet, collection or other ``kind`` of dependency."""
+    return f"{kind}:{key}"
+
+
+def _version_key(name: str) -> str:
+    # Country and source keys are short, but keep arbitrary tags within cache key limits.
+    return "cache_tag:" + hashlib.sha1(name.encode("utf-8")).hexdigest()
+
+
+def _new_version() -> str:
+    # Milliseconds since the epoch (hex), then a random token.
+    return f"{time.time_ns() // 1_000_000:x}-{uuid.uuid4().hex[:8]}"
+
+
+def _versions(tags) -> list:
+    keys = [_version_key(name) for name in tags]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            version = _new_version()
+            cache.add(key, version, timeout=None)
+            found[key] = cache.get(key, version)
+    return [found[key] for key in keys]
+
+
+def tagged_key(key: str, tags) -> str:
+    """``key`` qualified by the current versions of ``tags`` (one cache read)."""
+    tags = sorted(set(tags))
+    stamp = "|".join(f"{name}={version}" for name, version in zip(tags, _versions(tags), strict=True))
+    return f"{key}@{hashlib.sha1(stamp.encode('utf-8')).hexdigest()[:16]}"
+
+
+def tag_stamp(name: str) -> tuple[str, datetime]:
+    """``(version, bumped_at)`` of tag ``name``, for HTTP validators (one cache read)."""
+    version = _versions([name])[0]
+    bumped_at = datetime.fromtimestamp(int(version.split("-", 1)[0], 16) / 1000, tz=timezone.utc)
+    return version, bumped_at
+
+
+def bump_tags(tags) -> None:
+    """Retire every cached artifact that depends on any of ``tags``."""
+    tags = set(tags)
+    if tags:
+        cache.set_many({_version_key(name): _new_version() for name in tags}, timeout=None)
+
+
+def short_lived(response):
+    """Cap ``response``'s shared-cache lifetime at :data:`TAGGED_RESPONSE_MAX_AGE`."""
+    patch_cache_control(response, max_age=TAGGED_RESPONSE_MAX_AGE)
+    return response
+
+
+def bump_work_tags(work_ids, facet_keys) -> None:
+    """Bump the tags of works whose public representation changed.
+
+    ``facet_keys`` are the ``(kind, key)`` facets the works belonged to before
+    or after the change; the works' collections are looked up here.
+    """
+    from works.models import Work
+
+    tags = {WORKS}
+    tags.update(tag(kind, key) for kind, key in facet_keys if kind in TAGGED_FACETS)
+    collection_ids = (
+        Work.collections.through.objects.filter(work_id__in=list(work_ids))
+        .values_list("collection_id", flat=True)
+        .distinct()
+    )
+    tags.update(tag(COLLECTION, pk) for pk in collection_ids)
+    bump_tags(tags)
@@ -0,0 +1,279 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Rebuild the cached artifacts that are cold after a deploy or cache restart.
+
+After ``clear_caches``, a restart of the cache server or a deploy that moves
+cache keys, the first visitor of each page pays for building it: the
+statistics, source maps, region pages, collection downloads, feeds and landing
+pages. :func:`warm_caches` builds them
+ahead of visitors, one stage at a time in :data:`STAGES` order:
+
+``statistics``
+    the statistics counters, recounted if they were never filled
+    (``works.utils.statistics``);
+``facets``
+    the topic slug map and the source pages with their all-works maps;
+``regions``
+    the continent and ocean pages;
+``collections``
+    the CSV and GeoPackage downloads of published collections (the collection
+    pages themselves are rendered per request and have nothing to warm);
+``feeds``
+    every public feed, through :func:`works.services.feed_prerender.prerender_feeds`;
+``sitemap``
+    the work sitemap shards;
+``works``
+    the landing pages of the most requested works — counted in the tail of the
+    access log when one is given — topped up with the most recently updated.
+
+Pages are built by an anonymous GET on the public host through the full
+middleware stack, so they fill the same shared cache entries, the site-wide
+page cache included, that a browser visit would. Artifacts
+already in the cache are served from it and cost little. Up to ``workers``
+artifacts of a stage are built at once; every artifact's time and outcome is
+returned and reported by ``manage.py warm_caches``. The Django-Q task
+``works.tasks.warm_caches`` runs the same, e.g. enqueued after a deploy.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.http import Http404
+from django.test import Client
+from django.urls import Resolver404, resolve, reverse
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("statistics", "facets", "regions", "collections", "feeds", "sitemap", "works")
+
+#: Bytes read from the end of the access log to rank recently requested works.
+ACCESS_LOG_TAIL_BYTES = 16 * 1024 * 1024
+# The request line and status of the combined log format (nginx, gunicorn).
+_REQUEST_RE = re.compile(r'"GET (\S+) HTTP/[\d.]+" (\d{3}) ')
+_WORK_LANDING = "optimap:work-landing"
+
+
+def _get(path):
+    """Request ``path`` as an anonymous visitor of the public host; raises :class:`Http404` for missing pages.
+
+    The request passes through the whole middleware stack, so the site-wide
+    page cache stores the response too. That cache varies on
+    ``Accept-Encoding`` (added by ``GZipMiddleware``), so the request sends
+    ``CACHE_WARMUP_ACCEPT_ENCODING`` to fill the entry browsers look up.
+    """
+    base = urlsplit(settings.BASE_URL)
+    client = Client(HTTP_HOST=base.netloc, HTTP_ACCEPT_ENCODING=settings.CACHE_WARMUP_ACCEPT_ENCODING)
+    response = client.get(path, secure=base.scheme == "https")
+    if response.streaming:
+        # Streamed downloads fill their caches once read to the end.
+        for _chunk in response.streaming_content:
+            pass
+    if response.status_code == 404:
+        raise Http404(path)
+    if response.status_code >= 400:
+        raise RuntimeError(f"{path} returned {response.status_code}")
+    return response
+
+
+def _page(path):
+    return path, lambda: _get(path)
+
+
+# --- work landing pages ----------------------------------------------------
+
+
+def _log_tail(path, size=ACCESS_LOG_TAIL_BYTES):
+    with open(path, "rb") as fh:
+        end = fh.seek(0, os.SEEK_END)
+        fh.seek(max(0, end - size))
+        lines = fh.read().decode("utf-8", "replace").splitlines()
+    # The first line read is cut off unless the whole file fit.
+    return lines[1:] if end > size else lines
+
+
+def _logged_work_paths(access_log):
+    """Landing page paths in the tail of ``access_log``, most requested first."""
+    hits = Counter()
+    for line in _log_tail(access_log):
+        match = _REQUEST_RE.search(line)
+        if match and match.group(2) in ("200", "304"):
+            hits[match.group(1).split("?", 1)[0]] += 1
+    paths = []
+    for path, _n in hits.most_common():
+        try:
+            if resolve(path).view_name == _WORK_LANDING:
+                paths.append(path)
+        except Resolver404:
+            continue
+    return paths
+
+
+def popular_work_paths(limit, access_log=None) -> list[str]:
+    """Paths of up to ``limit`` landing pages worth warming.
+
+    The works requested most often in the tail of ``access_log`` come first; the
+    most recently updated published works fill the remaining places.
+    """
+    from works.models import Work
+    from works.services.sitemap_shards import work_path_builder
+
+    paths = []
+    if access_log:
+        try:
+            paths = _logged_work_paths(access_log)[:limit]
+        except OSError as exc:
+            logger.warning("Could not read access log %s: %s", access_log, exc)
+    if len(paths) < limit:
+        work_path = work_path_builder()
+        recent = Work.objects.filter(status="p").order_by("-lastUpdate", "-id").values_list("id", "doi")
+        seen = set(paths)
+        for pk, doi in recent[: limit * 2]:
+            path = work_path(pk, doi)
+            if path not in seen:
+                seen.add(path)
+                paths.append(path)
+                if len(paths) == limit:
+                    break
+    return paths
+
+
+# --- stages ----------------------------------------------------------------
+
+
+def _statistics_artifacts(options):
+    from works.utils.statistics import get_statistics
+
+    return [("statistics", get_statistics)]
+
+
+def _facet_artifacts(options):
+    from works.models import Source
+    from works.views_indexed import topic_slug_map
+
+    artifacts = [("topic slugs", topic_slug_map)]
+    sources = Source.objects.filter(works__status="p", slug__isnull=False).exclude(slug="")
+    for slug in sources.values_list("slug", flat=True).distinct().order_by("slug"):
+        artifacts.append(_page(reverse("optimap:in-source", kwargs={"source_slug": slug})))
+    return artifacts
+
+
+def _region_artifacts(options):
+    from works.models import GlobalRegion
+
+    artifacts = []
+    for region in GlobalRegion.objects.only("name", "region_type").order_by("pk"):
+        if region.region_type == GlobalRegion.OCEAN:
+            path = reverse("optimap:feed-ocean-page", kwargs={"ocean_slug": region.get_slug()})
+        else:
+            path = reverse("optimap:feed-continent-page", kwargs={"continent_slug": region.get_slug()})
+        artifacts.append(_page(path))
+    return artifacts
+
+
+def _collection_artifacts(options):
+    from works.models import Collection
+
+    artifacts = []
+    for identifier in Collection.objects.filter(is_published=True).values_list("identifier", flat=True):
+        for url_name in ("optimap:download-collection-csv", "optimap:download-collection-gpkg"):
+            artifacts.append(_page(reverse(url_name, kwargs={"collection_slug": identifier})))
+    return artifacts
+
+
+def _feed_artifacts(options):
+    from works.services.feed_prerender import prerender_feeds
+
+    return [("feeds", prerender_feeds)]
+
+
+def _sitemap_artifacts(options):
+    from works.services.sitemap_shards import build_sitemap_shards
+
+    return [("sitemap shards", build_sitemap_shards)]
+
+
+def _work_artifacts(options):
+    return [_page(path) for path in popular_work_paths(options["works"], options["access_log"])]
+
+
+_ARTIFACTS = {
+    "statistics": _statistics_artifacts,
+    "facets": _facet_artifacts,
+    "regions": _region_artifacts,
+    "collections": _collection_artifacts,
+    "feeds": _feed_artifacts,
+    "sitemap": _sitemap_artifacts,
+    "works": _work_artifacts,
+}
+
+
+def _build(stage, name, func, *, threaded=False) -> dict:
+    started = time.monotonic()
+    try:
+        func()
+        status = "ok"
+    except Http404:
+        status = "missing"
+    except Exception:
+        logger.exception("Could not warm %s %s", stage, name)
+        status = "failed"
+    finally:
+        if threaded:
+            connections.close_all()
+    return {"stage": stage, "artifact": name, "status": status, "seconds": time.monotonic() - started}
+
+
+def warm_caches(stages=None, *, workers=None, works=None, access_log=None, report=None) -> list[dict]:
+    """Build the artifacts of ``stages`` (all of :data:`STAGES` by default), in stage order.
+
+    ``workers`` bounds how many artifacts of a stage are built at once;
+    ``works`` is the number of landing pages to warm; ``access_log`` ranks them
+    by recent requests. ``report`` is called with each result as it completes.
+
+    Returns ``[{"stage", "artifact", "status", "seconds"}, ...]`` where
+    ``status`` is ``"ok"``, ``"missing"`` (the page 404s) or ``"failed"``.
+    """
+    options = {
+        "works": settings.CACHE_WARMUP_WORKS if works is None else works,
+        "access_log": settings.CACHE_WARMUP_ACCESS_LOG if access_log is None else access_log,
+    }
+    workers = max(1, settings.CACHE_WARMUP_WORKERS if workers is None else workers)
+    results = []
+
+    def done(result):
+        results.append(result)
+        if report:
+            report(result)
+
+    for stage in STAGES:
+        if stages and stage not in stages:
+            continue
+        try:
+            artifacts = _ARTIFACTS[stage](options)
+        except Exception:
+            logger.exception("Could not list the %s to warm", stage)
+            done({"stage": stage, "artifact": stage, "status": "failed", "seconds": 0.0})
+            continue
+        if workers == 1 or len(artifacts) < 2:
+            for name, func in artifacts:
+                done(_build(stage, name, func))
+            continue
+        # Each thread opens its own database connection and closes it after every artifact.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warm-caches") as pool:
+            futures = [pool.submit(_build, stage, name, func, threaded=True) for name, func in artifacts]
+            for future in as_completed(futures):
+                done(future.result())
+
+    counts = Counter(result["status"] for result in results)
+    logger.info("Warmed caches: %d ok, %d missing, %d failed", counts["ok"], counts["missing"], counts["failed"])
+    return results
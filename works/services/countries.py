@@ -13,6 +13,10 @@ multi-valued: a polygon spanning Germany and Poland returns both.
 
 Used by the ``Work`` post-save signal (``works.signals.assign_work_countries``)
 and the recurring backfill sweep (``works.tasks.backfill_work_countries``).
+
+The join runs against :class:`works.models.CountrySubdivided` — the outlines
+cut into small GiST-indexed pieces — rather than the full multipolygons, so a
+coastal country no longer costs a full-coastline intersects test per work.
 """
 
 from __future__ import annotations
@@ -53,22 +57,40 @@ def lookup_countries(geom, snap_tolerance: float = 0.12) -> tuple[list, dict | N
     from django.contrib.gis.db.models.functions import MakeValid
     from django.db.models import Func, Value
 
-    from works.models import Country
-
     geom_field = GeometryField(srid=4326)
     valid = MakeValid(Value(geom, output_field=geom_field))
-    matches = list(Country.objects.real().filter(geom__intersects=valid))
+    matches = _countries_intersecting(valid)
     if matches:
         return matches, _provenance(matches, "intersects")
     if snap_tolerance:
         # ST_Buffer (no Django GIS function wrapper) — snap to nearby outlines.
         buffered = Func(valid, Value(snap_tolerance), function="ST_Buffer", output_field=geom_field)
-        matches = list(Country.objects.real().filter(geom__intersects=buffered))
+        matches = _countries_intersecting(buffered)
         if matches:
             return matches, _provenance(matches, "buffer_snap", snap_tolerance)
     return [], None
 
 
+def _countries_intersecting(geom_expr) -> list:
+    """Real ``Country`` rows with at least one subdivided piece hitting ``geom_expr``."""
+    from works.models import Country, CountrySubdivided
+
+    hits = CountrySubdivided.objects.filter(geom__intersects=geom_expr).values("country_id")
+    return list(Country.objects.real().filter(pk__in=hits))
+
+
+def refresh_country_subdivisions(country_ids=None) -> int:
+    """Rebuild :class:`~works.models.CountrySubdivided` (all rows, or ``country_ids``).
+
+    Called by the ``Country`` post-save signal and at the end of
+    ``load_countries``. Returns the number of pieces written.
+    """
+    from works.models import CountrySubdivided
+    from works.services.subdivisions import refresh_subdivisions
+
+    return refresh_subdivisions(CountrySubdivided, country_ids)
+
+
 def countries_for_geometry(geom, snap_tolerance: float = 0.12) -> list:
     """Return the ``Country`` rows whose outline intersects ``geom``.
 
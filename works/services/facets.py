@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Maintain and query the ``WorkFacet`` index behind the facet pages (#29).
+
+:class:`works.models.WorkFacet` holds one ``(kind, key, work)`` row for every
+facet a *published* work belongs to: each data year its temporal coverage
+spans, each OpenAlex topic, each linked country and global region, and its
+source. The ``/browse/`` directory, ``/during/<year>``, ``/on/<topic>``, the
+place pages and the facet sitemaps then count and list works with a single
+indexed query each, instead of rescanning every published work whenever a
+one-hour cache expired.
+
+The index is maintained incrementally: :func:`refresh_work_facets` runs from
+the ``Work`` post-save signal and when a work's countries/regions change
+(``m2m_changed``), and bulk ``status`` updates (admin actions, collection
+publishing) call it explicitly. :func:`rebuild_facets` recomputes everything and
+backs ``manage.py rebuild_work_facets``; :func:`extend_year_facets` moves the
+year facets' upper bound every New Year. Each refresh also bumps the cache tags
+(:mod:`works.services.cache_tags`) of the facets the works left or joined.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import re
+
+from django.db import transaction
+from django.db.models import Count
+
+logger = logging.getLogger(__name__)
+
+YEAR = "year"
+TOPIC = "topic"
+COUNTRY = "country"
+REGION = "region"
+SOURCE = "source"
+
+YEAR_MIN = 1900
+_YEAR_RE = re.compile(r"(\d{4})")
+
+#: Work columns :func:`facet_keys` reads (besides the country/region M2Ms).
+FACET_SOURCE_FIELDS = ("id", "status", "topics", "timeperiod_startdate", "timeperiod_enddate", "source_id")
+
+
+# --- temporal-coverage (data year) helpers ---------------------------------
+
+
+def _year_of(datestr):
+    """Extract a 4-digit year from a stored date string, or None."""
+    if not datestr:
+        return None
+    m = _YEAR_RE.search(str(datestr))
+    return int(m.group(1)) if m else None
+
+
+def work_year_ranges(work):
+    """Yield (start_year, end_year) for each temporal interval of a work.
+
+    ``timeperiod_startdate``/``timeperiod_enddate`` are parallel ArrayFields of
+    date strings; either bound may be missing (open-ended interval). An interval
+    with no usable bound at all is skipped.
+    """
+    starts = work.timeperiod_startdate or []
+    ends = work.timeperiod_enddate or []
+    for i in range(max(len(starts), len(ends))):
+        sy = _year_of(starts[i]) if i < len(starts) else None
+        ey = _year_of(ends[i]) if i < len(ends) else None
+        if sy is None and ey is None:
+            continue
+        yield (sy if sy is not None else ey, ey if ey is not None else sy)
+
+
+def covered_years(work):
+    """Set of in-range data years a work's temporal coverage spans.
+
+    Each interval is clamped to ``[YEAR_MIN, current_year + 1]`` (rather than
+    dropped when it partly falls outside), so this is the single definition of
+    "which years a work covers" behind the ``year`` facet — shared by the
+    /during/<year> page, the /browse directory and ``YearSitemap``. The upper
+    bound moves every New Year; :func:`extend_year_facets` then refreshes the
+    works it cut off.
+    """
+    upper = datetime.date.today().year + 1
+    years = set()
+    for start, end in work_year_ranges(work):
+        lo, hi = (start, end) if start <= end else (end, start)
+        lo = max(lo, YEAR_MIN)
+        hi = min(hi, upper)
+        if lo <= hi:
+            years.update(range(lo, hi + 1))
+    return years
+
+
+# --- maintenance -----------------------------------------------------------
+
+
+def facet_keys(work, country_isos=(), region_ids=()):
+    """``{(kind, key), ...}`` a work belongs to; empty unless it is published.
+
+    ``country_isos``/``region_ids`` are the work's linked countries (the
+    sentinel "will not be matched" country excluded) and global regions; they
+    are passed in so bulk rebuilds can fetch them in one query.
+    """
+    if work.status != "p":
+        return set()
+    keys = {(YEAR, str(year)) for year in covered_years(work)}
+    keys.update((TOPIC, topic) for topic in (work.topics or []) if topic)
+    keys.update((COUNTRY, iso) for iso in country_isos)
+    keys.update((REGION, str(region_id)) for region_id in region_ids)
+    if work.source_id:
+        keys.add((SOURCE, str(work.source_id)))
+    return keys
+
+
+def _linked_places(work_ids):
+    """``({work_id: [iso, ...]}, {work_id: [region_id, ...]})`` for ``work_ids``."""
+    from works.models import SENTINEL_COUNTRY_ISO, Work
+
+    countries, regions = {}, {}
+    for work_id, iso in (
+        Work.countries.through.objects.filter(work_id__in=work_ids)
+        .exclude(country__iso_code=SENTINEL_COUNTRY_ISO)
+        .values_list("work_id", "country__iso_code")
+    ):
+        countries.setdefault(work_id, []).append(iso)
+    for work_id, region_id in Work.regions.through.objects.filter(work_id__in=work_ids).values_list(
+        "work_id", "globalregion_id"
+    ):
+        regions.setdefault(work_id, []).append(region_id)
+    return countries, regions
+
+
+def refresh_facets(work_ids) -> int:
+    """Recompute the ``WorkFacet`` rows of the given works; returns rows written.
+
+    Reads the works fresh from the database, so it is safe to call after a bulk
+    ``.update()`` as well as from signals. Unpublished or deleted works simply
+    lose their rows.
+    """
+    from works.models import Work, WorkFacet
+    from works.services.cache_tags import bump_work_tags
+
+    work_ids = list(work_ids)
+    if not work_ids:
+        return 0
+    works = list(Work.objects.filter(pk__in=work_ids).only(*FACET_SOURCE_FIELDS))
+    countries, regions = _linked_places([w.pk for w in works])
+    rows = [
+        WorkFacet(kind=kind, key=key, work_id=work.pk)
+        for work in works
+        for kind, key in facet_keys(work, countries.get(work.pk, ()), regions.get(work.pk, ()))
+    ]
+    with transaction.atomic():
+        previous = stored_facet_keys(work_ids)
+        WorkFacet.objects.filter(work_id__in=work_ids).delete()
+        WorkFacet.objects.bulk_create(rows, batch_size=1000)
+    # Works that are, or were, published changed public pages: retire the
+    # cached artifacts of every facet they left or joined (works.services.cache_tags).
+    changed = previous | {(row.kind, row.key) for row in rows}
+    if changed or any(work.status == "p" for work in works):
+        bump_work_tags(work_ids, changed)
+    return len(rows)
+
+
+def stored_facet_keys(work_ids) -> set:
+    """``{(kind, key), ...}`` the index currently holds for ``work_ids``."""
+    from works.models import WorkFacet
+
+    return set(WorkFacet.objects.filter(work_id__in=list(work_ids)).values_list("kind", "key").distinct())
+
+
+def refresh_work_facets(work) -> int:
+    """Recompute the ``WorkFacet`` rows of a single work (see :func:`refresh_facets`)."""
+    return refresh_facets([work.pk])
+
+
+def rebuild_facets(batch_size: int = 2000) -> int:
+    """Rebuild the whole ``WorkFacet`` table from the published works.
+
+    Runs in one transaction, so readers keep seeing the previous index until
+    the rebuild commits. Returns the number of rows written.
+    """
+    from works.models import Work, WorkFacet
+
+    written = 0
+    with transaction.atomic():
+        WorkFacet.objects.all().delete()
+        ids = Work.objects.filter(status="p").order_by("id").values_list("id", flat=True)
+        batch = []
+        for work_id in ids.iterator(chunk_size=batch_size):
+            batch.append(work_id)
+            if len(batch) >= batch_size:
+                written += refresh_facets(batch)
+                batch = []
+        written += refresh_facets(batch)
+    logger.info("Rebuilt work facet index: %d rows", written)
+    return written
+
+
+def extend_year_facets(batch_size: int = 2000) -> int:
+    """Refresh the works whose ``year`` facets were cut off by last year's upper bound.
+
+    :func:`covered_years` clamps coverage to next year when the facets are
+    written, so after New Year the works reaching the old bound lack the new
+    one. Refreshing every work indexed under that year adds it. Scheduled every
+    1 January by ``works.tasks.schedule_year_facet_extension``; returns the
+    number of rows written.
+    """
+    from works.models import WorkFacet
+
+    previous_bound = str(datetime.date.today().year)
+    ids = list(
+        WorkFacet.objects.filter(kind=YEAR, key=previous_bound).order_by("work_id").values_list("work_id", flat=True)
+    )
+    written = 0
+    for start in range(0, len(ids), batch_size):
+        written += refresh_facets(ids[start : start + batch_size])
+    logger.info("Extended the year facets of %d work(s): %d rows", len(ids), written)
+    return written
+
+
+# --- queries ---------------------------------------------------------------
+
+
+def facet_counts(kind) -> dict:
+    """``{key: number of published works}`` for one facet ``kind`` (one indexed query)."""
+    from works.models import WorkFacet
+
+    rows = WorkFacet.objects.filter(kind=kind).values("key").annotate(n=Count("work_id")).values_list("key", "n")
+    return dict(rows)
+
+
+def facet_work_ids(kind, key):
+    """Subquery of the IDs of published works in facet ``(kind, key)``, for ``pk__in=``."""
+    from works.models import WorkFacet
+
+    return WorkFacet.objects.filter(kind=kind, key=str(key)).values("work_id")
@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Background rendering of the GeoRSS and Atom feeds.
+
+A cached feed (:class:`works.feeds.BaseCachedGeoFeed`) is retired whenever one
+of its cache tags is bumped, and the first reader after that used to pay for
+rendering it — up to ``FEED_MAX_ITEMS`` works, with a spatial filter for the
+regional feeds. :func:`prerender_feeds` renders every public feed (global,
+continents and oceans, published collections, sources with published works;
+both variants) into the cache under the key the view will look up, skipping
+feeds whose current version is already there, so after a harvest or a
+publish/unpublish only the feeds that changed are rendered.
+
+It runs as ``works.tasks.prerender_feeds``, enqueued through
+:func:`schedule_feed_prerender` by :func:`works.services.work_changes.on_works_changed`
+whenever published works change, and run with every scheduled data dump, so
+feeds whose entries expired get rendered again.
+"""
+
+from __future__ import annotations
+
+import logging
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.http import Http404
+from django.test import RequestFactory
+from django.urls import reverse
+
+from works.utils.scheduling import debounced_task_started, enqueue_debounced
+
+logger = logging.getLogger(__name__)
+
+VARIANTS = (("georss", "rss"), ("atom", "atom"))
+
+_TASK = "works.tasks.prerender_feeds"
+
+
+def feed_targets():
+    """``(feed class, url name, url kwargs)`` for every public feed, without the variant."""
+    from works.feeds import CollectionGeoFeed, GlobalGeoFeed, RegionalGeoFeed, SourceGeoFeed
+    from works.models import Collection, GlobalRegion, Source
+
+    yield GlobalGeoFeed, "api-feed-{ext}", {}
+    for region in GlobalRegion.objects.only("name", "region_type").order_by("pk"):
+        if region.region_type == GlobalRegion.OCEAN:
+            yield RegionalGeoFeed, "api-ocean-{ext}", {"ocean_slug": region.get_slug()}
+        else:
+            yield RegionalGeoFeed, "api-continent-{ext}", {"continent_slug": region.get_slug()}
+    for identifier in Collection.objects.filter(is_published=True).values_list("identifier", flat=True):
+        yield CollectionGeoFeed, "api-collection-{ext}", {"collection_slug": identifier}
+    sources = Source.objects.filter(works__status="p", slug__isnull=False).exclude(slug="")
+    for slug in sources.values_list("slug", flat=True).distinct():
+        yield SourceGeoFeed, "api-source-{ext}", {"source_slug": slug}
+
+
+def _request(path):
+    """A GET for ``path`` on the public host, so feed and item links match served feeds."""
+    base = urlsplit(settings.BASE_URL)
+    return RequestFactory().get(path, HTTP_HOST=base.netloc, secure=base.scheme == "https")
+
+
+def prerender_feeds() -> dict:
+    """Render every public feed whose current version is not cached yet.
+
+    Returns ``{"rendered": n, "cached": n, "failed": n}``.
+    """
+    # Triggers arriving from now on may change feeds already rendered, so they enqueue the next run.
+    debounced_task_started(_TASK)
+    counts = {"rendered": 0, "cached": 0, "failed": 0}
+    for feed_class, url_name, kwargs in feed_targets():
+        for variant, ext in VARIANTS:
+            path = None
+            try:
+                path = reverse(f"optimap:{url_name.format(ext=ext)}", kwargs=kwargs)
+                rendered = feed_class(feed_type_variant=variant).prerender(_request(path), **kwargs)
+            except Http404:
+                continue
+            except Exception:
+                logger.exception("Could not pre-render feed %s", path or (url_name, kwargs))
+                counts["failed"] += 1
+                continue
+            counts["rendered" if rendered else "cached"] += 1
+    logger.info("Pre-rendered feeds: %(rendered)d rendered, %(cached)d current, %(failed)d failed", counts)
+    return counts
+
+
+def schedule_feed_prerender() -> None:
+    """Enqueue :func:`prerender_feeds`, at most once per ``works.utils.scheduling.DEBOUNCE_SECONDS``."""
+    enqueue_debounced(_TASK)
@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Prebuilt, precompressed snapshot of the public works map.
+
+Anonymous visitors all see the same published works, yet the main map used to
+page them through ``/api/v1/works/?minimal=true`` on every visit. Instead,
+:func:`build_map_snapshot` writes that exact payload (``WorkMinimalSerializer``
+features, ``simplify=high`` geometries) once into ``MAP_SNAPSHOT_DIR`` as
+
+- ``works-minimal.<hash>.geojson`` — the content-addressed FeatureCollection,
+- ``works-minimal.<hash>.geojson.gz`` and ``.br`` — precompressed siblings,
+- ``works-minimal.json`` — a manifest naming the current file.
+
+Because the name changes with the content, the web server can serve the files
+with far-future ``Cache-Control: immutable`` (``gzip_static``/``brotli_static``
+in nginx); :func:`current_snapshot_url` tells the homepage which file to load.
+The snapshot is rebuilt by ``works.tasks.regenerate_map_snapshot``, enqueued
+through :func:`schedule_map_snapshot` by
+:func:`works.services.work_changes.on_works_changed` when a work is
+(un)published or deleted or the geometry, title or DOI of a published work
+changes — in bulk, through the admin form or by a harvest — and run with
+every scheduled data dump.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from works.utils.scheduling import debounced_task_started, enqueue_debounced
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PREFIX = "works-minimal"
+MANIFEST_NAME = f"{SNAPSHOT_PREFIX}.json"
+SNAPSHOT_NAME_RE = re.compile(rf"{SNAPSHOT_PREFIX}\.[0-9a-f]{{16}}\.geojson")
+#: Snapshots kept on disk: pages cached before a rebuild still reference the old name.
+SNAPSHOT_RETENTION = 3
+
+_CURRENT_KEY = "map_snapshot:current"
+_TASK = "works.tasks.regenerate_map_snapshot"
+
+
+def snapshot_dir() -> Path:
+    return Path(settings.MAP_SNAPSHOT_DIR)
+
+
+def _snapshot_features():
+    from works.models import Work
+    from works.serializers import WorkMinimalSerializer
+    from works.utils.geometry import annotate_rounded_geometry, geometry_for_band
+
+    works = Work.objects.filter(status="p").order_by("-creationDate", "-id")
+    works = annotate_rounded_geometry(works, geo_field=geometry_for_band("high"))
+    for work in works.iterator(chunk_size=2000):
+        yield WorkMinimalSerializer(work).data
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _brotli(data: bytes):
+    try:
+        import brotli
+    except ImportError:
+        logger.warning("brotli is not installed; writing the map snapshot without a .br sibling")
+        return None
+    return brotli.compress(data, quality=11)
+
+
+def build_map_snapshot() -> Path:
+    """Write the current public map snapshot and its compressed siblings; return its path.
+
+    Unchanged content keeps its name, so a rebuild without edits costs one
+    query and no writes.
+    """
+    from works.utils.geojson import RawJSONEncoder, iter_feature_collection
+
+    # Triggers arriving from now on see the old content and enqueue the next rebuild.
+    debounced_task_started(_TASK)
+    directory = snapshot_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    data = "".join(iter_feature_collection(_snapshot_features(), cls=RawJSONEncoder)).encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    name = f"{SNAPSHOT_PREFIX}.{digest}.geojson"
+    path = directory / name
+    if not path.exists():
+        _write_atomic(path.with_name(name + ".gz"), gzip.compress(data, compresslevel=9, mtime=0))
+        compressed = _brotli(data)
+        if compressed is not None:
+            _write_atomic(path.with_name(name + ".br"), compressed)
+        # The plain file goes last: its presence marks a complete snapshot.
+        _write_atomic(path, data)
+    manifest = {"name": name, "sha256": digest, "size": len(data), "generated": timezone.now().isoformat()}
+    _write_atomic(directory / MANIFEST_NAME, json.dumps(manifest).encode("utf-8"))
+    cache.set(_CURRENT_KEY, name, timeout=None)
+    _prune(directory, keep=name)
+    logger.info("Map snapshot %s (%d bytes)", path, len(data))
+    return path
+
+
+def _prune(directory: Path, keep: str) -> None:
+    snapshots = sorted(directory.glob(f"{SNAPSHOT_PREFIX}.*.geojson"), key=lambda p: p.stat().st_mtime, reverse=True)
+    stale = [p for p in snapshots if p.name != keep][SNAPSHOT_RETENTION - 1 :]
+    for path in stale:
+        for sibling in (path, path.with_name(path.name + ".gz"), path.with_name(path.name + ".br")):
+            sibling.unlink(missing_ok=True)
+
+
+def current_snapshot_name():
+    """File name of the current snapshot, or ``None`` if none has been built yet."""
+    name = cache.get(_CURRENT_KEY)
+    if name is None:
+        try:
+            name = json.loads((snapshot_dir() / MANIFEST_NAME).read_text())["name"]
+        except (OSError, ValueError, KeyError):
+            return None
+        cache.set(_CURRENT_KEY, name, timeout=None)
+    if not (snapshot_dir() / name).exists():
+        return None
+    return name
+
+
+def current_snapshot_url():
+    """URL of the current snapshot under ``MAP_SNAPSHOT_URL``, or ``None``."""
+    name = current_snapshot_name()
+    if name is None:
+        return None
+    return settings.MAP_SNAPSHOT_URL.rstrip("/") + "/" + name
+
+
+def schedule_map_snapshot() -> None:
+    """Enqueue a snapshot rebuild, at most once per ``works.utils.scheduling.DEBOUNCE_SECONDS``."""
+    enqueue_debounced(_TASK)
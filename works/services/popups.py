@@ -0,0 +1,100 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Cached popup representation of a work for map feature clicks.
+
+Clicking a feature on a map used to fetch ``/api/v1/works/<id>/``, which runs
+the full ``WorkSerializer`` (source details with coverage lookups, countries,
+regions, BoK resolution and the full geometry) just to fill a popup.
+``/api/v1/works/<id>/popup/`` instead serves :class:`works.serializers.WorkPopupSerializer`
+— plain columns of the work and its source, read with one ``.only()`` query —
+and keeps the result under ``work_popup:<id>`` in the ``popups`` cache, a
+bounded cache of its own so that one entry per clicked work cannot crowd
+other entries out of the default cache.
+
+Entries are deleted by the ``Work`` save/delete signals, after bulk status
+updates and, for all of its works, when a ``Source`` is saved; source columns
+written with ``QuerySet.update()`` (OpenAlex statistics) catch up after
+``WORK_POPUP_CACHE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import caches
+
+_CACHE_ALIAS = "popups"
+_KEY = "work_popup:{pk}"
+# Keys per delete_many() call when a source's works are invalidated.
+_DELETE_BATCH = 1000
+
+_WORK_FIELDS = (
+    "title",
+    "doi",
+    "status",
+    "url",
+    "abstract",
+    "authors",
+    "publicationDate",
+    "timeperiod_startdate",
+    "timeperiod_enddate",
+    "openalex_id",
+    "source_id",
+)
+_SOURCE_FIELDS = (
+    "name",
+    "slug",
+    "issn_l",
+    "publisher_name",
+    "works_count",
+    "homepage_url",
+    "abbreviated_title",
+    "is_oa",
+)
+
+
+def popup_key(pk) -> str:
+    return _KEY.format(pk=pk)
+
+
+def build_work_popup(pk):
+    """Serialize the popup of work ``pk`` from the database; ``None`` if it does not exist."""
+    from works.models import Work
+    from works.serializers import WorkPopupSerializer
+
+    only = _WORK_FIELDS + tuple(f"source__{field}" for field in _SOURCE_FIELDS)
+    work = Work.objects.select_related("source").only(*only).filter(pk=pk).first()
+    if work is None:
+        return None
+    return dict(WorkPopupSerializer(work).data)
+
+
+def get_work_popup(pk):
+    """Popup of work ``pk`` from the cache, serializing it on a miss.
+
+    Returns ``None`` for unknown works. The caller decides visibility from the
+    cached ``status``.
+    """
+    cache = caches[_CACHE_ALIAS]
+    key = popup_key(pk)
+    popup = cache.get(key)
+    if popup is None:
+        popup = build_work_popup(pk)
+        if popup is not None:
+            cache.set(key, popup, settings.WORK_POPUP_CACHE_SECONDS)
+    return popup
+
+
+def invalidate_work_popups(pks) -> None:
+    """Drop the cached popups of the works ``pks``."""
+    cache = caches[_CACHE_ALIAS]
+    keys = [popup_key(pk) for pk in pks]
+    for start in range(0, len(keys), _DELETE_BATCH):
+        cache.delete_many(keys[start : start + _DELETE_BATCH])
+
+
+def invalidate_source_popups(source_id) -> None:
+    """Drop the cached popups of every work of source ``source_id``."""
+    from works.models import Work
+
+    invalidate_work_popups(Work.objects.filter(source_id=source_id).values_list("pk", flat=True).iterator())
@@ -16,6 +16,10 @@ region, and snapping would risk pulling a work into two adjacent continents.
 
 Used by the ``Work`` post-save signal (``works.signals.assign_work_regions``)
 and the recurring backfill sweep (``works.tasks.backfill_work_regions``).
+
+As for countries, the join runs against the subdivided outline pieces in
+:class:`works.models.GlobalRegionSubdivided`; the detailed ocean polygons are
+where this matters most.
 """
 
 from __future__ import annotations
@@ -45,16 +49,29 @@ def lookup_regions(geom) -> tuple[list, dict | None]:
     from django.contrib.gis.db.models.functions import MakeValid
     from django.db.models import Value
 
-    from works.models import GlobalRegion
+    from works.models import GlobalRegion, GlobalRegionSubdivided
 
     geom_field = GeometryField(srid=4326)
     valid = MakeValid(Value(geom, output_field=geom_field))
-    matches = list(GlobalRegion.objects.filter(geom__intersects=valid))
+    hits = GlobalRegionSubdivided.objects.filter(geom__intersects=valid).values("region_id")
+    matches = list(GlobalRegion.objects.filter(pk__in=hits))
     if not matches:
         return [], None
     return matches, _provenance(matches)
 
 
+def refresh_region_subdivisions(region_ids=None) -> int:
+    """Rebuild :class:`~works.models.GlobalRegionSubdivided` (all rows, or ``region_ids``).
+
+    Called by the ``GlobalRegion`` post-save signal and at the end of
+    ``load_global_regions``. Returns the number of pieces written.
+    """
+    from works.models import GlobalRegionSubdivided
+    from works.services.subdivisions import refresh_subdivisions
+
+    return refresh_subdivisions(GlobalRegionSubdivided, region_ids)
+
+
 def regions_for_geometry(geom) -> list:
     """Return the ``GlobalRegion`` rows whose outline intersects ``geom``.
 
@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Prebuilt, gzip-compressed sitemap shards of the published works.
+
+``/sitemap-works.xml`` rendered every published work on each crawler hit, and
+crawlers fetch it often. :func:`build_sitemap_shards` instead writes the work
+URLs once into ``SITEMAP_DIR`` as ``sitemap-works-<n>.xml.gz``, where shard
+``n`` holds the works with ``n * SITEMAP_SHARD_SIZE <= id < (n + 1) *
+SITEMAP_SHARD_SIZE``. It reads only ``(id, doi, lastUpdate)`` rows and builds
+each URL from a reversed template rather than calling ``reverse()`` per work.
+
+Because shards are ID ranges, new works only change the last shards; a shard
+whose content did not change is not rewritten, so its modification time — the
+``lastmod`` in the sitemap index and the ``Last-Modified`` it is served with —
+stays put and crawlers can skip it. The sitemap index lists the shards in place
+of the ``works`` section once the first build exists (see
+``optimap.views.sitemap_index``). Shards are rebuilt by
+``works.tasks.regenerate_sitemap_shards``, run with every scheduled data dump;
+nginx can serve ``SITEMAP_DIR`` directly.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import re
+import tempfile
+from datetime import UTC, datetime
+from itertools import groupby
+from pathlib import Path
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.urls import reverse
+
+logger = logging.getLogger(__name__)
+
+SHARD_NAME_RE = re.compile(r"sitemap-works-(\d+)\.xml\.gz")
+_PLACEHOLDER = "__identifier__"
+# Characters reverse() leaves unquoted in a <path:...> argument.
+_SAFE = "!$&'()*+,;=/~:@"
+
+
+def sitemap_dir() -> Path:
+    return Path(settings.SITEMAP_DIR)
+
+
+def shard_name(shard: int) -> str:
+    return f"sitemap-works-{shard}.xml.gz"
+
+
+def work_path_builder():
+    """Function ``(pk, doi) -> landing page path``, equal to ``reverse()`` of ``get_identifier()``."""
+    template = reverse("optimap:work-landing", args=[_PLACEHOLDER])
+    prefix, suffix = template.split(_PLACEHOLDER)
+
+    def build(pk, doi):
+        return prefix + quote(doi or str(pk), safe=_SAFE) + suffix
+
+    return build
+
+
+def _published_rows():
+    from works.models import Work
+
+    return Work.objects.filter(status="p").order_by("id").values_list("id", "doi", "lastUpdate")
+
+
+def _shard_xml(rows, base_url, work_path) -> bytes:
+    from optimap.sitemaps import WorksSitemap
+
+    tail = f"<changefreq>{WorksSitemap.changefreq}</changefreq><priority>{WorksSitemap.priority}</priority></url>\n"
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n',
+    ]
+    for pk, doi, last_update in rows:
+        parts.append(f"<url><loc>{escape(base_url + work_path(pk, doi))}</loc>")
+        if last_update:
+            parts.append(f"<lastmod>{last_update.date().isoformat()}</lastmod>")
+        parts.append(tail)
+    parts.append("</urlset>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    if path.exists() and path.read_bytes() == data:
+        return False
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".sitemap-")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+    return True
+
+
+def build_sitemap_shards() -> list[Path]:
+    """Write the work sitemap shards, dropping shards that no longer have works.
+
+    Returns the paths of the current shards.
+    """
+    directory = sitemap_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    size = settings.SITEMAP_SHARD_SIZE
+    base_url = settings.BASE_URL.rstrip("/")
+    work_path = work_path_builder()
+
+    paths, written = [], 0
+    for shard, rows in groupby(_published_rows().iterator(chunk_size=5000), key=lambda row: row[0] // size):
+        path = directory / shard_name(shard)
+        # mtime=0 keeps the gzip bytes a function of the content alone.
+        written += _write_if_changed(path, gzip.compress(_shard_xml(rows, base_url, work_path), mtime=0))
+        paths.append(path)
+
+    current = {path.name for path in paths}
+    for stale in directory.iterdir():
+        if SHARD_NAME_RE.fullmatch(stale.name) and stale.name not in current:
+            stale.unlink(missing_ok=True)
+    logger.info("Sitemap shards: %d current, %d rewritten", len(paths), written)
+    return paths
+
+
+def current_shards() -> list[tuple[int, datetime]]:
+    """``[(shard, last modified), ...]`` of the built shards, in shard order."""
+    try:
+        entries = list(sitemap_dir().iterdir())
+    except OSError:
+        return []
+    shards = []
+    for entry in entries:
+        match = SHARD_NAME_RE.fullmatch(entry.name)
+        if not match:
+            continue
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:  # dropped by a concurrent build
+            continue
+        shards.append((int(match.group(1)), datetime.fromtimestamp(mtime, tz=UTC)))
+    return sorted(shards)
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Maintain the ``ST_Subdivide`` tables behind the country/region joins.
+
+:class:`works.models.CountrySubdivided` and
+:class:`works.models.GlobalRegionSubdivided` hold each outline cut into small
+pieces of at most ``OUTLINE_SUBDIVIDE_MAX_VERTICES`` vertices. A work geometry
+then only has to be tested against the handful of pieces whose GiST-indexed
+bounding box it overlaps, instead of against the full (coastline-heavy)
+multipolygon — turning each per-work join from tens of milliseconds into well
+under one.
+
+The tables are derived data: :func:`refresh_subdivisions` rebuilds them from
+the parent outlines in a single ``INSERT … SELECT ST_Subdivide(...)``. It runs
+for a single row from the ``Country``/``GlobalRegion`` post-save signals, for
+all rows at the end of ``load_countries``/``load_global_regions``, and lazily
+from the backfill sweeps when a table is still empty.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+
+def refresh_subdivisions(subdivided_model, parent_ids=None) -> int:
+    """Rebuild the subdivided pieces of ``subdivided_model`` from its parent.
+
+    ``subdivided_model`` is :class:`~works.models.CountrySubdivided` or
+    :class:`~works.models.GlobalRegionSubdivided`; its single foreign key names
+    the parent outline table. ``parent_ids`` restricts the rebuild to those
+    parent rows (``None`` rebuilds everything). Parent outlines are repaired
+    with ``ST_MakeValid`` and empty geometries (the sentinel country) are
+    skipped. Returns the number of pieces written.
+    """
+    fk = next(f for f in subdivided_model._meta.concrete_fields if f.is_relation)
+    table = connection.ops.quote_name(subdivided_model._meta.db_table)
+    parent_table = connection.ops.quote_name(fk.related_model._meta.db_table)
+    column = connection.ops.quote_name(fk.column)
+    max_vertices = settings.OUTLINE_SUBDIVIDE_MAX_VERTICES
+
+    delete_sql = f"DELETE FROM {table}"
+    insert_sql = (
+        f"INSERT INTO {table} ({column}, geom) "
+        f"SELECT p.id, ST_Subdivide(ST_MakeValid(p.geom), %s) "
+        f"FROM {parent_table} p WHERE NOT ST_IsEmpty(p.geom)"
+    )
+    delete_params, insert_params = [], [max_vertices]
+    if parent_ids is not None:
+        parent_ids = list(parent_ids)
+        delete_sql += f" WHERE {column} = ANY(%s)"
+        insert_sql += " AND p.id = ANY(%s)"
+        delete_params.append(parent_ids)
+        insert_params.append(parent_ids)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(delete_sql, delete_params)
+        cursor.execute(insert_sql, insert_params)
+        written = cursor.rowcount
+    logger.debug("Rebuilt %d %s pieces (parents: %s)", written, subdivided_model.__name__, parent_ids or "all")
+    return written
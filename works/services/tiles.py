@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Render and cache vector tiles and clusters of the works map.
+
+``/api/v1/tiles/works/{z}/{x}/{y}.mvt`` serves the work geometries inside one
+Web-Mercator tile, encoded by PostGIS (``ST_AsMVTGeom`` clips and quantises each
+geometry to the tile grid, ``ST_AsMVT`` encodes the layer). The map then only
+downloads what is in view at the current zoom, instead of paging the whole
+corpus through ``/api/v1/works/?minimal=true`` up front.
+
+Each tile carries one layer per publication status (``published``, ``draft``,
+``harvested``, …) so the client can style and toggle them separately. The
+statuses a request may see mirror ``WorkViewSet.get_queryset``: staff see every
+work except merged-away duplicates (``r``), everyone else only published ones.
+Low zooms read the stored simplified geometries (``geometry_low`` …) chosen by
+:func:`works.utils.geometry.resolve_simplify_band`.
+
+:func:`render_cluster_tile` serves the low-zoom overview from the same tile
+grid: instead of every geometry it returns one point per occupied grid cell with
+a work count, a representative work and the cluster's extent.
+
+Rendered tiles are cached per audience under a generation number that
+:func:`invalidate_work_tiles` bumps whenever a work is saved, deleted or
+bulk-(un)published, so stale tiles are never served after an edit.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+#: MVT grid resolution and clip buffer (in tile units), the PostGIS defaults.
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+MAX_ZOOM = 22
+
+#: Layer name per status code, in layer order.
+STATUS_LAYERS = {
+    "p": "published",
+    "d": "draft",
+    "t": "testing",
+    "w": "withdrawn",
+    "h": "harvested",
+    "c": "contributed",
+}
+PUBLIC_STATUSES = ("p",)
+STAFF_STATUSES = tuple(STATUS_LAYERS)
+
+_GENERATION_KEY = "work_tiles:generation"
+
+# Web-Mercator is undefined at the poles: geometries are clipped to (and
+# cluster centres limited to) this latitude before they are projected.
+_WEB_MERCATOR_MAX_LAT = 85.0511
+
+
+def visible_statuses(user) -> tuple:
+    """Status codes ``user`` may see on the map (see ``WorkViewSet.get_queryset``)."""
+    if user is not None and user.is_authenticated and user.is_staff:
+        return STAFF_STATUSES
+    return PUBLIC_STATUSES
+
+
+def is_valid_tile(z: int, x: int, y: int) -> bool:
+    """Whether ``z/x/y`` addresses an existing tile of the Web-Mercator pyramid."""
+    if not 0 <= z <= MAX_ZOOM:
+        return False
+    n = 1 << z
+    return 0 <= x < n and 0 <= y < n
+
+
+def _geometry_sql(z: int) -> str:
+    """Geometry column expression for zoom ``z`` (a stored simplified band, else full)."""
+    from works.utils.geometry import resolve_simplify_band
+
+    band = resolve_simplify_band(zoom=z)
+    if band is None:
+        return "w.geometry"
+    return f"COALESCE(w.geometry_{band}, w.geometry)"
+
+
+def render_work_tile(z: int, x: int, y: int, statuses=PUBLIC_STATUSES) -> bytes:
+    """Encode tile ``z/x/y`` with one layer per status in ``statuses``.
+
+    Mixed geometry collections are split into their point, line and polygon
+    parts (``ST_CollectionExtract``), since an MVT feature holds a single
+    geometry type; each part is clipped to the latitudes Web-Mercator can
+    project and becomes a feature carrying the work's ``id``, ``title`` and
+    ``doi``. Layers without features are left out, so a tile with nothing in
+    view is empty (zero bytes).
+    """
+    from works.models import Work
+
+    table = connection.ops.quote_name(Work._meta.db_table)
+    statuses = [s for s in STATUS_LAYERS if s in statuses]
+    if not statuses:
+        return b""
+    layers_sql = " || ".join(
+        "COALESCE((SELECT ST_AsMVT(l, %s, {extent}, 'geom') FROM "
+        "(SELECT id, title, doi, geom FROM features WHERE status = %s AND geom IS NOT NULL) AS l), ''::bytea)".format(
+            extent=TILE_EXTENT
+        )
+        for _status in statuses
+    )
+    sql = f"""
+        WITH bounds AS (
+            SELECT ST_TileEnvelope(%s, %s, %s) AS env
+        ),
+        mercator AS (
+            SELECT ST_MakeEnvelope(-180, -{_WEB_MERCATOR_MAX_LAT}, 180, {_WEB_MERCATOR_MAX_LAT}, 4326)::box2d AS box
+        ),
+        features AS (
+            SELECT w.id, w.title, w.doi, w.status,
+                   ST_AsMVTGeom(ST_Transform(ST_ClipByBox2D(part.geom, mercator.box), 3857),
+                                bounds.env, {TILE_EXTENT}, {TILE_BUFFER}, true) AS geom
+            FROM {table} w
+            CROSS JOIN bounds
+            CROSS JOIN mercator
+            CROSS JOIN LATERAL (
+                SELECT ST_CollectionExtract({_geometry_sql(z)}, dim) AS geom
+                FROM (VALUES (1), (2), (3)) AS dims(dim)
+            ) part
+            WHERE w.status = ANY(%s)
+              AND w.geometry && ST_Transform(bounds.env, 4326)
+              AND NOT ST_IsEmpty(part.geom)
+        )
+        SELECT {layers_sql}
+    """
+    params = [z, x, y, statuses]
+    for status in statuses:
+        params.extend([STATUS_LAYERS[status], status])
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        tile = cursor.fetchone()[0]
+    return bytes(tile or b"")
+
+
+# --- clusters ---------------------------------------------------------------
+
+#: Clusters per tile side: a tile is cut into CLUSTER_GRID × CLUSTER_GRID cells.
+CLUSTER_GRID = 8
+_WEB_MERCATOR_WIDTH = 2 * 20037508.342789244
+
+
+def render_cluster_tile(z: int, x: int, y: int, statuses=PUBLIC_STATUSES) -> dict:
+    """GeoJSON ``FeatureCollection`` of the work clusters in tile ``z/x/y``.
+
+    Each work is placed at its stored bounding-box centre (``bbox_center``,
+    computed from the geometry for rows not yet backfilled), which falls into
+    one cell of a Web-Mercator grid of ``CLUSTER_GRID`` cells per tile side.
+    Cells are numbered with ``floor`` from the top-left corner of the world,
+    so every cell lies in exactly one tile, and a work belongs to the tile of
+    its cell: centres on a tile edge go to the tile to their right or below,
+    and no cluster is split between or repeated in neighbouring tiles. One
+    Point feature per occupied cell carries the number of works, the newest
+    work as representative (``work_id``/``title``) and the combined extent of
+    the members as ``bbox`` (west, south, east, north).
+    """
+    from works.models import Work
+
+    table = connection.ops.quote_name(Work._meta.db_table)
+    statuses = [s for s in STATUS_LAYERS if s in statuses]
+    cell_size = _WEB_MERCATOR_WIDTH / (1 << z) / CLUSTER_GRID
+    half_width = _WEB_MERCATOR_WIDTH / 2
+    newest_first = 'ORDER BY "creationDate" DESC, id DESC'
+    sql = f"""
+        WITH bounds AS (
+            SELECT ST_TileEnvelope(%s, %s, %s) AS env
+        ),
+        candidates AS (
+            SELECT w.id, w.title, w."creationDate",
+                   COALESCE(w.bbox, ST_Envelope(w.geometry)) AS extent,
+                   COALESCE(w.bbox_center, ST_Centroid(ST_Envelope(w.geometry))) AS center
+            FROM {table} w
+            CROSS JOIN bounds
+            WHERE w.status = ANY(%s)
+              AND w.geometry && ST_Transform(bounds.env, 4326)
+        ),
+        projected AS (
+            SELECT c.*, ST_Transform(c.center, 3857) AS point
+            FROM candidates c
+            WHERE ST_Y(c.center) BETWEEN -{_WEB_MERCATOR_MAX_LAT} AND {_WEB_MERCATOR_MAX_LAT}
+        ),
+        cells AS (
+            SELECT p.*,
+                   floor((ST_X(p.point) + {half_width}) / %s)::bigint AS cell_col,
+                   floor(({half_width} - ST_Y(p.point)) / %s)::bigint AS cell_row
+            FROM projected p
+        )
+        SELECT count(*),
+               ST_X(ST_Centroid(ST_Collect(center))), ST_Y(ST_Centroid(ST_Collect(center))),
+               (array_agg(id {newest_first}))[1], (array_agg(title {newest_first}))[1],
+               ST_XMin(ST_Extent(extent)), ST_YMin(ST_Extent(extent)),
+               ST_XMax(ST_Extent(extent)), ST_YMax(ST_Extent(extent))
+        FROM cells
+        WHERE cell_col / {CLUSTER_GRID} = %s AND cell_row / {CLUSTER_GRID} = %s
+        GROUP BY cell_col, cell_row
+        ORDER BY count(*) DESC
+    """
+    features = []
+    if statuses:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [z, x, y, statuses, cell_size, cell_size, x, y])
+            rows = cursor.fetchall()
+        for count, lon, lat, work_id, title, west, south, east, north in rows:
+            features.append(
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [round(lon, 5), round(lat, 5)]},
+                    "properties": {
+                        "count": count,
+                        "work_id": work_id,
+                        "title": title,
+                        "bbox": [round(v, 5) for v in (west, south, east, north)],
+                    },
+                }
+            )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _generation() -> int:
+    generation = cache.get(_GENERATION_KEY)
+    if generation is None:
+        generation = 1
+        cache.add(_GENERATION_KEY, generation, timeout=None)
+    return generation
+
+
+def invalidate_work_tiles() -> None:
+    """Retire every cached tile by bumping the cache generation.
+
+    Called from the ``Work`` save/delete signals and after bulk status updates.
+    Old entries are never read again and expire after
+    ``WORKS_TILE_CACHE_SECONDS``.
+    """
+    try:
+        cache.incr(_GENERATION_KEY)
+    except ValueError:
+        cache.set(_GENERATION_KEY, 2, timeout=None)
+
+
+def _cached(kind, render, z, x, y, statuses):
+    audience = "".join(sorted(statuses))
+    key = f"work_tiles:{_generation()}:{kind}:{audience}:{z}/{x}/{y}"
+    tile = cache.get(key)
+    if tile is None:
+        tile = render(z, x, y, statuses)
+        cache.set(key, tile, settings.WORKS_TILE_CACHE_SECONDS)
+    return tile
+
+
+def get_work_tile(z: int, x: int, y: int, statuses=PUBLIC_STATUSES) -> bytes:
+    """Tile ``z/x/y`` for ``statuses`` from the cache, rendering it on a miss."""
+    return _cached("mvt", render_work_tile, z, x, y, statuses)
+
+
+def get_cluster_tile(z: int, x: int, y: int, statuses=PUBLIC_STATUSES) -> dict:
+    """Clusters of tile ``z/x/y`` for ``statuses`` from the cache, computing them on a miss."""
+    return _cached("clusters", render_cluster_tile, z, x, y, statuses)
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Propagate changed works to everything derived from them.
+
+Several artifacts are built from the works and must follow every change: the
+``WorkFacet`` index and, through it, the cache tags of feeds, facet maps and
+downloads (:mod:`works.services.facets`, :mod:`works.services.cache_tags`), the
+works API validators (the ``WORK_RECORDS`` tag), the cached map tiles and
+popups, the prebuilt map snapshot and the pre-rendered feeds.
+:func:`on_works_changed` is the one place that knows this list. It runs from
+the ``Work`` save/delete signals and after every bulk status update
+(``QuerySet.update()`` sends no signals): the admin (un)publish actions and
+the collection publish endpoint.
+"""
+
+from __future__ import annotations
+
+
+def on_works_changed(work_ids, *, public=True, map_changed=True) -> None:
+    """Refresh or retire the artifacts derived from the works ``work_ids``.
+
+    ``public`` is false for changes that never touched a published work (a
+    draft edited in the admin); the public map snapshot and the feeds are then
+    left alone. ``map_changed`` additionally limits the snapshot rebuild to
+    changes of what the public map shows.
+    """
+    from works.services.cache_tags import WORK_RECORDS, bump_tags
+    from works.services.facets import refresh_facets
+    from works.services.feed_prerender import schedule_feed_prerender
+    from works.services.map_snapshot import schedule_map_snapshot
+    from works.services.popups import invalidate_work_popups
+    from works.services.tiles import invalidate_work_tiles
+
+    work_ids = list(work_ids)
+    refresh_facets(work_ids)
+    bump_tags([WORK_RECORDS])
+    invalidate_work_tiles()
+    invalidate_work_popups(work_ids)
+    if public:
+        if map_changed:
+            schedule_map_snapshot()
+        schedule_feed_prerender()
@@ -145,24 +145,35 @@ def update_work_placename(sender, instance, **kwargs):
     instance.provenance = provenance
 
 
+# Columns of the public map snapshot besides the geometry (WorkMinimalSerializer).
+_MAP_FIELDS = ("status", "title", "doi")
+
+
 @receiver(pre_save, sender=_Work)
 def track_work_geometry_change(sender, instance, **kwargs):
-    """Flag whether the geometry changed, for ``assign_work_countries`` (#261).
+    """Flag whether the geometry changed and remember the stored map columns.
 
     A curator's manual country decision is only valid for the geometry it was
     made against; when the geometry changes the decision is void and the work
-    re-enters automated matching. New works (no PK) count as changed.
+    re-enters automated matching (``assign_work_countries``, #261). The stored
+    status, title and DOI tell :func:`propagate_work_save` whether a published
+    work changed and whether the public map shows something new. New works (no
+    PK) count as changed and have nothing stored.
     """
     if not instance.pk:
         instance._geometry_changed = True
+        instance._stored_map_fields = None
         return
     update_fields = kwargs.get("update_fields")
-    if update_fields is not None and "geometry" not in update_fields:
-        # A targeted save that doesn't touch geometry can't void a country
-        # decision — skip the extra SELECT + WKB parse.
+    if update_fields is not None and not {"geometry", *_MAP_FIELDS} & set(update_fields):
+        # A targeted save that touches none of them can't void a country
+        # decision or change the map — skip the extra SELECT + WKB parse.
         instance._geometry_changed = False
+        instance._stored_map_fields = tuple(getattr(instance, name) for name in _MAP_FIELDS)
         return
-    old = sender.objects.filter(pk=instance.pk).values_list("geometry", flat=True).first()
+    stored = sender.objects.filter(pk=instance.pk).values_list("geometry", *_MAP_FIELDS).first()
+    old = stored[0] if stored else None
+    instance._stored_map_fields = stored[1:] if stored else None
     new = instance.geometry
     instance._geometry_changed = (old is None) != (new is None) or (
         old is not None and new is not None and not old.equals(new)
@@ -258,3 +269,156 @@ def assign_work_regions(sender, instance, **kwargs):
             invalidate_region_page_cache(region)
     except Exception as err:  # pragma: no cover — non-critical path
         logger.warning("region assignment failed for work %s: %s", instance.pk, err)
+
+
+# --- Facet index (WorkFacet) behind /browse, /during, /on and place pages ----
+from django.db.models.signals import m2m_changed, post_delete
+
+
+@receiver(post_save, sender=_Work)
+def propagate_work_save(sender, instance, raw=False, **kwargs):
+    """Bring everything derived from a saved work in step (see ``works.services.work_changes``).
+
+    That includes the ``WorkFacet`` rows (status, topics, data years, source).
+    Country/region membership is set after the work is saved (by
+    :func:`assign_work_countries` / :func:`assign_work_regions`, the sweeps or
+    curation), so those changes arrive through :func:`refresh_work_facets_on_m2m`.
+    """
+    if raw:
+        return
+    from works.services.work_changes import on_works_changed
+
+    stored = getattr(instance, "_stored_map_fields", None)
+    public = instance.status == "p" or (stored is not None and stored[0] == "p")
+    # Rebuild the public map snapshot when a work enters or leaves it or a
+    # published work's geometry, title or DOI changes — not for other edits.
+    map_changed = getattr(instance, "_geometry_changed", True) or stored != tuple(
+        getattr(instance, name) for name in _MAP_FIELDS
+    )
+    on_works_changed([instance.pk], public=public, map_changed=map_changed)
+
+
+@receiver(post_delete, sender=_Work)
+def propagate_work_delete(sender, instance, **kwargs):
+    """Retire everything derived from a deleted work (see ``works.services.work_changes``)."""
+    from works.services.work_changes import on_works_changed
+
+    on_works_changed([instance.pk], public=instance.status == "p")
+
+
+@receiver(m2m_changed, sender=_Work.countries.through)
+@receiver(m2m_changed, sender=_Work.regions.through)
+def refresh_work_facets_on_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """Refresh the country/region facets when ``Work.countries``/``Work.regions`` change.
+
+    The works API lists both, so its validators move as well.
+    """
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    from works.services.cache_tags import WORK_RECORDS, bump_tags
+    from works.services.facets import refresh_facets
+
+    bump_tags([WORK_RECORDS])
+
+    if not reverse:
+        refresh_facets([instance.pk])
+    elif pk_set:
+        # country.works.add(...) and friends: pk_set holds the affected works.
+        refresh_facets(pk_set)
+
+
+# --- Cached map popups (/api/v1/works/<id>/popup/) --------------------------
+from works.models import Source as _Source
+
+
+@receiver(post_save, sender=_Source)
+def invalidate_source_popups_on_save(sender, instance, created=False, raw=False, **kwargs):
+    """Drop the cached popups of a saved source's works, which embed its name and links."""
+    if raw or created:
+        return
+    from works.services.popups import invalidate_source_popups
+
+    invalidate_source_popups(instance.pk)
+
+
+# --- Cache tags of feeds, facet maps, downloads and region pages ------------
+# Saves and country/region changes bump their tags through refresh_facets()
+# above; these cover what the facet index does not see.
+from works.models import Collection as _Collection
+
+
+@receiver(pre_delete, sender=_Work)
+def bump_cache_tags_on_work_delete(sender, instance, **kwargs):
+    """Retire the artifacts listing a published work before its facet rows cascade away."""
+    if instance.status != "p":
+        return
+    from works.services.cache_tags import bump_work_tags
+    from works.services.facets import stored_facet_keys
+
+    bump_work_tags([instance.pk], stored_facet_keys([instance.pk]))
+
+
+@receiver(m2m_changed, sender=_Work.collections.through)
+def bump_cache_tags_on_collection_membership(sender, instance, action, reverse, pk_set, **kwargs):
+    """A work joined or left collections: retire those collections' feeds and downloads.
+
+    The works API lists each work's collections, so its validators move as well.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    from works.services.cache_tags import COLLECTION, WORK_RECORDS, bump_tags, tag
+
+    if reverse:
+        bump_tags([tag(COLLECTION, instance.pk), WORK_RECORDS])
+    else:
+        # pre_clear has no pk_set; the collections are still linked at that point.
+        ids = pk_set if action != "pre_clear" else instance.collections.values_list("pk", flat=True)
+        bump_tags([*(tag(COLLECTION, pk) for pk in ids), WORK_RECORDS])
+
+
+@receiver(post_save, sender=_Collection)
+@receiver(post_delete, sender=_Collection)
+def bump_cache_tags_on_collection_change(sender, instance, raw=False, **kwargs):
+    """Feeds, downloads and the works API embed the collection's name and description."""
+    if raw:
+        return
+    from works.services.cache_tags import COLLECTION, WORK_RECORDS, bump_tags, tag
+
+    bump_tags([tag(COLLECTION, instance.pk), WORK_RECORDS])
+
+
+@receiver(post_save, sender=_Source)
+def bump_cache_tags_on_source_save(sender, instance, created=False, raw=False, **kwargs):
+    """Source feeds, the source page and the works API embed its name and links."""
+    if raw or created:
+        return
+    from works.services.cache_tags import WORK_RECORDS, bump_tags, tag
+    from works.services.facets import SOURCE
+
+    bump_tags([tag(SOURCE, instance.pk), WORK_RECORDS])
+
+
+# --- Subdivided outline tables for the country/region joins -----------------
+from works.models import Country as _Country
+from works.models import GlobalRegion as _GlobalRegion
+
+
+@receiver(post_save, sender=_Country)
+def refresh_country_subdivisions_on_save(sender, instance, **kwargs):
+    """Keep ``CountrySubdivided`` in step with an edited or newly created outline.
+
+    ``lookup_countries`` only reads the subdivided pieces, so a country saved
+    from the admin, a fixture or a test must be re-cut immediately. Bulk loads
+    additionally rebuild everything at the end of ``load_countries``.
+    """
+    from works.services.countries import refresh_country_subdivisions
+
+    refresh_country_subdivisions([instance.pk])
+
+
+@receiver(post_save, sender=_GlobalRegion)
+def refresh_region_subdivisions_on_save(sender, instance, **kwargs):
+    """Keep ``GlobalRegionSubdivided`` in step with a saved region outline."""
+    from works.services.regions import refresh_region_subdivisions
+
+    refresh_region_subdivisions([instance.pk])
@@ -42,6 +42,9 @@ wget -q https://unpkg.com/leaflet.fullscreen@3.0.2/Control.FullScreen.js -O js/l
 echo "  - Leaflet Control Geocoder 2.4.0"
 wget -q https://unpkg.com/leaflet-control-geocoder@2.4.0/dist/Control.Geocoder.js -O js/leaflet.control.geocoder.js
 
+echo "  - Leaflet.VectorGrid 1.3.0"
+wget -q https://unpkg.com/leaflet.vectorgrid@1.3.0/dist/Leaflet.VectorGrid.bundled.js -O js/leaflet.vectorgrid.bundled.js
+
 # Bootstrap Datepicker
 echo "  - Bootstrap Datepicker 1.9.0"
 wget -q https://cdnjs.cloudflare.com/ajax/libs/bootstrap-datepicker/1.9.0/js/bootstrap-datepicker.min.js -O js/bootstrap-datepicker.min.js
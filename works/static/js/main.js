@@ -43,11 +43,25 @@ async function initMap() {
   window.publicationStyle = publicationStyle;
   window.publicationPopup = publicationPopup;
 
+  // -------------------------------------------------------------------------
+  // Vector tiles: only what is in view, rendered server-side per zoom level
+  // -------------------------------------------------------------------------
+  if (window.OPTIMAP_SETTINGS?.mapVectorTiles && L.vectorGrid) {
+    const tilesLayer = createWorkTilesLayer();
+    tilesLayer.addTo(map);
+    layerControl.addOverlay(tilesLayer, 'Works');
+    window.mapWorkTilesLayer = tilesLayer;
+    initAuxiliaryLayers(map, layerControl);
+    return;
+  }
+
   // -------------------------------------------------------------------------
   // Chunked loading
   // -------------------------------------------------------------------------
   const CHUNK_SIZE = window.OPTIMAP_SETTINGS?.mapChunkSize ?? 1000;
-  const MAP_API_BASE = '/api/v1/works/?minimal=true';
+  // simplify=high: stored topology-preserving simplification (~15 m tolerance),
+  // visually identical up to street-level zoom but far smaller for detailed polygons.
+  const MAP_API_BASE = '/api/v1/works/?minimal=true&simplify=high';
 
   // Pre-fetch statistics: used for (a) the loading-indicator denominator and
   // (b) layer-control labels.  `total_works_for_user` is auth-aware.
@@ -83,45 +97,62 @@ async function initMap() {
   let pubsLayer    = null;
   let pubsGroup    = null;
   let searchManager = null;
-  let offset = 0;
-  let serverTotal = Infinity;
+  let loaded = 0;
+  let fitted = false;
+  // Keyset pagination: each chunk starts where the previous one ended, so deep
+  // chunks cost the server the same as the first. Follow `next` until null.
+  const apiUrl = `${MAP_API_BASE}&pagination=cursor&limit=${CHUNK_SIZE}`;
+  // Non-staff visitors first try the prebuilt snapshot of all published works:
+  // one static, precompressed file whose name changes with its content, so
+  // browsers and the web server cache it indefinitely. It is a single "chunk".
+  const snapshotUrl = window.OPTIMAP_SETTINGS?.mapSnapshotUrl;
+  let url = snapshotUrl || apiUrl;
 
-  while (offset < serverTotal) {
-    const url = `${MAP_API_BASE}&limit=${CHUNK_SIZE}&offset=${offset}`;
+  while (url) {
     let body;
     try {
       const resp = await fetch(url);
+      if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
       body = await resp.json();
     } catch (err) {
+      if (url === snapshotUrl && loaded === 0) {
+        console.warn('OPTIMAP: map snapshot unavailable, loading works from the API', err);
+        url = apiUrl;
+        continue;
+      }
       console.error('OPTIMAP: failed to fetch works chunk', err);
       break;
     }
 
-    serverTotal = body.count ?? 0;
-    // GeoFeatureModelSerializer wraps results as a FeatureCollection object.
-    // LimitOffsetPagination puts it under `results`; extract the features array.
-    const rawResults = body.results;
-    const featureCollection = (rawResults && typeof rawResults === 'object' && !Array.isArray(rawResults))
-      ? rawResults
-      : { type: 'FeatureCollection', features: Array.isArray(rawResults) ? rawResults : [] };
+    let featureCollection;
+    if (url === snapshotUrl) {
+      featureCollection = body;
+      url = null;
+    } else {
+      url = body.next;
+      // GeoFeatureModelSerializer wraps results as a FeatureCollection object.
+      // LimitOffsetPagination puts it under `results`; extract the features array.
+      const rawResults = body.results;
+      featureCollection = (rawResults && typeof rawResults === 'object' && !Array.isArray(rawResults))
+        ? rawResults
+        : { type: 'FeatureCollection', features: Array.isArray(rawResults) ? rawResults : [] };
+    }
     const features = featureCollection.features ?? [];
     if (!features.length) break;
 
-    offset += features.length;
+    loaded += features.length;
 
-    // Update loading indicator: use serverTotal (from body.count) as the true denominator;
-    // fall back to the pre-fetched estimate only before the first response arrives.
+    // Cursor pages carry no count; the pre-fetched statistics total is the denominator.
     if (loadingEl) {
       loadingEl.style.display = 'block';
-      const shown = serverTotal !== Infinity ? serverTotal : (totalForUser ?? '?');
-      loadingEl.textContent = `Loading works… ${offset} / ${shown}`;
+      loadingEl.textContent = `Loading works… ${loaded} / ${totalForUser ?? '?'}`;
     }
 
     if (statusLayers === null) {
       // First chunk: initialise all managers.
       // Pass the full FeatureCollection so L.geoJSON and MapSearchManager
       // can each normalise it as they see fit.
-      console.log(`OPTIMAP: loading ${serverTotal} works in chunks of ${CHUNK_SIZE}`);
+      console.log(`OPTIMAP: loading works in chunks of ${CHUNK_SIZE}`);
       statusLayers = new MapStatusLayersManager(map, layerControl, featureCollection, {
         publishedLabel,
         unpublishedLabel,
@@ -149,44 +180,29 @@ async function initMap() {
         console.log('Map search enabled');
       }
 
-      // Initialize gazetteer (location search)
-      if (typeof MapGazetteerManager !== 'undefined' && window.OPTIMAP_SETTINGS?.gazetteer) {
-        const gazetteerManager = new MapGazetteerManager(map, window.OPTIMAP_SETTINGS.gazetteer);
-        window.mapGazetteerManager = gazetteerManager;
-        console.log('Gazetteer enabled');
-      }
-
       // Initialize zoom to all features control
       if (typeof MapZoomToAllControl !== 'undefined') {
         window.mapZoomToAllControl = new MapZoomToAllControl(map, pubsGroup);
         console.log('Zoom to all features control enabled');
       }
 
-      // Initialize global regions layer
-      if (typeof MapGlobalRegionsManager !== 'undefined') {
-        window.mapGlobalRegionsManager = new MapGlobalRegionsManager(map, layerControl);
-        console.log('Global regions layer initialized');
-      }
-
-      // Initialize countries layer
-      if (typeof MapCountriesManager !== 'undefined') {
-        window.mapCountriesManager = new MapCountriesManager(map, layerControl);
-        console.log('Countries layer initialized');
-      }
-
-      // Fit to first chunk immediately so the user sees content fast.
-      if (pubsGroup.getBounds().isValid()) {
-        map.fitBounds(pubsGroup.getBounds());
-      }
+      initAuxiliaryLayers(map, layerControl);
     } else {
       // Subsequent chunks: add to existing layers.
       statusLayers.addFeatures(features);
       searchManager?.addPublications(features);
     }
+
+    // Fit to the first chunk with any geometry so the user sees content fast
+    // (chunks come newest first, so early ones may be geometry-less harvests).
+    if (!fitted && pubsGroup.getBounds().isValid()) {
+      map.fitBounds(pubsGroup.getBounds());
+      fitted = true;
+    }
   }
 
   if (loadingEl) loadingEl.style.display = 'none';
-  console.log(`OPTIMAP: finished loading ${offset} works.`);
+  console.log(`OPTIMAP: finished loading ${loaded} works.`);
 
   // Update layer-control labels with counts from the actually loaded layers,
   // correcting any drift from the cached statistics used to pre-label them.
@@ -200,4 +216,69 @@ async function initMap() {
   }
 }
 
+// Gazetteer, global regions and countries: independent of how works are loaded.
+function initAuxiliaryLayers(map, layerControl) {
+  // Initialize gazetteer (location search)
+  if (typeof MapGazetteerManager !== 'undefined' && window.OPTIMAP_SETTINGS?.gazetteer) {
+    const gazetteerManager = new MapGazetteerManager(map, window.OPTIMAP_SETTINGS.gazetteer);
+    window.mapGazetteerManager = gazetteerManager;
+    console.log('Gazetteer enabled');
+  }
+
+  // Initialize global regions layer
+  if (typeof MapGlobalRegionsManager !== 'undefined') {
+    window.mapGlobalRegionsManager = new MapGlobalRegionsManager(map, layerControl);
+    console.log('Global regions layer initialized');
+  }
+
+  // Initialize countries layer
+  if (typeof MapCountriesManager !== 'undefined') {
+    window.mapCountriesManager = new MapCountriesManager(map, layerControl);
+    console.log('Countries layer initialized');
+  }
+}
+
+// Leaflet.VectorGrid layer over /api/v1/tiles/works/{z}/{x}/{y}.mvt. Each tile
+// has one layer per status; anonymous users only receive `published`. Popups
+// show the minimal properties carried in the tile and fetch the full details
+// lazily, as for the chunk-loaded GeoJSON layers.
+function createWorkTilesLayer() {
+  const published = OPTIMAP_MAP_STYLES.default;
+  const unpublished = Object.assign({}, published, { opacity: 0.5, fillOpacity: 0.1, dashArray: '4, 4' });
+  const pointStyle = (style) => Object.assign({ radius: 6, fill: true }, style);
+  const styleFor = (style) => (properties, zoom, geometryDimension) =>
+    geometryDimension === 1 ? pointStyle(style) : style;
+
+  const layer = L.vectorGrid.protobuf('/api/v1/tiles/works/{z}/{x}/{y}.mvt', {
+    rendererFactory: L.canvas.tile,
+    interactive: true,
+    maxNativeZoom: 22,
+    getFeatureId: (feature) => feature.properties.id,
+    vectorTileLayerStyles: {
+      published: styleFor(published),
+      draft: styleFor(unpublished),
+      testing: styleFor(unpublished),
+      withdrawn: styleFor(unpublished),
+      harvested: styleFor(unpublished),
+      contributed: styleFor(unpublished),
+    },
+  });
+
+  layer.on('click', async (e) => {
+    const props = e.layer.properties || {};
+    const featureId = props.id;
+    const popup = L.popup({ maxWidth: 300, maxHeight: 250 })
+      .setLatLng(e.latlng)
+      .setContent(_renderMinimalPopup(props, featureId))
+      .openOn(layer._map);
+    try {
+      const details = await window.fetchWorkDetails(featureId);
+      popup.setContent(_renderFullPopup(details, featureId));
+    } catch (_) {
+      // Leave "Loading details…" — don't crash.
+    }
+  });
+  return layer;
+}
+
 // Note: publicationPopup and publicationStyle functions are imported from map-popup.js
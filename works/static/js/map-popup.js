@@ -27,6 +27,7 @@ const _TMPL = {
     '<div><a href="{url}" target="_blank"><i class="fas fa-external-link-alt"></i> Visit source website</a></div>',
   sourceIssn:
     '<div><strong>ISSN-L:</strong> <a href="https://openalex.org/sources/issn:{issn}" target="_blank"><i class="fas fa-external-link-alt"></i> {issn}</a></div>',
+  publicationDate: '<div><strong>Published:</strong> {date}</div>',
   sourceAccess:  '<div><strong>Access:</strong> {access}</div>',
   sourceCited:   '<div>Cited by {count} works</div>',
   sourceWorks:   '<div>{count} works hosted</div>',
@@ -64,17 +65,18 @@ function publicationStatusBadgeHTML(status, statusDisplay) {
 window.workDetailsCache = {};
 
 /**
- * Fetch full work details from the API and cache them.
+ * Fetch the popup fields of a work from the API and cache them.
  * Returns the cached value if already fetched.
+ * Uses /api/v1/works/<id>/popup/, a flat, server-side cached subset of the
+ * work detail (no geometry, countries or BoK concepts).
  * @param {string|number} featureId
  * @returns {Promise<Object>} Resolved properties object.
  */
 window.fetchWorkDetails = async function(featureId) {
   if (window.workDetailsCache[featureId]) return window.workDetailsCache[featureId];
-  const resp = await fetch(`/api/v1/works/${featureId}/?format=json`);
-  const data = await resp.json();
-  // GeoFeatureModelSerializer places non-geometry fields under `properties`.
-  window.workDetailsCache[featureId] = data.properties ?? data;
+  const resp = await fetch(`/api/v1/works/${featureId}/popup/?format=json`);
+  if (!resp.ok) throw new Error(`popup ${featureId}: HTTP ${resp.status}`);
+  window.workDetailsCache[featureId] = await resp.json();
   return window.workDetailsCache[featureId];
 };
 
@@ -114,13 +116,21 @@ function _renderTimeperiods(starts, ends, workPath) {
 /**
  * Render the rich detail section of a popup (source, abstract, dates, links).
  * Exported on window so map-interaction.js can reuse it for the paginated popup.
- * @param {Object} p - Work properties object (from the full serializer).
+ * @param {Object} p - Work properties object (from the popup endpoint).
  * @param {string|number} featureId
  * @returns {string} HTML string.
  */
 window.renderPublicationContent = function(p, featureId) {
   let html = '';
 
+  if (Array.isArray(p.authors) && p.authors.length) {
+    const shown = p.authors.slice(0, 3).join('; ');
+    html += `<div><strong>Authors:</strong> ${shown}${p.authors.length > 3 ? ' et al.' : ''}</div>`;
+  }
+  if (p.publicationDate) {
+    html += L.Util.template(_TMPL.publicationDate, { date: p.publicationDate });
+  }
+
   // Source details
   if (p.source_details) {
     const s = p.source_details;
@@ -16,7 +16,6 @@ GeoPackage cache regeneration, schedule helpers) still live here.
 import calendar
 import glob
 import gzip
-import json
 import logging
 import os
 import tempfile
@@ -138,8 +137,8 @@ from works.harvesting.sessions import (  # noqa: F401
 )
 from works.models import EmailLog, Subscription, Work
 from works.utils.email import render_email
-from works.utils.geojson import _GEOJSON_METADATA
-from works.utils.geometry import annotate_rounded_geometry, round_geojson_coordinates
+from works.utils.flatgeobuf import FLATGEOBUF_TRANSLATE_OPTIONS
+from works.utils.geojson import RawJSONEncoderMixin, iter_feature_collection, work_geometry_json
 from works.utils.scheduling import log_scheduled_catchup
 
 logger = logging.getLogger(__name__)
@@ -189,7 +188,7 @@ def cleanup_old_data_dumps(directory: Path, keep: int):
 
     Each regen cycle now produces multiple files for the same timestamp
     (``optimap_data_dump_<ts>.geojson`` + ``.geojson.gz`` + ``.gpkg`` +
-    ``.csv``). Counting raw files would prune fresh formats from the current
+    ``.csv`` + ``.fgb``). Counting raw files would prune fresh formats from the current
     cycle (e.g. drop ``.csv`` because it sorts after ``.gpkg``); instead, we
     group by the ``optimap_data_dump_<ts>`` prefix and keep the newest
     ``keep`` *cycles*.
@@ -725,8 +724,8 @@ def backfill_work_countries(trigger_source="scheduled", limit=None, dry_run=Fals
     (silent on no-op runs), following the ``check_service_token_renewals``
     pattern. Returns the tally dict for callers/tests.
     """
-    from works.models import Country
-    from works.services.countries import lookup_countries
+    from works.models import Country, CountrySubdivided
+    from works.services.countries import lookup_countries, refresh_country_subdivisions
     from works.utils.provenance import set_block
 
     tally = {"processed": 0, "updated": 0, "multi_country": 0, "no_match": 0, "errors": 0}
@@ -736,6 +735,11 @@ def backfill_work_countries(trigger_source="scheduled", limit=None, dry_run=Fals
     if not Country.objects.real().exists():
         logger.warning("backfill_work_countries: Country table empty — run load_countries first; skipping.")
         return tally
+    # The join reads the subdivided pieces; cut them now if they were never built
+    # (e.g. outlines loaded by raw SQL or restored from a dump).
+    if not CountrySubdivided.objects.exists():
+        logger.info("backfill_work_countries: building CountrySubdivided from Country outlines.")
+        refresh_country_subdivisions()
 
     qs = (
         Work.objects.filter(geometry__isnull=False)
@@ -841,8 +845,8 @@ def backfill_work_regions(trigger_source="scheduled", limit=None, dry_run=False)
     Emails active staff a summary **only when something changed or errored**
     (silent on no-op runs). Returns the tally dict for callers/tests.
     """
-    from works.models import GlobalRegion
-    from works.services.regions import lookup_regions
+    from works.models import GlobalRegion, GlobalRegionSubdivided
+    from works.services.regions import lookup_regions, refresh_region_subdivisions
     from works.utils.provenance import set_block
 
     tally = {"processed": 0, "updated": 0, "multi_region": 0, "no_match": 0, "errors": 0}
@@ -850,6 +854,9 @@ def backfill_work_regions(trigger_source="scheduled", limit=None, dry_run=False)
     if not GlobalRegion.objects.exists():
         logger.warning("backfill_work_regions: GlobalRegion table empty — run load_global_regions first; skipping.")
         return tally
+    if not GlobalRegionSubdivided.objects.exists():
+        logger.info("backfill_work_regions: building GlobalRegionSubdivided from GlobalRegion outlines.")
+        refresh_region_subdivisions()
 
     from works.views_regions import NOT_MANUAL_REGION
 
@@ -1067,30 +1074,6 @@ def enrich_openaire_backfill(
 # -----------------------------------------------------------------------------
 
 
-def _unwrap_geometry_collection(geom):
-    """Unwrap a single-member GeometryCollection to its primitive type.
-
-    Django's GeometryCollectionField always emits a GEOMETRYCOLLECTION wrapper,
-    even for a single Point or Polygon.  GIS tools (QGIS, ArcGIS) cannot apply
-    default symbology to GEOMETRYCOLLECTION layers, so we strip the wrapper here
-    before writing any GeoJSON or GeoPackage export.
-    """
-    if geom is None or geom.get("type") != "GeometryCollection":
-        return geom
-    parts = [g for g in (geom.get("geometries") or []) if g is not None]
-    if not parts:
-        return None
-    if len(parts) == 1:
-        return parts[0]
-    types = {g["type"] for g in parts}
-    if len(types) == 1:
-        base = types.pop()
-        multi_map = {"Point": "MultiPoint", "LineString": "MultiLineString", "Polygon": "MultiPolygon"}
-        if base in multi_map:
-            return {"type": multi_map[base], "coordinates": [g["coordinates"] for g in parts]}
-    return geom
-
-
 _DUMP_FIELDS = [
     "title",
     "type",
@@ -1115,6 +1098,10 @@ _DUMP_FIELDS = [
 ]
 
 
+class _DumpJSONEncoder(RawJSONEncoderMixin, DjangoJSONEncoder):
+    pass
+
+
 def regenerate_geojson_cache():
     cache_dir = os.path.join(tempfile.gettempdir(), "optimap_cache")
     os.makedirs(cache_dir, exist_ok=True)
@@ -1122,39 +1109,39 @@ def regenerate_geojson_cache():
     json_filename = generate_data_dump_filename("geojson")
     json_path = os.path.join(cache_dir, json_filename)
 
-    works_qs = annotate_rounded_geometry(
-        Work.objects.filter(status="p").select_related("source").prefetch_related("collections", "countries")
+    # Geometries come from the GeoJSON text pre-rendered on save
+    # (``Work.geometry_geojson_unwrapped``) and are spliced in verbatim, so the
+    # dump does no geometry serialization; the file is written feature by
+    # feature instead of building the whole collection in memory.
+    works_qs = (
+        Work.objects.filter(status="p")
+        .select_related("source")
+        .prefetch_related("collections", "countries")
+        .order_by("id")
     )
 
     base_url = settings.BASE_URL.rstrip("/")
-    features = []
-    for w in works_qs:
-        props = {field: getattr(w, field) for field in _DUMP_FIELDS}
-        props.update(
-            {
-                "country_codes": w.country_codes,
-                "source_name": w.source.name if w.source else None,
-                "source_url": f"{base_url}/api/v1/sources/{w.source.pk}/" if w.source else None,
-                "collections": [c.identifier for c in w.collections.all()],
-            }
-        )
-        geometry = (
-            json.loads(w._rounded_geojson)
-            if w._rounded_geojson
-            else round_geojson_coordinates(json.loads(w.geometry.geojson))
-        )
-        features.append(
-            {
+
+    def features():
+        for w in works_qs.iterator(chunk_size=2000):
+            props = {field: getattr(w, field) for field in _DUMP_FIELDS}
+            props.update(
+                {
+                    "country_codes": w.country_codes,
+                    "source_name": w.source.name if w.source else None,
+                    "source_url": f"{base_url}/api/v1/sources/{w.source.pk}/" if w.source else None,
+                    "collections": [c.identifier for c in w.collections.all()],
+                }
+            )
+            yield {
                 "type": "Feature",
                 "id": w.pk,
                 "properties": props,
-                "geometry": _unwrap_geometry_collection(geometry),
+                "geometry": work_geometry_json(w, unwrapped=True),
             }
-        )
 
-    data = {"type": "FeatureCollection", **_GEOJSON_METADATA, "features": features}
-    with open(json_path, "w") as f:
-        json.dump(data, f, cls=DjangoJSONEncoder)
+    with open(json_path, "w", encoding="utf-8") as f:
+        f.writelines(iter_feature_collection(features(), cls=_DumpJSONEncoder))
 
     gzip_filename = generate_data_dump_filename("geojson.gz")
     gzip_path = os.path.join(cache_dir, gzip_filename)
@@ -1167,7 +1154,9 @@ def regenerate_geojson_cache():
     return json_path
 
 
-def convert_geojson_via_gdal(geojson_path, *, fmt, ext, layer_creation_options=None, field_type_map=None):
+def convert_geojson_via_gdal(
+    geojson_path, *, fmt, ext, layer_creation_options=None, field_type_map=None, translate_options=None
+):
     """Convert an existing GeoJSON dump to ``fmt`` via the GDAL Python bindings.
 
     Uses ``osgeo.gdal.VectorTranslate`` (the in-process equivalent of the
@@ -1181,6 +1170,8 @@ def convert_geojson_via_gdal(geojson_path, *, fmt, ext, layer_creation_options=N
     passed via ``-lco``; ``field_type_map`` is a list of ``SRC=DST`` strings
     passed via ``-mapFieldType`` (used to pin field-type conversions the driver
     would otherwise do implicitly, e.g. ``StringList=String(JSON)`` for GPKG).
+    ``translate_options`` is a complete ``ogr2ogr`` option list used instead of
+    the three above, for formats whose options are shared with another writer.
     Returns the output path or ``None`` if the conversion fails.
     """
     cache_dir = os.path.dirname(geojson_path)
@@ -1188,11 +1179,14 @@ def convert_geojson_via_gdal(geojson_path, *, fmt, ext, layer_creation_options=N
     out_path = os.path.join(cache_dir, out_filename)
     # A plain list of strings passed as ``options=`` is parsed exactly like the
     # ``ogr2ogr`` command-line arguments would be.
-    options = ["-f", fmt]
-    for opt in layer_creation_options or []:
-        options.extend(["-lco", opt])
-    for spec in field_type_map or []:
-        options.extend(["-mapFieldType", spec])
+    if translate_options is not None:
+        options = list(translate_options)
+    else:
+        options = ["-f", fmt]
+        for opt in layer_creation_options or []:
+            options.extend(["-lco", opt])
+        for spec in field_type_map or []:
+            options.extend(["-mapFieldType", spec])
     try:
         ds = gdal.VectorTranslate(out_path, geojson_path, options=options)
         if ds is None:
@@ -1232,6 +1226,18 @@ def convert_geojson_to_csv(geojson_path):
     )
 
 
+def convert_geojson_to_flatgeobuf(geojson_path):
+    # FlatGeobuf with its packed Hilbert R-tree, so clients can range-request
+    # just the features in their bounding box. Same layer name and column
+    # types as the ?format=fgb API output.
+    return convert_geojson_via_gdal(
+        geojson_path,
+        fmt="FlatGeobuf",
+        ext="fgb",
+        translate_options=FLATGEOBUF_TRANSLATE_OPTIONS,
+    )
+
+
 def regenerate_geopackage_cache():
     geojson_path = regenerate_geojson_cache()
     cache_dir = Path(geojson_path).parent
@@ -1248,9 +1254,17 @@ def regenerate_csv_cache():
     return csv_path
 
 
+def regenerate_flatgeobuf_cache():
+    geojson_path = regenerate_geojson_cache()
+    cache_dir = Path(geojson_path).parent
+    fgb_path = convert_geojson_to_flatgeobuf(geojson_path)
+    cleanup_old_data_dumps(cache_dir, settings.DATA_DUMP_RETENTION)
+    return fgb_path
+
+
 @log_scheduled_catchup
 def regenerate_all_data_dumps():
-    """Regenerate GeoJSON + GeoPackage + CSV from a single PostGIS pass.
+    """Regenerate GeoJSON + GeoPackage + CSV + FlatGeobuf from a single PostGIS pass.
 
     Used as the scheduled task (every ``DATA_DUMP_INTERVAL_HOURS`` hours) and
     by the admin "regenerate all data exports now" action. Returns a dict of
@@ -1261,20 +1275,143 @@ def regenerate_all_data_dumps():
     cache_dir = Path(geojson_path).parent
     gpkg_path = convert_geojson_to_geopackage(geojson_path)
     csv_path = convert_geojson_to_csv(geojson_path)
+    fgb_path = convert_geojson_to_flatgeobuf(geojson_path)
     cleanup_old_data_dumps(cache_dir, settings.DATA_DUMP_RETENTION)
-    return {"geojson": geojson_path, "gpkg": gpkg_path, "csv": csv_path}
+    # Catch edits of published works that no publish/harvest trigger saw, and
+    # feeds whose cached entries expired.
+    regenerate_map_snapshot()
+    prerender_feeds()
+    regenerate_sitemap_shards()
+    return {"geojson": geojson_path, "gpkg": gpkg_path, "csv": csv_path, "fgb": fgb_path}
+
+
+def regenerate_map_snapshot():
+    """Rebuild the precompressed public map snapshot (see ``works.services.map_snapshot``).
+
+    Enqueued by ``schedule_map_snapshot`` when the public map changes (see
+    ``works.services.work_changes``), and run with every scheduled data dump. Returns the snapshot path.
+    """
+    from works.services.map_snapshot import build_map_snapshot
+
+    return build_map_snapshot()
+
+
+def prerender_feeds():
+    """Render the public GeoRSS/Atom feeds into the cache (see ``works.services.feed_prerender``).
+
+    Enqueued by ``schedule_feed_prerender`` when published works change, and
+    run with every scheduled data dump. Returns the counts of rendered, already
+    current and failed feeds.
+    """
+    from works.services.feed_prerender import prerender_feeds as _prerender_feeds
+
+    return _prerender_feeds()
+
+
+def regenerate_sitemap_shards():
+    """Rebuild the gzip-compressed work sitemap shards (see ``works.services.sitemap_shards``).
+
+    Run with every scheduled data dump. Returns the paths of the current shards.
+    """
+    from works.services.sitemap_shards import build_sitemap_shards
+
+    return build_sitemap_shards()
+
+
+def warm_caches(stages=None, works=None, access_log=None):
+    """Build the cached pages, feeds and statistics ahead of visitors (see ``works.services.cache_warmup``).
+
+    Enqueued by ``manage.py warm_caches --async``, e.g. from the deploy script
+    after ``clear_caches``. Returns the time and outcome of every artifact.
+    """
+    from works.services.cache_warmup import warm_caches as _warm_caches
+
+    return _warm_caches(stages, works=works, access_log=access_log)
 
 
 def recompute_statistics_snapshot():
-    """Recompute the statistics snapshot and refresh the cache.
+    """Recount the statistics into the live counters and save a snapshot of them.
 
     Django-Q entry point for the staff-triggered "Calculate statistics now"
     button (``POST /api/v1/statistics/recompute/``). Runs off the request
     thread so the page stays responsive even as the computation grows. Returns
     the saved ``StatisticsSnapshot``.
     """
-    from works.utils.statistics import save_statistics_snapshot, update_statistics_cache
+    from works.utils.statistics import reconcile_statistics, save_statistics_snapshot
+
+    return save_statistics_snapshot(reconcile_statistics())
+
+
+@log_scheduled_catchup
+def reconcile_statistics():
+    """Recount the statistics and correct the trigger-maintained counters.
+
+    Scheduled every ``STATISTICS_RECONCILE_HOURS`` hours by
+    ``schedule_statistics_reconciliation``; also refreshes the breakdowns
+    (by continent, country, journal, …), which the triggers do not maintain.
+    """
+    from works.utils.statistics import reconcile_statistics as _reconcile_statistics
+
+    return _reconcile_statistics()
+
+
+def schedule_statistics_reconciliation():
+    if not Schedule.objects.filter(func="works.tasks.reconcile_statistics").exists():
+        schedule(
+            "works.tasks.reconcile_statistics",
+            schedule_type="I",
+            minutes=settings.STATISTICS_RECONCILE_HOURS * 60,
+            repeats=-1,
+            next_run=timezone.now(),
+            intended_date_kwarg="scheduled_for",
+        )
+        logger.info("Scheduled reconcile_statistics every %d hours.", settings.STATISTICS_RECONCILE_HOURS)
+
+
+@log_scheduled_catchup
+def calculate_source_coverage():
+    """Snapshot the coverage of every source into ``SourceCoverageSnapshot``.
+
+    Scheduled weekly by ``schedule_source_coverage``; the source landing pages,
+    the sources API and the /statistics/ page read the latest snapshots.
+    Returns the number of snapshots written.
+    """
+    from works.utils.statistics import calculate_sources_coverage
+
+    snapshots = calculate_sources_coverage()
+    logger.info("calculate_source_coverage: %d source coverage snapshot(s) written.", len(snapshots))
+    return len(snapshots)
+
 
-    snapshot = save_statistics_snapshot()
-    update_statistics_cache()
-    return snapshot
+def schedule_source_coverage():
+    if not Schedule.objects.filter(func="works.tasks.calculate_source_coverage").exists():
+        schedule(
+            "works.tasks.calculate_source_coverage",
+            schedule_type="W",
+            repeats=-1,
+            # Offset from the country (Mon 04:00) and region (Mon 05:00) sweeps.
+            next_run=_next_monday().replace(hour=6),
+            intended_date_kwarg="scheduled_for",
+        )
+        logger.info("Scheduled calculate_source_coverage weekly.")
+
+
+@log_scheduled_catchup
+def extend_year_facets():
+    """Add the new year to the year facets of works covering it (see ``works.services.facets``)."""
+    from works.services.facets import extend_year_facets as _extend_year_facets
+
+    return _extend_year_facets()
+
+
+def schedule_year_facet_extension():
+    if not Schedule.objects.filter(func="works.tasks.extend_year_facets").exists():
+        now = timezone.now()
+        schedule(
+            "works.tasks.extend_year_facets",
+            schedule_type="Y",
+            repeats=-1,
+            next_run=now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=5, second=0, microsecond=0),
+            intended_date_kwarg="scheduled_for",
+        )
+        logger.info("Scheduled extend_year_facets yearly (1 January).")
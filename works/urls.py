@@ -18,6 +18,7 @@ from works import (
     views_indexed,
     views_regions,
     views_sources,
+    views_tiles,
 )
 from works.api import router as publications_router
 from works.bok import views as bok_views
@@ -53,6 +54,9 @@ urlpatterns = [
     # API v1 Gazetteer proxy endpoints
     path("api/v1/gazetteer/<str:provider>/search/", views_gazetteer.gazetteer_search, name="gazetteer-search"),
     path("api/v1/gazetteer/<str:provider>/reverse/", views_gazetteer.gazetteer_reverse, name="gazetteer-reverse"),
+    # API v1 vector tiles of the works map
+    path("api/v1/tiles/works/<int:z>/<int:x>/<int:y>.mvt", views_tiles.work_tile, name="work-tile"),
+    path("api/v1/clusters/works/<int:z>/<int:x>/<int:y>.geojson", views_tiles.work_clusters, name="work-clusters"),
     # API v1 Body of Knowledge (EO4GEO BoK) autosuggest
     path("api/v1/bok/search/", bok_views.bok_search, name="bok-search"),
     # API v1 Feed endpoints - GeoRSS format (with .rss extension)
@@ -165,6 +169,8 @@ urlpatterns = [
     path("download/geojson/", work_views.download_geojson, name="download_geojson"),
     path("download/geopackage/", work_views.download_geopackage, name="download_geopackage"),
     path("download/csv/", work_views.download_csv, name="download_csv"),
+    path("download/flatgeobuf/", work_views.download_flatgeobuf, name="download_flatgeobuf"),
+    path("map-snapshot/<str:name>", work_views.map_snapshot, name="map_snapshot"),
     # Data downloads (per-collection — #217)
     path(
         "api/v1/collections/<slug:collection_slug>/download/geojson/",
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""FlatGeobuf encoding for the works API and the data dumps.
+
+`FlatGeobuf <https://flatgeobuf.org/>`_ stores features as binary FlatBuffers
+(typed columns instead of repeated JSON keys, coordinates as doubles instead of
+decimal text) preceded by a packed Hilbert R-tree. Clients parse it several
+times faster than GeoJSON, and a client that knows the R-tree layout can read
+the header and index and then HTTP range-request only the features inside its
+bounding box.
+
+Encoding goes through GDAL's ``FlatGeobuf`` driver, already a hard dependency
+via GeoDjango: the GeoJSON the serializers produce is converted in memory
+(``/vsimem/``), so the FlatGeobuf output carries exactly the same properties.
+"""
+
+import logging
+import uuid
+
+from osgeo import gdal
+
+logger = logging.getLogger(__name__)
+
+FLATGEOBUF_MEDIA_TYPE = "application/flatgeobuf"
+
+#: GDAL options shared by the API renderer and the data-dump conversion. The
+#: list-valued work fields (authors, keywords, topics, …) have no FlatGeobuf
+#: column type, so they are written as JSON strings.
+FLATGEOBUF_TRANSLATE_OPTIONS = [
+    "-f",
+    "FlatGeobuf",
+    "-nln",
+    "works",
+    "-lco",
+    "SPATIAL_INDEX=YES",
+    "-mapFieldType",
+    "StringList=String(JSON),IntegerList=String(JSON),RealList=String(JSON)",
+]
+
+
+def _read_vsimem(path) -> bytes:
+    stat = gdal.VSIStatL(path)
+    if stat is None:
+        return b""
+    handle = gdal.VSIFOpenL(path, "rb")
+    try:
+        return bytes(gdal.VSIFReadL(1, stat.size, handle))
+    finally:
+        gdal.VSIFCloseL(handle)
+
+
+def geojson_to_flatgeobuf(geojson_text) -> bytes:
+    """Encode a GeoJSON ``FeatureCollection`` (``str`` or ``bytes``) as FlatGeobuf.
+
+    Raises ``ValueError`` when GDAL cannot read or convert the input.
+    """
+    if isinstance(geojson_text, str):
+        geojson_text = geojson_text.encode("utf-8")
+    token = uuid.uuid4().hex
+    src = f"/vsimem/optimap_{token}.geojson"
+    dst = f"/vsimem/optimap_{token}.fgb"
+    gdal.FileFromMemBuffer(src, geojson_text)
+    try:
+        ds = gdal.VectorTranslate(dst, src, options=FLATGEOBUF_TRANSLATE_OPTIONS)
+        if ds is None:
+            raise ValueError(f"FlatGeobuf conversion failed: {gdal.GetLastErrorMsg()}")
+        # Drop the reference so GDAL writes the header, index and features.
+        ds = None
+        return _read_vsimem(dst)
+    finally:
+        gdal.Unlink(src)
+        if gdal.VSIStatL(dst) is not None:
+            gdal.Unlink(dst)
@@ -2,11 +2,25 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import json
+import re
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db.models import QuerySet
 
-from works.utils.geometry import COORDINATE_PRECISION, round_geojson_coordinates
+try:
+    import orjson
+except ImportError:  # optional speed-up; everything falls back to the json module
+    orjson = None
+
+from works.utils.geometry import (
+    COORDINATE_PRECISION,
+    annotate_rounded_geometry,
+    geometry_for_band,
+    resolve_simplify_band,
+    round_geojson_coordinates,
+    unwrap_geometry_collection,
+)
 
 # W3C SDW-BP 15: include CRS and precision metadata in every FeatureCollection.
 _GEOJSON_METADATA = {
@@ -19,11 +33,153 @@ _GEOJSON_METADATA = {
 }
 
 
-def publications_to_geojson(publications) -> str:
-    """Serialize a list (or queryset) of Work objects to a GeoJSON FeatureCollection string."""
-    features = []
+class RawJSON:
+    """Already-serialized JSON text (e.g. a pre-rendered geometry) to embed verbatim.
+
+    Place it anywhere in a structure encoded with :class:`RawJSONEncoder` (or an
+    encoder built on :class:`RawJSONEncoderMixin`) and its text is spliced into
+    the output as-is, without being parsed and re-dumped.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+
+# ``default()`` stands in a placeholder string for each RawJSON; the encoder
+# always escapes the NUL characters as ``\u0000``, and Postgres text cannot
+# contain NUL, so the escaped token cannot collide with real data.
+_RAW_PLACEHOLDER = "\x00rawjson:{}\x00"
+_RAW_PLACEHOLDER_RE = re.compile(r'"\\u0000rawjson:(\d+)\\u0000"')
+
+
+class RawJSONEncoderMixin:
+    """JSON encoder mixin that splices :class:`RawJSON` values into the output verbatim."""
+
+    def encode(self, o):
+        self._raw_json = []
+        encoded = super().encode(o)
+        if not self._raw_json:
+            return encoded
+        raw = self._raw_json
+        return _RAW_PLACEHOLDER_RE.sub(lambda m: raw[int(m.group(1))], encoded)
+
+    def default(self, o):
+        if isinstance(o, RawJSON):
+            self._raw_json.append(o.text)
+            return _RAW_PLACEHOLDER.format(len(self._raw_json) - 1)
+        return super().default(o)
+
 
-    for work in publications:
+class RawJSONEncoder(RawJSONEncoderMixin, json.JSONEncoder):
+    pass
+
+
+# orjson.Fragment (orjson >= 3.9) embeds already-serialized JSON; older releases
+# cannot splice RawJSON and are not used.
+FAST_JSON = orjson is not None and hasattr(orjson, "Fragment")
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if FAST_JSON else 0
+
+
+def encode_json(obj, *, cls=RawJSONEncoder) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON, with orjson when it is installed.
+
+    :class:`RawJSON` values are spliced in verbatim either way (as an
+    ``orjson.Fragment`` on the fast path). Everything orjson does not encode
+    natively — datetimes, ``Decimal``, lazy strings, … — is handed to
+    ``cls().default`` so the output matches the stdlib encoder ``cls``
+    (a :class:`RawJSONEncoderMixin` subclass).
+    """
+    if not FAST_JSON:
+        return json.dumps(obj, cls=cls, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    fallback = cls().default
+
+    def default(o):
+        if isinstance(o, RawJSON):
+            return orjson.Fragment(o.text)
+        return fallback(o)
+
+    return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+
+
+def iter_feature_collection(features, *, metadata=None, cls=RawJSONEncoder):
+    """Yield a GeoJSON FeatureCollection as text chunks, one feature at a time.
+
+    ``features`` may be any iterable (e.g. a generator over ``.iterator()``), so
+    the whole collection never has to be held in memory; each feature is
+    encoded with ``cls`` (a :class:`RawJSONEncoderMixin` encoder, so
+    pre-rendered geometries are spliced verbatim). ``metadata`` defaults to the
+    W3C SDW-BP 15 CRS/precision members.
+    """
+    header = {"type": "FeatureCollection", **(_GEOJSON_METADATA if metadata is None else metadata)}
+    yield json.dumps(header, cls=cls)[:-1] + ', "features": ['
+    for index, feature in enumerate(features):
+        yield (", " if index else "") + encode_json(feature, cls=cls).decode("utf-8")
+    yield "]}"
+
+
+def work_geometry_json(work, *, unwrapped=False):
+    """GeoJSON geometry of ``work`` for embedding, preferring pre-rendered text.
+
+    Returns a :class:`RawJSON` of the text stored on save
+    (``geometry_geojson``/``geometry_geojson_unwrapped``) or annotated by
+    ``annotate_rounded_geometry``, so no geometry is serialized or parsed on
+    the read path. Rows without stored text (loaded via ``.only()`` or saved
+    before the columns existed) fall back to rounding ``work.geometry`` in
+    Python. ``unwrapped=True`` gives the export form (see
+    ``works.utils.geometry.unwrap_geometry_collection``); ``None`` when there
+    is nothing to emit.
+    """
+    stored = work.__dict__.get("geometry_geojson")
+    if unwrapped:
+        if stored is not None:
+            text = work.__dict__.get("geometry_geojson_unwrapped")
+            return RawJSON(text) if text else None
+    else:
+        text = getattr(work, "_rounded_geojson", None) or stored
+        if text:
+            return RawJSON(text)
+    if work.geometry is None:
+        return None
+    geometry = round_geojson_coordinates(json.loads(work.geometry.geojson))
+    return unwrap_geometry_collection(geometry) if unwrapped else geometry
+
+
+#: Rows fetched per round trip when a queryset is streamed through a server-side cursor.
+STREAM_CHUNK_SIZE = 2000
+
+
+def iter_works(publications):
+    """Iterate ``publications``; querysets go through a server-side cursor in chunks."""
+    if isinstance(publications, QuerySet):
+        return publications.iterator(chunk_size=STREAM_CHUNK_SIZE)
+    return iter(publications)
+
+
+def streaming_geojson_response(chunks, *, filename=None):
+    """``StreamingHttpResponse`` of GeoJSON text ``chunks`` (e.g. :func:`iter_feature_collection`).
+
+    The first bytes go out as soon as the first feature is encoded, and the
+    whole document is never held in memory. Streamed responses are also
+    skipped by the site-wide cache middleware.
+    """
+    from django.http import StreamingHttpResponse
+
+    response = StreamingHttpResponse(chunks, content_type="application/geo+json")
+    if filename:
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def iter_publication_features(publications):
+    """Yield the map Feature of each work in ``publications`` that has a geometry.
+
+    ``publications`` may be a list or a queryset (read with :func:`iter_works`).
+    Geometries are spliced in from their pre-rendered text (:func:`work_geometry_json`).
+    """
+    for work in iter_works(publications):
         if not work.geometry or work.geometry.empty:
             continue
 
@@ -42,12 +198,10 @@ def publications_to_geojson(publications) -> str:
                 "works_count": work.source.works_count,
             }
 
-        features.append(
+        yield (
             {
                 "type": "Feature",
-                "geometry": json.loads(work._rounded_geojson)
-                if getattr(work, "_rounded_geojson", None)
-                else round_geojson_coordinates(json.loads(work.geometry.geojson)),
+                "geometry": work_geometry_json(work),
                 "properties": {
                     "id": work.id,
                     "title": work.title,
@@ -74,7 +228,14 @@ def publications_to_geojson(publications) -> str:
             }
         )
 
-    return json.dumps({"type": "FeatureCollection", **_GEOJSON_METADATA, "features": features})
+
+def publications_to_geojson(publications) -> str:
+    """Serialize a list (or queryset) of Work objects to a GeoJSON FeatureCollection string.
+
+    Built feature by feature (:func:`iter_publication_features`), so a queryset
+    is never materialised as a list of model instances.
+    """
+    return "".join(iter_feature_collection(iter_publication_features(publications)))
 
 
 def build_works_map_context(page_object_list, all_works, scope_key, *, all_cache_key=None, force_refresh=False):
@@ -91,12 +252,27 @@ def build_works_map_context(page_object_list, all_works, scope_key, *, all_cache
     has-features flag are cached for ``FEED_CACHE_HOURS`` (``?now`` →
     ``force_refresh=True`` bypasses, mirroring the region pages). The current
     page's GeoJSON is small and always computed fresh.
+
+    When ``all_works`` is a queryset, its geometries are serialized from the
+    ``WORKS_MAP_SIMPLIFY`` zoom band (stored, topology-preserving simplified
+    columns) instead of the full-resolution geometry — a facet map never zooms
+    in far enough to show the difference, and PostGIS then serializes a fraction
+    of the vertices of polygon-heavy facets.
     """
     cached = None if force_refresh or not all_cache_key else cache.get(all_cache_key)
     if cached is None:
-        all_list = list(all_works)
-        all_geojson = publications_to_geojson(all_list)
-        has_features = any(w.geometry is not None and not w.geometry.empty for w in all_list)
+        band = resolve_simplify_band(getattr(settings, "WORKS_MAP_SIMPLIFY", None))
+        if band is not None and isinstance(all_works, QuerySet):
+            all_works = annotate_rounded_geometry(all_works, geo_field=geometry_for_band(band))
+        has_features = False
+
+        def all_features():
+            nonlocal has_features
+            for feature in iter_publication_features(all_works):
+                has_features = True
+                yield feature
+
+        all_geojson = "".join(iter_feature_collection(all_features()))
         if all_cache_key:
             timeout = getattr(settings, "FEED_CACHE_HOURS", 24) * 3600
             cache.set(all_cache_key, (all_geojson, has_features), timeout)
@@ -1,7 +1,11 @@
 # SPDX-FileCopyrightText: 2025 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
+
 from django.contrib.gis.db.models.functions import AsGeoJSON
+from django.contrib.gis.geos import GeometryCollection, Point
+from django.db.models.functions import Coalesce
 
 # W3C SDW-BP 6: cap coordinate precision so we don't imply sub-meter accuracy
 # that the underlying metadata doesn't support.  5 decimal places ≈ 1.1 m at
@@ -123,12 +127,20 @@ def sanitize_geojson_geometry(obj):
 def annotate_rounded_geometry(
     queryset, geo_field="geometry", precision=COORDINATE_PRECISION, out_field="_rounded_geojson"
 ):
-    """Annotate *queryset* with a PostGIS-rounded GeoJSON string for *geo_field*.
+    """Annotate *queryset* with a rounded GeoJSON string for *geo_field*.
+
+    For the full-resolution ``geometry`` at the default precision, the text
+    pre-rendered on save (``Work.geometry_geojson``, see :func:`geojson_texts`)
+    is read as-is, so PostGIS does no geometry serialization at all; only rows
+    saved before that column existed fall back to ``ST_AsGeoJSON`` (Postgres'
+    ``COALESCE`` evaluates the fallback lazily).
 
-    Uses ``ST_AsGeoJSON(geom, precision)`` (via Django's ``AsGeoJSON``) so the
-    rounding happens in the database in the same pass that produces the
-    GeoJSON text, instead of Python parsing the full-precision GeoJSON and
-    recursively rounding it afterwards.
+    Any other field or precision uses ``ST_AsGeoJSON(geom, precision)`` (via
+    Django's ``AsGeoJSON``) so the rounding happens in the database in the same
+    pass that produces the GeoJSON text, instead of Python parsing the
+    full-precision GeoJSON and recursively rounding it afterwards. ``geo_field``
+    may also be an expression, e.g. :func:`geometry_for_band` to serialize a
+    simplified variant.
 
     Note: PostGIS's ``ST_AsGeoJSON`` raises ``GeoJson: geometry not supported``
     for a GeometryCollection whose sole member is itself a GeometryCollection.
@@ -136,4 +148,206 @@ def annotate_rounded_geometry(
     already wraps every geometry once; wrapping it again is redundant, not
     something real harvested/contributed data ever does).
     """
-    return queryset.annotate(**{out_field: AsGeoJSON(geo_field, precision=precision)})
+    expression = AsGeoJSON(geo_field, precision=precision)
+    if geo_field == "geometry" and precision == COORDINATE_PRECISION:
+        expression = Coalesce("geometry_geojson", expression)
+    return queryset.annotate(**{out_field: expression})
+
+
+def unwrap_geometry_collection(geom):
+    """Unwrap the GeometryCollection envelope that Django's GeometryCollectionField always emits.
+
+    Django stores every geometry as a GeometryCollection, even when a work has a
+    single Point or Polygon. GIS tools (QGIS, ArcGIS, ogr2ogr-built GeoPackages)
+    cannot apply a default symbology to GEOMETRYCOLLECTION layers, so exports
+    strip the wrapper.
+
+    Transformation rules applied to each GeoJSON geometry dict:
+    - GeometryCollection([X])           → X          (unwrap single-member)
+    - GeometryCollection([X, X, ...])   → Multi* X   (same-type members → Multi*)
+    - GeometryCollection([X, Y, ...])   → unchanged  (mixed types, rare)
+    - GeometryCollection([])            → None
+    - null / non-collection             → unchanged
+    """
+    if geom is None or geom.get("type") != "GeometryCollection":
+        return geom
+    parts = [g for g in (geom.get("geometries") or []) if g is not None]
+    if not parts:
+        return None
+    if len(parts) == 1:
+        return parts[0]
+    types = {g["type"] for g in parts}
+    if len(types) == 1:
+        base = types.pop()
+        multi_map = {"Point": "MultiPoint", "LineString": "MultiLineString", "Polygon": "MultiPolygon"}
+        if base in multi_map:
+            return {"type": multi_map[base], "coordinates": [g["coordinates"] for g in parts]}
+    return geom
+
+
+#: ``Work`` columns holding pre-rendered GeoJSON text, derived by :func:`geojson_texts`.
+GEOJSON_TEXT_FIELDS = ("geometry_geojson", "geometry_geojson_unwrapped")
+
+
+def geojson_texts(geom, precision=COORDINATE_PRECISION):
+    """Pre-rendered GeoJSON text for ``geom``, keyed by :data:`GEOJSON_TEXT_FIELDS`.
+
+    ``geometry_geojson`` is the coordinate-rounded GeometryCollection exactly as
+    the API, feeds and maps emit it; ``geometry_geojson_unwrapped`` is the same
+    geometry passed through :func:`unwrap_geometry_collection` for the data
+    dumps and collection downloads (``None`` when nothing is left to export).
+    Both are compact JSON, ready to be spliced into a response verbatim with
+    :class:`works.utils.geojson.RawJSON`. Both are ``None`` without a geometry.
+    """
+    if geom is None:
+        return dict.fromkeys(GEOJSON_TEXT_FIELDS)
+    rounded = round_geojson_coordinates(json.loads(geom.geojson), precision)
+    unwrapped = unwrap_geometry_collection(rounded)
+    return {
+        "geometry_geojson": json.dumps(rounded, separators=(",", ":")),
+        "geometry_geojson_unwrapped": json.dumps(unwrapped, separators=(",", ":")) if unwrapped else None,
+    }
+
+
+#: ``Work`` columns derived from ``Work.geometry`` by :func:`spatial_summary`.
+SPATIAL_SUMMARY_FIELDS = (
+    "bbox",
+    "bbox_center",
+    "extreme_north",
+    "extreme_south",
+    "extreme_east",
+    "extreme_west",
+)
+
+
+def _iter_vertices(geom):
+    """Yield every ``(x, y)`` vertex of a GEOS geometry, descending into collections and polygon rings."""
+    geom_type = geom.geom_type
+    if geom_type == "Point":
+        yield geom.coords[:2]
+    elif geom_type in ("LineString", "LinearRing"):
+        for coord in geom.coords:
+            yield coord[:2]
+    else:  # Polygon (iterates rings) and all collection types (iterate members)
+        for part in geom:
+            yield from _iter_vertices(part)
+
+
+def spatial_summary(geom):
+    """Bounding box, bbox centre and the four extreme vertices of ``geom``.
+
+    Returns a dict keyed by :data:`SPATIAL_SUMMARY_FIELDS`; every value is
+    ``None`` for an absent or empty geometry. Computed with GEOS in-process so
+    it can run on save without a database round trip. Semantics match the
+    PostGIS queries it replaces: ``bbox`` is ``ST_Envelope`` (a Point for a
+    single-point geometry), ``bbox_center`` is ``ST_Centroid(ST_Envelope(...))``,
+    and each extreme is a vertex with the highest/lowest latitude/longitude
+    (the first one wins on ties, as ``ORDER BY … LIMIT 1`` would pick any).
+    """
+    if geom is None or geom.empty:
+        return dict.fromkeys(SPATIAL_SUMMARY_FIELDS)
+    srid = geom.srid or 4326
+    vertices = list(_iter_vertices(geom))
+    envelope = geom.envelope
+    envelope.srid = srid
+    center = envelope.centroid
+    center.srid = srid
+
+    def _point(coord):
+        return Point(coord[0], coord[1], srid=srid)
+
+    return {
+        "bbox": envelope,
+        "bbox_center": center,
+        "extreme_north": _point(max(vertices, key=lambda c: c[1])),
+        "extreme_south": _point(min(vertices, key=lambda c: c[1])),
+        "extreme_east": _point(max(vertices, key=lambda c: c[0])),
+        "extreme_west": _point(min(vertices, key=lambda c: c[0])),
+    }
+
+
+#: Zoom bands of the stored simplified geometries, coarsest first:
+#: ``(band, highest web-map zoom it is meant for, tolerance in degrees)``. Each
+#: tolerance is about half a screen pixel at the band's highest zoom
+#: (360° / (256 px · 2^zoom) / 2), so the simplification stays invisible on the
+#: map while dropping most vertices of detailed polygons at low zoom.
+SIMPLIFIED_GEOMETRY_BANDS = (
+    ("low", 4, 0.04),
+    ("medium", 8, 0.0025),
+    ("high", 12, 0.00015),
+)
+
+#: ``Work`` columns holding the simplified variants, in band order.
+SIMPLIFIED_GEOMETRY_FIELDS = tuple(f"geometry_{band}" for band, _zoom, _tolerance in SIMPLIFIED_GEOMETRY_BANDS)
+
+#: Accepted ``?simplify=`` values that select the full-resolution geometry.
+FULL_RESOLUTION_VALUES = ("none", "full")
+
+
+def simplified_geometries(geom):
+    """Topology-preserving simplified variants of ``geom`` per zoom band.
+
+    Returns a dict keyed by :data:`SIMPLIFIED_GEOMETRY_FIELDS`. Each value is a
+    ``GeometryCollection`` simplified with GEOS' ``TopologyPreservingSimplifier``
+    (``ST_SimplifyPreserveTopology``), so polygon rings never collapse or
+    self-intersect. A value is ``None`` when simplification would not drop a
+    single vertex (points, short lines, already coarse polygons) — readers then
+    fall back to ``geometry`` via :func:`geometry_for_band` — which keeps the
+    columns empty for the bulk of point-only works.
+    """
+    result = dict.fromkeys(SIMPLIFIED_GEOMETRY_FIELDS)
+    if geom is None or geom.empty:
+        return result
+    srid = geom.srid or 4326
+    n_coords = geom.num_coords
+    for field, (_band, _zoom, tolerance) in zip(SIMPLIFIED_GEOMETRY_FIELDS, SIMPLIFIED_GEOMETRY_BANDS):
+        simplified = geom.simplify(tolerance, preserve_topology=True)
+        if simplified.num_coords >= n_coords:
+            # Bands run coarse → fine: if the coarsest tolerance keeps every
+            # vertex, no finer one will drop any either.
+            break
+        if simplified.geom_type != "GeometryCollection":
+            simplified = GeometryCollection(simplified)
+        simplified.srid = srid
+        result[field] = simplified
+    return result
+
+
+def resolve_simplify_band(simplify=None, zoom=None):
+    """Map a ``?simplify=`` band name or a ``?zoom=`` level to a band name.
+
+    ``simplify`` wins over ``zoom``. Returns ``None`` for the full-resolution
+    geometry (no parameter, ``simplify=none``/``full``, or a zoom above the
+    finest band). Raises ``ValueError`` for an unknown band or a non-integer
+    zoom so API callers can answer with a 400.
+    """
+    bands = [band for band, _zoom, _tolerance in SIMPLIFIED_GEOMETRY_BANDS]
+    if simplify:
+        simplify = simplify.strip().lower()
+        if simplify in FULL_RESOLUTION_VALUES:
+            return None
+        if simplify not in bands:
+            raise ValueError(f"simplify must be one of: {', '.join(bands + list(FULL_RESOLUTION_VALUES))}")
+        return simplify
+    if zoom not in (None, ""):
+        try:
+            zoom = int(zoom)
+        except (TypeError, ValueError):
+            raise ValueError("zoom must be an integer") from None
+        for band, max_zoom, _tolerance in SIMPLIFIED_GEOMETRY_BANDS:
+            if zoom <= max_zoom:
+                return band
+    return None
+
+
+def geometry_for_band(band):
+    """Query expression for the geometry to serialize at ``band``.
+
+    ``None`` selects ``"geometry"`` itself; a band name selects its simplified
+    column, falling back to the full geometry where the column is ``NULL``
+    (nothing to simplify, or a row not yet backfilled). Pass the result as
+    ``geo_field`` to :func:`annotate_rounded_geometry`.
+    """
+    if band is None:
+        return "geometry"
+    return Coalesce(f"geometry_{band}", "geometry")
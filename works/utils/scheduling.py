@@ -17,6 +17,11 @@ time and emits a WARNING when the run is late by more than
 ``settings.SCHEDULED_TASK_CATCHUP_THRESHOLD_MINUTES``. It never skips the task
 and never alters its return value; manual/ad-hoc invocations (no
 ``scheduled_for``) pass straight through.
+
+``enqueue_debounced`` enqueues a task at most once per window, so a burst of
+triggers (e.g. many single publishes) shares one run; the task calls
+``debounced_task_started`` first, so triggers arriving while it runs enqueue
+the next run.
 """
 
 import functools
@@ -24,10 +29,14 @@ import logging
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+#: Window in which further triggers share one queued run of a debounced task.
+DEBOUNCE_SECONDS = 60
+
 
 def log_scheduled_catchup(func):
     """Log a catch-up WARNING when a recurring scheduled run starts late.
@@ -58,3 +67,32 @@ def log_scheduled_catchup(func):
         return func(*args, **kwargs)
 
     return wrapper
+
+
+def _debounce_key(func: str) -> str:
+    return f"debounced_task:{func}"
+
+
+def enqueue_debounced(func: str, seconds: int = DEBOUNCE_SECONDS) -> bool:
+    """Enqueue the Django-Q task ``func`` unless it was already queued in the last ``seconds``.
+
+    Returns whether the task was enqueued. When enqueueing fails the window is
+    released again, so the next trigger retries.
+    """
+    key = _debounce_key(func)
+    if not cache.add(key, True, timeout=seconds):
+        return False
+    try:
+        from django_q.tasks import async_task
+
+        async_task(func)
+    except Exception as exc:
+        cache.delete(key)
+        logger.warning("Could not enqueue %s: %s", func, exc)
+        return False
+    return True
+
+
+def debounced_task_started(func: str) -> None:
+    """Release the window of ``func``; called by the task before it reads any data."""
+    cache.delete(_debounce_key(func))
@@ -2,18 +2,52 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import logging
+from collections import defaultdict
 from datetime import timedelta
 
-from django.core.cache import cache
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 
 from works.models import SENTINEL_COUNTRY_ISO, Collection, Source, Work
 
 logger = logging.getLogger(__name__)
 
-STATS_CACHE_KEY = "publications_statistics"
-STATS_CACHE_TIMEOUT = 86400  # 24 hours
+
+# Conditions over published works counted by calculate_statistics and
+# calculate_sources_coverage. Each becomes a ``COUNT(*) FILTER (WHERE ...)`` of
+# one aggregate query, so works_work is scanned once rather than once per metric.
+_HAS_GEOMETRY = Q(geometry__isnull=False)
+_HAS_TEMPORAL = Q(timeperiod_startdate__isnull=False) | Q(timeperiod_enddate__isnull=False)
+_HAS_AUTHORS = Q(authors__isnull=False) & ~Q(authors=[])
+
+
+def _filled(field):
+    return Q(**{f"{field}__isnull": False}) & ~Q(**{field: ""})
+
+
+_PUBLISHED_COUNTS = {
+    "with_geometry": _HAS_GEOMETRY,
+    "with_temporal": _HAS_TEMPORAL,
+    "with_authors": _HAS_AUTHORS,
+    "with_doi": _filled("doi"),
+    "with_abstract": _filled("abstract"),
+    "open_access": _filled("openalex_open_access_status"),
+    "from_openalex": _filled("openalex_id"),
+    "with_complete_metadata": _HAS_GEOMETRY & _HAS_TEMPORAL & _HAS_AUTHORS,
+}
+_STATUSES = ("p", "h", "c", "d", "t", "w")
+_OPEN_ACCESS_STATUSES = ("gold", "green", "hybrid")
+
+
+def _work_counts():
+    """Every scalar count over ``works_work`` from a single aggregate query."""
+    aggregates = {"total_works": Count("id")}
+    aggregates.update((f"status_{code}", Count("id", filter=Q(status=code))) for code in _STATUSES)
+    aggregates.update(
+        (name, Count("id", filter=Q(status="p") & condition)) for name, condition in _PUBLISHED_COUNTS.items()
+    )
+    return Work.objects.aggregate(**aggregates)
 
 
 def calculate_statistics():
@@ -26,37 +60,24 @@ def calculate_statistics():
 
     published = Work.objects.filter(status="p")
 
+    counts = _work_counts()
+    works_by_status = {code: counts.pop(f"status_{code}") for code in _STATUSES}
+    contributions = Contribution.objects.aggregate(
+        contributed_dois=Count("id", filter=Q(kind=Contribution.DOI)),
+        contributors=Count("user", distinct=True),
+    )
+
     stats = {
-        "total_works": Work.objects.count(),
-        "published_works": published.count(),
-        "harvested_works": Work.objects.filter(status="h").count(),
-        "contributed_works": Work.objects.filter(status="c").count(),
-        "contributed_dois": Contribution.objects.filter(kind=Contribution.DOI).count(),
-        "with_geometry": published.exclude(geometry__isnull=True).count(),
-        "with_temporal": published.filter(
-            Q(timeperiod_startdate__isnull=False) | Q(timeperiod_enddate__isnull=False)
-        ).count(),
-        "with_authors": published.exclude(authors__isnull=True).exclude(authors=[]).count(),
-        "with_doi": published.exclude(doi__isnull=True).exclude(doi="").count(),
-        "with_abstract": published.exclude(abstract__isnull=True).exclude(abstract="").count(),
-        "open_access": published.exclude(openalex_open_access_status__isnull=True)
-        .exclude(openalex_open_access_status="")
-        .count(),
-        "from_openalex": published.exclude(openalex_id__isnull=True).exclude(openalex_id="").count(),
-        "works_by_status": {s: Work.objects.filter(status=s).count() for s in ("p", "h", "c", "d", "t", "w")},
+        **counts,
+        "published_works": works_by_status["p"],
+        "harvested_works": works_by_status["h"],
+        "contributed_works": works_by_status["c"],
+        "works_by_status": works_by_status,
+        **contributions,
         "sources": Source.objects.count(),
         "collections": Collection.objects.count(),
         "users": User.objects.count(),
-        "contributors": Contribution.objects.exclude(user__isnull=True).values("user").distinct().count(),
     }
-
-    complete = (
-        published.exclude(geometry__isnull=True)
-        .filter(Q(timeperiod_startdate__isnull=False) | Q(timeperiod_enddate__isnull=False))
-        .exclude(authors__isnull=True)
-        .exclude(authors=[])
-    )
-    stats["with_complete_metadata"] = complete.count()
     stats["complete_percentage"] = (
         round(stats["with_complete_metadata"] / stats["published_works"] * 100, 1)
         if stats["published_works"] > 0
@@ -116,14 +137,13 @@ def calculate_statistics():
     ]
 
     # by_collection — all public collections with their published work counts
+    collections = Collection.objects.filter(is_published=True).annotate(
+        cnt=Count("works", filter=Q(works__status="p"))
+    )
     stats["by_collection"] = sorted(
         [
-            {
-                "name": coll.name,
-                "url": coll.get_absolute_url(),
-                "count": published.filter(collections=coll).count(),
-            }
-            for coll in Collection.objects.filter(is_published=True).order_by("name")
+            {"name": coll.name, "url": coll.get_absolute_url(), "count": coll.cnt}
+            for coll in collections.order_by("name")
         ],
         key=lambda x: -x["count"],
     )
@@ -131,11 +151,12 @@ def calculate_statistics():
     return stats
 
 
-def save_statistics_snapshot():
-    """Calculate statistics and persist a StatisticsSnapshot row."""
+def save_statistics_snapshot(stats=None):
+    """Persist a StatisticsSnapshot row of ``stats`` (calculated if not given)."""
     from works.models import StatisticsSnapshot
 
-    stats = calculate_statistics()
+    if stats is None:
+        stats = calculate_statistics()
     now = timezone.now()
     snapshot = StatisticsSnapshot.objects.create(
         next_update=now + timedelta(hours=24),
@@ -169,74 +190,141 @@ def save_statistics_snapshot():
 def calculate_source_coverage(source):
     """Compute and persist a SourceCoverageSnapshot for one Source.
 
+    See :func:`calculate_sources_coverage`.
+    """
+    return calculate_sources_coverage([source])[0]
+
+
+def calculate_sources_coverage(sources=None):
+    """Compute and persist a SourceCoverageSnapshot for each of ``sources`` (default: every Source).
+
     Uses Source.works_count (populated by update_openalex_sources) as the
     OpenAlex total. openalex_total and coverage_pct are NULL when the source
     has no works_count (e.g. no openalex_id), so zero is never used as a
-    sentinel for "unknown".
+    sentinel for "unknown". Three grouped queries serve all sources at once —
+    the counts, the contributors and the works per year — whatever their
+    number. Returns the snapshots in the order of ``sources``.
     """
-    from django.db.models import Count, Q
+    from django.db.models.functions import ExtractYear
 
     from works.models import Contribution, SourceCoverageSnapshot
 
-    published = Work.objects.filter(status="p", source=source)
-    optimap_count = published.count()
-
-    openalex_total = source.works_count  # None when not set
-    coverage_pct = round(optimap_count / openalex_total * 100, 1) if openalex_total else None
+    sources = list(Source.objects.order_by("pk") if sources is None else sources)
+    source_ids = [source.pk for source in sources]
+    published = Work.objects.filter(status="p", source__in=source_ids)
+
+    counts = {
+        row["source"]: row
+        for row in published.values("source")
+        .annotate(
+            optimap_count=Count("id"),
+            with_geometry=Count("id", filter=_HAS_GEOMETRY),
+            with_temporal=Count("id", filter=_HAS_TEMPORAL),
+            open_access=Count("id", filter=Q(openalex_open_access_status__in=_OPEN_ACCESS_STATUSES)),
+        )
+        .order_by()
+    }
+    contributors = dict(
+        Contribution.objects.filter(work__source__in=source_ids, user__isnull=False)
+        .values_list("work__source")
+        .annotate(cnt=Count("user", distinct=True))
+        .order_by()
+    )
+    by_year = defaultdict(list)
+    for row in (
+        published.exclude(publicationDate__isnull=True)
+        .annotate(year=ExtractYear("publicationDate"))
+        .values("source", "year")
+        .annotate(cnt=Count("id"))
+        .order_by("source", "year")
+    ):
+        by_year[row["source"]].append({"year": row["year"], "count": row["cnt"]})
+
+    snapshots = []
+    for source in sources:
+        row = counts.get(source.pk, {})
+        optimap_count = row.get("optimap_count", 0)
+        openalex_total = source.works_count  # None when not set
+
+        def _rate(numerator):
+            return round(numerator / optimap_count * 100, 1) if optimap_count > 0 else None
+
+        snapshots.append(
+            SourceCoverageSnapshot(
+                source=source,
+                openalex_total=openalex_total,
+                optimap_count=optimap_count,
+                coverage_pct=round(optimap_count / openalex_total * 100, 1) if openalex_total else None,
+                spatial_rate=_rate(row.get("with_geometry", 0)),
+                temporal_rate=_rate(row.get("with_temporal", 0)),
+                open_access_ratio=_rate(row.get("open_access", 0)),
+                contributors_count=contributors.get(source.pk, 0),
+                by_year=by_year[source.pk],
+            )
+        )
+    return SourceCoverageSnapshot.objects.bulk_create(snapshots)
 
-    def _rate(numerator):
-        return round(numerator / optimap_count * 100, 1) if optimap_count > 0 else None
 
-    spatial_rate = _rate(published.exclude(geometry__isnull=True).count())
-    temporal_rate = _rate(
-        published.filter(Q(timeperiod_startdate__isnull=False) | Q(timeperiod_enddate__isnull=False)).count()
-    )
-    open_access_ratio = _rate(published.filter(openalex_open_access_status__in=("gold", "green", "hybrid")).count())
-    contributors_count = (
-        Contribution.objects.filter(work__source=source).exclude(user__isnull=True).values("user").distinct().count()
-    )
-    from django.db.models.functions import ExtractYear
+def get_statistics():
+    """Return the current statistics: the ``StatisticsCounters`` row plus its shards (two queries).
 
-    by_year = [
-        {"year": row["year"], "count": row["cnt"]}
-        for row in (
-            published.exclude(publicationDate__isnull=True)
-            .annotate(year=ExtractYear("publicationDate"))
-            .values("year")
-            .annotate(cnt=Count("id"))
-            .order_by("year")
-        )
-    ]
+    Reconciles first if the row was never filled, e.g. right after the
+    migration that creates it.
+    """
+    from works.models import StatisticsCounters, StatisticsCounterShard
 
-    return SourceCoverageSnapshot.objects.create(
-        source=source,
-        openalex_total=openalex_total,
-        optimap_count=optimap_count,
-        coverage_pct=coverage_pct,
-        spatial_rate=spatial_rate,
-        temporal_rate=temporal_rate,
-        open_access_ratio=open_access_ratio,
-        contributors_count=contributors_count,
-        by_year=by_year,
+    counters = StatisticsCounters.objects.filter(pk=1).first()
+    if counters is None or counters.reconciled_at is None:
+        return reconcile_statistics()
+    deltas = StatisticsCounterShard.objects.aggregate(
+        **{name: Sum(name) for name in StatisticsCounterShard.COUNT_FIELDS}
     )
+    for name, delta in deltas.items():
+        setattr(counters, name, getattr(counters, name) + (delta or 0))
+    return counters.as_statistics()
 
 
-def get_cached_statistics():
-    """Return statistics from cache, calculating if absent."""
-    stats = cache.get(STATS_CACHE_KEY)
-    if stats is None:
-        stats = calculate_statistics()
-        cache.set(STATS_CACHE_KEY, stats, STATS_CACHE_TIMEOUT)
-    return stats
+def reconcile_statistics():
+    """Recount the statistics from scratch into the ``StatisticsCounters`` row.
 
+    The shards and then the row are locked for the recount, so a concurrent
+    write's trigger update waits and then applies on top of the recounted
+    values instead of being overwritten. The recount replaces the row's counts
+    and resets the shards to zero. Counts that had drifted from the recount
+    (e.g. rows changed while the triggers were disabled) are logged. Returns
+    the statistics.
+    """
+    from works.models import StatisticsCounters, StatisticsCounterShard
 
-def update_statistics_cache():
-    """Force recalculation and refresh the cache."""
-    stats = calculate_statistics()
-    cache.set(STATS_CACHE_KEY, stats, STATS_CACHE_TIMEOUT)
+    with transaction.atomic():
+        # Recreate shards lost to a table flush; their deltas are recounted below.
+        StatisticsCounterShard.objects.bulk_create(
+            [StatisticsCounterShard(slot=slot) for slot in range(StatisticsCounterShard.SHARDS)],
+            ignore_conflicts=True,
+        )
+        shards = list(StatisticsCounterShard.objects.select_for_update().order_by("slot"))
+        counters, _ = StatisticsCounters.objects.select_for_update().get_or_create(pk=1)
+        stats = calculate_statistics()
+        values = {name: stats[name] for name in StatisticsCounters.BREAKDOWN_FIELDS}
+        values.update(
+            (name, stats["works_by_status"][code]) for code, name in StatisticsCounters.STATUS_FIELDS.items()
+        )
+        values.update((name, stats[name]) for name in StatisticsCounters.COUNT_FIELDS if name not in values)
+        if counters.reconciled_at is not None:
+            current = {name: getattr(counters, name) for name in StatisticsCounters.COUNT_FIELDS}
+            for shard in shards:
+                for name in StatisticsCounterShard.COUNT_FIELDS:
+                    current[name] += getattr(shard, name)
+            drift = {
+                name: current[name] - values[name]
+                for name in StatisticsCounters.COUNT_FIELDS
+                if current[name] != values[name]
+            }
+            if drift:
+                logger.warning("Statistics counters drifted from the recount: %s", drift)
+        for name, value in values.items():
+            setattr(counters, name, value)
+        counters.reconciled_at = timezone.now()
+        counters.save()
+        StatisticsCounterShard.objects.update(**dict.fromkeys(StatisticsCounterShard.COUNT_FIELDS, 0))
     return stats
-
-
-def clear_statistics_cache():
-    """Clear the statistics cache."""
-    cache.delete(STATS_CACHE_KEY)
@@ -35,9 +35,11 @@ from .data import (
     download_collection_geojson,
     download_collection_gpkg,
     download_csv,
+    download_flatgeobuf,
     download_geojson,
     download_geopackage,
     generate_geopackage,
+    map_snapshot,
 )
 from .work_views import (
     contribute,
@@ -77,6 +79,8 @@ __all__ = [
     "download_geojson",
     "download_geopackage",
     "download_csv",
+    "download_flatgeobuf",
+    "map_snapshot",
     "generate_geopackage",
     "download_collection_geojson",
     "download_collection_gpkg",
@@ -8,6 +8,8 @@ This module handles:
 - GeoJSON export
 - GeoPackage export
 - CSV export (with WKT geometry column, issue #206)
+- FlatGeobuf export (with HTTP range requests)
+- The precompressed public map snapshot (development fallback for nginx)
 - Data download endpoints
 """
 
@@ -26,6 +28,8 @@ from django.core.cache import cache
 from django.core.serializers import serialize
 from django.http import FileResponse, Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers, quote_etag
+from django.utils.http import http_date, parse_http_date_safe
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiResponse, extend_schema, inline_serializer
 from rest_framework import serializers as drf_serializers
@@ -41,13 +45,32 @@ _DOWNLOAD_404 = OpenApiResponse(
 )
 from osgeo import ogr, osr
 
+from works.conditional import build_etag
 from works.models import Collection, Work
+from works.services.cache_tags import COLLECTION, WORKS, short_lived, tag, tag_stamp, tagged_key
 from works.tasks import (
     regenerate_csv_cache,
+    regenerate_flatgeobuf_cache,
     regenerate_geojson_cache,
     regenerate_geopackage_cache,
 )
-from works.utils.geometry import annotate_rounded_geometry
+from works.utils.flatgeobuf import FLATGEOBUF_MEDIA_TYPE
+from works.utils.geojson import (
+    STREAM_CHUNK_SIZE,
+    RawJSONEncoder,
+    iter_feature_collection,
+    streaming_geojson_response,
+    work_geometry_json,
+)
+from works.utils.geometry import (
+    GEOJSON_TEXT_FIELDS,
+    SIMPLIFIED_GEOMETRY_FIELDS,
+    SPATIAL_SUMMARY_FIELDS,
+    annotate_rounded_geometry,
+)
+
+# Re-exported under its historical name (moved to works.utils.geometry).
+from works.utils.geometry import unwrap_geometry_collection as _unwrap_geometry_collection  # noqa: F401
 
 ogr.UseExceptions()
 
@@ -59,7 +82,8 @@ ogr.UseExceptions()
         "When the client sends `Accept-Encoding: gzip` the response is gzipped on the "
         "wire (`Content-Encoding: gzip`); the payload itself remains GeoJSON. "
         "The cache is regenerated every 6 hours by a Django-Q schedule; this endpoint "
-        "regenerates on demand if the cache is missing."
+        "regenerates it on demand when it is missing or older than the last change to the "
+        "published works, so downloads are always current."
     ),
     tags=["Downloads"],
     responses={(200, "application/geo+json"): OpenApiTypes.BINARY},
@@ -70,10 +94,12 @@ def download_geojson(request):
     """
     Returns the latest GeoJSON dump file, gzipped if the client accepts it,
     with Content-Type: application/geo+json (W3C SDW-BP 5).
+
+    The file is streamed from disk; a dump is only built here when none
+    exists yet or the published works changed after it was written, instead
+    of re-serializing every work on each download.
     """
-    cache_dir = Path(tempfile.gettempdir()) / "optimap_cache"
-    cache_dir.mkdir(exist_ok=True)
-    json_path = regenerate_geojson_cache()
+    json_path = _current_data_dump("geojson") or regenerate_geojson_cache()
     gzip_path = Path(str(json_path) + ".gz")
     accept_enc = request.META.get("HTTP_ACCEPT_ENCODING", "")
 
@@ -95,7 +121,7 @@ def download_geojson(request):
 
 
 def _unwrap_ogr_geometry(geom):
-    """OGR-API mirror of _unwrap_geometry_collection for the global GeoPackage builder."""
+    """OGR-API mirror of ``unwrap_geometry_collection`` for the global GeoPackage builder."""
     if geom is None:
         return None
     if geom.GetGeometryType() != ogr.wkbGeometryCollection:
@@ -217,6 +243,172 @@ def download_csv(request):
     )
 
 
+def _latest_data_dump(extension):
+    """Newest cached ``optimap_data_dump_*.<extension>`` file, or ``None``."""
+    cache_dir = Path(tempfile.gettempdir()) / "optimap_cache"
+    dumps = sorted(cache_dir.glob(f"optimap_data_dump_*.{extension}"), reverse=True)
+    return dumps[0] if dumps else None
+
+
+def _current_data_dump(extension):
+    """Newest dump written after the last change to the published works (the
+    :data:`~works.services.cache_tags.WORKS` tag), or ``None``."""
+    path = _latest_data_dump(extension)
+    if path is None:
+        return None
+    _, changed_at = tag_stamp(WORKS)
+    # Tag times are whole milliseconds: a dump from the same millisecond may predate the change.
+    if path.stat().st_mtime < changed_at.timestamp() + 0.001:
+        return None
+    return path
+
+
+def _parse_byte_range(header, size):
+    """``(start, end)`` (inclusive) of a single-range ``Range: bytes=…`` header.
+
+    Returns ``None`` when there is no usable header (serve the whole file) and
+    raises ``ValueError`` for a range that lies outside the file (answer 416).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes=") :].strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the final N bytes.
+            start, end = max(0, size - int(last)), size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise ValueError("Requested range not satisfiable")
+    return start, min(end, size - 1)
+
+
+def _if_range_matches(request, etag, last_modified) -> bool:
+    """Whether the ``Range`` of ``request`` applies to the current file (RFC 9110 §13.1.5).
+
+    A request without ``If-Range`` always matches. An entity tag must equal
+    ``etag`` (weak tags never match), a date must equal ``last_modified``;
+    otherwise the client's partial copy is of an older dump and it gets the
+    whole new one.
+    """
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+@extend_schema(
+    summary="Download all published works as FlatGeobuf (.fgb)",
+    description=(
+        "Returns the cached [FlatGeobuf](https://flatgeobuf.org/) dump of every published work — "
+        "single layer `works`, EPSG:4326, with a packed Hilbert R-tree spatial index. The endpoint "
+        "honours single HTTP `Range` requests (`206 Partial Content`), so FlatGeobuf clients can "
+        "read the header and index and then fetch only the features inside a bounding box. "
+        "Responses carry an `ETag` and `Last-Modified` of the dump; send one of them as `If-Range` "
+        "so that a range of a newer dump is never spliced into an older copy."
+    ),
+    tags=["Downloads"],
+    responses={
+        (200, "application/flatgeobuf"): OpenApiTypes.BINARY,
+        (206, "application/flatgeobuf"): OpenApiTypes.BINARY,
+        404: _DOWNLOAD_404,
+    },
+)
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def download_flatgeobuf(request):
+    """
+    Returns the latest FlatGeobuf dump, whole or as the requested byte range.
+
+    Unlike the other downloads this serves the newest existing dump instead of
+    regenerating it, so successive range requests read the same file; it only
+    builds one when none exists yet. Every dump is a new file, so its name,
+    size and mtime make the ``ETag``; a ``Range`` whose ``If-Range`` names
+    another dump is answered with the whole current file. The file is sent
+    uncompressed so the ``ETag`` stays strong and byte ranges refer to it.
+    """
+    fgb_path = _latest_data_dump("fgb")
+    if fgb_path is None:
+        regenerated = regenerate_flatgeobuf_cache()
+        fgb_path = Path(regenerated) if regenerated else None
+    if fgb_path is None or not fgb_path.exists():
+        raise Http404("FlatGeobuf not available.")
+
+    stat = fgb_path.stat()
+    size = stat.st_size
+    etag = quote_etag(build_etag(fgb_path.name, size, stat.st_mtime_ns))
+    last_modified = int(stat.st_mtime)
+    range_header = request.META.get("HTTP_RANGE")
+    if range_header and not _if_range_matches(request, etag, last_modified):
+        range_header = None
+    try:
+        byte_range = _parse_byte_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+    if byte_range is None:
+        response = FileResponse(
+            open(fgb_path, "rb"),
+            content_type=FLATGEOBUF_MEDIA_TYPE,
+            as_attachment=True,
+            filename=fgb_path.name,
+        )
+    else:
+        start, end = byte_range
+        with open(fgb_path, "rb") as f:
+            f.seek(start)
+            chunk = f.read(end - start + 1)
+        response = HttpResponse(chunk, status=206, content_type=FLATGEOBUF_MEDIA_TYPE)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Disposition"] = f'attachment; filename="{fgb_path.name}"'
+    response["Accept-Ranges"] = "bytes"
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    # GZipMiddleware skips responses that already name an encoding. Compressing
+    # would weaken the ETag (so no If-Range ever matched and resumed downloads
+    # restarted) and turn a 206 into a gzip of the slice instead of file bytes.
+    response["Content-Encoding"] = "identity"
+    return response
+
+
+def map_snapshot(request, name):
+    """
+    Serves a prebuilt map snapshot (see ``works.services.map_snapshot``).
+
+    In production nginx serves ``MAP_SNAPSHOT_DIR`` directly; this view covers
+    development and deployments without that location. The file name carries
+    the content hash, so the response is cacheable forever; the ``.br`` or
+    ``.gz`` sibling is sent as-is when the client accepts it.
+    """
+    from works.services.map_snapshot import SNAPSHOT_NAME_RE, snapshot_dir
+
+    if not SNAPSHOT_NAME_RE.fullmatch(name):
+        raise Http404("No such map snapshot.")
+    path = snapshot_dir() / name
+    if not path.exists():
+        raise Http404("No such map snapshot.")
+    accepted = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    encoding = None
+    for candidate, suffix in (("br", ".br"), ("gzip", ".gz")):
+        sibling = path.with_name(name + suffix)
+        if candidate in accepted and sibling.exists():
+            path, encoding = sibling, candidate
+            break
+    # Streamed, so the site-wide cache middleware does not copy it into the cache.
+    response = FileResponse(open(path, "rb"), content_type="application/geo+json")
+    if encoding:
+        response["Content-Encoding"] = encoding
+    response["Cache-Control"] = "public, max-age=31536000, immutable"
+    patch_vary_headers(response, ["Accept-Encoding"])
+    return response
+
+
 # ---------------------------------------------------------------------------
 # Per-collection download endpoints (#217)
 # ---------------------------------------------------------------------------
@@ -230,61 +422,82 @@ _COLLECTION_404 = OpenApiResponse(
 )
 
 
+# Columns derived from ``Work.geometry`` (extent, simplified variants, GeoJSON
+# text); they duplicate the geometry and are kept out of download properties.
+_DERIVED_GEOMETRY_FIELDS = {*SPATIAL_SUMMARY_FIELDS, *SIMPLIFIED_GEOMETRY_FIELDS, *GEOJSON_TEXT_FIELDS}
+
+
 def _collection_qs(collection):
     return annotate_rounded_geometry(Work.objects.filter(collections=collection, status="p"))
 
 
-def _unwrap_geometry_collection(geom):
-    """Unwrap the GeometryCollection envelope that Django's GeometryCollectionField always emits.
+# Django's geojson serializer names the CRS in the FeatureCollection header.
+_COLLECTION_GEOJSON_METADATA = {"crs": {"type": "name", "properties": {"name": "EPSG:4326"}}}
 
-    Django stores every geometry as a GeometryCollection, even when a work has a
-    single Point or Polygon.  Leaving the wrapper intact causes ogr2ogr to declare
-    the GeoPackage layer type as GEOMETRYCOLLECTION, which QGIS and most GIS tools
-    cannot render with a default symbology (the layer loads but shows no features).
-
-    Transformation rules applied to each GeoJSON geometry dict:
-    - GeometryCollection([X])           → X          (unwrap single-member)
-    - GeometryCollection([X, X, ...])   → Multi* X   (same-type members → Multi*)
-    - GeometryCollection([X, Y, ...])   → unchanged  (mixed types, rare)
-    - null / non-collection             → unchanged
-    """
-    if geom is None or geom.get("type") != "GeometryCollection":
-        return geom
-    parts = [g for g in (geom.get("geometries") or []) if g is not None]
-    if not parts:
-        return None
-    if len(parts) == 1:
-        return parts[0]
-    types = {g["type"] for g in parts}
-    if len(types) == 1:
-        base = types.pop()
-        multi_map = {"Point": "MultiPoint", "LineString": "MultiLineString", "Polygon": "MultiPolygon"}
-        if base in multi_map:
-            return {"type": multi_map[base], "coordinates": [g["coordinates"] for g in parts]}
-    return geom
 
+def _iter_collection_features(collection):
+    """Yield the GeoJSON Features of the published works in *collection*, in ID order.
 
-def _serialize_collection_geojson(collection):
-    """Return a GeoJSON FeatureCollection string for published works in *collection*,
+    Properties are serialized via Django's full-field "geojson" format (every
+    concrete Work field) — geometry is swapped afterwards for the unwrapped,
+    rounded text pre-rendered on save (`Work.geometry_geojson_unwrapped`),
+    spliced in without being parsed. The derived geometry columns themselves
+    are left out of the properties. Works are read through a server-side
+    cursor and serialized a chunk at a time, so memory stays flat however
+    large the collection is.
+    """
+    property_fields = [
+        f.name
+        for f in Work._meta.concrete_fields
+        if not f.primary_key and f.name != "geometry" and f.name not in _DERIVED_GEOMETRY_FIELDS
+    ]
+
+    def serialize_chunk(works):
+        raw = serialize("geojson", works, geometry_field="geometry", fields=property_fields, srid=4326)
+        geometry_by_id = {w.pk: work_geometry_json(w, unwrapped=True) for w in works}
+        for feat in json.loads(raw)["features"]:
+            feat["geometry"] = geometry_by_id.get(feat.get("id"))
+            yield feat
+
+    chunk = []
+    for work in _collection_qs(collection).order_by("pk").iterator(chunk_size=STREAM_CHUNK_SIZE):
+        chunk.append(work)
+        if len(chunk) == STREAM_CHUNK_SIZE:
+            yield from serialize_chunk(chunk)
+            chunk = []
+    if chunk:
+        yield from serialize_chunk(chunk)
+
+
+def _iter_collection_geojson(collection):
+    """GeoJSON FeatureCollection text chunks for the published works in *collection*,
     with GeometryCollection wrappers unwrapped to primitive / Multi* types and
     coordinates capped at 5 decimal places (W3C SDW-BP 6).
+    """
+    return iter_feature_collection(
+        _iter_collection_features(collection), metadata=_COLLECTION_GEOJSON_METADATA, cls=RawJSONEncoder
+    )
 
-    Properties are serialized via Django's full-field "geojson" format (no
-    `fields=` restriction, so every Work model field is exposed) — geometry is
-    swapped afterwards for the DB-precomputed, already-rounded text from
-    `annotate_rounded_geometry`. Coordinate rounding was previously missing
-    entirely on this path (a gap in the original BP6 implementation); this
-    also fixes that, for free, as a side effect of the DB-side migration.
+
+def _cache_when_complete(chunks, cache_key, timeout, max_bytes):
+    """Yield the text ``chunks`` and cache their concatenation once the last one is sent.
+
+    Only documents of at most ``max_bytes`` (UTF-8) are cached: the chunks are
+    kept until the total exceeds it and then dropped, so a worker never holds
+    more than that of a large download. An interrupted download leaves the
+    cache untouched.
     """
-    works_qs = _collection_qs(collection)
-    rounded_by_id = {w.pk: w._rounded_geojson for w in works_qs}
-    raw = serialize("geojson", works_qs, geometry_field="geometry", srid=4326)
-    data = json.loads(raw)
-    for feat in data.get("features", []):
-        rounded = rounded_by_id.get(feat.get("id"))
-        geometry = json.loads(rounded) if rounded else feat.get("geometry")
-        feat["geometry"] = _unwrap_geometry_collection(geometry)
-    return json.dumps(data)
+    parts, size = [], 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk.encode("utf-8"))
+            if size > max_bytes:
+                parts = None
+            else:
+                parts.append(chunk)
+        yield chunk
+    if parts is not None:
+        cache.set(cache_key, "".join(parts), timeout)
 
 
 def _generate_collection_converted_bytes(collection, ogr_fmt, layer_creation_options=None):
@@ -293,8 +506,8 @@ def _generate_collection_converted_bytes(collection, ogr_fmt, layer_creation_opt
         ext = ogr_fmt.lower() if ogr_fmt != "CSV" else "csv"
         geojson_path = os.path.join(tmpdir, "data.geojson")
         out_path = os.path.join(tmpdir, f"data.{ext}")
-        with open(geojson_path, "w") as f:
-            f.write(_serialize_collection_geojson(collection))
+        with open(geojson_path, "w", encoding="utf-8") as f:
+            f.writelines(_iter_collection_geojson(collection))
         cmd = ["ogr2ogr", "-f", ogr_fmt, out_path, geojson_path]
         for opt in layer_creation_options or []:
             cmd.extend(["-lco", opt])
@@ -311,7 +524,11 @@ def _generate_collection_converted_bytes(collection, ogr_fmt, layer_creation_opt
     summary="Download collection works as GeoJSON",
     description=(
         "Returns a GeoJSON FeatureCollection of all published works in the collection. "
-        "Cached for `FEED_CACHE_HOURS` (default 24 h); pass `?now` to force refresh."
+        "A collection not yet cached is streamed feature by feature, so the download starts "
+        "immediately even for large collections, and cached once complete unless larger than "
+        "`COLLECTION_GEOJSON_CACHE_MAX_BYTES` (default 8 MiB). "
+        "Cached for `FEED_CACHE_HOURS` (default 24 h) or until the collection's works change; "
+        "pass `?now` to force refresh."
     ),
     tags=["Collections"],
     responses={
@@ -323,15 +540,21 @@ def _generate_collection_converted_bytes(collection, ogr_fmt, layer_creation_opt
 @permission_classes([AllowAny])
 def download_collection_geojson(request, collection_slug):
     collection = get_object_or_404(Collection, identifier=collection_slug, is_published=True)
-    cache_key = f"download:collection:{collection_slug}:geojson"
+    cache_key = tagged_key(f"download:collection:{collection_slug}:geojson", [tag(COLLECTION, collection.pk)])
+    filename = f"optimap_collection_{collection_slug}.geojson"
     force = request.GET.get("now") is not None
     data = None if force else cache.get(cache_key)
     if data is None:
-        data = _serialize_collection_geojson(collection)
-        cache.set(cache_key, data, settings.FEED_CACHE_HOURS * 3600)
+        chunks = _cache_when_complete(
+            _iter_collection_geojson(collection),
+            cache_key,
+            settings.FEED_CACHE_HOURS * 3600,
+            settings.COLLECTION_GEOJSON_CACHE_MAX_BYTES,
+        )
+        return streaming_geojson_response(chunks, filename=filename)
     response = HttpResponse(data, content_type="application/geo+json")
-    response["Content-Disposition"] = f'attachment; filename="optimap_collection_{collection_slug}.geojson"'
-    return response
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return short_lived(response)
 
 
 @extend_schema(
@@ -351,7 +574,7 @@ def download_collection_geojson(request, collection_slug):
 @permission_classes([AllowAny])
 def download_collection_gpkg(request, collection_slug):
     collection = get_object_or_404(Collection, identifier=collection_slug, is_published=True)
-    cache_key = f"download:collection:{collection_slug}:gpkg"
+    cache_key = tagged_key(f"download:collection:{collection_slug}:gpkg", [tag(COLLECTION, collection.pk)])
     force = request.GET.get("now") is not None
     data = None if force else cache.get(cache_key)
     if data is None:
@@ -361,7 +584,7 @@ def download_collection_gpkg(request, collection_slug):
         cache.set(cache_key, data, settings.FEED_CACHE_HOURS * 3600)
     response = HttpResponse(data, content_type="application/geopackage+sqlite3")
     response["Content-Disposition"] = f'attachment; filename="optimap_collection_{collection_slug}.gpkg"'
-    return response
+    return short_lived(response)
 
 
 @extend_schema(
@@ -381,7 +604,7 @@ def download_collection_gpkg(request, collection_slug):
 @permission_classes([AllowAny])
 def download_collection_csv(request, collection_slug):
     collection = get_object_or_404(Collection, identifier=collection_slug, is_published=True)
-    cache_key = f"download:collection:{collection_slug}:csv"
+    cache_key = tagged_key(f"download:collection:{collection_slug}:csv", [tag(COLLECTION, collection.pk)])
     force = request.GET.get("now") is not None
     data = None if force else cache.get(cache_key)
     if data is None:
@@ -391,4 +614,4 @@ def download_collection_csv(request, collection_slug):
         cache.set(cache_key, data, settings.FEED_CACHE_HOURS * 3600)
     response = HttpResponse(data, content_type="text/csv; charset=utf-8")
     response["Content-Disposition"] = f'attachment; filename="optimap_collection_{collection_slug}.csv"'
-    return response
+    return short_lived(response)
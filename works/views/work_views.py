@@ -18,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 from django.conf import settings
 from django.contrib import messages
-from django.core.cache import caches
+from django.core.cache import cache
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db.models import Q
 from django.http import FileResponse, Http404
@@ -38,6 +38,8 @@ from works.seo import (
     geo_meta_tags,
 )
 from works.serializers import get_available_gazetteers as _ner_available_gazetteers
+from works.services.cache_tags import COLLECTION, tag, tagged_key
+from works.services.facets import SOURCE
 from works.services.preview_image import (
     cache_path_for as _preview_cache_path,
 )
@@ -45,7 +47,7 @@ from works.services.preview_image import (
     render_work_preview,
 )
 from works.utils.identifiers import resolve_work_for_landing, resolve_work_identifier
-from works.utils.statistics import get_cached_statistics
+from works.utils.statistics import get_statistics
 
 
 def contribute(request):
@@ -294,8 +296,8 @@ def works_list(request):
 
         works.append(work_data)
 
-    # Get cached statistics
-    stats = get_cached_statistics()
+    # Live statistics (one row)
+    stats = get_statistics()
 
     # Build API URL for current page/size
     # DRF uses limit/offset pagination, so calculate offset from page number
@@ -327,10 +329,20 @@ def _work_landing_cache_key(work, request) -> str:
       each other — the cached payload contains absolute URLs built from the
       request host.
     - ``work.lastUpdate`` (auto-bumped to ``now()`` on every ``Work.save()``)
-      so any edit immediately misses the old entry. No explicit invalidation
-      signal needed; superseded entries age out via TTL.
+      so any edit immediately misses the old entry.
+    - the cache tags of the work's source and collections: the context
+      repeats the source's name, ISSN and homepage (citation tags, JSON-LD,
+      COinS), and source or collection edits don't touch ``lastUpdate``.
+
+    No explicit invalidation needed; superseded entries age out via TTL.
     """
-    return f"work_landing:ctx:{request.get_host()}:{work.id}:{work.lastUpdate.timestamp() if work.lastUpdate else 0}"
+    tags = [tag(COLLECTION, pk) for pk in work.collections.values_list("pk", flat=True)]
+    if work.source_id:
+        tags.append(tag(SOURCE, work.source_id))
+    return tagged_key(
+        f"work_landing:ctx:{request.get_host()}:{work.id}:{work.lastUpdate.timestamp() if work.lastUpdate else 0}",
+        tags,
+    )
 
 
 def _build_work_landing_cacheable(request, work, identifier_type):
@@ -416,10 +428,13 @@ def work_landing(request, identifier):
     Admin users can view all works with a status label.
 
     For anonymous requests the work-derived part of the context is cached
-    in the in-memory backend (key ``work_landing:ctx:<host>:<work.id>``)
-    and invalidated by ``works.signals.invalidate_work_caches`` on every
-    ``Work`` save. Authenticated and staff requests always render live to
-    keep status badges, publish buttons, and provenance current.
+    in the shared ``default`` cache (key
+    ``work_landing:ctx:<host>:<work.id>:<lastUpdate>``, qualified by the
+    source and collection cache tags), so it is built once for all workers
+    and survives restarts; every ``Work`` save bumps ``lastUpdate`` and every
+    source or collection edit bumps a tag, and so moves to a new key. Authenticated and staff
+    requests always render live to keep status badges, publish buttons, and
+    provenance current.
     """
 
     is_admin = request.user.is_authenticated and request.user.is_staff
@@ -450,16 +465,15 @@ def work_landing(request, identifier):
         raise Http404("Work not found.")
 
     is_anonymous = not request.user.is_authenticated
-    cache_backend = caches["memory"]
     cache_key = _work_landing_cache_key(work, request) if is_anonymous else None
 
     cacheable = None
     if cache_key:
-        cacheable = cache_backend.get(cache_key)
+        cacheable = cache.get(cache_key)
     if cacheable is None:
         cacheable = _build_work_landing_cacheable(request, work, identifier_type)
         if cache_key:
-            cache_backend.set(cache_key, cacheable, timeout=_WORK_LANDING_CACHE_TIMEOUT)
+            cache.set(cache_key, cacheable, timeout=_WORK_LANDING_CACHE_TIMEOUT)
 
     # Rebuild Meta per request — cheap; the heavy schema dict comes from
     # the cache.
@@ -18,9 +18,10 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db.models import Count, Q
-from django.http import Http404, HttpResponse, HttpResponseRedirect, JsonResponse
+from django.http import Http404, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.cache import add_never_cache_headers
 from django.utils.html import strip_tags
 from django.views.decorators.http import require_POST
@@ -29,7 +30,13 @@ from .models import STATUS_CHOICES, Collection, Source, Work
 
 User = get_user_model()
 from .seo import coins_title
-from .utils.geojson import publications_to_geojson
+from .services.work_changes import on_works_changed
+from .utils.geojson import (
+    iter_feature_collection,
+    iter_publication_features,
+    publications_to_geojson,
+    streaming_geojson_response,
+)
 from .utils.geometry import annotate_rounded_geometry
 
 logger = logging.getLogger(__name__)
@@ -238,7 +245,7 @@ def collection_geojson(request, collection_slug):
     works_qs = annotate_rounded_geometry(
         Work.objects.filter(collections=collection, status="p").select_related("source")
     )
-    return HttpResponse(publications_to_geojson(list(works_qs)), content_type="application/geo+json")
+    return streaming_geojson_response(iter_feature_collection(iter_publication_features(works_qs)))
 
 
 def collection_short_redirect(request, short_slug):
@@ -325,9 +332,14 @@ def publish_collection_works(request, collection_id):
             or any(d is not None for d in (w.timeperiod_startdate or []))
             or any(d is not None for d in (w.timeperiod_enddate or []))
         ]
-        count = Work.objects.filter(pk__in=qualifying_ids).update(status="p")
     else:
-        count = Work.objects.filter(collections=collection, status__in=["h", "c"]).update(status="p")
+        qualifying_ids = list(
+            Work.objects.filter(collections=collection, status__in=["h", "c"]).values_list("pk", flat=True)
+        )
+    count = Work.objects.filter(pk__in=qualifying_ids).update(status="p", lastUpdate=timezone.now())
+    # Bulk .update() bypasses auto_now and the save signals, so bump lastUpdate
+    # (the API's conditional-GET validator) and propagate the change here.
+    on_works_changed(qualifying_ids)
     return JsonResponse({"success": True, "published_count": count})
 
 
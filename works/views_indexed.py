@@ -20,13 +20,10 @@ get SEO metadata via :func:`works.seo.build_facet_page_meta`.
 import datetime
 import json
 import logging
-import re
-from collections import Counter
 
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
 from django.core.cache import cache
-from django.db.models import Count, Q
 from django.http import Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
@@ -37,8 +34,11 @@ from django_q.humanhash import humanize as humanize_task_id
 from django_q.tasks import async_task
 
 from .feeds import get_region_from_slug, normalize_region_slug
-from .models import SENTINEL_COUNTRY_ISO, Country, GlobalRegion, Source, StatisticsSnapshot, Work
+from .models import SENTINEL_COUNTRY_ISO, Country, GlobalRegion, Source, Work
 from .seo import build_facet_page_meta, coins_title
+from .services import facets
+from .services.cache_tags import WORKS, short_lived, tag, tagged_key
+from .services.facets import YEAR_MIN, facet_counts, facet_work_ids
 from .utils.geojson import build_works_map_context
 from .utils.geometry import annotate_rounded_geometry
 from .utils.pagination import paginate_works
@@ -47,125 +47,43 @@ from .views_regions import _get_regional_publications
 
 logger = logging.getLogger(__name__)
 
-YEAR_MIN = 1900
-_YEAR_RE = re.compile(r"(\d{4})")
-_YEAR_CACHE_TIMEOUT = 60 * 60  # 1 hour — data years change rarely
+_TOPIC_SLUG_CACHE_TIMEOUT = 60 * 60  # 1 hour — only the slug → topic mapping is cached
 
 
-# --- temporal-coverage (data year) helpers ---------------------------------
+# --- facet helpers (single indexed queries against WorkFacet) --------------
+#
+# Data years, topics, countries and sources are read from the incrementally
+# maintained ``WorkFacet`` index (works/services/facets.py) — one indexed query
+# per count or page, instead of a cached full scan of all published works.
 
 
-def _year_of(datestr):
-    """Extract a 4-digit year from a stored date string, or None."""
-    if not datestr:
-        return None
-    m = _YEAR_RE.search(str(datestr))
-    return int(m.group(1)) if m else None
-
-
-def _work_year_ranges(work):
-    """Yield (start_year, end_year) for each temporal interval of a work.
-
-    ``timeperiod_startdate``/``timeperiod_enddate`` are parallel ArrayFields of
-    date strings; either bound may be missing (open-ended interval). An interval
-    with no usable bound at all is skipped.
-    """
-    starts = work.timeperiod_startdate or []
-    ends = work.timeperiod_enddate or []
-    for i in range(max(len(starts), len(ends))):
-        sy = _year_of(starts[i]) if i < len(starts) else None
-        ey = _year_of(ends[i]) if i < len(ends) else None
-        if sy is None and ey is None:
-            continue
-        yield (sy if sy is not None else ey, ey if ey is not None else sy)
-
-
-def _published_works_with_temporal():
-    """Published works that have at least one temporal bound (candidate set)."""
-    return Work.objects.filter(status="p").exclude(timeperiod_startdate__isnull=True).exclude(timeperiod_startdate=[])
-
-
-def _covered_years(work):
-    """Set of in-range data years a work's temporal coverage spans.
+def works_covering_year(year):
+    """Subquery of the PKs of published works whose temporal coverage covers ``year``.
 
-    Each interval is clamped to ``[YEAR_MIN, current_year + 1]`` (rather than
-    dropped when it partly falls outside), so this is the single definition of
-    "which years a work covers" shared by both :func:`works_covering_year`
-    (the /during/<year> page) and :func:`data_year_counts` (the /browse
-    directory and ``YearSitemap``) — the two can no longer disagree.
+    "Covers" is defined once by :func:`works.services.facets.covered_years`
+    (data years, NOT the publication date).
     """
-    upper = datetime.date.today().year + 1
-    years = set()
-    for start, end in _work_year_ranges(work):
-        lo, hi = (start, end) if start <= end else (end, start)
-        lo = max(lo, YEAR_MIN)
-        hi = min(hi, upper)
-        if lo <= hi:
-            years.update(range(lo, hi + 1))
-    return years
-
-
-def works_covering_year(year):
-    """PKs of published works whose temporal coverage covers ``year`` (cached)."""
-    cache_key = f"facet:data_year_pks:{year}"
-    pks = cache.get(cache_key)
-    if pks is not None:
-        return pks
-    pks = [
-        w.pk
-        for w in _published_works_with_temporal().only("id", "timeperiod_startdate", "timeperiod_enddate")
-        if year in _covered_years(w)
-    ]
-    cache.set(cache_key, pks, _YEAR_CACHE_TIMEOUT)
-    return pks
+    return facet_work_ids(facets.YEAR, year)
 
 
 def data_year_counts():
-    """{year: count} of published works per data year covered (cached)."""
-    cache_key = "facet:data_year_counts"
-    counts = cache.get(cache_key)
-    if counts is not None:
-        return counts
-    counter = Counter()
-    for w in _published_works_with_temporal().only("id", "timeperiod_startdate", "timeperiod_enddate"):
-        for y in _covered_years(w):
-            counter[y] += 1
-    counts = dict(counter)
-    cache.set(cache_key, counts, _YEAR_CACHE_TIMEOUT)
-    return counts
-
-
-# --- topic helpers (single scan of Work.topics, cached) --------------------
+    """{year: count} of published works per data year covered."""
+    return {int(year): n for year, n in facet_counts(facets.YEAR).items()}
 
 
 def published_topic_counts():
-    """{canonical_topic: count} across published works' OpenAlex topics (cached).
+    """{canonical_topic: count} across published works' OpenAlex topics.
 
     The single source of truth for topics, shared by the /on/<topic> resolver,
     the /browse directory, and ``TopicSitemap`` so all three list/resolve the
     same set (a slug advertised in one can't 404 in another).
     """
-    cache_key = "facet:topic_counts"
-    counts = cache.get(cache_key)
-    if counts is not None:
-        return counts
-    counter = Counter()
-    for topics in (
-        Work.objects.filter(status="p")
-        .exclude(topics__isnull=True)
-        .exclude(topics=[])
-        .values_list("topics", flat=True)
-    ):
-        for topic in topics or []:
-            counter[topic] += 1
-    counts = dict(counter)
-    cache.set(cache_key, counts, _YEAR_CACHE_TIMEOUT)
-    return counts
+    return facet_counts(facets.TOPIC)
 
 
 def topic_slug_map():
     """{slug: canonical_topic} for all published topics (cached, slug wins last)."""
-    cache_key = "facet:topic_slug_map"
+    cache_key = tagged_key("facet:topic_slug_map", [WORKS])
     mapping = cache.get(cache_key)
     if mapping is not None:
         return mapping
@@ -174,7 +92,7 @@ def topic_slug_map():
         slug = slugify(topic)
         if slug:
             mapping[slug] = topic
-    cache.set(cache_key, mapping, _YEAR_CACHE_TIMEOUT)
+    cache.set(cache_key, mapping, _TOPIC_SLUG_CACHE_TIMEOUT)
     return mapping
 
 
@@ -212,7 +130,8 @@ def _render_facet(
         )
     if extra:
         context.update(extra)
-    return render(request, "indexed_page.html", context)
+    response = render(request, "indexed_page.html", context)
+    return short_lived(response) if map_cache_key else response
 
 
 # --- facet views -----------------------------------------------------------
@@ -241,7 +160,7 @@ def place_page(request, place_slug):
     extra = {"show_place_nav": True}
     if is_country:
         works = annotate_rounded_geometry(
-            Work.objects.filter(status="p", countries=country)
+            Work.objects.filter(pk__in=facet_work_ids(facets.COUNTRY, country.iso_code))
             .select_related("source")
             .order_by("-creationDate", "-id")
         )
@@ -251,6 +170,7 @@ def place_page(request, place_slug):
         # browser-cached /api/v1/countries/ data) so the page always shows a
         # map even when no works carry geometry.
         extra["facet_country_iso"] = country.iso_code
+        place_tag = tag(facets.COUNTRY, country.iso_code)
     else:
         region = get_region_from_slug(place_slug)
         if region is None:
@@ -258,6 +178,7 @@ def place_page(request, place_slug):
         works = _get_regional_publications(region)
         kind = region.get_region_type_display()
         name = region.name
+        place_tag = tag(facets.REGION, region.pk)
 
     page_url = reverse("optimap:at-place", kwargs={"place_slug": place_slug})
     return _render_facet(
@@ -270,7 +191,7 @@ def place_page(request, place_slug):
         works=works,
         extra=extra,
         with_map=True,
-        map_cache_key=f"facet_map_all:place:{normalized}",
+        map_cache_key=tagged_key(f"facet_map_all:place:{normalized}", [place_tag]),
     )
 
 
@@ -296,7 +217,7 @@ def topic_page(request, topic_slug):
     topic = topic_slug_map().get(topic_slug)
     if topic is None:
         raise Http404(f"Topic not found: {topic_slug}")
-    works = Work.objects.filter(status="p", topics__contains=[topic]).order_by("-creationDate", "-id")
+    works = Work.objects.filter(pk__in=facet_work_ids(facets.TOPIC, topic)).order_by("-creationDate", "-id")
     page_url = reverse("optimap:on-topic", kwargs={"topic_slug": topic_slug})
     return _render_facet(
         request,
@@ -310,30 +231,23 @@ def topic_page(request, topic_slug):
 
 
 def browse_page(request):
-    """Directory of all facets (places, years, sources, topics) with counts."""
-    try:
-        snapshot = StatisticsSnapshot.objects.latest()
-    except StatisticsSnapshot.DoesNotExist:
-        snapshot = None
+    """Directory of all facets (places, years, sources, topics) with counts.
 
+    Every count is one grouped query on the ``WorkFacet`` index.
+    """
     # Places: continents + oceans (GlobalRegion) and countries with published works.
-    region_counts = {}
-    if snapshot:
-        for row in (snapshot.by_continent or []) + (snapshot.by_ocean or []):
-            region_counts[row["name"]] = row["count"]
+    region_counts = facet_counts(facets.REGION)
     regions = [
         {
             "name": region.name,
             "slug": region.get_slug(),
             "type": region.get_region_type_display(),
-            "count": region_counts.get(region.name, 0),
+            "count": region_counts.get(str(region.pk), 0),
         }
         for region in GlobalRegion.objects.all()
     ]
 
-    country_counts = {}
-    if snapshot:
-        country_counts = {row["name"]: row["count"] for row in (snapshot.by_country or [])}
+    country_counts = facet_counts(facets.COUNTRY)
     countries = [
         {"name": c.name, "slug": c.slug, "count": country_counts.get(c.iso_code, 0)}
         for c in Country.objects.real().only("name", "slug", "iso_code")
@@ -346,15 +260,15 @@ def browse_page(request):
     years = [{"year": y, "count": counts[y]} for y in sorted(counts, reverse=True)]
 
     # Sources: those with a slug and at least one published work.
-    sources = list(
-        Source.objects.exclude(slug__isnull=True)
-        .annotate(n=Count("works", filter=Q(works__status="p")))
-        .filter(n__gt=0)
-        .order_by("-n", "name")
-        .values("name", "slug", "n")
-    )
+    source_counts = facet_counts(facets.SOURCE)
+    sources = [
+        {"name": source.name, "slug": source.slug, "n": source_counts[str(source.pk)]}
+        for source in Source.objects.exclude(slug__isnull=True).only("name", "slug")
+        if str(source.pk) in source_counts
+    ]
+    sources.sort(key=lambda x: (-x["n"], x["name"]))
 
-    # Topics: shared cached scan (same set as /on/<topic> and TopicSitemap).
+    # Topics: same set as /on/<topic> and TopicSitemap.
     topics = [
         {"name": name, "slug": slugify(name), "count": count}
         for name, count in sorted(published_topic_counts().items(), key=lambda kv: (-kv[1], kv[0]))
@@ -405,14 +319,8 @@ def _flag_emoji(iso_code):
 
 
 def _published_country_counts():
-    """{iso_code: published-work count} for the country overviews."""
-    rows = (
-        Work.objects.filter(status="p", countries__isnull=False)
-        .exclude(countries__iso_code=SENTINEL_COUNTRY_ISO)
-        .values("countries__iso_code")
-        .annotate(n=Count("id", distinct=True))
-    )
-    return {r["countries__iso_code"]: r["n"] for r in rows}
+    """{iso_code: published-work count} for the country overviews (sentinel never indexed)."""
+    return facet_counts(facets.COUNTRY)
 
 
 def _countries_by_continent():
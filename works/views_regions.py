@@ -22,6 +22,8 @@ from django_q.tasks import async_task
 from .feeds import get_region_from_slug
 from .models import GlobalRegion, Work
 from .seo import build_feed_page_meta
+from .services.cache_tags import bump_tags, short_lived, tag, tagged_key
+from .services.facets import REGION
 from .utils.geojson import publications_to_geojson
 from .utils.geometry import annotate_rounded_geometry
 from .utils.provenance import append_event, set_block
@@ -168,17 +170,17 @@ def _get_regional_publications(region):
 
 
 def invalidate_region_page_cache(region):
-    """Delete the cached landing-page context for a region.
+    """Retire the cached landing page, feeds and facet map of a region.
 
     Called whenever ``Work.regions`` membership changes (the ``assign_work_regions``
     signal or the ``backfill_work_regions`` sweep) so the page reflects new
     associations before ``FEED_CACHE_HOURS`` elapses, instead of serving a stale
-    (possibly empty) page for up to a day.
+    (possibly empty) page for up to a day. Bumps the region's cache tag, which
+    the facet index refresh also does for every work joining or leaving it.
     """
     if region is None:
         return
-    kind = "continent" if region.region_type == GlobalRegion.CONTINENT else "ocean"
-    cache.delete(f"feed_page:{kind}:{region.get_slug()}")
+    bump_tags([tag(REGION, region.pk)])
 
 
 def continent_feed_page(request, continent_slug):
@@ -189,13 +191,13 @@ def continent_feed_page(request, continent_slug):
     if region is None or region.region_type != GlobalRegion.CONTINENT:
         raise Http404(f"Continent not found: {continent_slug}")
 
-    cache_key = f"feed_page:continent:{continent_slug}"
+    cache_key = tagged_key(f"feed_page:continent:{continent_slug}", [tag(REGION, region.pk)])
 
     if not force_refresh:
         cached_data = cache.get(cache_key)
         if cached_data:
             logger.debug("Serving cached continent page: %s", continent_slug)
-            return render(request, "feed_page.html", _with_region_seo(request, cached_data, region))
+            return short_lived(render(request, "feed_page.html", _with_region_seo(request, cached_data, region)))
 
     logger.debug("Generating fresh continent page: %s", continent_slug)
     publications = _get_regional_publications(region)
@@ -215,7 +217,7 @@ def continent_feed_page(request, continent_slug):
     cache_hours = getattr(settings, "FEED_CACHE_HOURS", 24)
     cache.set(cache_key, context, timeout=cache_hours * 3600)
 
-    return render(request, "feed_page.html", _with_region_seo(request, context, region))
+    return short_lived(render(request, "feed_page.html", _with_region_seo(request, context, region)))
 
 
 def ocean_feed_page(request, ocean_slug):
@@ -226,13 +228,13 @@ def ocean_feed_page(request, ocean_slug):
     if region is None or region.region_type != GlobalRegion.OCEAN:
         raise Http404(f"Ocean not found: {ocean_slug}")
 
-    cache_key = f"feed_page:ocean:{ocean_slug}"
+    cache_key = tagged_key(f"feed_page:ocean:{ocean_slug}", [tag(REGION, region.pk)])
 
     if not force_refresh:
         cached_data = cache.get(cache_key)
         if cached_data:
             logger.debug("Serving cached ocean page: %s", ocean_slug)
-            return render(request, "feed_page.html", _with_region_seo(request, cached_data, region))
+            return short_lived(render(request, "feed_page.html", _with_region_seo(request, cached_data, region)))
 
     logger.debug("Generating fresh ocean page: %s", ocean_slug)
     publications = _get_regional_publications(region)
@@ -252,7 +254,7 @@ def ocean_feed_page(request, ocean_slug):
     cache_hours = getattr(settings, "FEED_CACHE_HOURS", 24)
     cache.set(cache_key, context, timeout=cache_hours * 3600)
 
-    return render(request, "feed_page.html", _with_region_seo(request, context, region))
+    return short_lived(render(request, "feed_page.html", _with_region_seo(request, context, region)))
 
 
 def _with_region_seo(request, context: dict, region) -> dict:
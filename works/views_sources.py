@@ -20,6 +20,8 @@ from django.urls import reverse
 
 from .models import Source, Work
 from .seo import build_facet_page_meta, coins_title
+from .services.cache_tags import short_lived, tag, tagged_key
+from .services.facets import SOURCE
 from .utils.geojson import build_works_map_context
 from .utils.geometry import annotate_rounded_geometry
 from .utils.pagination import paginate_works
@@ -120,8 +122,8 @@ def source_page(request, source_slug):
             page_obj.object_list,
             works_qs,
             page_url,
-            all_cache_key=f"facet_map_all:source:{source.slug}",
+            all_cache_key=tagged_key(f"facet_map_all:source:{source.slug}", [tag(SOURCE, source.pk)]),
             force_refresh=request.GET.get("now") is not None,
         ),
     }
-    return render(request, "source_page.html", context)
+    return short_lived(render(request, "source_page.html", context))
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 OPTIMETA and KOMET projects <https://projects.tib.eu/komet>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Vector tiles and clusters of the works map.
+
+``/api/v1/tiles/works/{z}/{x}/{y}.mvt`` serves the work geometries,
+``/api/v1/clusters/works/{z}/{x}/{y}.geojson`` the aggregated low-zoom view.
+
+Thin HTTP wrapper around :mod:`works.services.tiles`, which renders the tiles
+with PostGIS and keeps them in the cache until a work changes.
+"""
+
+from django.http import Http404, HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import require_GET
+
+from .services.tiles import get_cluster_tile, get_work_tile, is_valid_tile, visible_statuses
+
+MVT_CONTENT_TYPE = "application/vnd.mapbox-vector-tile"
+
+# Browsers and the site-wide UpdateCacheMiddleware honour this max-age, so keep
+# it short: the server-side tile cache is what absorbs repeated requests, and it
+# is invalidated as soon as a work is edited.
+_PUBLIC_TILE_MAX_AGE = 60
+
+
+@require_GET
+def work_tile(request, z, x, y):
+    """One Mapbox Vector Tile of the works the requesting user may see.
+
+    Staff receive a layer per status (published, draft, harvested, …) as in the
+    works API; everyone else receives only the ``published`` layer. Tiles
+    outside the Web-Mercator pyramid are a 404; tiles with nothing in view are
+    an empty 200 response.
+    """
+    if not is_valid_tile(z, x, y):
+        raise Http404("No such tile.")
+    statuses = visible_statuses(request.user)
+    response = HttpResponse(get_work_tile(z, x, y, statuses), content_type=MVT_CONTENT_TYPE)
+    return _with_cache_headers(request, response)
+
+
+@require_GET
+def work_clusters(request, z, x, y):
+    """GeoJSON clusters of the works in tile ``z/x/y``, for world and continent zooms.
+
+    One Point per occupied grid cell (8 × 8 per tile) with ``count``, the
+    newest member as ``work_id``/``title`` and the members' extent as
+    ``bbox``, so a low-zoom view loads a few hundred points instead of every
+    geometry. Visibility, caching and invalidation are the same as for the
+    vector tiles.
+    """
+    if not is_valid_tile(z, x, y):
+        raise Http404("No such tile.")
+    statuses = visible_statuses(request.user)
+    response = JsonResponse(get_cluster_tile(z, x, y, statuses), content_type="application/geo+json")
+    return _with_cache_headers(request, response)
+
+
+def _with_cache_headers(request, response):
+    if request.user.is_authenticated:
+        response["Cache-Control"] = "private, no-store"
+    else:
+        response["Cache-Control"] = f"public, max-age={_PUBLIC_TILE_MAX_AGE}"
+    patch_vary_headers(response, ["Cookie"])
+    return response
@@ -15,12 +15,13 @@ from pathlib import Path
 import geoextent.lib.extent as geoextent
 from django.conf import settings
 from django.contrib.gis.geos import Point, Polygon
-from django.db.models import Case, Count, IntegerField, Q, Value, When
+from django.db.models import Case, Count, IntegerField, Max, Q, Value, When
 from django_q.humanhash import humanize
 from django_q.tasks import async_task
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     OpenApiExample,
+    OpenApiParameter,
     OpenApiResponse,
     extend_schema,
     extend_schema_view,
@@ -29,13 +30,17 @@ from drf_spectacular.utils import (
 from rest_framework import serializers as drf_serializers
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAuthenticatedOrReadOnly
-from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
 from rest_framework_gis import filters
 
-from .models import Collection, Country, GlobalRegion, Source, Subscription, Work
+from .conditional import ConditionalGetMixin
+from .models import Collection, Country, GlobalRegion, Source, SourceCoverageSnapshot, Subscription, Work
+from .pagination import WorkPagination
+from .renderers import FastJSONRenderer
 from .serializers import (
     CollectionSerializer,
     ContributeDoiSerializer,
@@ -49,9 +54,14 @@ from .serializers import (
     SourceSerializer,
     SubscriptionSerializer,
     WorkMinimalSerializer,
+    WorkPopupSerializer,
     WorkSerializer,
 )
-from .utils.geometry import annotate_rounded_geometry
+from .services.cache_tags import WORK_RECORDS, tag_stamp
+from .services.popups import get_work_popup
+from .services.tiles import visible_statuses
+from .utils.flatgeobuf import FLATGEOBUF_MEDIA_TYPE, geojson_to_flatgeobuf
+from .utils.geometry import annotate_rounded_geometry, geometry_for_band, resolve_simplify_band
 from .utils.provenance import append_event, public_subset
 
 logger = logging.getLogger(__name__)
@@ -81,13 +91,54 @@ class ContributeDoiThrottle(UserRateThrottle):
     scope = "contribute_doi"
 
 
-class _GeoJSONRenderer(JSONRenderer):
+class _PrecomputedJSONRenderer(FastJSONRenderer):
+    """JSONRenderer that splices pre-rendered geometry text verbatim.
+
+    ``PrecomputedGeometryField`` hands back the GeoJSON stored on the row as a
+    :class:`~works.utils.geojson.RawJSON`; this renderer embeds it without
+    parsing, so listing works does no geometry serialization at all (and
+    encodes the rest with orjson when available, see :mod:`works.renderers`).
+    """
+
+
+class _GeoJSONRenderer(_PrecomputedJSONRenderer):
     """Sets Content-Type: application/geo+json per W3C SDW-BP 5."""
 
     media_type = "application/geo+json"
     format = "geo+json"
 
 
+class _FlatGeobufRenderer(_PrecomputedJSONRenderer):
+    """Renders works as FlatGeobuf (``?format=fgb``), with a packed Hilbert R-tree.
+
+    The page's GeoJSON ``FeatureCollection`` is rendered as usual and then
+    re-encoded by GDAL (see :mod:`works.utils.flatgeobuf`), so the columns match
+    the GeoJSON properties. Pagination stays in the ``Link`` header; errors are
+    answered as JSON.
+    """
+
+    media_type = FLATGEOBUF_MEDIA_TYPE
+    format = "fgb"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        response = renderer_context.get("response")
+        if isinstance(data, dict) and isinstance(data.get("results"), dict):
+            data = data["results"]
+        if isinstance(data, dict) and data.get("type") == "Feature":
+            data = {"type": "FeatureCollection", "features": [data]}
+        geojson = super().render(data, "application/json", renderer_context)
+        if (response is not None and response.exception) or not (
+            isinstance(data, dict) and data.get("type") == "FeatureCollection"
+        ):
+            if response is not None:
+                response["Content-Type"] = "application/json"
+            return geojson
+        return geojson_to_flatgeobuf(geojson)
+
+
 @extend_schema_view(
     list=extend_schema(
         summary="List harvested data sources",
@@ -103,11 +154,36 @@ class _GeoJSONRenderer(JSONRenderer):
         },
     ),
 )
-class SourceViewSet(viewsets.ReadOnlyModelViewSet):
+class SourceViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Source.objects.all()
     serializer_class = SourceSerializer
     permission_classes = [AllowAny]
 
+    def conditional_state(self, request, detail, **kwargs):
+        # A source's representation also embeds its latest coverage snapshot and
+        # its default collection, so those timestamps are part of the validator.
+        sources = Source.objects.aggregate(n=Count("pk"), last=Max("updated_at"))
+        coverage = SourceCoverageSnapshot.objects.aggregate(last=Max("computed_at"))["last"]
+        collections = Collection.objects.aggregate(last=Max("updated_at"))["last"]
+        stamps = [s for s in (sources["last"], coverage, collections) if s is not None]
+        return (sources["n"], *stamps), max(stamps, default=None)
+
+
+_FIELDS_PARAMETER = OpenApiParameter(
+    "fields",
+    str,
+    OpenApiParameter.QUERY,
+    required=False,
+    description="Comma-separated work properties to return (default: all). `id` and `geometry` are always included.",
+)
+_OMIT_PARAMETER = OpenApiParameter(
+    "omit",
+    str,
+    OpenApiParameter.QUERY,
+    required=False,
+    description="Comma-separated work properties to leave out, applied after `fields`.",
+)
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -118,14 +194,30 @@ class SourceViewSet(viewsets.ReadOnlyModelViewSet):
             "`?in_bbox=west,south,east,north`.\n\n"
             "Pass `?minimal=true` to receive only `id`, `title`, `doi`, `status`, "
             "`status_display`, and `geometry` — the reduced payload is used by the map "
-            "for chunked loading; full details are fetched lazily per work."
+            "for chunked loading; full details are fetched lazily per work.\n\n"
+            "To walk the whole list, pass `?pagination=cursor` and follow the `next` link (also in "
+            "the `Link` header) until it is `null`: pages are keyed on `(creationDate, id)`, newest "
+            "first, so deep pages cost the same as the first one. Cursor pages carry no `count` "
+            "unless `?count=estimate` asks for the planner's estimate.\n\n"
+            "`?format=fgb` returns the page as [FlatGeobuf](https://flatgeobuf.org/) "
+            "(`application/flatgeobuf`, single layer `works`, with a spatial index) — a compact "
+            "binary encoding that is much faster to parse than GeoJSON.\n\n"
+            "Pick the properties you need with `?fields=title,doi` or drop some with "
+            "`?omit=abstract,locations` (comma-separated field names; `id` and `geometry` are always "
+            "included). Unrequested columns are not even loaded from the database, so e.g. "
+            "`?fields=title` transfers and loads a fraction of the full payload."
         ),
         tags=["Works"],
+        parameters=[_FIELDS_PARAMETER, _OMIT_PARAMETER],
     ),
     retrieve=extend_schema(
         summary="Retrieve a work by numeric ID",
-        description="See the work landing page (`/work/<id>/`) for the human-readable view.",
+        description=(
+            "See the work landing page (`/work/<id>/`) for the human-readable view. "
+            "`?fields=` and `?omit=` select properties as on the list."
+        ),
         tags=["Works"],
+        parameters=[_FIELDS_PARAMETER, _OMIT_PARAMETER],
         responses={
             200: WorkSerializer,
             404: OpenApiResponse(
@@ -135,18 +227,86 @@ class SourceViewSet(viewsets.ReadOnlyModelViewSet):
         },
     ),
 )
-class WorkViewSet(viewsets.ReadOnlyModelViewSet):
+class WorkViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     bbox_filter_field = "geometry"
     filter_backends = (filters.InBBoxFilter,)
     serializer_class = WorkSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    renderer_classes = [_GeoJSONRenderer, JSONRenderer, BrowsableAPIRenderer]
+    pagination_class = WorkPagination
+    renderer_classes = [_GeoJSONRenderer, _PrecomputedJSONRenderer, _FlatGeobufRenderer, BrowsableAPIRenderer]
+
+    #: Model columns behind serializer fields that are not plain model fields.
+    #: ``country_codes``/``region_names`` come from prefetches instead (see
+    #: ``_load_only``); every other field is the column of the same name.
+    _FIELD_COLUMNS = {
+        "status_display": ("status",),
+        "source_details": ("source",),
+        "bok_concepts_resolved": ("bok_concepts",),
+        "country_codes": (),
+        "region_names": (),
+    }
+    _FIELD_PREFETCHES = {"country_codes": "countries", "region_names": "regions"}
 
     def get_serializer_class(self):
         if self.request.query_params.get("minimal") == "true":
             return WorkMinimalSerializer
         return WorkSerializer
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        fields = self.sparse_fields()
+        if fields is not None:
+            context["fields"] = fields
+        return context
+
+    def sparse_fields(self):
+        """Serializer fields chosen with ``?fields=`` and/or ``?omit=``, or ``None`` for all.
+
+        Both take comma-separated ``WorkSerializer`` field names; ``omit`` is
+        applied after ``fields``. ``id`` and ``geometry`` are always kept.
+        Ignored with ``?minimal=true``, which has its own fixed field set.
+        """
+        qp = getattr(self.request, "query_params", self.request.GET)
+        if qp.get("minimal") == "true" or not (qp.get("fields") or qp.get("omit")):
+            return None
+        available = list(dict.fromkeys([*WorkSerializer.Meta.fields, "geometry"]))
+
+        def parse(param):
+            names = [name.strip() for name in qp.get(param, "").split(",") if name.strip()]
+            unknown = sorted(set(names) - set(available))
+            if unknown:
+                message = f"Unknown field(s) in ?{param}=: {', '.join(unknown)}. Available: {', '.join(available)}."
+                raise ValidationError({"error": message})
+            return names
+
+        selected = set(parse("fields") or available) - set(parse("omit"))
+        return [name for name in available if name in selected or name in WorkSerializer.REQUIRED_FIELDS]
+
+    def _load_only(self, qs):
+        """Prefetch and load just the columns the serialized fields read.
+
+        Without a sparse fieldset every column but ``provenance`` (which the
+        serializer never reads) is loaded and both M2Ms are prefetched. With
+        one, ``.only()`` skips the unrequested columns — ``abstract``,
+        ``openalex_match_info``, ``locations`` and the like are the bulk of a
+        row — and the ``countries``/``regions`` prefetch queries are dropped
+        unless ``country_codes``/``region_names`` are requested. Other actions
+        (e.g. ``provenance``) get full rows.
+        """
+        if getattr(self, "action", None) not in ("list", "retrieve"):
+            return qs.prefetch_related("countries", "regions")
+        fields = self.sparse_fields()
+        if fields is None:
+            return qs.defer("provenance").prefetch_related("countries", "regions")
+        # creationDate keys cursor pagination; geometry feeds the bbox.
+        columns = {"geometry", "creationDate"}
+        for name in fields:
+            columns.update(self._FIELD_COLUMNS.get(name, (name,)))
+        prefetches = [self._FIELD_PREFETCHES[name] for name in fields if name in self._FIELD_PREFETCHES]
+        if prefetches:
+            qs = qs.prefetch_related(*prefetches)
+        return qs.only(*sorted(columns))
+
     def retrieve(self, request, *args, **kwargs):
         """302-redirect a merged-away duplicate's detail to the canonical work.
 
@@ -167,6 +327,20 @@ class WorkViewSet(viewsets.ReadOnlyModelViewSet):
                     return redirect(reverse("optimap:works:work-detail", args=[canonical.id]))
         return super().retrieve(request, *args, **kwargs)
 
+    def conditional_state(self, request, detail, **kwargs):
+        """Validators for the works list or one work: the ``WORK_RECORDS`` version stamp.
+
+        The stamp moves on every change to a work's representation — saves,
+        deletes, bulk (un)publishing, country/region/collection membership and
+        source or collection edits (``works.services.work_changes``,
+        ``works.signals``) — and costs one cache read, no query. Any change
+        retires the validators of every works URL.
+        """
+        if getattr(self, "action", None) not in ("list", "retrieve"):
+            return None
+        version, bumped_at = tag_stamp(WORK_RECORDS)
+        return (version,), bumped_at
+
     def get_queryset(self):
         """
         Return all publications for admin users, only published ones for others.
@@ -181,6 +355,7 @@ class WorkViewSet(viewsets.ReadOnlyModelViewSet):
         # Merged-away duplicates (status='r') are tombstones for redirect only —
         # never list them, unless explicitly requested for inspection.
         include_redirected = qp.get("include") == "redirected"
+        geo_field = self._geometry_source(qp)
 
         if self.request.user.is_authenticated and self.request.user.is_staff:
             qs = Work.objects.all().distinct()
@@ -198,16 +373,25 @@ class WorkViewSet(viewsets.ReadOnlyModelViewSet):
                 ).order_by("_status_priority", "-creationDate", "-id")
             else:
                 qs = qs.order_by("-creationDate", "-id")
-            return annotate_rounded_geometry(qs).prefetch_related("countries", "regions")
+            return self._load_only(annotate_rounded_geometry(qs, geo_field=geo_field))
         if getattr(self, "action", None) == "provenance" and self.request.user.is_authenticated:
             curated = Work.objects.filter(collections__curators=self.request.user)
             public = Work.objects.filter(status="p")
             qs = (curated | public).distinct()
             if not include_redirected:
                 qs = qs.exclude(status="r")
-            return annotate_rounded_geometry(qs).prefetch_related("countries", "regions")
+            return self._load_only(annotate_rounded_geometry(qs, geo_field=geo_field))
         public = Work.objects.filter(status="p").order_by("-creationDate", "-id").distinct()
-        return annotate_rounded_geometry(public).prefetch_related("countries", "regions")
+        return self._load_only(annotate_rounded_geometry(public, geo_field=geo_field))
+
+    @staticmethod
+    def _geometry_source(qp):
+        """Geometry expression selected by ``?simplify=`` / ``?zoom=`` (full resolution by default)."""
+        try:
+            band = resolve_simplify_band(qp.get("simplify"), qp.get("zoom"))
+        except ValueError as exc:
+            raise ValidationError({"error": str(exc)}) from exc
+        return geometry_for_band(band)
 
     @extend_schema(
         summary="Retrieve provenance for a work",
@@ -585,6 +769,40 @@ class WorkViewSet(viewsets.ReadOnlyModelViewSet):
             response["Cache-Control"] = "public, max-age=3600"
         return response
 
+    @extend_schema(
+        summary="Popup summary of a work",
+        tags=["Works"],
+        description=(
+            "The fields a map popup shows when a feature is clicked: title, DOI, status, authors, "
+            "publication date, time periods, abstract, links and the source's name and homepage. "
+            "No geometry, countries, regions or BoK concepts — use the work detail for those.\n\n"
+            "Served from a per-work cache that is cleared whenever the work or its source is saved, "
+            "so repeated clicks do not serialize the work again. Visibility matches the work detail: "
+            "staff see every status except merged-away duplicates, everyone else only published works."
+        ),
+        responses={
+            200: WorkPopupSerializer,
+            404: OpenApiResponse(_ERROR_RESPONSE, description="No visible work with this ID."),
+        },
+    )
+    @action(detail=True, url_path="popup", methods=["get"], renderer_classes=[FastJSONRenderer])
+    def popup(self, request, pk=None):
+        # Deliberately not get_object(): the cached payload carries the status,
+        # so a cache hit costs no query at all.
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound() from None
+        data = get_work_popup(pk)
+        if data is None or data["status"] not in visible_statuses(request.user):
+            raise NotFound()
+        response = Response(data)
+        if request.user.is_authenticated:
+            response["Cache-Control"] = "private, no-store"
+        else:
+            response["Cache-Control"] = "public, max-age=60"
+        return response
+
     @extend_schema(
         summary="Contribute a new work by DOI",
         tags=["Contribute"],
@@ -821,7 +1039,7 @@ class SubscriptionViewSet(viewsets.ModelViewSet):
         },
     ),
 )
-class GlobalRegionViewSet(viewsets.ReadOnlyModelViewSet):
+class GlobalRegionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """
     GlobalRegion view set for continent and ocean geometries.
     Returns GeoJSON FeatureCollection for use in map layers.
@@ -832,6 +1050,11 @@ class GlobalRegionViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = GlobalRegionSerializer
     permission_classes = [AllowAny]
 
+    def conditional_state(self, request, detail, **kwargs):
+        # Regions only change when the loader runs, which touches last_loaded.
+        state = GlobalRegion.objects.aggregate(n=Count("pk"), last=Max("last_loaded"))
+        return (state["n"], state["last"]), state["last"]
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -852,13 +1075,17 @@ class GlobalRegionViewSet(viewsets.ReadOnlyModelViewSet):
         },
     ),
 )
-class CountryViewSet(viewsets.ReadOnlyModelViewSet):
+class CountryViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     """Country geometries for map layers. Read-only — loaded via load_countries."""
 
     queryset = Country.objects.real().order_by("name")
     serializer_class = CountrySerializer
     permission_classes = [AllowAny]
 
+    def conditional_state(self, request, detail, **kwargs):
+        state = Country.objects.real().aggregate(n=Count("pk"), last=Max("last_loaded"))
+        return (state["n"], state["last"]), state["last"]
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -883,7 +1110,7 @@ class CountryViewSet(viewsets.ReadOnlyModelViewSet):
         },
     ),
 )
-class CollectionViewSet(viewsets.ReadOnlyModelViewSet):
+class CollectionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = CollectionSerializer
     permission_classes = [AllowAny]
     lookup_field = "identifier"
@@ -896,6 +1123,17 @@ class CollectionViewSet(viewsets.ReadOnlyModelViewSet):
             return qs
         return qs.filter(is_published=True)
 
+    def conditional_state(self, request, detail, **kwargs):
+        # works_count moves with every (un)published work and membership
+        # change, so the works' version stamp is part of the validator.
+        collections = (
+            Collection.objects.all() if request.user.is_staff else Collection.objects.filter(is_published=True)
+        )
+        state = collections.aggregate(n=Count("pk"), last=Max("updated_at"))
+        version, bumped_at = tag_stamp(WORK_RECORDS)
+        stamps = [s for s in (state["last"], bumped_at) if s is not None]
+        return (state["n"], state["last"], version), max(stamps)
+
 
 @extend_schema(tags=["Geoextent"])
 class GeoextentViewSet(viewsets.ViewSet):
@@ -1685,10 +1923,11 @@ class GeoextentViewSet(viewsets.ViewSet):
 
 @extend_schema_view(
     list=extend_schema(
-        summary="Site statistics (cached, 24 h TTL)",
+        summary="Site statistics",
         description=(
             "Returns aggregate counts for the OPTIMAP database. "
-            "Results are cached for 24 hours.\n\n"
+            "The counts are current; the `by_*` breakdowns are refreshed by a periodic "
+            "recount (every 24 hours by default).\n\n"
             "`total_works_for_user` equals `published_works` for anonymous and non-staff users, "
             "and `total_works` for staff — matching the total that `/api/v1/works/` returns for "
             "the caller. Use it to drive a loading progress indicator."
@@ -1736,20 +1975,20 @@ class GeoextentViewSet(viewsets.ViewSet):
     ),
 )
 class StatisticsViewSet(viewsets.ViewSet):
-    """Read-only viewset exposing cached site-wide statistics."""
+    """Read-only viewset exposing the live site-wide statistics counters."""
 
     permission_classes = [AllowAny]
 
     def list(self, request):
         from works.models import StatisticsSnapshot
-        from works.utils.statistics import get_cached_statistics
+        from works.utils.statistics import get_statistics
 
         try:
             snapshot = StatisticsSnapshot.objects.latest()
         except StatisticsSnapshot.DoesNotExist:
             snapshot = None
 
-        stats = get_cached_statistics()
+        stats = get_statistics()
         is_staff = request.user.is_authenticated and request.user.is_staff
         total_for_user = stats.get("total_works", 0) if is_staff else stats.get("published_works", 0)
 